@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+title: bench_atmospheric_lut.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Speed and accuracy of the atmospheric attenuation lookup table against the exact
+ITU-R P.676-12 line-by-line kernel, for random weather states and frequencies.
+
+Run from the repository root:
+    python -m benchmarks.bench_atmospheric_lut [-n N] [--method linear|cubic]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from project.link_element import itu_p676
+from project.link_element.atmospheric_lut import AttenuationTable, DEFAULT_GRID
+
+
+def best_time(func, repeat=3):
+    '''Returns the best wall time of a number of calls [s]'''
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(n, method):
+    start = time.perf_counter()
+    table = AttenuationTable.cached(method=method)
+    print(f'Table ready in {time.perf_counter() - start:.2f} s: {table}')
+
+    rng = np.random.default_rng(0)
+    log_f_bounds = np.log10(DEFAULT_GRID['frequency'][:2])
+    f = 10**rng.uniform(*log_f_bounds, n)
+    T = rng.uniform(*DEFAULT_GRID['temperature'][:2], n)
+    p = rng.uniform(*DEFAULT_GRID['pressure'][:2], n)
+    rho = rng.uniform(*DEFAULT_GRID['water_vapour'][:2], n)
+
+    exact = itu_p676.zenith_attenuation(f, p, rho, T)
+    fast = table.zenith_attenuation(f, p, rho, T)
+    error = np.abs(fast - exact)
+
+    t_exact = best_time(lambda: itu_p676.zenith_attenuation(f, p, rho, T))
+    t_fast = best_time(lambda: table.zenith_attenuation(f, p, rho, T))
+
+    print(f'{n} random states')
+    print(f'  exact kernel : {t_exact*1e3:9.2f} ms')
+    print(f'  lookup table : {t_fast*1e3:9.2f} ms  ({t_exact/t_fast:.1f}x faster)')
+    print(f'  max error    : {error.max():.3g} dB, {(error/exact).max():.3g} relative '
+          f'(sampled at build {table.sampled_error:.3g} dB, {table.sampled_rel_error:.3g})')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('-n', type=int, default=100000, help='number of random states')
+    parser.add_argument('--method', default='linear', choices=['linear', 'cubic'])
+    args = parser.parse_args()
+    main(args.n, args.method)
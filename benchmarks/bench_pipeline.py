@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+title: bench_pipeline.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Latency and throughput of the processing pipeline on synthetic budgets (see synthetic.py)
+of 10 up to 100k elements with a mix of link types, and of every element kernel.
+
+Pipeline stages, per budget size: load_from_yaml, convert_config_units, read_user_data,
+fill_results_data, sum_results, and main_process as a whole. Element kernels, per link
+type and parameter set: a scalar evaluation, and a batch evaluation with one parameter
+given as an array (project.batch.element_gain).
+
+The results are written as JSON together with a description of the machine and the
+software versions, so they can be compared between releases:
+    {"machine": {...}, "settings": {...},
+     "pipeline": [{"stage", "n_elements", "repeat", "best", "median", "per_element",
+                   "throughput"}, ...],
+     "kernels": [{"link_type", "input_type", "mode", "parameter", "size", "repeat",
+                  "best", "median", "throughput"}, ...]}
+Times are in seconds, throughputs in elements (pipeline) or values (kernels) per second.
+
+Run from the repository root:
+    python -m benchmarks.bench_pipeline [--sizes N [N ...]] [-o FILE]
+"""
+import argparse
+import copy
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.synthetic import ELEMENT_KINDS, synthetic_config
+from project.batch import element_gain
+from project.process import fill_results_data, load_from_yaml, main_process, read_user_data, \
+    save_to_yaml, sum_results
+from project.settings import BASE_DIR, ELEMENT_REFERENCE
+from project.unit_conversion import convert_config_units
+
+DEFAULT_SIZES = (10, 100, 1000, 10_000, 100_000)
+
+
+def machine_info():
+    '''Description of the machine and software the benchmark runs on'''
+    import pandas
+    import scipy
+    import yaml
+
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=BASE_DIR, text=True,
+                                capture_output=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    try:
+        memory = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+    except (AttributeError, ValueError, OSError):
+        memory = None   # Not available on Windows
+
+    return {'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'commit': commit,
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'processor': platform.processor(),
+            'cpu_count': os.cpu_count(),
+            'memory': memory,
+            'python': f'{platform.python_implementation()} {platform.python_version()}',
+            'numpy': np.__version__,
+            'scipy': scipy.__version__,
+            'pandas': pandas.__version__,
+            'pyyaml': yaml.__version__}
+
+
+def summary(times, count):
+    '''Best and median of repeated timings, and the throughput of the best one'''
+    best = min(times)
+    return {'repeat': len(times), 'best': best, 'median': statistics.median(times),
+            'throughput': count / best if best > 0 else None}
+
+
+def repeats(n_elements, repeat):
+    '''Number of repeats for a budget size, fewer for large budgets'''
+    return max(1, min(repeat, 10_000 // n_elements))
+
+
+def bench_stages(n_elements, repeat, seed=0):
+    '''Times the stages of the pipeline on a synthetic budget
+
+    Parameters
+    ----------
+    n_elements : int
+    repeat : int
+        Maximum number of repeats, see repeats()
+    seed : int, default=0
+
+    Returns
+    -------
+    list of dict
+        Timings per stage
+    '''
+    stages = ('load_from_yaml', 'convert_config_units', 'read_user_data',
+              'fill_results_data', 'sum_results', 'main_process')
+    times = {stage: [] for stage in stages}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        file = Path(tmp, 'synthetic.yaml')
+        save_to_yaml(synthetic_config(n_elements, seed=seed), file)
+
+        for _ in range(repeats(n_elements, repeat)):
+            start = time.perf_counter()
+            data = load_from_yaml(file)
+            times['load_from_yaml'].append(time.perf_counter() - start)
+            user_data = copy.deepcopy(data)
+
+            start = time.perf_counter()
+            converted = convert_config_units(data)
+            times['convert_config_units'].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            df_user_data = read_user_data(converted)
+            times['read_user_data'].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            results = fill_results_data(df_user_data, converted)
+            times['fill_results_data'].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            sum_results(results)
+            times['sum_results'].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            main_process(user_data)
+            times['main_process'].append(time.perf_counter() - start)
+
+    rows = []
+    for stage in stages:
+        row = {'stage': stage, 'n_elements': n_elements, **summary(times[stage], n_elements)}
+        row['per_element'] = row['best'] / n_elements
+        rows.append(row)
+    return rows
+
+
+def time_calls(func, min_time=0.2, max_repeat=1000):
+    '''Times a function, repeated until min_time has passed [s per call]'''
+    times = []
+    start = time.perf_counter()
+    while len(times) < max_repeat and (time.perf_counter() - start < min_time or not times):
+        t = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t)
+    return times
+
+
+def batch_parameter(parameters):
+    '''First parameter of an element with a nonzero float value, varied in a batch'''
+    for param, value in parameters.items():
+        if isinstance(value, float) and value != 0:
+            return param
+    return None
+
+
+def bench_kernels(batch_size, seed=0):
+    '''Times every element kernel, for a scalar and a batch evaluation
+
+    Parameters
+    ----------
+    batch_size : int
+        Number of values of the varied parameter in a batch evaluation
+    seed : int, default=0
+
+    Returns
+    -------
+    list of dict
+        Timings per link type, parameter set and mode ('scalar' or 'batch')
+    '''
+    param_ref = load_from_yaml(ELEMENT_REFERENCE)
+    rng = np.random.default_rng(seed)
+    config = synthetic_config(len(ELEMENT_KINDS), seed=seed, param_ref=param_ref)
+    # One element of every kind, the NOISE element given by parameters
+    elements = {}
+    for name, attributes in config['elements'].items():
+        kind = (attributes['link_type'], attributes['input_type'])
+        if kind in ELEMENT_KINDS:
+            elements.setdefault(kind, (name, attributes))
+
+    rows = []
+    for (link_type, input_type), (name, attributes) in sorted(elements.items()):
+        base = {'link_type': link_type, 'input_type': input_type}
+        times = time_calls(lambda: element_gain(name, attributes, param_ref=param_ref))
+        rows.append({**base, 'mode': 'scalar', 'parameter': None, 'size': 1,
+                     **summary(times, 1)})
+
+        if link_type == 'GENERIC':
+            param, value = 'gain_loss', attributes['gain_loss']
+        else:
+            param = batch_parameter(attributes['parameters'])
+            value = None if param is None else attributes['parameters'][param]
+        if param is None:
+            continue
+        values = value * (1 + rng.uniform(-0.01, 0.01, batch_size))
+        try:
+            times = time_calls(lambda: element_gain(name, attributes, {param: values},
+                                                    param_ref=param_ref), max_repeat=20)
+        except Exception as E:  # A kernel without array support is reported, not fatal
+            rows.append({**base, 'mode': 'batch', 'parameter': param, 'size': batch_size,
+                         'error': f'{type(E).__name__}: {E}'})
+            continue
+        rows.append({**base, 'mode': 'batch', 'parameter': param, 'size': batch_size,
+                     **summary(times, batch_size)})
+    return rows
+
+
+def main(sizes, repeat, batch_size, seed, output):
+    log = sys.stderr
+    report = {'machine': machine_info(),
+              'settings': {'sizes': list(sizes), 'repeat': repeat, 'batch_size': batch_size,
+                           'seed': seed},
+              'pipeline': [], 'kernels': []}
+
+    for n in sizes:
+        print(f'{n} elements', file=log)
+        for row in bench_stages(n, repeat, seed):
+            report['pipeline'].append(row)
+            print(f'  {row["stage"]:22s}: {row["best"]*1e3:10.2f} ms '
+                  f'{row["per_element"]*1e6:9.2f} us/element', file=log)
+
+    print(f'element kernels, batch of {batch_size}', file=log)
+    for row in bench_kernels(batch_size, seed):
+        report['kernels'].append(row)
+        kind = f'{row["link_type"]} {row["input_type"]} {row["mode"]}'
+        if 'error' in row:
+            print(f'  {kind:42s}: {row["error"]}', file=log)
+        else:
+            print(f'  {kind:42s}: {row["best"]*1e3:10.3f} ms '
+                  f'{row["throughput"]:14.0f} values/s', file=log)
+
+    text = json.dumps(report, indent=2)
+    if output is None:
+        print(text)
+    else:
+        Path(output).write_text(text)
+        print(f'written to {output}', file=log)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='numbers of elements of the synthetic budgets')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='maximum repeats per size, fewer above 2000 elements')
+    parser.add_argument('--batch-size', type=int, default=100_000,
+                        help='values per batch evaluation of a kernel')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', default=None, help='JSON file, stdout by default')
+    args = parser.parse_args()
+    main(args.sizes, args.repeat, args.batch_size, args.seed, args.output)
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+title: bench_plot_render.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Time to paint a long margin series in the plots dock, with min/max downsampling of the
+visible range against a polyline through every point.
+
+Run from the repository root:
+    python -m benchmarks.bench_plot_render [-n N]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+if not os.environ.get('DISPLAY') and sys.platform.startswith('linux'):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PyQt5.QtGui import QImage, QPainter
+from PyQt5.QtWidgets import QApplication
+
+from project.app.plots import PlotWidget, polygon
+
+
+def best_time(func, repeat=5):
+    '''Returns the best wall time of a number of calls [s]'''
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(n):
+    app = QApplication.instance() or QApplication(sys.argv)
+    x = np.linspace(0, 3600, n)
+    y = np.sin(x / 300) * 10 + np.random.default_rng(0).normal(0, 1, n)
+
+    plot = PlotWidget()
+    plot.resize(1600, 800)
+    plot.set_line(x, y, ('Time [s]', 'Margin [dB]'), reference=0.0)
+    t_full = best_time(plot.grab)
+    plot.set_view(1000, 1100)
+    t_zoom = best_time(plot.grab)
+
+    def every_point():
+        image = QImage(1600, 800, QImage.Format_RGB32)
+        painter = QPainter(image)
+        px, py = plot.to_pixels(x, y)
+        painter.drawPolyline(polygon(px, py))
+        painter.end()
+
+    plot.set_view(*plot.full_view)
+    t_naive = best_time(every_point, repeat=1)
+
+    print(f'{n} points, 1600 x 800 pixels')
+    print(f'  downsampled, all data : {t_full*1e3:9.1f} ms')
+    print(f'  downsampled, zoomed   : {t_zoom*1e3:9.1f} ms')
+    print(f'  every point           : {t_naive*1e3:9.1f} ms')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('-n', type=int, default=2_000_000, help='number of points')
+    args = parser.parse_args()
+    main(args.n)
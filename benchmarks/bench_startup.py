@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+title: bench_startup.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Cold start of the User Interface: time from starting Python until the main window is
+first painted, and until the default configuration is shown in it.
+
+Every run is a new Python process, as a user starting the application. Without a display,
+the offscreen Qt platform is used.
+
+Run from the repository root:
+    python -m benchmarks.bench_startup [-n N] [--runtime-ui]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from project.settings import BASE_DIR
+
+
+def child(runtime_ui):
+    '''Starts the application and prints a line when the window is painted and loaded'''
+    from PyQt5.QtCore import QEvent, QObject, QTimer
+    from PyQt5.QtWidgets import QApplication
+
+    if runtime_ui:
+        import project.app.forms as forms
+        forms.UI_PACKAGE = 'compiled_forms_disabled'     # Falls back to uic.loadUiType
+
+    app = QApplication(sys.argv)
+    from project.app.app import MainWindow
+
+    class FirstPaint(QObject):
+        painted = False
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint and not self.painted:
+                self.painted = True
+                print('window', flush=True)
+            return False
+
+    window = MainWindow()
+    first_paint = FirstPaint()
+    window.installEventFilter(first_paint)
+    window.show()
+
+    def check_loaded():
+        if window.cfg_data is not None and first_paint.painted:
+            print('loaded', flush=True)
+            app.quit()
+
+    timer = QTimer()
+    timer.timeout.connect(check_loaded)
+    timer.start(0)
+    app.exec()
+
+
+def run_once(runtime_ui):
+    '''Times one start of the application in a new process [s]'''
+    env = dict(os.environ)
+    if not env.get('DISPLAY') and sys.platform.startswith('linux'):
+        env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    cmd = [sys.executable, '-m', 'benchmarks.bench_startup', '--child']
+    if runtime_ui:
+        cmd.append('--runtime-ui')
+
+    times = {}
+    start = time.perf_counter()
+    with subprocess.Popen(cmd, cwd=BASE_DIR, env=env, stdout=subprocess.PIPE,
+                          stderr=subprocess.DEVNULL, text=True) as proc:
+        for line in proc.stdout:
+            times[line.strip()] = time.perf_counter() - start
+    return times
+
+
+def main(n, runtime_ui):
+    runs = [run_once(runtime_ui) for _ in range(n)]
+    ui = 'loaded from .ui files' if runtime_ui else 'compiled'
+    print(f'{n} cold starts, forms {ui}')
+    for event, label in (('window', 'time to window'), ('loaded', 'configuration shown')):
+        values = [run[event] for run in runs]
+        print(f'  {label:20s}: {statistics.median(values)*1e3:7.0f} ms median, '
+              f'{min(values)*1e3:7.0f} ms best')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('-n', type=int, default=5, help='number of starts')
+    parser.add_argument('--runtime-ui', action='store_true',
+                        help='load the forms from the .ui files instead of the compiled modules')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.runtime_ui)
+    else:
+        main(args.n, args.runtime_ui)
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""
+title: synthetic.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Synthetic link budget configurations of any size, for the benchmarks.
+
+Every link type and parameter set of element_reference.yaml has a realistic base value per
+parameter (BASE_VALUES). The generated elements cycle through the parameter sets in a
+random order and vary the base values by up to +-JITTER, clipped to the range of the
+parameter in the element reference, so every configuration runs through main_process.
+Only one NOISE element given by parameters is allowed in a budget, further NOISE
+elements are given by their gain_loss.
+
+Run from the repository root to write a configuration:
+    python -m benchmarks.synthetic N [-o FILE] [--seed SEED]
+"""
+import argparse
+import math
+
+import numpy as np
+
+from project.process import load_from_yaml, save_to_yaml
+from project.settings import ELEMENT_REFERENCE
+
+JITTER = 0.1    # Relative variation of the base values
+
+# Base parameter values per link type and parameter set, in the units of the reference
+BASE_VALUES = {
+    'FREE_SPACE': {
+        'parameter_set_1': {'distance': 1500.0, 'frequency': 2200.0},
+        'parameter_set_2': {'elevation_angle': 30.0, 'distance': 1000.0, 'gs_altitude': 0.0,
+                            'sc_altitude': 500.0, 'frequency': 2200.0},
+        'parameter_set_3': {'semi_major_axis': 6878.137, 'eccentricity': 0.001,
+                            'inclination': 97.4, 'raan': 10.0, 'arg_perigee': 20.0,
+                            'mean_anomaly': 30.0, 'j2_drift': 0, 'gs_latitude': 52.0,
+                            'gs_longitude': 4.4, 'gs_altitude': 0.0, 'time': 0.0,
+                            'frequency': 2200.0}},
+    'ATMOSPHERIC': {
+        'parameter_set_1': {'air_temperature': 288.15, 'air_pressure': 1013.25,
+                            'water_vapor_content': 7.5, 'elevation_angle': 30.0,
+                            'frequency': 12000.0},
+        'parameter_set_2': {'air_temperature': 288.15, 'air_pressure': 1013.25,
+                            'water_vapor_content': 7.5, 'elevation_angle': 30.0,
+                            'frequency': 22.0},
+        'parameter_set_3': {'air_temperature': 288.15, 'air_pressure': 1013.25,
+                            'water_vapor_content': 7.5, 'elevation_angle': 30.0,
+                            'frequency': 22.0, 'gs_altitude': 0.0, 'n_layers': 20}},
+    'RAIN': {
+        'parameter_set_1': {'frequency': 12.0, 'polarization_tilt': 45.0,
+                            'elevation_angle': 30.0, 'gs_latitude': 52.0, 'gs_altitude': 0.0,
+                            'rain_rate': 10.0},
+        'parameter_set_2': {'frequency': 12.0, 'polarization_tilt': 45.0,
+                            'elevation_angle': 30.0, 'gs_latitude': 52.0, 'gs_altitude': 0.0,
+                            'rain_rate': 30.0, 'exceedance': 0.1}},
+    'RX': {
+        'parameter_set_1': {'antenna_diameter': 2.0, 'antenna_efficiency': 0.6,
+                            'frequency': 2200.0},
+        'parameter_set_2': {'waist_radius': 0.05, 'frequency': 2200.0},
+        'parameter_set_3': {'pattern_file': 'example_dish.csv', 'off_boresight_angle': 1.0},
+        'parameter_set_4': {'pattern_file': 'example_patch_2d.csv', 'azimuth_offset': 5.0,
+                            'elevation_offset': 5.0}},
+    'TX': {
+        'parameter_set_1': {'antenna_diameter': 0.5, 'antenna_efficiency': 0.6,
+                            'frequency': 2200.0},
+        'parameter_set_2': {'waist_radius': 0.05, 'frequency': 2200.0},
+        'parameter_set_3': {'pattern_file': 'example_dish.csv', 'off_boresight_angle': 1.0},
+        'parameter_set_4': {'pattern_file': 'example_patch_2d.csv', 'azimuth_offset': 5.0,
+                            'elevation_offset': 5.0}},
+    'NOISE': {
+        'parameter_set_1': {'antenna_temperature': 150.0, 'feed_loss': 0.5, 'noise_figure': 1.0,
+                            'data_rate': 9.6, 'required_eb_n0': 9.6},
+        'parameter_set_2': {'system_temperature': 300.0, 'data_rate': 9.6,
+                            'required_eb_n0': 9.6}},
+    'BEAM_DIVERGENCE': {
+        'parameter_set_1': {'waist_radius': 10.0, 'wavelength': 1550.0, 'distance': 1000.0,
+                            'rx_aperture_diameter': 0.5},
+        'parameter_set_2': {'waist_radius': 10.0, 'wavelength': 1550.0,
+                            'beam_divergence': 100.0}},
+    'POINTING': {
+        'parameter_set_1': {'pointing_error': 5.0, 'beam_divergence': 20.0},
+        'parameter_set_2': {'pointing_bias': 2.0, 'pointing_jitter': 3.0,
+                            'beam_divergence': 20.0, 'exceedance': 1.0},
+        'parameter_set_3': {'pointing_bias': 2.0, 'pointing_jitter': 3.0,
+                            'beam_divergence': 20.0}},
+    'TURBULENCE': {
+        'parameter_set_1': {'wavelength': 1550.0, 'elevation_angle': 30.0, 'gs_altitude': 100.0,
+                            'wind_speed': 21.0, 'ground_cn2': 1.7e-14,
+                            'rx_aperture_diameter': 0.4, 'exceedance': 1.0}},
+    'GENERIC': {
+        'gain_loss': {}},
+}
+
+# Kinds of elements, (link type, input type), in a fixed order
+ELEMENT_KINDS = [(link_type, input_type) for link_type, sets in BASE_VALUES.items()
+                 for input_type in sets]
+
+
+def parse_range(range_raw):
+    '''Bounds of an interval of the element reference, e.g. "(0, 90]" gives (0, 90)'''
+    if range_raw is None:
+        return -math.inf, math.inf
+    lower, upper = range_raw.replace(' ', '').split(',')
+    return float(lower[1:]), float(upper[:-1])
+
+
+def vary(value, details, rng):
+    '''Random value within +-JITTER of a base value, inside the range of the parameter
+
+    Integer and zero values, and values of parameters without units ('-'), are kept as
+    they are, e.g. the number of layers or a flag.
+    '''
+    if isinstance(value, (str, int)) or value == 0 or details.get('units') == '-':
+        return value
+    lower, upper = parse_range(details.get('range'))
+    new = value * (1 + rng.uniform(-JITTER, JITTER))
+    if not lower < new < upper:
+        return value
+    return float(new)
+
+
+def element_kinds(n_elements, link_types=None, seed=0):
+    '''Kinds of the elements of a synthetic budget
+
+    Parameters
+    ----------
+    n_elements : int
+    link_types : list of str, optional
+        Link types to use, all of BASE_VALUES by default
+    seed : int, default=0
+
+    Returns
+    -------
+    list of tuple
+        (link type, input type) per element. Every kind occurs equally often (up to one),
+        in random order
+    '''
+    kinds = [kind for kind in ELEMENT_KINDS if link_types is None or kind[0] in link_types]
+    rng = np.random.default_rng(seed)
+    order = np.resize(np.arange(len(kinds)), n_elements)
+    rng.shuffle(order)
+    return [kinds[k] for k in order]
+
+
+def synthetic_config(n_elements, link_types=None, seed=0, param_ref=None):
+    '''Valid configuration dictionary with a mix of link types
+
+    Parameters
+    ----------
+    n_elements : int
+        Number of elements
+    link_types : list of str, optional
+        Link types to use, all by default
+    seed : int, default=0
+        Seed of the random kinds and values, the same seed gives the same configuration
+    param_ref : dict, optional
+        Loaded element_reference.yaml. Loaded from file if not given
+
+    Returns
+    -------
+    dict
+        Configuration dictionary, as loaded from a configuration file
+    '''
+    if param_ref is None:
+        param_ref = load_from_yaml(ELEMENT_REFERENCE)
+    rng = np.random.default_rng(seed)
+
+    elements = {}
+    has_noise = False
+    for idx, (link_type, input_type) in enumerate(element_kinds(n_elements, link_types, seed)):
+        name = f'{link_type} {idx}'
+        if link_type == 'GENERIC' or (link_type == 'NOISE' and has_noise):
+            elements[name] = {'link_type': link_type, 'input_type': 'gain_loss',
+                              'gain_loss': float(rng.uniform(-3.0, 3.0)), 'parameters': None,
+                              'idx': idx}
+            continue
+        has_noise |= link_type == 'NOISE'
+        reference = param_ref[link_type][input_type]
+        parameters = {param: vary(value, reference[param], rng)
+                      for param, value in BASE_VALUES[link_type][input_type].items()}
+        elements[name] = {'link_type': link_type, 'input_type': input_type, 'gain_loss': None,
+                          'parameters': parameters, 'idx': idx}
+
+    return {'elements': elements,
+            'general_values': {'input_power': 30.0, 'rx_sys_threshold': -120.0,
+                               'total_gain': None, 'total_margin': None},
+            'settings': {'case_type': 'nominal'}}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[1])
+    parser.add_argument('n', type=int, help='number of elements')
+    parser.add_argument('-o', '--output', default=None,
+                        help='configuration file to write, synthetic_<N>.yaml in the configs '
+                             'folder by default')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    save_to_yaml(synthetic_config(args.n, seed=args.seed),
+                 args.output or f'synthetic_{args.n}.yaml')
@@ -6,17 +6,17 @@ Allows user to choose whether to use script or UI app
 
 """
 
-from project.process import main_process, load_from_yaml
+from project.memory import memory_limit, parse_size
 from project.settings import DEFAULT_LINK_CONFIG
-from project.app.app import run_app
 
 import argparse
+import contextlib
 import os
 from pathlib import Path, WindowsPath
 
 
 
-def run_script(config_file, decimals=2):
+def run_script(config_file, decimals=2, profile=False, memory_report=False):
     '''Runs Link Budget Toolbox as a script without a User Interface
 
     Total gain and margin are printed in console as results
@@ -27,6 +27,10 @@ def run_script(config_file, decimals=2):
         File path to configuration YAML file
     decimals : int, default=2
         Decimals to round off to in printed results
+    profile : bool, default=False
+        Prints the time spent in every stage of loading and processing the configuration
+    memory_report : bool, default=False
+        Prints the peak memory of every stage and the lines that allocated the most
 
     Returns
     -------
@@ -39,10 +43,16 @@ def run_script(config_file, decimals=2):
         for row in values:
             print(indent + "".join(word.ljust(col_width) for word in row))
 
-    # Load config
-    data = load_from_yaml(config_file)
+    from project.process import main_process, load_from_yaml
+    from project.profiling import profile as profile_stages, stage
 
-    result = main_process(data)
+    measure = profile or memory_report
+    with profile_stages(memory=memory_report) if measure else contextlib.nullcontext() as stages:
+        # Load config
+        with stage('load_from_yaml'):
+            data = load_from_yaml(config_file)
+
+        result = main_process(data)
 
 
     # Print Results
@@ -68,6 +78,13 @@ def run_script(config_file, decimals=2):
     print()
     column_print(footer)
 
+    if profile:
+        print()
+        print(stages.table())
+    if memory_report:
+        print()
+        print(stages.memory_table())
+
     return result
 
 
@@ -76,13 +93,21 @@ def run_script(config_file, decimals=2):
 def main():
     '''Runs Link Budget Toolbox. Defaults to GUI app, unless CLI argument '-s' is passed
 
-    usage: Link Budget Toolbox [-h] [-d | -s] [-f FILE]
+    usage: Link Budget Toolbox [-h] [-d | -s] [-f FILE] [-p] [-t TRACE] [-m]
+                               [--max-memory SIZE]
 
     optional arguments:
       -h, --help            show this help message and exit
       -d, --debug           GUI app only: Print debug statements to terminal
       -s, --script          Run as CLI script. Does not open GUI
       -f FILE, --file FILE  Link Budget configuration file (YAML)
+      -p, --profile         CLI script only: Print the time spent per stage of the analysis
+      -t TRACE, --trace TRACE
+                            Write a timeline of the run to TRACE (Chrome Trace Event JSON)
+      -m, --memory-report   CLI script only: Print the peak memory per stage of the analysis
+                            and the top allocation sites
+      --max-memory SIZE     Memory limit of sweeps, Monte Carlo runs and networks, e.g. 2G.
+                            Their chunks are sized to stay within it
     '''
 
     parser = argparse.ArgumentParser(prog="Link Budget Toolbox",
@@ -93,8 +118,27 @@ def main():
     group.add_argument('-s', '--script', help="Run as CLI script. Does not open GUI",
                        action="store_true")
     parser.add_argument('-f', '--file', nargs=1, default=DEFAULT_LINK_CONFIG, help='Link Budget configuration file (YAML)')
+    parser.add_argument('-p', '--profile', help='CLI script only: Print the time spent per stage of the analysis',
+                        action="store_true")
+    parser.add_argument('-t', '--trace', default=None,
+                        help='Write a timeline of the run to TRACE (Chrome Trace Event JSON)')
+    parser.add_argument('-m', '--memory-report', action="store_true",
+                        help='CLI script only: Print the peak memory per stage of the analysis '
+                             'and the top allocation sites')
+    parser.add_argument('--max-memory', type=parse_size, default=None, metavar='SIZE',
+                        help='Memory limit of sweeps, Monte Carlo runs and networks, e.g. 2G. '
+                             'Their chunks are sized to stay within it')
     args = parser.parse_args()
 
+    from project.tracing import trace
+    with trace(args.trace) if args.trace else contextlib.nullcontext(), \
+            memory_limit(args.max_memory):
+        run(args)
+
+
+def run(args):
+    '''Runs the script or the application, as selected by the parsed arguments of main()'''
+
     # ----------- Command Line Script ---------
     if args.script:
         file = args.file
@@ -103,10 +147,12 @@ def main():
 
         cfg_file = Path(os.getcwd(), file)
         print(cfg_file)
-        run_script(str(cfg_file))
+        run_script(str(cfg_file), profile=args.profile, memory_report=args.memory_report)
 
     # --------- GUI Application ------------
     else:
+        # Imported here, the calculation modules are loaded in the background by the app
+        from project.app.app import run_app
         if args.debug:
             run_app(log_lvl='DEBUG')
         else:
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+title: acm.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Adaptive coding and modulation (ACM) and the data volume of passes.
+
+A MODCOD table lists the Es/N0 required by every modulation and coding combination
+and its efficiency in information bits per symbol. With ACM the link uses, at every
+sample of a pass, the most efficient MODCOD whose requirement is met. A fixed MODCOD
+transmits at its rate whenever its requirement is met, and not at all otherwise.
+
+Es/N0 follows from the C/N0 of the budget (a NOISE element is required) and the symbol
+rate. The data volume of a pass is the rate of every sample times the time it holds,
+as for the time above threshold of project.passes.
+"""
+import numpy as np
+import pandas as pd
+
+from project.passes import sample_durations
+
+# DVB-S2 normal frames, ideal Es/N0 [dB] for quasi error free operation on an AWGN
+# channel and efficiency [bit/symbol], ETSI EN 302 307-1 table 13
+DVB_S2 = pd.DataFrame([
+    ('QPSK 1/4', -2.35, 0.490243), ('QPSK 1/3', -1.24, 0.656448),
+    ('QPSK 2/5', -0.30, 0.789412), ('QPSK 1/2', 1.00, 0.988858),
+    ('QPSK 3/5', 2.23, 1.188304), ('QPSK 2/3', 3.10, 1.322253),
+    ('QPSK 3/4', 4.03, 1.487473), ('QPSK 4/5', 4.68, 1.587196),
+    ('QPSK 5/6', 5.18, 1.654663), ('QPSK 8/9', 6.20, 1.766451),
+    ('QPSK 9/10', 6.42, 1.788612), ('8PSK 3/5', 5.50, 1.779991),
+    ('8PSK 2/3', 6.62, 1.980636), ('8PSK 3/4', 7.91, 2.228124),
+    ('8PSK 5/6', 9.35, 2.478562), ('8PSK 8/9', 10.69, 2.646012),
+    ('8PSK 9/10', 10.98, 2.679207), ('16APSK 2/3', 8.97, 2.637201),
+    ('16APSK 3/4', 10.21, 2.966728), ('16APSK 4/5', 11.03, 3.165623),
+    ('16APSK 5/6', 11.61, 3.300184), ('16APSK 8/9', 12.89, 3.523143),
+    ('16APSK 9/10', 13.13, 3.567342), ('32APSK 3/4', 12.73, 3.703295),
+    ('32APSK 4/5', 13.64, 3.951571), ('32APSK 5/6', 14.28, 4.119540),
+    ('32APSK 8/9', 15.69, 4.397854), ('32APSK 9/10', 16.05, 4.453027)],
+    columns=['name', 'es_n0', 'efficiency'])
+
+
+def modcod_table(table=None):
+    '''Returns the MODCODs that ACM can select, by increasing required Es/N0
+
+    MODCODs that need at least the Es/N0 of a more efficient one are never the best
+    choice and are dropped, so that the efficiency increases along the table.
+
+    Parameters
+    ----------
+    table : pandas.DataFrame or str, optional
+        Columns 'name', 'es_n0' [dB] and 'efficiency' [bit/symbol], or a CSV file
+        with these columns. DVB_S2 by default
+
+    Returns
+    -------
+    pandas.DataFrame
+    '''
+    if table is None:
+        table = DVB_S2
+    elif not isinstance(table, pd.DataFrame):
+        table = pd.read_csv(table)
+
+    table = table.sort_values(['es_n0', 'efficiency'], ascending=[True, False])
+    efficiency = table['efficiency'].to_numpy()
+    best_before = np.maximum.accumulate(np.append(-np.inf, efficiency[:-1]))
+    return table[efficiency > best_before].reset_index(drop=True)
+
+
+def select_modcod(es_n0, table=None, implementation_margin=0.0):
+    '''Most efficient MODCOD for every Es/N0
+
+    Parameters
+    ----------
+    es_n0 : float or numpy.ndarray
+        Available Es/N0 in [dB]
+    table : pandas.DataFrame, optional
+        Output of modcod_table, modcod_table() by default
+    implementation_margin : float, default=0.0
+        Margin in [dB] kept on top of the required Es/N0
+
+    Returns
+    -------
+    numpy.ndarray
+        Row of table, -1 where no MODCOD closes
+    numpy.ndarray
+        Efficiency in [bit/symbol], zero where no MODCOD closes
+    '''
+    if table is None:
+        table = modcod_table()
+    required = table['es_n0'].to_numpy() + implementation_margin
+    idx = np.searchsorted(required, es_n0, side='right') - 1
+    efficiency = np.where(idx >= 0, table['efficiency'].to_numpy()[np.maximum(idx, 0)], 0.0)
+    return idx, efficiency
+
+
+def pass_data_volume(samples, symbol_rate, table=None, implementation_margin=0.0,
+                     fixed=None):
+    '''Data volume of every pass with ACM, and optionally with fixed MODCODs
+
+    Parameters
+    ----------
+    samples : pandas.DataFrame
+        Samples of project.passes.evaluate_passes (return_samples=True), of a budget
+        with a NOISE element. Any number of passes, e.g. weeks of passes of a network
+    symbol_rate : float
+        Symbol rate in [symbol/s]
+    table : pandas.DataFrame or str, optional
+        MODCOD table, see modcod_table. DVB_S2 by default
+    implementation_margin : float, default=0.0
+        Margin in [dB] kept on top of the required Es/N0
+    fixed : list of str, optional
+        Names of MODCODs (of the full table) to compare at a fixed rate
+
+    Raises
+    ------
+    ValueError:
+        If the samples have no C/N0, or a fixed MODCOD is not in the table
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per pass: 'acm_volume' in [byte], 'acm_time' in [s] (time during which
+        a MODCOD closes) and 'acm_mean_rate' in [bit/s] over that time, followed by
+        '<name> volume' in [byte] for every fixed MODCOD
+    '''
+    if 'c_n0' not in samples:
+        raise ValueError('Data volumes need the C/N0 of a budget with a NOISE element')
+
+    full = table if isinstance(table, pd.DataFrame) else \
+        (DVB_S2 if table is None else pd.read_csv(table))
+    acm = modcod_table(full)
+
+    pass_idx = samples['pass'].to_numpy()
+    passes = np.unique(pass_idx)
+    dt, starts = sample_durations(np.searchsorted(passes, pass_idx),
+                                  samples['time'].to_numpy(dtype=float), passes.size)
+    es_n0 = samples['c_n0'].to_numpy(dtype=float) - 10 * np.log10(symbol_rate)
+
+    idx, efficiency = select_modcod(es_n0, acm, implementation_margin)
+    bits = symbol_rate * efficiency * dt
+    acm_time = np.add.reduceat(dt * (idx >= 0), starts) if dt.size else np.empty(0)
+    acm_bits = np.add.reduceat(bits, starts) if dt.size else np.empty(0)
+    out = pd.DataFrame({'acm_volume': acm_bits / 8,
+                        'acm_time': acm_time,
+                        'acm_mean_rate': np.divide(acm_bits, acm_time, out=np.zeros_like(acm_bits),
+                                                   where=acm_time > 0)},
+                       index=pd.Index(passes, name='pass'))
+
+    if fixed:
+        rows = full.set_index('name')
+        missing = [name for name in fixed if name not in rows.index]
+        if missing:
+            raise ValueError(f'MODCOD(s) not in the table: {", ".join(missing)}')
+        required = rows.loc[fixed, 'es_n0'].to_numpy() + implementation_margin
+        rate = symbol_rate * rows.loc[fixed, 'efficiency'].to_numpy()
+
+        # All fixed MODCODs at once, one column each
+        bits = (es_n0[:, None] >= required) * rate * dt[:, None]
+        volume = np.add.reduceat(bits, starts, axis=0) if dt.size else np.empty((0, len(fixed)))
+        for name, col in zip(fixed, volume.T):
+            out[f'{name} volume'] = col / 8
+
+    return out
+
+
+if __name__ == '__main__':
+    import time
+    from pathlib import Path
+    from project.orbit import Orbit, GroundStation, R_EARTH
+    from project.passes import find_passes, evaluate_passes
+    from project.process import load_from_yaml
+    from project.settings import CONFIGS_DIR
+
+    data = load_from_yaml(Path(CONFIGS_DIR, 'Example_Delfi.yaml'))
+    data['elements']['Receiver Noise'] = {'gain_loss': None, 'idx': 20, 'link_type': 'NOISE',
+                                          'input_type': 'parameter_set_2',
+                                          'parameters': {'system_temperature': 500.0,
+                                                         'data_rate': 9.6,
+                                                         'required_eb_n0': 9.6}}
+    sc_orbit = Orbit(R_EARTH + 500e3, 0.001, 97.4, 0, 0, 0)
+    station = GroundStation(52.0, 4.36, 0)
+
+    start = time.perf_counter()
+    passes = find_passes(sc_orbit, station, 0, 28 * 86400, min_elevation=5)
+    summary, samples = evaluate_passes(data, sc_orbit, station, passes, return_samples=True)
+    volume = pass_data_volume(samples, symbol_rate=9600, fixed=['QPSK 1/2', '8PSK 3/4'])
+    print(f'{len(passes)} passes in {time.perf_counter() - start:.2f} s')
+    print(volume.sum())
@@ -13,19 +13,24 @@ from pathlib import Path
 
 import numpy as np
 import yaml
-from PyQt5 import QtWidgets, uic
-from PyQt5.QtCore import pyqtSlot
-from PyQt5.QtGui import QFont
+from PyQt5 import QtWidgets
+from PyQt5.QtCore import pyqtSlot, QModelIndex, QTimer, Qt
 from PyQt5.QtWidgets import QMainWindow, QFileDialog, QHeaderView, QLineEdit
 from loguru import logger
 
 from project.app.custom_objects import *
+from project.app.forms import load_form
 from project.app.new_element_dialog import NewElementDialog
+from project.app.plot_dock import PlotDock
+from project.app.portfolio_dock import PortfolioDock
 from project.app.rename_element_dialog import RenameElementDialog
-from project.process import main_process
-from project.settings import ELEMENT_REFERENCE, DEFAULT_LINK_CONFIG, CONFIGS_DIR, APP_UI_DIR
+from project.app.table_models import ElementReference, ElementTableModel, ResultsTableModel
+from project.app.worker import Worker, budget_job, preload
+from project.settings import ELEMENT_REFERENCE, DEFAULT_LINK_CONFIG, CONFIGS_DIR
 
-mainwindow_form_class = uic.loadUiType(Path(APP_UI_DIR, 'main_window.ui'))[0]
+mainwindow_form_class = load_form('main_window')
+
+LIVE_DELAY = 150    # [ms], time without edits before live results are updated
 
 
 class MainWindow(QMainWindow, mainwindow_form_class):
@@ -41,8 +46,9 @@ class MainWindow(QMainWindow, mainwindow_form_class):
     The layout and construction of each window or dialog is stored in the *.ui files,
     which are generated and modified using QtDesigner. The object names defined in QtDesigner
     automatically become class attributes here in Python, and can be used accordingly. These ui
-    files are dynamically loaded at each run and SHOULD NEVER BE MODIFIED DIRECTLY. Modifications
-    will be overwritten by QtDesigner.
+    files SHOULD NEVER BE MODIFIED DIRECTLY. Modifications will be overwritten by QtDesigner.
+    For a fast start, they are compiled to Python modules (see forms.py), which are only used
+    while they are up to date with the ui files.
 
     Signals/Slots:
     --------------
@@ -54,10 +60,33 @@ class MainWindow(QMainWindow, mainwindow_form_class):
     suffix of the method name. This clarifies for the developer which class methods are run by
     signals/slots and which are purely program logic.
 
+    Tables:
+    -------
+    The input and results tables are views of the configuration dictionary, through the
+    models of table_models.py. Edited values are stored in self.cfg_data directly, and only
+    changed rows are repainted.
+
+    Background Evaluation:
+    ----------------------
+    The analysis runs in a Worker (see worker.py) on a separate thread, so that the window
+    stays responsive. Results arrive through the signals of the worker and are displayed by
+    the '_finished' methods. Only one analysis runs at a time, and it can be cancelled.
+    The plots of the 'Plots' dock (plot_dock.py, shown from the View menu) run in the
+    same way. The 'Portfolio' dock (portfolio_dock.py) evaluates a folder of configurations
+    with a worker of its own, and opens a configuration in the editor when it is clicked.
+
+    Live Mode:
+    ----------
+    With 'Live' checked, the results follow the edits of the user. A short pause after the
+    last edit, only the gains of the edited elements and the totals are computed again,
+    with a CompiledBudget seeded with the results of the last analysis. Adding, removing,
+    renaming or reordering elements starts a new analysis in the background instead.
+
     App Setup:
     ----------
     File paths of the default configuration to be loaded or element_reference should be changed
-    in settings.py
+    in settings.py. They are loaded right after the window is shown (load_startup_config),
+    and the calculation modules are imported in the background meanwhile.
     """
 
     def __init__(self, **kwargs):
@@ -75,31 +104,97 @@ class MainWindow(QMainWindow, mainwindow_form_class):
         self.decimals = kwargs.pop('UI_decimal_accuracy', 2)
         self.default_cfg = DEFAULT_LINK_CONFIG
 
-        # Set initial values and general attributes
+        # Set initial values and general attributes, loaded by load_startup_config
         self.cfg_file = Path(self.default_cfg)
-        self.cfg_data = self.read_config()
-        self.element_details = self.read_config(file=ELEMENT_REFERENCE)
+        self.cfg_data = None
+        self.element_details = {}
 
         # TABLE SETUP
-        self.col_titles = ['Element Name', 'Attribute', 'Value', 'Units']
-        self.res_col_titles = ['Total GAIN', 'Value', 'Units']
-        self.name_col = 0
-        self.attribute_col = 1
-        self.value_col = 2
-        self.units_col = 3
-
-        # Load default configuration
-        self.fill_input_table()
-        self.fill_general_values()
+        self.reference = ElementReference(self.element_details)
+        self.element_model = ElementTableModel(self.reference, self.decimals, parent=self)
+        self.results_model = ResultsTableModel(self.reference, self.decimals, parent=self)
+        self.tbl_elements.setModel(self.element_model)
+        self.tbl_results.setModel(self.results_model)
+        self.name_col = ElementTableModel.name_col
+        self.value_col = ElementTableModel.value_col
+
+        for table in (self.tbl_elements, self.tbl_results):
+            table.verticalHeader().setVisible(False)
+            # Fit columns to the visible rows only, instead of every row of a large budget
+            table.horizontalHeader().setResizeContentsPrecision(0)
         header = self.tbl_elements.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(2, QHeaderView.Stretch)
         header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
+        header = self.tbl_results.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(1, QHeaderView.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
+
+        # Live mode, see live_update
+        self.live_budget = None     # CompiledBudget of the displayed results, None if outdated
+        self.live_edited = set()    # Elements edited since the last update
+        self.layout_version = 0     # Incremented for every change of the table layout
+        self.run_version = None     # layout_version of the last analysis started
+        self.live_timer = QTimer(self)
+        self.live_timer.setSingleShot(True)
+        self.live_timer.setInterval(LIVE_DELAY)
+        self.live_timer.timeout.connect(self.live_update)
+        self.element_model.value_edited.connect(self.element_value_edited)
 
         # Ensure only numerical values are entered in input fields
         self.set_lineedit_validators()
 
+        # Background analysis, None when idle
+        self.worker = None
+        self.prg_process.setVisible(False)
+
+        # Plots, hidden until chosen in the View menu
+        self.plot_dock = PlotDock(parent=self)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.plot_dock)
+        self.plot_dock.hide()
+        self.menu_View.addAction(self.plot_dock.toggleViewAction())
+        self.plot_dock.btn_plot.clicked.connect(self.plot_clicked)
+
+        # Summary of a folder of configurations, evaluated when first shown
+        self.portfolio_dock = PortfolioDock(self.decimals, parent=self)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.portfolio_dock)
+        self.tabifyDockWidget(self.plot_dock, self.portfolio_dock)
+        self.portfolio_dock.hide()
+        self.menu_View.addAction(self.portfolio_dock.toggleViewAction())
+        self.portfolio_dock.config_clicked.connect(self.open_config)
+
+        # Load default configuration once the window is shown
+        self.centralwidget.setEnabled(False)
+        QTimer.singleShot(0, self.load_startup_config)
+
+    def load_startup_config(self):
+        """Loads the element reference and the default configuration
+
+        Runs from the event loop once the window is shown, so that reading the files and
+        filling the tables does not delay its appearance. The calculation modules are
+        imported in the background meanwhile, see worker.preload.
+
+        Returns
+        -------
+        None
+        """
+        if self.cfg_data is not None:
+            return  # Already loaded
+
+        preload()
+
+        self.element_details = self.read_config(file=ELEMENT_REFERENCE)
+        self.reference = ElementReference(self.element_details)
+        self.element_model.reference = self.reference
+        self.results_model.reference = self.reference
+
+        self.cfg_data = self.read_config()
+        self.fill_input_table()
+        self.fill_general_values()
+        self.centralwidget.setEnabled(True)
+
     @staticmethod
     def W_to_dBm(W):
         """Converts Watts to Decibel-milliwatts
@@ -143,6 +238,22 @@ class MainWindow(QMainWindow, mainwindow_form_class):
         if file_path == '':
             return  # Dialog cancelled, Exit this
 
+        self.open_config(file_path)
+
+    def open_config(self, file_path):
+        """Loads a configuration file in the tables
+
+        Invalid files are reported to the user.
+
+        Parameters
+        ----------
+        file_path : str or Path
+            Configuration YAML file
+
+        Returns
+        -------
+        None
+        """
         self.cfg_file = Path(file_path)
         self.lbl_config_file.setText(self.cfg_file.name)
 
@@ -156,7 +267,7 @@ class MainWindow(QMainWindow, mainwindow_form_class):
         except Exception as E:
             logger.debug(f'Error loading file: {E}')
             logger.debug(traceback.format_exc())
-            if 'Configuration file' in E.args[0]:  # KeyError originates from self.read_config()
+            if E.args and 'Configuration file' in str(E.args[0]):  # KeyError from self.read_config()
                 msg = E.args[0]
                 showdialog(['Please select a valid YAML configuration file', '', msg])
             else:  # A different (unexpected) Exception
@@ -225,17 +336,14 @@ class MainWindow(QMainWindow, mainwindow_form_class):
         Deletes the selected table element
         """
         # Identify selected element
-        selected = self.tbl_elements.selectedItems()
-        if len(selected) == 0:
-            return  # quit because no rows selected
-
-        col_L = selected[0].column()
-        if col_L == 0:  # Element name must be selected, so user cant remove individual attributes
-            rows = sorted({cell.row() for cell in selected})
-            logger.debug(f'Removing rows: {rows}')
+        names = self.selected_element_names()
+        if not names:
+            return  # quit because no element names selected
 
-            for row in reversed(rows):  # Must remove from bottom up, else indexes gets confused
-                self.tbl_elements.removeRow(row)
+        logger.debug(f'Removing elements: {names}')
+        for name in names:
+            self.element_model.elements.pop(name)
+        self.fill_input_table(self.element_model.elements)
 
         # Save new table (without checking for completed values, allows new entries to be deleted)
         self.save_input_table(allow_blank=True)
@@ -244,8 +352,7 @@ class MainWindow(QMainWindow, mainwindow_form_class):
     def move_up_clicked(self):
         """PyQt Slot for 'Move Up' button"""
         # Identify selected element
-        selected = self.tbl_elements.selectedItems()
-        if len(selected) == 0:
+        if not self.selected_element_names():
             return  # quit because no rows selected
 
         self.shift_selected_elements(up=True)
@@ -254,22 +361,19 @@ class MainWindow(QMainWindow, mainwindow_form_class):
     def move_down_clicked(self):
         """PyQt Slot for 'Move Down' button"""
         # Identify selected element
-        selected = self.tbl_elements.selectedItems()
-        if len(selected) == 0:
+        if not self.selected_element_names():
             return  # quit because no rows selected
 
         self.shift_selected_elements(up=False)
 
-    @pyqtSlot(int, int)
-    def input_table_double_clicked(self, row, column):
+    @pyqtSlot(QModelIndex)
+    def input_table_double_clicked(self, index):
         '''PyQt Slot for input table double clicked
 
         Triggers methods based on row and/or column that is double clicked
-        The (row, column) signature must be kept, even if one of the args is
-        not used.
         '''
         # Double-click on name column should open rename dialog
-        if column == self.name_col:
+        if index.column() == self.name_col:
             self.rename_element()
 
     @pyqtSlot()
@@ -286,36 +390,56 @@ class MainWindow(QMainWindow, mainwindow_form_class):
         if not valid_data:
             return
 
-        # Update cfg_data elements
-        self.save_input_table()
+        self.start_analysis()
 
-        self.cfg_data = main_process(self.cfg_data)
+    @pyqtSlot()
+    def plot_clicked(self):
+        """PyQt Slot for 'Plot' button of the plots dock
 
-        # Convert any possible float64 values to float
-        for elem, data in self.cfg_data['elements'].items():
-            for attr, val in data.items():
-                try:
-                    self.cfg_data['elements'][elem][attr] = float(val)
-                except (ValueError, TypeError):
-                    pass  # Strings or None's do not need to be converted
+        Runs the chosen sweep, pass or Monte Carlo plot in the background
+        """
+        if self.worker is not None:
+            return  # Only one analysis at a time
 
-        for name, val in self.cfg_data['general_values'].items():
-            try:
-                self.cfg_data['general_values'][name] = float(val)
-            except (ValueError, TypeError):
-                pass  # Strings or None's do not need to be converted
+        if not self.validate_input_values():
+            return
+        self.save_input_table()
 
-        # Display intermediate gain results in table
-        self.fill_results_table(self.cfg_data['elements'])
+        job = self.plot_dock.build_job(self.cfg_data)
+        if job is not None:
+            self.start_worker(job, self.plot_dock.show_result)
 
-        # Display Final Values
-        margin = self.cfg_data['general_values']['total_margin']
-        output_power = self.cfg_data['general_values']['output_power']
+    @pyqtSlot()
+    def cancel_process_clicked(self):
+        """PyQt Slot for 'Cancel' button
 
-        self.txt_total.setText(f'{output_power:.{self.decimals}f}')
-        self.txt_margin.setText(f'{margin:.{self.decimals}f}')
+        Stops the running analysis after its current step. Its results are discarded
+        """
+        if self.worker is not None:
+            logger.debug('Cancelling analysis')
+            self.worker.cancel()
+            self.btn_cancel_process.setEnabled(False)
 
-        self.btn_save_results.setEnabled(True) # Enable save_results button
+    @pyqtSlot(bool)
+    def live_mode_toggled(self, checked):
+        """PyQt Slot for 'Live' checkbox
+
+        Updates the results right away, and from then on after every edit
+        """
+        self.live_budget = None  # Edits made meanwhile are not tracked
+        self.live_edited.clear()
+        if checked:
+            self.live_update()
+        else:
+            self.live_timer.stop()
+
+    def closeEvent(self, event):
+        """Stops a running analysis before the window closes"""
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker.wait()
+        self.portfolio_dock.stop(wait=True)
+        event.accept()
 
     @pyqtSlot()
     def save_config_clicked(self):
@@ -356,6 +480,10 @@ class MainWindow(QMainWindow, mainwindow_form_class):
 
         logger.debug(f"Config saved to {self.cfg_file}")
 
+        # Show the new results of the file if it is in the portfolio
+        if self.portfolio_dock.folder == self.cfg_file.parent:
+            self.portfolio_dock.refresh_clicked()
+
     @pyqtSlot()
     def input_power_W_edited(self):
         """PyQt Slot for 'Input Power [W]' QLineEdit
@@ -408,6 +536,193 @@ class MainWindow(QMainWindow, mainwindow_form_class):
         # Update self.cfg_data
         self.txt_threshold_dbm_changed()
 
+    def start_analysis(self):
+        """Saves the input table and runs the main process in the background"""
+        # Update cfg_data elements
+        self.save_input_table()
+
+        self.run_version = self.layout_version
+        self.live_edited.clear()    # Included in this analysis
+        self.start_worker(budget_job(self.cfg_data), self.process_finished)
+
+    def element_value_edited(self, name, param):
+        """Marks an element for the next live update, see live_update"""
+        self.live_edited.add(name)
+        self.schedule_live_update()
+
+    def schedule_live_update(self):
+        """(Re)starts the live update delay, if live mode is on
+
+        Successive edits within LIVE_DELAY result in a single update
+        """
+        if self.chk_live.isChecked():
+            self.live_timer.start()
+
+    def live_update(self):
+        """Updates the results after edits, in live mode
+
+        Only the gains of the edited elements are computed again, and only their rows of
+        the results table are repainted. Without a budget of the displayed results, e.g.
+        after elements were added or reordered, a new analysis is started instead.
+
+        Returns
+        -------
+        None
+        """
+        if not self.chk_live.isChecked() or self.cfg_data is None:
+            return  # Off, or started by load_startup_config
+        if self.live_budget is None:
+            if self.worker is not None:
+                return  # Retried when the running analysis has ended, see worker_done
+            if self.element_model.invalid_values():
+                self.statusbar.showMessage('Live: waiting for all values to be entered', 3000)
+                return
+            self.start_analysis()
+            return
+
+        edited, self.live_edited = self.live_edited, set()
+        for name in edited:
+            self.live_budget.invalidate(name)
+        try:
+            results = self.live_budget.evaluate({})
+        except Exception as E:
+            logger.debug(traceback.format_exc())
+            self.statusbar.showMessage(f'Live: {E}', 5000)
+            return
+
+        for name in edited:
+            gain = float(results[f'{name}.gain_loss'])
+            element = self.cfg_data['elements'][name]
+            if element['input_type'] != 'gain_loss':
+                element['gain_loss'] = gain
+            self.results_model.set_gain(name, gain)
+        for name, val in results.items():
+            if not name.endswith('.gain_loss'):
+                self.cfg_data['general_values'][name] = float(val)
+
+        self.show_totals(self.cfg_data['general_values'])
+
+    def start_worker(self, job, on_finished, on_partial=None):
+        """Runs a job in the background, see worker.py
+
+        The run button is disabled and the progress bar shown until the job ends.
+
+        Parameters
+        ----------
+        job : generator
+            Job to run, e.g. worker.budget_job(self.cfg_data)
+        on_finished : function
+            Called with the result of the job on the main thread
+        on_partial : function, optional
+            Called with a list of partial results on the main thread
+
+        Returns
+        -------
+        None
+        """
+        if self.worker is not None:
+            return  # Only one analysis at a time
+
+        self.worker = Worker(job)
+        self.worker.progress.connect(self.worker_progress)
+        self.worker.finished.connect(on_finished)
+        if on_partial is not None:
+            self.worker.partial.connect(on_partial)
+        self.worker.failed.connect(self.worker_failed)
+        self.worker.cancelled.connect(self.worker_cancelled)
+        for signal in (self.worker.finished, self.worker.failed, self.worker.cancelled):
+            signal.connect(self.worker_done)
+
+        self.btn_run_process.setEnabled(False)
+        self.btn_cancel_process.setEnabled(True)
+        self.prg_process.setRange(0, 0)  # Busy until the first progress update
+        self.prg_process.setVisible(True)
+        self.worker.start(parent=self)
+
+    def worker_progress(self, done, total):
+        """Updates the progress bar"""
+        self.prg_process.setRange(0, total)
+        self.prg_process.setValue(done)
+
+    def worker_failed(self, msg):
+        """Shows the traceback of a failed analysis"""
+        logger.debug(msg)
+        showdialog(['An unexpected error occurred while running the analysis', '', msg])
+
+    def worker_cancelled(self):
+        """Reports a cancelled analysis"""
+        self.statusbar.showMessage('Analysis cancelled', 3000)
+
+    def worker_done(self, *args):
+        """Resets the run controls once the background analysis has ended in any way"""
+        self.worker = None
+        self.btn_run_process.setEnabled(True)
+        self.btn_cancel_process.setEnabled(False)
+        self.prg_process.setVisible(False)
+
+        # Catch up with edits made during the analysis
+        if self.live_budget is not None or self.run_version != self.layout_version:
+            self.schedule_live_update()
+
+    def process_finished(self, results):
+        """Displays the results of the main process
+
+        Only the computed values are taken over in self.cfg_data, so that edits made
+        while the analysis was running are kept.
+
+        Parameters
+        ----------
+        results : dict
+            Configuration dictionary as returned by process.main_process
+
+        Returns
+        -------
+        None
+        """
+        # Convert any possible float64 values to float
+        for elem, data in results['elements'].items():
+            for attr, val in data.items():
+                try:
+                    results['elements'][elem][attr] = float(val)
+                except (ValueError, TypeError):
+                    pass  # Strings or None's do not need to be converted
+
+        for name, val in results['general_values'].items():
+            try:
+                results['general_values'][name] = float(val)
+            except (ValueError, TypeError):
+                pass  # Strings or None's do not need to be converted
+
+        for name, data in results['elements'].items():
+            element = self.cfg_data['elements'].get(name)
+            if element is not None and element['input_type'] != 'gain_loss':
+                element['gain_loss'] = data['gain_loss']
+        for name, val in results['general_values'].items():
+            if name not in ('input_power', 'rx_sys_threshold'):
+                self.cfg_data['general_values'][name] = val
+
+        # Display intermediate gain results in table
+        self.fill_results_table(results['elements'])
+
+        # Display Final Values
+        self.show_totals(results['general_values'])
+
+        self.btn_save_results.setEnabled(True) # Enable save_results button
+
+        # Seed live updates with these results, unless the table layout changed meanwhile
+        if self.chk_live.isChecked() and self.run_version == self.layout_version:
+            from project.batch import CompiledBudget   # Imported by the analysis already
+            gains = {name: data['gain_loss'] for name, data in results['elements'].items()}
+            self.live_budget = CompiledBudget(self.cfg_data, gains=gains)
+
+    def show_totals(self, general_values):
+        """Displays the output power and margin of a results dictionary"""
+        margin = general_values['total_margin']
+        output_power = general_values['output_power']
+
+        self.txt_total.setText(f'{output_power:.{self.decimals}f}')
+        self.txt_margin.setText(f'{margin:.{self.decimals}f}')
+
     def read_config(self, file=None):
         """Reads and loads YAML configuration file to a dictionary
 
@@ -469,6 +784,8 @@ class MainWindow(QMainWindow, mainwindow_form_class):
     def clear_table_elements(self, results=True):
         """Clears tables of contents and rows/columns
 
+        Does not modify self.cfg_data, the table is only saved to it by save_input_table
+
         Parameters
         ----------
         results : bool, default=True
@@ -479,8 +796,7 @@ class MainWindow(QMainWindow, mainwindow_form_class):
         None
         """
         # Clear Input Table
-        self.tbl_elements.clearContents()
-        self.tbl_elements.setRowCount(0)
+        self.fill_input_table({})
 
         # Clear input general values
         self.txt_in_power_dbm.clear()
@@ -490,9 +806,7 @@ class MainWindow(QMainWindow, mainwindow_form_class):
 
         if results:
             # Clear results table
-            self.tbl_results.clearContents()
-            self.tbl_results.setRowCount(0)
-            self.tbl_results.setColumnCount(0)
+            self.fill_results_table({})
 
             # Clear result general values (totals)
             self.txt_total.clear()
@@ -515,27 +829,18 @@ class MainWindow(QMainWindow, mainwindow_form_class):
         bool
             Whether all values are valid floats
         """
-        try:
-            # Iterate through all value cells
-            for r in range(self.tbl_elements.rowCount()):
-                val = self.tbl_elements.item(r, self.value_col).text()
-                if allow_blank and val == '':
-                    continue # Skip to next row
-                float(val)
-            return True # All values are valid
-
-        except ValueError:
+        if self.element_model.invalid_values(allow_blank=allow_blank):
             showdialog(['Please check that only numerical values are entered in the table'])
             return False
+        return True # All values are valid
 
     def save_input_table(self, allow_blank=False):
         """Save contents of Input Table to self.cfg_data dictionary
 
-        Converts PyQt Table to an 'elements' dictionary of the same format
-        as the input config file. This can be passed to the main process
-
-        NOTE: This method must be called explicitly by other methods and cannot
-        be bound to a cell-changed event, because of how new elements are generated
+        The table edits the elements dictionary it shows directly. Saving makes it the
+        'elements' of self.cfg_data, in the same format as the input config file, with
+        the indexes numbered in the order of the table. This can be passed to the main
+        process
 
         Parameters
         ----------
@@ -546,199 +851,64 @@ class MainWindow(QMainWindow, mainwindow_form_class):
         -------
         None
         """
-
-        def wrap_up_previous_element(elem_name, params):
-            """Saves previous parameters if they exist to overall element dictionary"""
-            if elem_name:  # Does not run for first element in table
-
-                if len(params) > 0:  # Checks if parameters contain any values
-                    data[elem_name]['parameters'] = params
-                else:
-                    # Saves parameters entry as null instead of empty dict a {key: empty dict}
-                    # pair is ignored when writing to yaml, but null values are not
-                    data[elem_name]['parameters'] = None
-
-                # if gain_loss is not already added, include the default value of None
-                if data[elem_name].get('gain_loss') is None:
-                    data[elem_name]['gain_loss'] = None
-
-        data = {}  # Empty dict to build
-        parameters = {}  # Parameter attributes that may be present in a link element
-        element_name = None  # The current element being read, initialized to none
-        idx = 0  # The position in the table of the element (1 = top element)
-
         # Check if ref_data in table is valid
         valid_data = self.validate_input_values(allow_blank=allow_blank)
         if not valid_data:
             return
 
-        # Walk through each row of the table to detect new elements and read attributes
-        for r in range(self.tbl_elements.rowCount()):
-            # Check if this row is a new element
-            elem_item = self.tbl_elements.item(r, self.name_col)
-            if isinstance(elem_item, ElementTableItem):
-                # First, wrap up previous element
-                wrap_up_previous_element(element_name, parameters)
-                parameters = {}
-
-                # Then, start constructing next element
-                idx += 1
-                element_name = elem_item.text()
-                link_type = elem_item.link_type
-                input_type = elem_item.input_type
-
-                data[element_name] = {'input_type': input_type,
-                                      'link_type': link_type,
-                                      'idx': idx}
-
-            # Use last defined element name for the remaining parameters, skip if not yet defined
-            if element_name:
-                attribute = self.tbl_elements.item(r, self.attribute_col)
-
-                # Extract attribute name, depending on how ref_data was inserted into cell
-                attribute_type = attribute.type
-                if attribute_type == 'gain_loss':
-                    name = 'gain_loss'
-                else:
-                    name = attribute.text()
-
-                # if strings are entered, this will raise a TypeError to be caught by the click
-                # action
-                value = self.tbl_elements.item(r, self.value_col).text()
-                if allow_blank and value == '':
-                    value = None
-
-                else:
-                    if value == '':
-                        value = 0
-
-                    value = float(value)
-
-                    if isinstance(value, str): # Sometimes previous line doesn't run, double check here
-                        value = float(value)
-
-                # Decide where to save name:value
-                if attribute_type == 'parameter':
-                    parameters[name] = value
-                else:
-                    data[element_name][name] = value
-
-        wrap_up_previous_element(element_name, parameters)
+        data = self.element_model.elements
+        for idx, (name, params) in enumerate(self.element_model.layout, start=1):
+            element = data[name]
+            element['idx'] = idx  # The position in the table of the element (1 = top element)
+
+            if allow_blank:  # Blank values of new elements are saved as null
+                for param in params:
+                    if self.element_model.value(name, param) == '':
+                        self.element_model.set_value(name, param, None)
+
+            if not element.get('parameters'):
+                # Saves parameters entry as null instead of empty dict a {key: empty dict}
+                # pair is ignored when writing to yaml, but null values are not
+                element['parameters'] = None
+            # if gain_loss is not already added, include the default value of None
+            element.setdefault('gain_loss', None)
 
         self.cfg_data['elements'] = data
 
-        self.fill_input_table()  # reload table with saved values (fills empty cells with 0)
+    def fill_input_table(self, elements=None):
+        """Show the elements stored in the cfg_data attribute in the input table
 
-    def fill_input_table(self):
-        """Populate table with elements in stored in the cfg_data attribute
+        The table consists of four columns: Element, Attribute, Value, Units. The name
+        of every element spans its rows.
 
-        This converts the ref_data dictionary elements to the necessary table items
-        The table consists of four columns: Element, Attribute, Value, Units
+        Parameters
+        ----------
+        elements : dict, default=self.cfg_data['elements']
+            Elements to show
 
         Returns
         -------
         None
         """
+        if elements is None:
+            elements = self.cfg_data['elements']  # Select sub-dictionary of elements from config
 
-        elements = self.cfg_data['elements']  # Select sub-dictionary of elements from config
+        self.element_model.set_elements(elements)
 
-        # Determine number of rows needed for table  rows are: name + gainloss + each parameter
-        n_rows = 0
-        for elem in elements.values():
-            try:
-                n_rows += len(elem['parameters'])
-            except (KeyError, TypeError):
-                # this link element has no parameters, so just a gain_loss
-                n_rows += 1
-
-        # Create empty table of correct size
-        self.tbl_elements.setColumnCount(len(self.col_titles))
-        self.tbl_elements.setRowCount(n_rows)
-
-        # Set row/column labels
-        self.tbl_elements.setHorizontalHeaderLabels(self.col_titles)
-        self.tbl_elements.verticalHeader().setVisible(False)
-
-        # Set Font of element titles
-        element_font = QFont()
-        element_font.setBold(True)
-
-        # Order elements according to their saved index
-        elements_ordered = {key: val for key, val in
-                            sorted(elements.items(), key=lambda item: item[1]['idx'])}
-
-        # Iterate through elements and add to rows
-        row = 0
-        for name, data in elements_ordered.items():
-            start_row = row
-
-            # ---------------------- Element Title ------------------------------------
-            # Create element title table item, containing other attributes needed later for saving
-            element_link_type = data['link_type']
-            element_input_type = data['input_type']
-            title = ElementTableItem(name,
-                                     link_type=element_link_type,
-                                     input_type=element_input_type)
-
-            # Set to format as specified above (bold)
-            title.setFont(element_font)
-            # Add title element to table
-            self.tbl_elements.setItem(row, self.name_col, title)
-
-            # ------------------------- Attributes ------------------------------------
-            if element_link_type == 'GENERIC':
-                units = self.get_attribute_details(data, gain=True)['units']
-                descr = self.get_attribute_details(data, gain=True)['description']
-
-                value = data['gain_loss']
-                if value is None:
-                    value = ''
-
-                self.tbl_elements.setItem(row, self.attribute_col,
-                                          AttributeTableItem('Gain',
-                                                             type='gain_loss',
-                                                             description=descr))
-                self.tbl_elements.setItem(row, self.value_col,
-                                          ValueTableItem(str(value)))
-                self.tbl_elements.setItem(row, self.units_col,
-                                          UnitsTableItem(units))
-                row += 1
-
-            else:  # If link element has parameters
-                # --------------------- Parameters
-                for param, val in data['parameters'].items():
-                    # get attribute details
-                    att_details = self.get_attribute_details(data, specific_parameter=param)
-                    units = att_details.get('units')
-                    descr = att_details.get('description')
-                    val_range = att_details.get('range')
-
-                    if val is None:
-                        val = ''
-
-                    try:
-                        value_text = f"{val:.{self.decimals}f}"
-                    except ValueError:
-                        # Occurs with new element where default value is ''
-                        value_text = val
-
-                    # Add attribute cells
-                    self.tbl_elements.setItem(row, self.attribute_col,
-                                              AttributeTableItem(param, description=descr))
-
-                    self.tbl_elements.setItem(row, self.value_col,
-                                              ValueTableItem(value_text, range=val_range))
-
-                    self.tbl_elements.setItem(row, self.units_col,
-                                              UnitsTableItem(units))
-                    row += 1
-
-            # Make name cell span all other rows
-            if (row - start_row) > 1:
-                self.tbl_elements.setSpan(start_row, self.name_col, row - start_row, 1)
-
-        # Show table
-        self.tbl_elements.show()
+        # Make name cell span all other rows
+        self.tbl_elements.clearSpans()
+        for start_row, n_rows in self.element_model.spans.values():
+            if n_rows > 1:
+                self.tbl_elements.setSpan(start_row, self.name_col, n_rows, 1)
+
+        # Parameters that can be plotted
+        general_values = self.cfg_data['general_values'] if self.cfg_data else {}
+        self.plot_dock.set_elements(elements, general_values, self.reference)
+
+        # The live budget no longer matches the elements
+        self.layout_version += 1
+        self.live_budget = None
+        self.schedule_live_update()
 
     def fill_general_values(self):
         """Fills input power and thershold receiver power fields
@@ -779,7 +949,7 @@ class MainWindow(QMainWindow, mainwindow_form_class):
 
         Only gain_loss values are added to this table. Each element is a span
         of rows to align with the input table, and the elements are in the same
-        order.
+        order. If the elements are the same as shown, only changed values are updated.
 
         Parameters
         ----------
@@ -790,65 +960,15 @@ class MainWindow(QMainWindow, mainwindow_form_class):
         -------
         None
         """
+        if not self.results_model.set_results(results_data):
+            return  # Same rows, no need to set the spans again
 
-        # Determine number of rows needed for table. Stored to dict of element_name: rows
-        n_rows = 0
-        elem_rows = {}
-        for name, elem in results_data.items():
-            try:
-                rows = len(elem['parameters'])
-            except (
-                    KeyError,
-                    TypeError):  # this link element has no parameters, so just a gain_loss
-                rows = 1
-            elem_rows[name] = rows
-            n_rows += rows
-
-        # Create empty table of correct size
-        self.tbl_results.setColumnCount(len(self.res_col_titles))
-        self.tbl_results.setRowCount(n_rows)
-
-        # Set row/column labels
-        self.tbl_results.setHorizontalHeaderLabels(self.res_col_titles)
-        self.tbl_results.verticalHeader().setVisible(False)
-
-        title_font = QFont()
-        title_font.setBold(True)
-
-        # Order elements according to their saved index
-        elements_ordered = {key: val for key, val in
-                            sorted(results_data.items(), key=lambda item: item[1]['idx'])}
-
-        row = 0
-        for name, data in elements_ordered.items():
-            start_row = row
-
-            # Load these from element_config_reference for consistency, so it can be changed elsewhere
-            units = self.get_attribute_details(data, gain=True)['units']
-            descr = self.get_attribute_details(data, gain=True)['description']
-
-            gain_item = QTableWidgetItem(f"{data['gain_loss']:.{self.decimals}f}")
-            gain_item.setFlags(QtCore.Qt.ItemIsEnabled)
-
-            title = AttributeTableItem(f'{name}', description=descr)
-            title.setFont(title_font)
-            self.tbl_results.setItem(row, 0, title)
-            self.tbl_results.setItem(row, 1, gain_item)
-            self.tbl_results.setItem(row, 2, UnitsTableItem(units))
-
-            # Make cells span all other rows of this element
-            for r in range(len(self.res_col_titles)):
-                if elem_rows[name] > 1:
-                    self.tbl_results.setSpan(start_row, r, elem_rows[name], 1)
-
-            row += elem_rows[name]
-
-        # Show table
-        self.tbl_results.show()
-        header = self.tbl_results.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
+        # Make cells span all other rows of this element
+        self.tbl_results.clearSpans()
+        for start_row, n_rows in self.results_model.spans.values():
+            if n_rows > 1:
+                for col in range(self.results_model.columnCount()):
+                    self.tbl_results.setSpan(start_row, col, n_rows, 1)
 
     def get_attribute_details(self, element, specific_parameter=None, gain=False):
         """Gets details about an element's parameters
@@ -958,25 +1078,17 @@ class MainWindow(QMainWindow, mainwindow_form_class):
         # Save current table (in case some values have been changed)
         self.save_input_table(allow_blank=True)
 
-        selected = self.tbl_elements.selectedRanges() # Identify selected elements
-
-        self.tbl_elements.clearSpans() # Clear multi-row spans of element titles
-
-        rows = {cell.topRow() for cell in selected} # Create set of rows to move (no duplicates)
+        names = self.selected_element_names() # Identify selected elements
 
         for elem in self.cfg_data['elements'].values():
             elem['idx'] *= 2  # multiply indexes of all by two, to allow space for item to shift
 
-        # Iterate through all selected rows, and modify 'idx' if cell contains element title
-        for row in rows:
-            elem_item = self.tbl_elements.item(row, self.name_col)
-            if isinstance(elem_item, ElementTableItem): # new element
-                name = elem_item.text()
-
-                if up:
-                    self.cfg_data['elements'][name]['idx'] -= 3
-                else:
-                    self.cfg_data['elements'][name]['idx'] += 3
+        # Modify 'idx' of the selected elements
+        for name in names:
+            if up:
+                self.cfg_data['elements'][name]['idx'] -= 3
+            else:
+                self.cfg_data['elements'][name]['idx'] += 3
 
         # Reset index counting to 1,2,3,4
         idx = 1
@@ -1001,34 +1113,44 @@ class MainWindow(QMainWindow, mainwindow_form_class):
         -------
         None
         """
-        selected = self.tbl_elements.selectedRanges()
-        if len(selected) == 0:
-            return  # quit because no rows selected
+        # Ensure the left column (element name) is selected
+        names = self.selected_element_names()
+        if not names:
+            return  # quit because no element names selected
 
         # Get existing names, (cannot have a duplicate, due to dictionary structure)
         existing_element_names = [name.lower() for name in self.cfg_data['elements'].keys()]
 
-        # Ensure the left column (element name) is selected
-        col_L = selected[0].leftColumn()
-        if col_L == 0:
-            # Get current name
-            old_name = self.tbl_elements.item(selected[0].topRow(), self.name_col).text()
+        # Get current name
+        old_name = names[0]
+
+        # Open dialog, passing current and existing names of all other elements
+        dlg = RenameElementDialog(old_name, existing_element_names)
+        accepted = dlg.exec()
 
-            # Open dialog, passing current and existing names of all other elements
-            dlg = RenameElementDialog(old_name, existing_element_names)
-            accepted = dlg.exec()
+        if accepted: # New name is not same as old and does not yet exist
+            new_name = dlg.txt_name.text()
 
-            if accepted: # New name is not same as old and does not yet exist
-                new_name = dlg.txt_name.text()
+            # Remove current element from config
+            old_elem = self.cfg_data['elements'].pop(old_name)
 
-                # Remove current element from config
-                old_elem = self.cfg_data['elements'].pop(old_name)
+            # Re-add current element to config under new name
+            self.cfg_data['elements'][new_name] = old_elem
 
-                # Re-add current element to config under new name
-                self.cfg_data['elements'][new_name] = old_elem
+            # Reload input table
+            self.fill_input_table()
+
+    def selected_element_names(self):
+        """Names of the elements whose name cell is selected in the input table
 
-                # Reload input table
-                self.fill_input_table()
+        Returns
+        -------
+        list of str
+            In order of the table
+        """
+        rows = {index.row() for index in self.tbl_elements.selectionModel().selectedIndexes()
+                if index.column() == self.name_col}
+        return [self.element_model.element_at(row) for row in sorted(rows)]
 
     def sync_input_fields(self, in_field, out_field, convert_fn, sigfigs=4):
         """Updates the text in one QLineEdit field based on another field
@@ -1078,6 +1200,7 @@ class MainWindow(QMainWindow, mainwindow_form_class):
         """
         threshold = float(self.txt_threshold_dbm.text())
         self.cfg_data['general_values']['rx_sys_threshold'] = threshold
+        self.schedule_live_update()
 
     def txt_in_power_dbm_changed(self):
         """Automatically update self.cfg_data with new input power
@@ -1091,6 +1214,7 @@ class MainWindow(QMainWindow, mainwindow_form_class):
         """
         power = float(self.txt_in_power_dbm.text())
         self.cfg_data['general_values']['input_power'] = power
+        self.schedule_live_update()
 
 
 
@@ -9,7 +9,6 @@ author: Luigi Maiorano
 
 from PyQt5 import QtCore, QtGui
 from PyQt5.QtGui import QDoubleValidator
-from PyQt5.QtWidgets import QTableWidgetItem
 from PyQt5.QtWidgets import QMessageBox
 
 
@@ -82,122 +81,3 @@ class NotEmptyNumericValidator(QDoubleValidator):
             text = ''
             state = QtGui.QValidator.Acceptable
         return state, text, pos
-
-
-class ElementTableItem(QTableWidgetItem):
-    def __init__(self, *args, **kwargs):
-        '''Custom TableWidgetItem to allow other attributes to be stored.
-
-        This is necessary so that additional link element properties can be saved
-        in the ref_data dictionary which is passed to the main process
-        '''
-        self.link_type = kwargs.pop('link_type', 'gain_loss')
-        self.input_type = kwargs.pop('input_type', 'GENERIC')
-        super().__init__(*args, **kwargs)
-        self.setToolTip(f'Type: {self.link_type}')
-
-        # not directly editable to prevent duplicate naming
-        self.setFlags(QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable)
-
-
-class AttributeTableItem(QTableWidgetItem):
-    def __init__(self, *args, **kwargs):
-        '''Custom TableWidgetItem to allow other attributes to be stored.
-
-        This is necessary so that additional link element properties can be saved
-        in the ref_data dictionary which is passed to the main process
-
-        Parameters
-        ----------
-        type : str, optional
-            Whether the attribute is a 'parameter', or 'gain_loss'
-        description: str, optional
-            Description of the attribute to show as a tooltip
-        '''
-        self.type = kwargs.pop('type', 'parameter')
-        self.description = kwargs.pop('description', 'Link element attribute')
-        super().__init__(*args, **kwargs)
-        self.setToolTip(self.description)
-
-        self.setFlags(QtCore.Qt.ItemIsEnabled) # not selectable or editable
-
-
-class ValueTableItem(QTableWidgetItem):
-    def __init__(self, *args, **kwargs):
-        '''Custom TableWidgetItem to allow other attributes to be stored.
-
-        This is necessary so that additional link element properties can be saved
-        in the ref_data dictionary which is passed to the main process
-        '''
-        self.range_raw = kwargs.pop('range', None)
-        self.range_msg = ''
-        self.bounds = self.eval_range()
-        super().__init__(*args, **kwargs)
-
-
-    def eval_range(self):
-        range_raw = self.range_raw
-        if range_raw is None:
-            return None
-
-        bounds = {}
-        L, R = range_raw.replace(' ', '').split(',')
-
-        # Left bound
-        if L[0] == '(':
-            bounds['left'] = L[1:] + ' <'
-        else:
-            bounds['left'] = L[1:] + ' <='
-
-        # Right Bound
-        if R[-1] == ')':
-            bounds['right'] = '< ' + R[:-1]
-        else:
-            bounds['right'] = '<= ' + R[:-1]
-
-        self.range_msg = self.format_range(bounds.copy()) # this can be used for information dialogs
-
-
-        # convert inf to float("inf") which can be evaluated
-        for k, v in bounds.items():
-            bounds[k] = v.replace('inf', 'float("inf")')
-
-        return bounds
-
-    @staticmethod
-    def format_range(b_dict):
-        for k, v in b_dict.items():
-            if 'inf' in v:
-                b_dict[k] = ''
-
-        return f"{b_dict['left']} Value {b_dict['right']}"
-
-
-    def setData(self, role: int, value) -> None:
-        # check input
-        try:
-            val_in = float(value)
-        except ValueError:
-            showdialog(['Only numerical values are allowed'], level='information')
-        else:
-            if self.bounds is None:
-                super().setData(role, value)
-
-            elif eval(f'{self.bounds["left"]} {val_in}') and eval(f'{val_in} {self.bounds["right"]}'):
-                super().setData(role, value)
-
-            else:
-                showdialog([f'Entered value is not valid \n\n'
-                            f'Required interval:\n{self.range_msg}'], level='information')
-
-
-class UnitsTableItem(QTableWidgetItem):
-    def __init__(self, *args, **kwargs):
-        '''Custom TableWidgetItem to allow other attributes to be stored.
-
-        This is necessary so that additional link element properties can be saved
-        in the ref_data dictionary which is passed to the main process
-        '''
-        super().__init__(*args, **kwargs)
-        self.setFlags(QtCore.Qt.ItemIsEnabled) # not selectable or editable
-
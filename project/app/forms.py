@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+title: forms.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Form classes of the QtDesigner files in project/app/ui.
+
+Parsing a .ui file with uic.loadUiType at every start of the application is slow, so the
+forms are compiled to Python modules beforehand (project/app/ui/<name>_ui.py). Each module
+records the hash of the .ui file it was compiled from. If the .ui file was modified
+since, e.g. in QtDesigner, or the module does not exist, the form is loaded from the .ui
+file at runtime instead, so editing the .ui files works as before.
+
+After modifying a .ui file, compile the modules again from the repository root:
+    python -m project.app.forms
+"""
+import hashlib
+import importlib
+import io
+import re
+from pathlib import Path
+
+from loguru import logger
+
+from project.settings import APP_UI_DIR, BASE_DIR
+
+UI_PACKAGE = 'project.app.ui'
+
+
+def ui_hash(ui_file):
+    '''SHA-1 hash of the contents of a .ui file, independent of its line endings'''
+    return hashlib.sha1(Path(ui_file).read_bytes().replace(b'\r\n', b'\n')).hexdigest()
+
+
+def load_form(name):
+    '''Form class of a QtDesigner file
+
+    Parameters
+    ----------
+    name : str
+        Name of the .ui file in APP_UI_DIR, without extension, e.g. 'main_window'
+
+    Returns
+    -------
+    type
+        Form class with setupUi(), as the first item returned by uic.loadUiType
+    '''
+    ui_file = Path(APP_UI_DIR, f'{name}.ui')
+    try:
+        module = importlib.import_module(f'{UI_PACKAGE}.{name}_ui')
+        if module.UI_HASH == ui_hash(ui_file):
+            return module.FORM_CLASS
+        logger.debug(f'{name}_ui.py is outdated, loading {ui_file.name}')
+    except (ImportError, AttributeError):
+        logger.debug(f'{name}_ui.py not found, loading {ui_file.name}')
+
+    from PyQt5 import uic
+    return uic.loadUiType(ui_file)[0]
+
+
+def compile_form(name):
+    '''Compiles a QtDesigner file to a Python module, see load_form
+
+    Parameters
+    ----------
+    name : str
+        Name of the .ui file in APP_UI_DIR, without extension
+
+    Returns
+    -------
+    Path
+        File path of the module
+    '''
+    from PyQt5 import uic
+
+    ui_file = Path(APP_UI_DIR, f'{name}.ui')
+    py_file = Path(APP_UI_DIR, f'{name}_ui.py')
+
+    code = io.StringIO()
+    uic.compileUi(str(ui_file), code)
+    # Refer to the .ui file by its path in the repository, not on this computer
+    code = code.getvalue().replace(str(ui_file), ui_file.relative_to(BASE_DIR).as_posix())
+    class_name = re.search(r'^class (\w+)\(object\):', code, re.MULTILINE).group(1)
+
+    with open(py_file, 'w') as f:
+        f.write(code)
+        f.write(f'\n\nFORM_CLASS = {class_name}\n'
+                f'UI_HASH = {ui_hash(ui_file)!r}\n')
+    return py_file
+
+
+def compile_forms():
+    '''Compiles every QtDesigner file in APP_UI_DIR'''
+    for ui_file in sorted(Path(APP_UI_DIR).glob('*.ui')):
+        print(f'{ui_file.name} -> {compile_form(ui_file.stem).name}')
+
+
+if __name__ == '__main__':
+    compile_forms()
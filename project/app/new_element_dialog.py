@@ -7,15 +7,13 @@ date: 17/05/2021
 author: Nicolas Fosseprez
 """
 
-from PyQt5 import QtWidgets, uic, QtCore
 from PyQt5.QtWidgets import QDialog
 from project.app.custom_objects import showdialog
+from project.app.forms import load_form
 from loguru import logger
-from pathlib import Path
-from project.settings import APP_UI_DIR
 
 
-newelement_form_class = uic.loadUiType(Path(APP_UI_DIR, 'new_element.ui'))[0]
+newelement_form_class = load_form('new_element')
 
 class NewElementDialog(QDialog, newelement_form_class):
     ''' Dialog window when creating a New Element in the LinkBudget Toolbox
@@ -0,0 +1,343 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+title: plot_dock.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Plots dock of the main window: the link margin versus one or two swept values, over a
+pass of a satellite, or as histogram of a Monte Carlo run.
+
+The dock only builds the jobs and shows their results. The main window runs them in its
+background worker (see worker.py), like the analysis, so the window stays responsive and
+the progress bar and cancel button apply to the plots as well.
+"""
+import numpy as np
+from PyQt5.QtCore import pyqtSlot
+from PyQt5.QtWidgets import QDockWidget
+
+from project.app.custom_objects import showdialog
+from project.app.forms import load_form
+from project.app.table_models import in_range
+from project.app.worker import batch_job, histogram_job, pass_job
+
+plotdock_form_class = load_form('plot_dock')
+
+SWEEP, SWEEP_2D, MONTE_CARLO, PASS = range(4)     # Items of cmb_plot_type
+MAX_GRID = 2**22    # Maximum number of values of a 2-D sweep, far more than screen pixels
+GENERAL_COLUMNS = {'input_power': 'Input Power', 'rx_sys_threshold': 'Receiver Threshold'}
+
+
+def sweep_columns(elements, reference):
+    '''Scenario columns of a configuration that can be varied in a plot
+
+    Parameters
+    ----------
+    elements : dict
+        Elements of a configuration dictionary
+    reference : ElementReference
+        Details of the attributes
+
+    Returns
+    -------
+    dict
+        {column name: (label, units, bounds)} in order of the table, followed by the
+        input power and threshold. See table_models.parse_range for the bounds
+    '''
+    columns = {}
+    for name, element in sorted(elements.items(), key=lambda item: item[1]['idx']):
+        params = element.get('parameters')
+        if element['link_type'] == 'GENERIC' or not params:
+            details = reference.attribute(element['link_type'], element['input_type'])
+            columns[f'{name}.gain_loss'] = (f'{name} Gain', details['units'], None)
+            continue
+        for param in params:
+            details = reference.attribute(element['link_type'], element['input_type'], param)
+            if details['units'] != 'path':
+                columns[f'{name}.{param}'] = (f'{name} {param}', details['units'],
+                                              details['bounds'])
+    for column, label in GENERAL_COLUMNS.items():
+        columns[column] = (label, 'dBm', None)
+    return columns
+
+
+def clip_to_bounds(values, bounds):
+    '''Clips values into an interval of parse_range, just inside open limits'''
+    if bounds is None:
+        return values
+    lower, lower_closed, upper, upper_closed, _ = bounds
+    if not lower_closed:
+        lower = np.nextafter(lower, np.inf)
+    if not upper_closed:
+        upper = np.nextafter(upper, -np.inf)
+    return np.clip(values, lower, upper)
+
+
+def default_range(value, bounds):
+    '''Sweep range around a configured value, within the valid interval
+
+    Parameters
+    ----------
+    value : float or None
+        Configured value
+    bounds : tuple or None
+        See table_models.parse_range
+
+    Returns
+    -------
+    tuple
+        (start, stop)
+    '''
+    value = 0.0 if value is None else float(value)
+    span = max(abs(value) * 0.5, 1.0)
+    start, stop = clip_to_bounds(np.array([value - span, value + span]), bounds)
+    return float(start), float(stop)
+
+
+class PlotDock(QDockWidget, plotdock_form_class):
+    """Dock with the settings and plot of a sweep, pass or Monte Carlo run
+
+    Usage:
+        job = dock.build_job(user_data)     # None if a setting is invalid
+        ... run the job, and pass its result to dock.show_result
+    """
+    def __init__(self, parent=None):
+        """
+        Parameters
+        ----------
+        parent : QWidget, optional
+        """
+        super().__init__(parent=parent)
+        self.setupUi(self)
+
+        self.columns = {}           # see sweep_columns
+        self.elements = {}
+        self.general_values = {}
+        self.pending = None         # Settings of the plot being computed
+        self.plot_type_changed(self.cmb_plot_type.currentIndex())
+        self.plot.clear('Choose a plot and press Plot')
+
+    def set_elements(self, elements, general_values, reference):
+        """Updates the parameters to choose from, keeping the selected ones
+
+        Parameters
+        ----------
+        elements : dict
+            Elements of the configuration, as shown in the input table
+        general_values : dict
+            General values of the configuration
+        reference : ElementReference
+            Details of the attributes
+        """
+        self.elements, self.general_values = elements, general_values
+        self.columns = sweep_columns(elements, reference)
+        for combo, update in ((self.cmb_x_param, self.x_param_changed),
+                              (self.cmb_y_param, self.y_param_changed),
+                              (self.cmb_mc_param, None)):
+            selected = combo.currentData()
+            combo.blockSignals(True)
+            combo.clear()
+            for column, (label, units, _) in self.columns.items():
+                combo.addItem(f'{label} [{units}]', column)
+            idx = combo.findData(selected)
+            if idx >= 0:
+                combo.setCurrentIndex(idx)
+            else:   # Y differs from X by default
+                combo.setCurrentIndex(int(combo is self.cmb_y_param and combo.count() > 1))
+            combo.blockSignals(False)
+            if idx < 0 and update is not None:
+                update()
+
+    def current_value(self, column):
+        """Configured value of a scenario column, None if blank"""
+        if column in GENERAL_COLUMNS:
+            return self.general_values.get(column)
+        name, attribute = column.rsplit('.', 1)
+        element = self.elements[name]
+        value = element['gain_loss'] if attribute == 'gain_loss' \
+            else element['parameters'][attribute]
+        return None if value in ('', None) else float(value)
+
+    @pyqtSlot(int)
+    def plot_type_changed(self, index):
+        """PyQt Slot for the plot type, shows its settings"""
+        page = {SWEEP: self.page_sweep, SWEEP_2D: self.page_sweep,
+                MONTE_CARLO: self.page_monte_carlo, PASS: self.page_pass}[index]
+        self.stk_settings.setCurrentWidget(page)
+        for widget in (self.lbl_y, self.cmb_y_param, self.txt_y_start, self.txt_y_stop,
+                       self.spn_y_points):
+            widget.setVisible(index == SWEEP_2D)
+
+    @pyqtSlot()
+    def x_param_changed(self):
+        """PyQt Slot for the X parameter, proposes a range around its value"""
+        self._fill_range(self.cmb_x_param, self.txt_x_start, self.txt_x_stop)
+
+    @pyqtSlot()
+    def y_param_changed(self):
+        """PyQt Slot for the Y parameter, proposes a range around its value"""
+        self._fill_range(self.cmb_y_param, self.txt_y_start, self.txt_y_stop)
+
+    def _fill_range(self, combo, txt_start, txt_stop):
+        column = combo.currentData()
+        if column is None:
+            return
+        start, stop = default_range(self.current_value(column), self.columns[column][2])
+        txt_start.setText(f'{start:.6g}')
+        txt_stop.setText(f'{stop:.6g}')
+
+    def build_job(self, user_data):
+        """Job of the chosen plot, see worker.py
+
+        Invalid settings are reported to the user.
+
+        Parameters
+        ----------
+        user_data : dict
+            Configuration dictionary, with valid values
+
+        Returns
+        -------
+        generator or None
+            None if a setting is invalid
+        """
+        plot_type = self.cmb_plot_type.currentIndex()
+        try:
+            if plot_type in (SWEEP, SWEEP_2D):
+                x = self._sweep(self.cmb_x_param, self.txt_x_start, self.txt_x_stop,
+                                self.spn_x_points)
+                columns = {self.cmb_x_param.currentData(): x}
+                self.pending = {'type': plot_type, 'x': x,
+                                'x_label': self.axis_label(self.cmb_x_param.currentData())}
+                if plot_type == SWEEP:
+                    return batch_job(user_data, columns)
+
+                y = self._sweep(self.cmb_y_param, self.txt_y_start, self.txt_y_stop,
+                                self.spn_y_points)
+                if self.cmb_y_param.currentData() == self.cmb_x_param.currentData():
+                    raise ValueError('Choose two different parameters for X and Y')
+                if x.size * y.size > MAX_GRID:
+                    raise ValueError(f'A 2-D sweep can have at most {MAX_GRID} values, '
+                                     f'please reduce the number of points')
+                columns = {self.cmb_x_param.currentData(): x[:, None],
+                           self.cmb_y_param.currentData(): y[None, :]}
+                self.pending.update(y=y, y_label=self.axis_label(self.cmb_y_param.currentData()))
+                return batch_job(user_data, columns)
+
+            if plot_type == MONTE_CARLO:
+                column = self.cmb_mc_param.currentData()
+                mean = self.current_value(column)
+                sigma = self._float(self.txt_mc_sigma, 'Standard deviation')
+                if mean is None or sigma <= 0:
+                    raise ValueError('The parameter needs a value and a positive deviation')
+                samples = np.random.default_rng().normal(mean, sigma,
+                                                         self.spn_mc_samples.value())
+                samples = clip_to_bounds(samples, self.columns[column][2])
+                self.pending = {'type': plot_type, 'column': column, 'sigma': sigma}
+                return histogram_job(user_data, {column: samples},
+                                     bins=self.spn_mc_bins.value())
+
+            from project.orbit import GroundStation, Orbit, R_EARTH
+            altitude = self._float(self.txt_altitude, 'Orbit altitude')
+            orbit = Orbit(R_EARTH + altitude * 1e3, 0.0,
+                          self._float(self.txt_inclination, 'Inclination'), 0.0, 0.0, 0.0)
+            station = GroundStation(self._float(self.txt_latitude, 'Station latitude'),
+                                    self._float(self.txt_longitude, 'Station longitude'))
+            min_elevation = self._float(self.txt_min_elevation, 'Elevation mask')
+            self.pending = {'type': plot_type, 'min_elevation': min_elevation}
+            return pass_job(user_data, orbit, station, min_elevation)
+
+        except ValueError as E:
+            showdialog([str(E)], level='information')
+            return None
+
+    @staticmethod
+    def _float(field, name):
+        try:
+            return float(field.text())
+        except ValueError:
+            raise ValueError(f'{name}: only numerical values are allowed')
+
+    def _sweep(self, combo, txt_start, txt_stop, spn_points):
+        column = combo.currentData()
+        if column is None:
+            raise ValueError('There are no parameters to sweep')
+        label, _, bounds = self.columns[column]
+        start, stop = self._float(txt_start, 'From'), self._float(txt_stop, 'To')
+        if not (in_range(start, bounds) and in_range(stop, bounds)):
+            raise ValueError(f'{label}: values are not valid\n\n'
+                             f'Required interval:\n{bounds[-1]}')
+        return np.linspace(start, stop, spn_points.value())
+
+    def axis_label(self, column):
+        """Label of a scenario column with its units"""
+        label, units, _ = self.columns[column]
+        return f'{label} [{units}]'
+
+    def show_result(self, result):
+        """Plots the result of a job of build_job
+
+        Parameters
+        ----------
+        result : object
+            Result of the job
+        """
+        pending, self.pending = self.pending, None  # Settings at the time of build_job
+        if pending is None:
+            return
+        plot_type = pending['type']
+
+        if plot_type == SWEEP:
+            margin = np.broadcast_to(result['total_margin'], pending['x'].shape)
+            self.plot.set_line(pending['x'], margin, (pending['x_label'], 'Margin [dB]'),
+                               f'Margin over {pending["x"].size} values', reference=0.0)
+
+        elif plot_type == SWEEP_2D:
+            x, y = pending['x'], pending['y']
+            margin = np.broadcast_to(result['total_margin'], (x.size, y.size))
+            self.plot.set_heatmap(margin, (x[0], x[-1]), (y[0], y[-1]),
+                                  (pending['x_label'], pending['y_label']),
+                                  f'Margin over {x.size} x {y.size} values', 'Margin [dB]')
+
+        elif plot_type == MONTE_CARLO:
+            margin = np.ravel(result['results']['total_margin'])
+            closed = np.mean(margin <= 0)   # margin = threshold - output power
+            self.plot.set_histogram(result['counts'], result['edges'],
+                                    ('Margin [dB]', 'Samples'),
+                                    f'{margin.size} samples, link closes in {closed:.1%}',
+                                    reference=0.0)
+
+        elif result is None:
+            self.plot.clear(f'No pass above {pending["min_elevation"]:g} deg within a day')
+
+        else:
+            t = result['time'].to_numpy()
+            self.plot.set_line(t - t[0], result['total_margin'].to_numpy(),
+                               ('Time since AOS [s]', 'Margin [dB]'),
+                               f'First pass at {t[0] / 3600:.2f} h, peak elevation '
+                               f'{result["elevation"].max():.1f} deg', reference=0.0)
+
+
+if __name__ == '__main__':
+    import sys
+    from PyQt5.QtWidgets import QApplication
+    from project.app.table_models import ElementReference
+    from project.process import load_from_yaml
+    from project.settings import DEFAULT_LINK_CONFIG, ELEMENT_REFERENCE
+
+    app = QApplication(sys.argv)
+    data = load_from_yaml(DEFAULT_LINK_CONFIG)
+    dock = PlotDock()
+    dock.set_elements(data['elements'], data['general_values'],
+                      ElementReference(load_from_yaml(ELEMENT_REFERENCE)))
+
+    # Runs the job without a worker
+    job = dock.build_job(data)
+    try:
+        while True:
+            next(job)
+    except StopIteration as stop:
+        dock.show_result(stop.value)
+    dock.show()
+    app.exec()
@@ -0,0 +1,479 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+title: plots.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Plots of the User Interface, drawn with QPainter.
+
+A series of millions of points cannot be drawn point by point in the time of a frame,
+and does not need to: a screen only shows a few thousand pixel columns. Before drawing,
+the visible part of a series is reduced to the minimum and maximum of every pixel column
+(minmax_downsample). A line through these points covers exactly the same pixels as the
+full series, so peaks and dips (e.g. the worst margin of a sweep) are never lost, unlike
+with decimation. Because only the visible part is reduced, zooming in shows full detail.
+
+Heatmaps of 2-D sweeps are mapped to 8-bit colour indices with NumPy and wrapped in a
+QImage without drawing the cells one by one (heatmap_image).
+"""
+import numpy as np
+from PyQt5.QtCore import QPointF, QRectF, Qt
+from PyQt5.QtGui import QColor, QImage, QPainter, QPen, QPolygonF
+from PyQt5.QtWidgets import QSizePolicy, QWidget
+
+# Anchor colours of the heatmap colour scale, from low to high values (viridis)
+COLOR_SCALE = ['#440154', '#3b528b', '#21918c', '#5ec962', '#fde725']
+LINE_COLOR = '#1f77b4'
+ZOOM_STEP = 1.25    # Zoom factor of one step of the mouse wheel
+
+
+def minmax_downsample(x, y, n_bins, x_range=None):
+    '''Reduces a series to the minimum and maximum of equal bins, in their original order
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        Sorted 1-D coordinates
+    y : numpy.ndarray
+        Values at x
+    n_bins : int
+        Number of bins, e.g. the width of the plot in pixels
+    x_range : tuple, optional
+        (min, max) of x to keep, e.g. the visible range. One point on either side is
+        kept, so that the line continues outside the plot
+
+    Returns
+    -------
+    numpy.ndarray, numpy.ndarray
+        At most 2 * n_bins points. NaN values are skipped
+    '''
+    x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+    if x_range is not None:
+        start = max(np.searchsorted(x, x_range[0], side='left') - 1, 0)
+        stop = min(np.searchsorted(x, x_range[1], side='right') + 1, x.size)
+        x, y = x[start:stop], y[start:stop]
+
+    valid = ~np.isnan(y)
+    if not valid.all():
+        x, y = x[valid], y[valid]
+    if y.size <= 2 * n_bins:
+        return x, y
+
+    # Equal bins of 'size' points, the remainder is added to the last bin
+    size = y.size // n_bins
+    body = y[:size * n_bins].reshape(n_bins, size)
+    offset = np.arange(n_bins) * size
+    i_min = offset + body.argmin(axis=1)
+    i_max = offset + body.argmax(axis=1)
+
+    tail = y[size * n_bins:]
+    if tail.size:
+        last = size * (n_bins - 1)
+        i_min[-1] = last + np.argmin(y[last:])
+        i_max[-1] = last + np.argmax(y[last:])
+
+    idx = np.sort(np.concatenate([i_min, i_max]))
+    return x[idx], y[idx]
+
+
+def nice_ticks(lower, upper, n=5):
+    '''Round tick values between two limits
+
+    Parameters
+    ----------
+    lower, upper : float
+        Axis limits
+    n : int, default=5
+        Approximate number of ticks
+
+    Returns
+    -------
+    numpy.ndarray
+        Multiples of 1, 2 or 5 times a power of ten within the limits
+    '''
+    span = upper - lower
+    if not np.isfinite(span) or span <= 0:
+        return np.array([lower])
+    raw = span / n
+    magnitude = 10 ** np.floor(np.log10(raw))
+    step = magnitude * min((1, 2, 5, 10), key=lambda m: abs(m * magnitude - raw))
+    first = np.ceil(lower / step)
+    last = np.floor(upper / step + 1e-9)
+    return np.arange(first, last + 1) * step + 0.0    # + 0.0 turns -0.0 into 0.0
+
+
+def color_table(colors=COLOR_SCALE, n=256):
+    '''Colour table interpolated between anchor colours, as QImage.setColorTable expects'''
+    anchors = np.array([QColor(c).getRgb()[:3] for c in colors], dtype=float)
+    pos = np.linspace(0, 1, len(colors))
+    levels = np.linspace(0, 1, n)
+    rgb = np.stack([np.interp(levels, pos, anchors[:, k]) for k in range(3)], axis=1)
+    rgb = rgb.round().astype(np.uint32)
+    return [int(0xFF000000 | r << 16 | g << 8 | b) for r, g, b in rgb]
+
+
+def heatmap_image(z, z_range=None, colors=COLOR_SCALE):
+    '''8-bit indexed image of a 2-D array
+
+    Parameters
+    ----------
+    z : numpy.ndarray
+        Values of shape (n_x, n_y): the first axis runs left to right, the second bottom
+        to top, as the axes of a plot
+    z_range : tuple, optional
+        (min, max) of the colour scale, by default the finite range of z
+    colors : list of str, default=COLOR_SCALE
+
+    Returns
+    -------
+    QImage
+        Image of n_x by n_y pixels, with its own copy of the data. NaN values are
+        transparent
+    '''
+    z = np.asarray(z, dtype=float)
+    if z_range is None:
+        finite = z[np.isfinite(z)]
+        z_range = (finite.min(), finite.max()) if finite.size else (0.0, 1.0)
+    lower, upper = z_range
+    scale = 254 / (upper - lower) if upper > lower else 0.0
+
+    # Index 255 is reserved for NaN. Rows of the image run top to bottom
+    index = np.clip((z - lower) * scale, 0, 254)
+    index = np.where(np.isnan(z), 255, index).astype(np.uint8)
+
+    # Image lines are aligned to 32 bits
+    n_x, n_y = index.shape
+    stride = (n_x + 3) // 4 * 4
+    buffer = np.zeros((n_y, stride), dtype=np.uint8)
+    buffer[:, :n_x] = index.T[::-1]
+    image = QImage(buffer.data, n_x, n_y, stride, QImage.Format_Indexed8)
+    image.setColorTable(color_table(colors, 255) + [0x00000000])
+    return image.copy()   # Detached from buffer, which is freed on return
+
+
+def polygon(x, y):
+    '''QPolygonF of coordinate arrays, filled without creating a QPointF per point'''
+    poly = QPolygonF(x.size)
+    if x.size:
+        buffer = poly.data()
+        buffer.setsize(x.size * 2 * np.dtype(np.float64).itemsize)
+        points = np.frombuffer(buffer, dtype=np.float64).reshape(x.size, 2)
+        points[:, 0] = x
+        points[:, 1] = y
+    return poly
+
+
+class PlotWidget(QWidget):
+    """Plot of a line, a histogram or a heatmap
+
+    The mouse wheel zooms around the cursor, dragging pans and a double-click shows all
+    data again. Lines and histograms zoom along the x axis only, and scale the y axis to
+    the visible data.
+    """
+    def __init__(self, parent=None):
+        """
+        Parameters
+        ----------
+        parent : QWidget, optional
+        """
+        super().__init__(parent)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setMinimumSize(300, 200)
+        self.kind = None
+        self.data = {}
+        self.title = ''
+        self.labels = ('', '')
+        self.reference = None   # y value of a dashed reference line, e.g. zero margin
+        self.full_view = None   # (x0, x1, y0, y1) of all data
+        self.view = None        # (x0, x1, y0, y1) shown
+        self._drag = None
+
+    # ----- Data -----
+    def clear(self, title=''):
+        """Removes the data, showing only a title"""
+        self.kind, self.data, self.title = None, {}, title
+        self.full_view = self.view = None
+        self.update()
+
+    def set_line(self, x, y, labels=('', ''), title='', reference=None):
+        """Shows a line
+
+        Parameters
+        ----------
+        x : numpy.ndarray
+            Coordinates, sorted if not ascending (e.g. a sweep from a high to a low value)
+        y : numpy.ndarray
+            Values at x
+        labels : tuple of str
+            Labels of the x and y axes
+        title : str
+        reference : float, optional
+            Value of a dashed horizontal line
+        """
+        x, y = np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        if np.any(x[1:] < x[:-1]):     # Downsampling and zooming need ascending x
+            order = np.argsort(x, kind='stable')
+            x, y = x[order], y[order]
+        self._set('line', {'x': x, 'y': y}, labels, title, reference,
+                  (x[0], x[-1]) if x.size else (0.0, 1.0))
+
+    def set_histogram(self, counts, edges, labels=('', 'Samples'), title='', reference=None):
+        """Shows a histogram, e.g. of numpy.histogram"""
+        counts, edges = np.asarray(counts, dtype=float), np.asarray(edges, dtype=float)
+        self._set('bars', {'counts': counts, 'edges': edges}, labels, title, reference,
+                  (edges[0], edges[-1]))
+
+    def set_heatmap(self, z, x_range, y_range, labels=('', ''), title='', z_label=''):
+        """Shows a heatmap
+
+        Parameters
+        ----------
+        z : numpy.ndarray
+            Values of shape (n_x, n_y)
+        x_range, y_range : tuple
+            Coordinates of the first and last cells, either may be the larger one
+        labels : tuple of str
+            Labels of the x and y axes
+        title : str
+        z_label : str
+            Label of the colour scale
+        """
+        z = np.asarray(z, dtype=float)
+        # Shown with ascending axes, the cells flipped along a descending one
+        if x_range[1] < x_range[0]:
+            z, x_range = z[::-1], x_range[::-1]
+        if y_range[1] < y_range[0]:
+            z, y_range = z[:, ::-1], y_range[::-1]
+        finite = z[np.isfinite(z)]
+        z_range = (finite.min(), finite.max()) if finite.size else (0.0, 1.0)
+
+        # Cells are centred on their coordinates
+        x0, x1 = x_range
+        y0, y1 = y_range
+        dx = (x1 - x0) / max(z.shape[0] - 1, 1) / 2
+        dy = (y1 - y0) / max(z.shape[1] - 1, 1) / 2
+        extent = (x0 - dx, x1 + dx, y0 - dy, y1 + dy)
+
+        data = {'image': heatmap_image(z, z_range), 'extent': extent, 'z_range': z_range,
+                'z_label': z_label}
+        self._set('image', data, labels, title, None, extent[:2], extent[2:])
+
+    def _set(self, kind, data, labels, title, reference, x_range, y_range=None):
+        self.kind, self.data = kind, data
+        self.labels, self.title, self.reference = labels, title, reference
+        x0, x1 = x_range
+        if x1 <= x0:
+            x0, x1 = x0 - 0.5, x1 + 0.5
+        if y_range is None:
+            y_range = self._y_range(x0, x1)
+        self.full_view = self.view = (x0, x1) + tuple(y_range)
+        self.update()
+
+    def _y_range(self, x0, x1):
+        """Range of the y axis that fits the data between x0 and x1, with some margin"""
+        if self.kind == 'line':
+            _, y = minmax_downsample(self.data['x'], self.data['y'], 1, (x0, x1))
+            values = [y.min(), y.max()] if y.size else [0.0, 1.0]
+        else:
+            values = [0.0, self.data['counts'].max() if self.data['counts'].size else 1.0]
+        if self.reference is not None:
+            values.append(self.reference)
+        lower, upper = min(values), max(values)
+        pad = (upper - lower) * 0.05 or 0.5
+        return lower - pad, upper + pad
+
+    # ----- Coordinates -----
+    def margins(self):
+        """Space for the title, ticks and labels around the data: left, top, right, bottom"""
+        metrics = self.fontMetrics()
+        line = metrics.height()
+        left = line + metrics.horizontalAdvance('-0000.00') + 10
+        right = 20 + (2 * line + metrics.horizontalAdvance('-000.00') if self.kind == 'image'
+                      else 0)   # Colour scale
+        return left, line + 10, right, 2 * line + 12
+
+    def plot_rect(self):
+        """Area of the data in widget coordinates"""
+        left, top, right, bottom = self.margins()
+        return QRectF(left, top, max(self.width() - left - right, 1),
+                      max(self.height() - top - bottom, 1))
+
+    def to_pixels(self, x, y):
+        """Widget coordinates of data coordinates"""
+        rect = self.plot_rect()
+        x0, x1, y0, y1 = self.view
+        px = rect.left() + (np.asarray(x) - x0) * (rect.width() / (x1 - x0))
+        py = rect.bottom() - (np.asarray(y) - y0) * (rect.height() / (y1 - y0))
+        return px, py
+
+    def to_data(self, px, py):
+        """Data coordinates of widget coordinates"""
+        rect = self.plot_rect()
+        x0, x1, y0, y1 = self.view
+        x = x0 + (px - rect.left()) * (x1 - x0) / rect.width()
+        y = y0 + (rect.bottom() - py) * (y1 - y0) / rect.height()
+        return x, y
+
+    def set_view(self, x0, x1, y0=None, y1=None):
+        """Shows a range of the data, fitting the y axis to it if y0 and y1 are None"""
+        if y0 is None:
+            y0, y1 = self._y_range(x0, x1)
+        self.view = (x0, x1, y0, y1)
+        self.update()
+
+    # ----- Painting -----
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), Qt.white)
+        rect = self.plot_rect()
+
+        painter.setPen(Qt.black)
+        painter.drawText(QRectF(0, 0, self.width(), rect.top()), Qt.AlignCenter, self.title)
+        if self.kind is None:
+            return
+
+        self._draw_axes(painter, rect)
+        painter.setClipRect(rect)
+        if self.kind == 'line':
+            self._draw_line(painter, rect)
+        elif self.kind == 'bars':
+            self._draw_bars(painter)
+        elif self.kind == 'image':
+            self._draw_image(painter)
+
+        if self.reference is not None:
+            _, py = self.to_pixels(0.0, self.reference)
+            painter.setPen(QPen(Qt.gray, 1, Qt.DashLine))
+            painter.drawLine(QPointF(rect.left(), py), QPointF(rect.right(), py))
+        painter.setClipping(False)
+
+        if self.kind == 'image':
+            self._draw_color_scale(painter, rect)
+
+    def _draw_axes(self, painter, rect):
+        x0, x1, y0, y1 = self.view
+        painter.setPen(Qt.black)
+        painter.drawRect(rect)
+        metrics = painter.fontMetrics()
+
+        for x in nice_ticks(x0, x1, max(2, int(rect.width() // 80))):
+            px, _ = self.to_pixels(x, y0)
+            painter.drawLine(QPointF(px, rect.bottom()), QPointF(px, rect.bottom() + 4))
+            painter.drawText(QRectF(px - 40, rect.bottom() + 5, 80, metrics.height()),
+                             Qt.AlignHCenter, f'{x:.6g}')
+        for y in nice_ticks(y0, y1, max(2, int(rect.height() // 40))):
+            _, py = self.to_pixels(x0, y)
+            painter.drawLine(QPointF(rect.left() - 4, py), QPointF(rect.left(), py))
+            painter.drawText(QRectF(0, py - metrics.height() / 2, rect.left() - 6,
+                                    metrics.height()), Qt.AlignRight, f'{y:.6g}')
+
+        painter.drawText(QRectF(0, self.height() - metrics.height() - 2, self.width(),
+                                metrics.height()), Qt.AlignCenter, self.labels[0])
+        painter.save()
+        painter.translate(2, rect.center().y())
+        painter.rotate(-90)
+        painter.drawText(QRectF(-rect.height() / 2, 0, rect.height(), metrics.height()),
+                         Qt.AlignCenter, self.labels[1])
+        painter.restore()
+
+    def _draw_line(self, painter, rect):
+        x0, x1 = self.view[:2]
+        x, y = minmax_downsample(self.data['x'], self.data['y'], max(int(rect.width()), 1),
+                                 (x0, x1))
+        px, py = self.to_pixels(x, y)
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        pen = QPen(QColor(LINE_COLOR), 1)
+        pen.setCosmetic(True)     # Fast path of the raster engine for dense polylines
+        painter.setPen(pen)
+        painter.drawPolyline(polygon(px, py))
+
+    def _draw_bars(self, painter):
+        edges, counts = self.data['edges'], self.data['counts']
+        left, top = self.to_pixels(edges[:-1], counts)
+        right, bottom = self.to_pixels(edges[1:], np.zeros_like(counts))
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(LINE_COLOR))
+        for l, t, r, b in zip(left, top, right, bottom):
+            painter.drawRect(QRectF(l, t, max(r - l, 1.0), b - t))
+
+    def _draw_image(self, painter):
+        x0, x1, y0, y1 = self.data['extent']
+        left, top = self.to_pixels(x0, y1)
+        right, bottom = self.to_pixels(x1, y0)
+        painter.drawImage(QRectF(left, top, right - left, bottom - top), self.data['image'])
+
+    def _draw_color_scale(self, painter, rect):
+        z0, z1 = self.data['z_range']
+        bar = QRectF(rect.right() + 10, rect.top(), 12, rect.height())
+        scale = heatmap_image(np.linspace(z0, z1, 256)[None, :], (z0, z1))
+        painter.drawImage(bar, scale)
+        painter.setPen(Qt.black)
+        painter.drawRect(bar)
+        metrics = painter.fontMetrics()
+        line, width = metrics.height(), metrics.horizontalAdvance('-000.00')
+        for z, y in ((z1, bar.top()), (z0, bar.bottom() - line)):
+            painter.drawText(QRectF(bar.right() + 3, y, width, line), Qt.AlignLeft, f'{z:.4g}')
+        painter.save()
+        # Rotated clockwise, the text runs downwards to the left of this point
+        painter.translate(bar.right() + 6 + width + line, bar.center().y())
+        painter.rotate(90)
+        painter.drawText(QRectF(-bar.height() / 2, 0, bar.height(), line),
+                         Qt.AlignCenter, self.data['z_label'])
+        painter.restore()
+
+    # ----- Mouse -----
+    def wheelEvent(self, event):
+        if self.view is None:
+            return
+        factor = ZOOM_STEP ** (-event.angleDelta().y() / 120)
+        x, y = self.to_data(event.pos().x(), event.pos().y())
+        x0, x1, y0, y1 = self.view
+        x0, x1 = x + (x0 - x) * factor, x + (x1 - x) * factor
+        if self.kind == 'image':
+            self.set_view(x0, x1, y + (y0 - y) * factor, y + (y1 - y) * factor)
+        else:
+            self.set_view(x0, x1)
+
+    def mousePressEvent(self, event):
+        if self.view is not None and event.button() == Qt.LeftButton:
+            self._drag = (event.pos(), self.view)
+
+    def mouseMoveEvent(self, event):
+        if self._drag is None:
+            return
+        start, (x0, x1, y0, y1) = self._drag
+        rect = self.plot_rect()
+        dx = (event.pos().x() - start.x()) * (x1 - x0) / rect.width()
+        dy = (event.pos().y() - start.y()) * (y1 - y0) / rect.height()
+        if self.kind == 'image':
+            self.set_view(x0 - dx, x1 - dx, y0 + dy, y1 + dy)
+        else:
+            self.set_view(x0 - dx, x1 - dx)
+
+    def mouseReleaseEvent(self, event):
+        self._drag = None
+
+    def mouseDoubleClickEvent(self, event):
+        if self.full_view is not None:
+            self.set_view(*self.full_view)
+
+
+if __name__ == '__main__':
+    import sys
+    import time
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication(sys.argv)
+    plot = PlotWidget()
+    plot.resize(1200, 600)
+    x = np.linspace(0, 600, 5_000_000)
+    y = np.sin(x / 20) * 10 + np.random.default_rng(0).normal(0, 1, x.size)
+    plot.set_line(x, y, ('Time [s]', 'Margin [dB]'), 'Noisy margin', reference=0.0)
+
+    start = time.perf_counter()
+    plot.grab()
+    print(f'{x.size} points drawn in {(time.perf_counter() - start) * 1e3:.1f} ms')
+    plot.show()
+    app.exec()
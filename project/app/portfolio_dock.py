@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+title: portfolio_dock.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Portfolio dock of the main window: total gain, output power and margin of every
+configuration file in a folder, in a sortable table. Clicking a row opens the
+configuration in the editor.
+
+The folder is only listed when it is chosen, or when the dock is first shown. The files
+are read and evaluated by a Worker of the dock itself (see worker.portfolio_job), in
+parallel processes, so the editor and its analysis stay available meanwhile. Summaries
+are cached by file contents (see project/portfolio.py): unchanged files show their
+result right away, also after a restart, and Refresh only evaluates the modified ones.
+
+A job evaluates into a copy of the cache, merged into the cache of the dock and saved on
+the main thread once the job has ended. A new folder or Refresh therefore cancels the
+running job without waiting for it: a job only sees the cancellation once its current
+file is done, which could freeze the window for as long.
+"""
+from functools import partial
+from pathlib import Path
+
+from PyQt5.QtCore import QModelIndex, Qt, pyqtSignal, pyqtSlot
+from PyQt5.QtWidgets import QDockWidget, QFileDialog, QHeaderView
+from loguru import logger
+
+from project.app.custom_objects import showdialog
+from project.app.forms import load_form
+from project.app.table_models import PortfolioTableModel
+from project.app.worker import Worker, portfolio_job
+from project.portfolio import ResultCache, list_configs
+from project.settings import CONFIGS_DIR
+
+portfoliodock_form_class = load_form('portfolio_dock')
+
+
+class PortfolioDock(QDockWidget, portfoliodock_form_class):
+    """Dock with the summary of every configuration file in a folder
+
+    Signals
+    -------
+    config_clicked(object)
+        Path of the configuration file of a clicked row
+    """
+    config_clicked = pyqtSignal(object)
+
+    def __init__(self, decimals=2, parent=None):
+        """
+        Parameters
+        ----------
+        decimals : int, default=2
+            Decimals to show of the values
+        parent : QWidget, optional
+        """
+        super().__init__(parent=parent)
+        self.setupUi(self)
+
+        self.folder = None
+        self.cache = None   # ResultCache, loaded with the first folder
+        self.worker = None
+        self.jobs = {}      # {worker: its copy of the cache}, of every job that did not end
+        self.model = PortfolioTableModel(decimals, parent=self)
+        self.tbl_portfolio.setModel(self.model)
+        self.tbl_portfolio.verticalHeader().setVisible(False)
+        header = self.tbl_portfolio.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setStretchLastSection(True)
+        self.tbl_portfolio.sortByColumn(0, Qt.AscendingOrder)
+        self.prg_portfolio.setVisible(False)
+        self.visibilityChanged.connect(self.dock_shown)
+
+    @pyqtSlot(bool)
+    def dock_shown(self, visible):
+        """Lists the default configurations folder the first time the dock is shown"""
+        if visible and self.folder is None:
+            self.load_folder(CONFIGS_DIR)
+
+    @pyqtSlot()
+    def open_folder_clicked(self):
+        """PyQt Slot for 'Open Folder' button"""
+        folder = QFileDialog.getExistingDirectory(self, 'Open Folder of Configurations',
+                                                  str(self.folder or CONFIGS_DIR))
+        if folder == '':
+            return  # Dialog cancelled
+        self.load_folder(folder)
+
+    @pyqtSlot()
+    def refresh_clicked(self):
+        """PyQt Slot for 'Refresh' button, lists the folder again and evaluates new files"""
+        if self.folder is not None:
+            self.load_folder(self.folder)
+
+    @pyqtSlot(QModelIndex)
+    def row_clicked(self, index):
+        """PyQt Slot for a click in the table, opens the configuration of the row"""
+        if index.isValid():
+            self.config_clicked.emit(self.model.path(index.row()))
+
+    def load_folder(self, folder):
+        """Shows the configuration files of a folder and evaluates them in the background
+
+        A running evaluation of the previous folder is stopped.
+
+        Parameters
+        ----------
+        folder : str or Path
+
+        Returns
+        -------
+        None
+        """
+        self.stop()
+        self.folder = Path(folder)
+        self.lbl_folder.setText(self.folder.name)
+        self.lbl_folder.setToolTip(str(self.folder))
+
+        paths = list_configs(self.folder)
+        self.model.set_files(paths)
+        if not paths:
+            return
+
+        if self.cache is None:
+            self.cache = ResultCache.load()
+
+        logger.debug(f'Evaluating {len(paths)} configurations in {self.folder}')
+        # Stopped workers may still run and send signals, they are told apart by the worker
+        cache = ResultCache(results=self.cache.results)    # Not saved by the job itself
+        self.worker = worker = Worker(portfolio_job(paths, cache))
+        self.jobs[worker] = cache
+        worker.progress.connect(partial(self.worker_progress, worker))
+        worker.partial.connect(partial(self.worker_partial, worker))
+        worker.failed.connect(self.worker_failed)
+        for signal in (worker.finished, worker.failed, worker.cancelled):
+            signal.connect(partial(self.worker_done, worker))
+
+        self.prg_portfolio.setRange(0, len(paths))
+        self.prg_portfolio.setValue(0)
+        self.prg_portfolio.setVisible(True)
+        self.worker.start(parent=self)
+
+    def stop(self, wait=False):
+        """Cancels the running evaluation
+
+        Parameters
+        ----------
+        wait : bool, default=False
+            Also waits until every job has ended and saves their results, e.g. before
+            the window closes. Blocks until the files being evaluated are done.
+        """
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker = None
+            self.prg_portfolio.setVisible(False)
+        if wait:
+            for worker in list(self.jobs):
+                worker.cancel()
+                worker.wait()
+                self.merge_results(worker)
+
+    def merge_results(self, worker):
+        """Adds the summaries of an ended job to the cache of the dock and saves it"""
+        cache = self.jobs.pop(worker, None)
+        if cache is not None and cache.changed:
+            self.cache.update(cache)
+            self.cache.save()
+
+    def worker_progress(self, worker, done, total):
+        """Updates the progress bar"""
+        if worker is self.worker:
+            self.prg_portfolio.setValue(done)
+
+    def worker_partial(self, worker, partials):
+        """Shows the summaries of the files evaluated since the previous update"""
+        if worker is self.worker:
+            self.model.set_summaries({part['path']: part['summary'] for part in partials})
+
+    def worker_failed(self, msg):
+        """Shows the traceback of a failed evaluation"""
+        logger.debug(msg)
+        showdialog(['An unexpected error occurred while evaluating the portfolio', '', msg])
+
+    def worker_done(self, worker, *args):
+        """Keeps the results of an ended job, and hides the progress bar of the current one"""
+        self.merge_results(worker)
+        if worker is self.worker:
+            self.worker = None
+            self.prg_portfolio.setVisible(False)
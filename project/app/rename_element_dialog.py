@@ -8,15 +8,12 @@ author: Luigi Maiorano
 """
 
 
-from pathlib import Path
-
-from PyQt5 import uic
 from PyQt5.QtWidgets import QDialog
 
 from project.app.custom_objects import showdialog
-from project.settings import APP_UI_DIR
+from project.app.forms import load_form
 
-rename_form_class = uic.loadUiType(Path(APP_UI_DIR, 'rename_element.ui'))[0]
+rename_form_class = load_form('rename_element')
 
 class RenameElementDialog(QDialog, rename_form_class):
     def __init__(self, current_name, existing_names, parent=None):
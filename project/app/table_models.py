@@ -0,0 +1,563 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+title: table_models.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Models of the input and results tables of the main window, and of the summary table of
+the portfolio dock.
+
+The tables show the configuration dictionary directly (Qt model/view), instead of copying
+every value into a table item. A view only asks for the cells it displays, so the size of
+the budget does not matter for scrolling, and an edit or a new result only repaints the
+rows it changes (dataChanged). The row layout, one row per parameter of every element in
+the order of their 'idx', is only rebuilt when elements are added, removed or reordered.
+
+Units, descriptions and valid ranges of the attributes are looked up once per parameter
+set in the element reference, see ElementReference.
+"""
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
+from PyQt5.QtGui import QFont
+
+from project.app.custom_objects import showdialog
+
+
+def parse_range(range_raw):
+    '''Parses an interval of the element reference, e.g. "(0, 90]"
+
+    Parameters
+    ----------
+    range_raw : str or None
+        Interval with round (open) or square (closed) brackets, 'inf' for no bound
+
+    Returns
+    -------
+    tuple or None
+        (lower, lower_closed, upper, upper_closed, message), None if no range is given.
+        The message is shown to the user, e.g. "0 < Value <= 90"
+    '''
+    if range_raw is None:
+        return None
+
+    L, R = range_raw.replace(' ', '').split(',')
+    lower, upper = float(L[1:]), float(R[:-1])
+    lower_closed, upper_closed = L[0] == '[', R[-1] == ']'
+
+    left = '' if 'inf' in L else L[1:] + (' <=' if lower_closed else ' <')
+    right = '' if 'inf' in R else ('<= ' if upper_closed else '< ') + R[:-1]
+    return lower, lower_closed, upper, upper_closed, f'{left} Value {right}'
+
+
+def in_range(value, bounds):
+    '''Returns whether a value lies in an interval of parse_range'''
+    if bounds is None:
+        return True
+    lower, lower_closed, upper, upper_closed, _ = bounds
+    above = value >= lower if lower_closed else value > lower
+    below = value <= upper if upper_closed else value < upper
+    return above and below
+
+
+def bold_font():
+    '''Font of the element names'''
+    font = QFont()
+    font.setBold(True)
+    return font
+
+
+def element_layout(elements):
+    '''Returns the row layout of a table of elements
+
+    Parameters
+    ----------
+    elements : dict
+        Elements of a configuration dictionary
+
+    Returns
+    -------
+    list of tuple
+        (name, parameters) per element in order of 'idx', with parameters the list of
+        parameter names of the element, or [None] for a single gain_loss row
+    '''
+    layout = []
+    for name, element in sorted(elements.items(), key=lambda item: item[1]['idx']):
+        params = element.get('parameters')
+        if element['link_type'] == 'GENERIC' or not params:
+            layout.append((name, [None]))
+        else:
+            layout.append((name, list(params)))
+    return layout
+
+
+class ElementReference:
+    """Cached index of the element reference
+
+    The details of every attribute are looked up and their range parsed once, instead of
+    for every cell that is displayed.
+    """
+    def __init__(self, element_details):
+        """
+        Parameters
+        ----------
+        element_details : dict
+            Contents of element_reference.yaml
+        """
+        self.element_details = element_details
+        self._cache = {}
+
+    def attribute(self, link_type, input_type, param=None):
+        """Details of an attribute of an element
+
+        Parameters
+        ----------
+        link_type : str
+            Link type of the element
+        input_type : str
+            Parameter set of the element
+        param : str, optional
+            Parameter name, None for the gain_loss of the element
+
+        Returns
+        -------
+        dict
+            'units', 'description', 'range' as in the element reference, and 'bounds'
+            (see parse_range)
+        """
+        key = (link_type, input_type, param) if param is not None else None
+        details = self._cache.get(key)
+        if details is None:
+            if param is None:
+                details = self.element_details['GENERIC']['gain_loss']['gain_loss']
+            else:
+                details = self.element_details[link_type][input_type].get(param, {})
+            details = {'units': details.get('units'),
+                       'description': details.get('description', 'Link element attribute'),
+                       'range': details.get('range'),
+                       'bounds': parse_range(details.get('range'))}
+            self._cache[key] = details
+        return details
+
+
+class ElementTableModel(QAbstractTableModel):
+    """Input table: Element Name, Attribute, Value and Units of every element
+
+    Backed by the elements dictionary of the configuration, which is modified in place
+    when a value is edited.
+
+    Signals
+    -------
+    value_edited(str, object)
+        Element name and parameter (None for the gain_loss) of an edited value
+    """
+    value_edited = pyqtSignal(str, object)
+
+    titles = ['Element Name', 'Attribute', 'Value', 'Units']
+    name_col, attribute_col, value_col, units_col = range(4)
+
+    def __init__(self, reference, decimals=2, parent=None):
+        """
+        Parameters
+        ----------
+        reference : ElementReference
+            Details of the attributes
+        decimals : int, default=2
+            Decimals to show of numerical values
+        parent : QObject, optional
+        """
+        super().__init__(parent)
+        self.reference = reference
+        self.decimals = decimals
+        self.elements = {}
+        self.layout = []
+        self.rows = []          # (name, parameter) per row
+        self.spans = {}         # name: (first row, number of rows)
+
+    def set_elements(self, elements):
+        """Shows a new elements dictionary, rebuilding the row layout
+
+        Parameters
+        ----------
+        elements : dict
+            Elements of a configuration dictionary
+        """
+        self.beginResetModel()
+        self.elements = elements
+        self.layout = element_layout(elements)
+        self.rows = [(name, param) for name, params in self.layout for param in params]
+        self.spans = {}
+        row = 0
+        for name, params in self.layout:
+            self.spans[name] = (row, len(params))
+            row += len(params)
+        self.endResetModel()
+
+    def element_at(self, row):
+        """Name of the element of a row"""
+        return self.rows[row][0]
+
+    def refresh_values(self, names=None):
+        """Repaints the values of some elements, or of all elements
+
+        Parameters
+        ----------
+        names : list of str, optional
+            Elements whose values changed outside the model
+        """
+        if not self.rows:
+            return
+        if names is None:
+            self.dataChanged.emit(self.index(0, self.value_col),
+                                  self.index(len(self.rows) - 1, self.value_col))
+            return
+        for name in names:
+            start, count = self.spans[name]
+            self.dataChanged.emit(self.index(start, self.value_col),
+                                  self.index(start + count - 1, self.value_col))
+
+    def value(self, name, param):
+        """Value of an attribute, param None for the gain_loss"""
+        element = self.elements[name]
+        if param is None:
+            return element.get('gain_loss')
+        return element['parameters'].get(param)
+
+    def set_value(self, name, param, value):
+        """Stores a value in the elements dictionary"""
+        if param is None:
+            self.elements[name]['gain_loss'] = value
+        else:
+            self.elements[name]['parameters'][param] = value
+
+    def details(self, name, param):
+        """Reference details of an attribute"""
+        element = self.elements[name]
+        return self.reference.attribute(element['link_type'], element['input_type'], param)
+
+    def invalid_values(self, allow_blank=False):
+        """Returns whether any numerical value cannot be converted to float
+
+        Parameters
+        ----------
+        allow_blank : bool, default=False
+            Whether blank values are allowed, e.g. of newly added elements
+        """
+        for name, param in self.rows:
+            if self.details(name, param)['units'] == 'path':
+                continue  # Text values, such as file paths
+            val = self.value(name, param)
+            if allow_blank and val in ('', None):
+                continue
+            try:
+                float(val)
+            except (ValueError, TypeError):
+                return True
+        return False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.titles)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.titles[section]
+        return None
+
+    def flags(self, index):
+        col = index.column()
+        if col == self.name_col:
+            # Not directly editable, to prevent duplicate naming
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if col == self.value_col:
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+        return Qt.ItemIsEnabled     # not selectable or editable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        name, param = self.rows[index.row()]
+        col = index.column()
+
+        if col == self.name_col:
+            if role == Qt.DisplayRole:
+                return name if self.spans[name][0] == index.row() else None
+            if role == Qt.ToolTipRole:
+                return f"Type: {self.elements[name]['link_type']}"
+            if role == Qt.FontRole:
+                return bold_font()
+
+        elif col == self.attribute_col:
+            if role == Qt.DisplayRole:
+                return 'Gain' if param is None else param
+            if role == Qt.ToolTipRole:
+                return self.details(name, param)['description']
+
+        elif col == self.value_col:
+            if role in (Qt.DisplayRole, Qt.EditRole):
+                val = self.value(name, param)
+                if val is None:
+                    return ''
+                if isinstance(val, str) or role == Qt.EditRole:
+                    return str(val)
+                return f'{val:.{self.decimals}f}'
+
+        elif col == self.units_col:
+            if role == Qt.DisplayRole:
+                return self.details(name, param)['units']
+
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or index.column() != self.value_col:
+            return False
+        name, param = self.rows[index.row()]
+        details = self.details(name, param)
+
+        if details['units'] == 'path':
+            self.set_value(name, param, str(value))
+        else:
+            # check input
+            try:
+                val_in = float(value)
+            except ValueError:
+                showdialog(['Only numerical values are allowed'], level='information')
+                return False
+            if not in_range(val_in, details['bounds']):
+                showdialog([f'Entered value is not valid \n\n'
+                            f'Required interval:\n{details["bounds"][-1]}'], level='information')
+                return False
+            self.set_value(name, param, val_in)
+
+        self.dataChanged.emit(index, index)
+        self.value_edited.emit(name, param)
+        return True
+
+
+class ResultsTableModel(QAbstractTableModel):
+    """Results table: gain of every element, aligned with the rows of the input table"""
+    titles = ['Total GAIN', 'Value', 'Units']
+
+    def __init__(self, reference, decimals=2, parent=None):
+        """
+        Parameters
+        ----------
+        reference : ElementReference
+            Details of the attributes
+        decimals : int, default=2
+            Decimals to show of the gains
+        parent : QObject, optional
+        """
+        super().__init__(parent)
+        self.reference = reference
+        self.decimals = decimals
+        self.layout = []
+        self.gains = {}
+        self.names = []         # Element name of every row, None for spanned rows
+        self.spans = {}         # name: (first row, number of rows)
+
+    def set_results(self, elements):
+        """Shows the gain of every element
+
+        If the elements and their rows are the same as shown, only the changed gains are
+        repainted.
+
+        Parameters
+        ----------
+        elements : dict
+            Elements of a configuration dictionary, each with a gain_loss value
+
+        Returns
+        -------
+        bool
+            Whether the row layout was rebuilt, and spans must be set again
+        """
+        layout = element_layout(elements)
+        gains = {name: elements[name]['gain_loss'] for name, _ in layout}
+        if layout == self.layout:
+            for name, gain in gains.items():
+                self.set_gain(name, gain)
+            return False
+
+        self.beginResetModel()
+        self.layout = layout
+        self.gains = gains
+        self.names, self.spans = [], {}
+        for name, params in layout:
+            self.spans[name] = (len(self.names), len(params))
+            self.names.extend([name] + [None] * (len(params) - 1))
+        self.endResetModel()
+        return True
+
+    def set_gain(self, name, gain):
+        """Updates the gain of a single element"""
+        if self.gains.get(name) == gain:
+            return
+        self.gains[name] = gain
+        row = self.spans[name][0]
+        self.dataChanged.emit(self.index(row, 1), self.index(row, 1))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.names)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.titles)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.titles[section]
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        name = self.names[index.row()]
+        if name is None:
+            return None     # Covered by the span of the element
+        details = self.reference.attribute(None, None)
+        col = index.column()
+
+        if col == 0:
+            if role == Qt.DisplayRole:
+                return name
+            if role == Qt.ToolTipRole:
+                return details['description']
+            if role == Qt.FontRole:
+                return bold_font()
+        elif col == 1 and role == Qt.DisplayRole:
+            return f'{self.gains[name]:.{self.decimals}f}'
+        elif col == 2 and role == Qt.DisplayRole:
+            return details['units']
+        return None
+
+
+class PortfolioTableModel(QAbstractTableModel):
+    """Summary table of a folder of configurations, see project/portfolio.py
+
+    Rows are shown for every file right away, their values once they are evaluated.
+    Sorting by a value keeps files without a result (pending or failed) at the bottom.
+    """
+    titles = ['Configuration', 'Total Gain [dB]', 'Output Power [dBm]', 'Margin [dB]']
+    keys = [None, 'total_gain', 'output_power', 'total_margin']
+
+    def __init__(self, decimals=2, parent=None):
+        """
+        Parameters
+        ----------
+        decimals : int, default=2
+            Decimals to show of the values
+        parent : QObject, optional
+        """
+        super().__init__(parent)
+        self.decimals = decimals
+        self.paths = []         # Configuration file of every row
+        self.summaries = {}     # path: summary, see project.portfolio.summarize_config
+        self.sort_order = None  # (column, Qt.SortOrder) of the last sort, kept for new results
+
+    def set_files(self, paths):
+        """Shows a row per configuration file, without values"""
+        self.beginResetModel()
+        self.paths = list(paths)
+        self.summaries = {}
+        self.endResetModel()
+        if self.sort_order is not None:
+            self.sort(*self.sort_order)
+
+    def set_summaries(self, summaries):
+        """Shows the values of evaluated files
+
+        Parameters
+        ----------
+        summaries : dict
+            {path: summary} of files in the table, others are ignored
+
+        Returns
+        -------
+        None
+        """
+        rows = {path: row for row, path in enumerate(self.paths)}
+        summaries = {path: val for path, val in summaries.items() if path in rows}
+        self.summaries.update(summaries)
+        if self.sort_order is not None and self.sort_order[0] > 0:
+            self.sort(*self.sort_order)   # Values changed, move the rows
+            return
+        for path in summaries:
+            row = rows[path]
+            self.dataChanged.emit(self.index(row, 1), self.index(row, len(self.titles) - 1))
+
+    def path(self, row):
+        """Configuration file of a row"""
+        return self.paths[row]
+
+    def value(self, path, column):
+        """Value of a file in a column, None if not (successfully) evaluated"""
+        summary = self.summaries.get(path)
+        return None if summary is None else summary[self.keys[column]]
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sort_order = (column, order)
+        reverse = order == Qt.DescendingOrder
+        if column == 0:
+            paths = sorted(self.paths, key=lambda path: path.name.lower(), reverse=reverse)
+        else:
+            valid = [path for path in self.paths if self.value(path, column) is not None]
+            missing = [path for path in self.paths if self.value(path, column) is None]
+            paths = sorted(valid, key=lambda path: self.value(path, column), reverse=reverse)
+            paths += missing
+        if paths == self.paths:
+            return
+
+        # Selected rows follow their file
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        old_paths = [self.paths[idx.row()] for idx in old_indexes]
+        self.paths = paths
+        new_rows = {path: row for row, path in enumerate(paths)}
+        self.changePersistentIndexList(
+            old_indexes, [self.index(new_rows[path], idx.column())
+                          for path, idx in zip(old_paths, old_indexes)])
+        self.layoutChanged.emit()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.paths)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.titles)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.titles[section]
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        path = self.paths[index.row()]
+        summary = self.summaries.get(path)
+        col = index.column()
+
+        if col == 0:
+            if role == Qt.DisplayRole:
+                return path.name
+            if role == Qt.ToolTipRole:
+                return str(path)
+            return None
+        if role == Qt.DisplayRole:
+            if summary is None:
+                return '...'    # Not evaluated yet
+            if summary['error'] is not None:
+                return 'Error' if col == 1 else ''
+            return f'{summary[self.keys[col]]:.{self.decimals}f}'
+        if role == Qt.ToolTipRole and summary is not None:
+            return summary['error']
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
@@ -0,0 +1,4 @@
+"""
+QtDesigner files of the User Interface, and the Python modules compiled from them.
+See project/app/forms.py
+"""
@@ -0,0 +1,457 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'project/app/ui/main_window.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(761, 683)
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.groupBox = QtWidgets.QGroupBox(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.groupBox.sizePolicy().hasHeightForWidth())
+        self.groupBox.setSizePolicy(sizePolicy)
+        self.groupBox.setTitle("")
+        self.groupBox.setObjectName("groupBox")
+        self.formLayout = QtWidgets.QFormLayout(self.groupBox)
+        self.formLayout.setObjectName("formLayout")
+        self.btn_load_config = QtWidgets.QPushButton(self.groupBox)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.btn_load_config.setFont(font)
+        self.btn_load_config.setObjectName("btn_load_config")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.btn_load_config)
+        self.lbl_config_file = QtWidgets.QLabel(self.groupBox)
+        self.lbl_config_file.setText("")
+        self.lbl_config_file.setObjectName("lbl_config_file")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.lbl_config_file)
+        self.verticalLayout.addWidget(self.groupBox)
+        self.gridLayout = QtWidgets.QGridLayout()
+        self.gridLayout.setObjectName("gridLayout")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem)
+        self.btn_save_results = QtWidgets.QPushButton(self.centralwidget)
+        self.btn_save_results.setEnabled(False)
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.btn_save_results.setFont(font)
+        self.btn_save_results.setObjectName("btn_save_results")
+        self.horizontalLayout_2.addWidget(self.btn_save_results)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem1)
+        self.gridLayout.addLayout(self.horizontalLayout_2, 5, 3, 1, 1)
+        self.tbl_results = QtWidgets.QTableView(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.tbl_results.sizePolicy().hasHeightForWidth())
+        self.tbl_results.setSizePolicy(sizePolicy)
+        self.tbl_results.setMinimumSize(QtCore.QSize(300, 0))
+        self.tbl_results.setSelectionMode(QtWidgets.QAbstractItemView.ContiguousSelection)
+        self.tbl_results.setObjectName("tbl_results")
+        self.gridLayout.addWidget(self.tbl_results, 2, 3, 1, 1)
+        self.lbl_elements = QtWidgets.QLabel(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lbl_elements.sizePolicy().hasHeightForWidth())
+        self.lbl_elements.setSizePolicy(sizePolicy)
+        self.lbl_elements.setMinimumSize(QtCore.QSize(0, 0))
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.lbl_elements.setFont(font)
+        self.lbl_elements.setAlignment(QtCore.Qt.AlignCenter)
+        self.lbl_elements.setObjectName("lbl_elements")
+        self.gridLayout.addWidget(self.lbl_elements, 0, 0, 1, 2)
+        self.gridLayout_3 = QtWidgets.QGridLayout()
+        self.gridLayout_3.setObjectName("gridLayout_3")
+        self.txt_threshold_dbm = QtWidgets.QLineEdit(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.txt_threshold_dbm.setFont(font)
+        self.txt_threshold_dbm.setInputMask("")
+        self.txt_threshold_dbm.setObjectName("txt_threshold_dbm")
+        self.gridLayout_3.addWidget(self.txt_threshold_dbm, 1, 5, 1, 1)
+        self.label_3 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.label_3.setFont(font)
+        self.label_3.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_3.setObjectName("label_3")
+        self.gridLayout_3.addWidget(self.label_3, 0, 0, 1, 1)
+        self.label_8 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.label_8.setFont(font)
+        self.label_8.setObjectName("label_8")
+        self.gridLayout_3.addWidget(self.label_8, 1, 3, 1, 1)
+        self.label_7 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.label_7.setFont(font)
+        self.label_7.setObjectName("label_7")
+        self.gridLayout_3.addWidget(self.label_7, 0, 3, 1, 1)
+        spacerItem2 = QtWidgets.QSpacerItem(10, 20, QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_3.addItem(spacerItem2, 0, 4, 2, 1)
+        self.label_5 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.label_5.setFont(font)
+        self.label_5.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_5.setWordWrap(False)
+        self.label_5.setObjectName("label_5")
+        self.gridLayout_3.addWidget(self.label_5, 1, 0, 1, 1)
+        self.label_9 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.label_9.setFont(font)
+        self.label_9.setObjectName("label_9")
+        self.gridLayout_3.addWidget(self.label_9, 0, 6, 1, 1)
+        self.label_10 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.label_10.setFont(font)
+        self.label_10.setObjectName("label_10")
+        self.gridLayout_3.addWidget(self.label_10, 1, 6, 1, 1)
+        self.txt_in_power_W = QtWidgets.QLineEdit(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.txt_in_power_W.sizePolicy().hasHeightForWidth())
+        self.txt_in_power_W.setSizePolicy(sizePolicy)
+        self.txt_in_power_W.setMinimumSize(QtCore.QSize(80, 0))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.txt_in_power_W.setFont(font)
+        self.txt_in_power_W.setInputMask("")
+        self.txt_in_power_W.setText("")
+        self.txt_in_power_W.setClearButtonEnabled(False)
+        self.txt_in_power_W.setObjectName("txt_in_power_W")
+        self.gridLayout_3.addWidget(self.txt_in_power_W, 0, 2, 1, 1)
+        self.txt_in_power_dbm = QtWidgets.QLineEdit(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.txt_in_power_dbm.sizePolicy().hasHeightForWidth())
+        self.txt_in_power_dbm.setSizePolicy(sizePolicy)
+        self.txt_in_power_dbm.setMinimumSize(QtCore.QSize(50, 0))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.txt_in_power_dbm.setFont(font)
+        self.txt_in_power_dbm.setObjectName("txt_in_power_dbm")
+        self.gridLayout_3.addWidget(self.txt_in_power_dbm, 0, 5, 1, 1)
+        self.txt_threshold_W = QtWidgets.QLineEdit(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.txt_threshold_W.setFont(font)
+        self.txt_threshold_W.setClearButtonEnabled(False)
+        self.txt_threshold_W.setObjectName("txt_threshold_W")
+        self.gridLayout_3.addWidget(self.txt_threshold_W, 1, 2, 1, 1)
+        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_3.addItem(spacerItem3, 0, 1, 2, 1)
+        self.gridLayout.addLayout(self.gridLayout_3, 3, 0, 1, 2)
+        self.line_4 = QtWidgets.QFrame(self.centralwidget)
+        self.line_4.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_4.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_4.setObjectName("line_4")
+        self.gridLayout.addWidget(self.line_4, 1, 3, 1, 1)
+        self.line_5 = QtWidgets.QFrame(self.centralwidget)
+        self.line_5.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_5.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_5.setObjectName("line_5")
+        self.gridLayout.addWidget(self.line_5, 4, 3, 1, 1)
+        self.tbl_elements = QtWidgets.QTableView(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.tbl_elements.sizePolicy().hasHeightForWidth())
+        self.tbl_elements.setSizePolicy(sizePolicy)
+        self.tbl_elements.setMinimumSize(QtCore.QSize(300, 0))
+        self.tbl_elements.setEditTriggers(QtWidgets.QAbstractItemView.AnyKeyPressed|QtWidgets.QAbstractItemView.DoubleClicked|QtWidgets.QAbstractItemView.EditKeyPressed)
+        self.tbl_elements.setDragEnabled(True)
+        self.tbl_elements.setDragDropOverwriteMode(False)
+        self.tbl_elements.setAlternatingRowColors(False)
+        self.tbl_elements.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.tbl_elements.setObjectName("tbl_elements")
+        self.tbl_elements.horizontalHeader().setStretchLastSection(False)
+        self.tbl_elements.verticalHeader().setStretchLastSection(False)
+        self.gridLayout.addWidget(self.tbl_elements, 2, 1, 1, 1)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        spacerItem4 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem4)
+        self.btn_add_element = QtWidgets.QPushButton(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.btn_add_element.setFont(font)
+        self.btn_add_element.setObjectName("btn_add_element")
+        self.verticalLayout_2.addWidget(self.btn_add_element)
+        spacerItem5 = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        self.verticalLayout_2.addItem(spacerItem5)
+        self.btn_mv_up = QtWidgets.QPushButton(self.centralwidget)
+        self.btn_mv_up.setObjectName("btn_mv_up")
+        self.verticalLayout_2.addWidget(self.btn_mv_up)
+        self.btn_mv_dwn = QtWidgets.QPushButton(self.centralwidget)
+        self.btn_mv_dwn.setObjectName("btn_mv_dwn")
+        self.verticalLayout_2.addWidget(self.btn_mv_dwn)
+        spacerItem6 = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        self.verticalLayout_2.addItem(spacerItem6)
+        self.btn_delete_element = QtWidgets.QPushButton(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.btn_delete_element.setFont(font)
+        self.btn_delete_element.setObjectName("btn_delete_element")
+        self.verticalLayout_2.addWidget(self.btn_delete_element)
+        self.btn_clear_all = QtWidgets.QPushButton(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(11)
+        self.btn_clear_all.setFont(font)
+        self.btn_clear_all.setObjectName("btn_clear_all")
+        self.verticalLayout_2.addWidget(self.btn_clear_all)
+        spacerItem7 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_2.addItem(spacerItem7)
+        self.gridLayout.addLayout(self.verticalLayout_2, 2, 0, 1, 1)
+        self.line = QtWidgets.QFrame(self.centralwidget)
+        self.line.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line.setObjectName("line")
+        self.gridLayout.addWidget(self.line, 1, 0, 1, 2)
+        self.line_2 = QtWidgets.QFrame(self.centralwidget)
+        self.line_2.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_2.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_2.setObjectName("line_2")
+        self.gridLayout.addWidget(self.line_2, 4, 0, 1, 2)
+        self.lbl_results = QtWidgets.QLabel(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lbl_results.sizePolicy().hasHeightForWidth())
+        self.lbl_results.setSizePolicy(sizePolicy)
+        self.lbl_results.setMinimumSize(QtCore.QSize(0, 0))
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.lbl_results.setFont(font)
+        self.lbl_results.setAlignment(QtCore.Qt.AlignCenter)
+        self.lbl_results.setObjectName("lbl_results")
+        self.gridLayout.addWidget(self.lbl_results, 0, 3, 1, 1)
+        self.gridLayout_2 = QtWidgets.QGridLayout()
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.label_2 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.label_2.setFont(font)
+        self.label_2.setObjectName("label_2")
+        self.gridLayout_2.addWidget(self.label_2, 0, 4, 1, 1)
+        spacerItem8 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_2.addItem(spacerItem8, 0, 0, 2, 1)
+        self.txt_total = QtWidgets.QLineEdit(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.txt_total.setFont(font)
+        self.txt_total.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.txt_total.setReadOnly(True)
+        self.txt_total.setObjectName("txt_total")
+        self.gridLayout_2.addWidget(self.txt_total, 0, 3, 1, 1)
+        self.label_6 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.label_6.setFont(font)
+        self.label_6.setObjectName("label_6")
+        self.gridLayout_2.addWidget(self.label_6, 1, 4, 1, 1)
+        spacerItem9 = QtWidgets.QSpacerItem(30, 20, QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_2.addItem(spacerItem9, 0, 2, 2, 1)
+        self.label_4 = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.label_4.setFont(font)
+        self.label_4.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label_4.setObjectName("label_4")
+        self.gridLayout_2.addWidget(self.label_4, 1, 1, 1, 1)
+        self.txt_margin = QtWidgets.QLineEdit(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.txt_margin.setFont(font)
+        self.txt_margin.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.txt_margin.setReadOnly(True)
+        self.txt_margin.setObjectName("txt_margin")
+        self.gridLayout_2.addWidget(self.txt_margin, 1, 3, 1, 1)
+        self.label = QtWidgets.QLabel(self.centralwidget)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.label.setFont(font)
+        self.label.setAlignment(QtCore.Qt.AlignRight|QtCore.Qt.AlignTrailing|QtCore.Qt.AlignVCenter)
+        self.label.setObjectName("label")
+        self.gridLayout_2.addWidget(self.label, 0, 1, 1, 1)
+        spacerItem10 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_2.addItem(spacerItem10, 0, 5, 2, 1)
+        self.gridLayout.addLayout(self.gridLayout_2, 3, 3, 1, 1)
+        self.horizontalLayout_run = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_run.setObjectName("horizontalLayout_run")
+        self.btn_run_process = QtWidgets.QPushButton(self.centralwidget)
+        self.btn_run_process.setMinimumSize(QtCore.QSize(200, 0))
+        font = QtGui.QFont()
+        font.setPointSize(13)
+        self.btn_run_process.setFont(font)
+        self.btn_run_process.setObjectName("btn_run_process")
+        self.horizontalLayout_run.addWidget(self.btn_run_process)
+        self.prg_process = QtWidgets.QProgressBar(self.centralwidget)
+        self.prg_process.setMaximumSize(QtCore.QSize(150, 16777215))
+        self.prg_process.setProperty("value", 0)
+        self.prg_process.setTextVisible(False)
+        self.prg_process.setObjectName("prg_process")
+        self.horizontalLayout_run.addWidget(self.prg_process)
+        self.btn_cancel_process = QtWidgets.QPushButton(self.centralwidget)
+        self.btn_cancel_process.setEnabled(False)
+        self.btn_cancel_process.setObjectName("btn_cancel_process")
+        self.horizontalLayout_run.addWidget(self.btn_cancel_process)
+        self.chk_live = QtWidgets.QCheckBox(self.centralwidget)
+        self.chk_live.setObjectName("chk_live")
+        self.horizontalLayout_run.addWidget(self.chk_live)
+        self.gridLayout.addLayout(self.horizontalLayout_run, 5, 0, 1, 2)
+        self.line_3 = QtWidgets.QFrame(self.centralwidget)
+        self.line_3.setFrameShape(QtWidgets.QFrame.VLine)
+        self.line_3.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.line_3.setObjectName("line_3")
+        self.gridLayout.addWidget(self.line_3, 0, 2, 6, 1)
+        self.verticalLayout.addLayout(self.gridLayout)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 761, 21))
+        self.menubar.setObjectName("menubar")
+        self.menu_File = QtWidgets.QMenu(self.menubar)
+        self.menu_File.setObjectName("menu_File")
+        self.menu_View = QtWidgets.QMenu(self.menubar)
+        self.menu_View.setObjectName("menu_View")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+        self.action_New = QtWidgets.QAction(MainWindow)
+        self.action_New.setObjectName("action_New")
+        self.action_Open = QtWidgets.QAction(MainWindow)
+        self.action_Open.setObjectName("action_Open")
+        self.actionOpen_Recent = QtWidgets.QAction(MainWindow)
+        self.actionOpen_Recent.setObjectName("actionOpen_Recent")
+        self.action_Save = QtWidgets.QAction(MainWindow)
+        self.action_Save.setObjectName("action_Save")
+        self.actionExit = QtWidgets.QAction(MainWindow)
+        self.actionExit.setObjectName("actionExit")
+        self.actionSave_Results = QtWidgets.QAction(MainWindow)
+        self.actionSave_Results.setObjectName("actionSave_Results")
+        self.menu_File.addAction(self.action_New)
+        self.menu_File.addAction(self.action_Open)
+        self.menu_File.addSeparator()
+        self.menu_File.addAction(self.action_Save)
+        self.menu_File.addSeparator()
+        self.menu_File.addAction(self.actionExit)
+        self.menubar.addAction(self.menu_File.menuAction())
+        self.menubar.addAction(self.menu_View.menuAction())
+        self.label_3.setBuddy(self.txt_in_power_W)
+        self.label_5.setBuddy(self.txt_threshold_W)
+        self.label_2.setBuddy(self.txt_total)
+        self.label_6.setBuddy(self.txt_margin)
+        self.label_4.setBuddy(self.txt_margin)
+        self.label.setBuddy(self.txt_total)
+
+        self.retranslateUi(MainWindow)
+        self.btn_load_config.clicked.connect(MainWindow.open_config_clicked) # type: ignore
+        self.action_Open.triggered.connect(MainWindow.open_config_clicked) # type: ignore
+        self.btn_add_element.clicked.connect(MainWindow.add_element_clicked) # type: ignore
+        self.btn_run_process.clicked.connect(MainWindow.run_process_clicked) # type: ignore
+        self.chk_live.toggled['bool'].connect(MainWindow.live_mode_toggled) # type: ignore
+        self.action_Save.triggered.connect(MainWindow.save_config_clicked) # type: ignore
+        self.actionExit.triggered.connect(MainWindow.close) # type: ignore
+        self.action_New.triggered.connect(MainWindow.new_clicked) # type: ignore
+        self.btn_delete_element.clicked.connect(MainWindow.delete_element_clicked) # type: ignore
+        self.btn_clear_all.clicked.connect(MainWindow.clear_all_clicked) # type: ignore
+        self.txt_in_power_W.editingFinished.connect(MainWindow.input_power_W_edited) # type: ignore
+        self.txt_threshold_W.editingFinished.connect(MainWindow.threshold_W_edited) # type: ignore
+        self.txt_in_power_dbm.editingFinished.connect(MainWindow.input_power_dbm_edited) # type: ignore
+        self.txt_threshold_dbm.editingFinished.connect(MainWindow.threshold_dbm_edited) # type: ignore
+        self.tbl_elements.doubleClicked['QModelIndex'].connect(MainWindow.input_table_double_clicked) # type: ignore
+        self.btn_save_results.clicked.connect(MainWindow.save_config_clicked) # type: ignore
+        self.btn_mv_up.clicked.connect(MainWindow.move_up_clicked) # type: ignore
+        self.btn_mv_dwn.clicked.connect(MainWindow.move_down_clicked) # type: ignore
+        self.btn_cancel_process.clicked.connect(MainWindow.cancel_process_clicked) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+        MainWindow.setTabOrder(self.btn_load_config, self.btn_add_element)
+        MainWindow.setTabOrder(self.btn_add_element, self.btn_delete_element)
+        MainWindow.setTabOrder(self.btn_delete_element, self.btn_clear_all)
+        MainWindow.setTabOrder(self.btn_clear_all, self.txt_in_power_W)
+        MainWindow.setTabOrder(self.txt_in_power_W, self.txt_threshold_dbm)
+        MainWindow.setTabOrder(self.txt_threshold_dbm, self.btn_run_process)
+        MainWindow.setTabOrder(self.btn_run_process, self.btn_cancel_process)
+        MainWindow.setTabOrder(self.btn_cancel_process, self.chk_live)
+        MainWindow.setTabOrder(self.chk_live, self.btn_save_results)
+        MainWindow.setTabOrder(self.btn_save_results, self.txt_total)
+        MainWindow.setTabOrder(self.txt_total, self.txt_margin)
+        MainWindow.setTabOrder(self.txt_margin, self.tbl_elements)
+        MainWindow.setTabOrder(self.tbl_elements, self.tbl_results)
+        MainWindow.setTabOrder(self.tbl_results, self.txt_in_power_dbm)
+        MainWindow.setTabOrder(self.txt_in_power_dbm, self.txt_threshold_W)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
+        self.btn_load_config.setToolTip(_translate("MainWindow", "(optional) Load pre-configured link budget from YAML file"))
+        self.btn_load_config.setText(_translate("MainWindow", "Load Config File"))
+        self.btn_save_results.setText(_translate("MainWindow", "Save Results"))
+        self.lbl_elements.setText(_translate("MainWindow", " Inputs"))
+        self.label_3.setText(_translate("MainWindow", "Input Power:"))
+        self.label_8.setText(_translate("MainWindow", "W"))
+        self.label_7.setText(_translate("MainWindow", "W"))
+        self.label_5.setText(_translate("MainWindow", "Receiver System Threshold:"))
+        self.label_9.setText(_translate("MainWindow", "dBm"))
+        self.label_10.setText(_translate("MainWindow", "dBm"))
+        self.btn_add_element.setToolTip(_translate("MainWindow", "asdfasdfasdf"))
+        self.btn_add_element.setText(_translate("MainWindow", "Add Element"))
+        self.btn_mv_up.setText(_translate("MainWindow", "Move Up"))
+        self.btn_mv_dwn.setText(_translate("MainWindow", "Move Down"))
+        self.btn_delete_element.setText(_translate("MainWindow", "Delete Element"))
+        self.btn_clear_all.setText(_translate("MainWindow", "Clear All"))
+        self.lbl_results.setText(_translate("MainWindow", "Results"))
+        self.label_2.setText(_translate("MainWindow", "dBm"))
+        self.label_6.setText(_translate("MainWindow", "dB"))
+        self.label_4.setToolTip(_translate("MainWindow", "= Receiver Sys Threshold - Received Power"))
+        self.label_4.setText(_translate("MainWindow", "Margin:"))
+        self.label.setToolTip(_translate("MainWindow", "= Input Power + Sum( Element Gains/Losses )"))
+        self.label.setText(_translate("MainWindow", "Received Power"))
+        self.btn_run_process.setText(_translate("MainWindow", "Run Analysis"))
+        self.btn_cancel_process.setToolTip(_translate("MainWindow", "Stop the running analysis"))
+        self.btn_cancel_process.setText(_translate("MainWindow", "Cancel"))
+        self.chk_live.setToolTip(_translate("MainWindow", "Recalculate the results while values are edited"))
+        self.chk_live.setText(_translate("MainWindow", "Live"))
+        self.menu_File.setTitle(_translate("MainWindow", "&File"))
+        self.menu_View.setTitle(_translate("MainWindow", "&View"))
+        self.action_New.setText(_translate("MainWindow", "&New"))
+        self.action_New.setShortcut(_translate("MainWindow", "Ctrl+N"))
+        self.action_Open.setText(_translate("MainWindow", "&Open"))
+        self.action_Open.setShortcut(_translate("MainWindow", "Ctrl+O"))
+        self.actionOpen_Recent.setText(_translate("MainWindow", "Open &Recent"))
+        self.action_Save.setText(_translate("MainWindow", "&Save Input Config"))
+        self.action_Save.setShortcut(_translate("MainWindow", "Ctrl+S"))
+        self.actionExit.setText(_translate("MainWindow", "&Exit"))
+        self.actionExit.setShortcut(_translate("MainWindow", "Ctrl+Q"))
+        self.actionSave_Results.setText(_translate("MainWindow", "Save Results"))
+
+
+FORM_CLASS = Ui_MainWindow
+UI_HASH = '3eb295e8d96d2392585d159df5039a5a349989c3'
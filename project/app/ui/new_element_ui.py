@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'project/app/ui/new_element.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(749, 480)
+        self.verticalLayout = QtWidgets.QVBoxLayout(Dialog)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.formLayout = QtWidgets.QFormLayout()
+        self.formLayout.setObjectName("formLayout")
+        self.lbl_element_name = QtWidgets.QLabel(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.lbl_element_name.setFont(font)
+        self.lbl_element_name.setObjectName("lbl_element_name")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.lbl_element_name)
+        self.txt_element_name = QtWidgets.QLineEdit(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.txt_element_name.setFont(font)
+        self.txt_element_name.setObjectName("txt_element_name")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.txt_element_name)
+        self.lbl_elementtype = QtWidgets.QLabel(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.lbl_elementtype.setFont(font)
+        self.lbl_elementtype.setObjectName("lbl_elementtype")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.lbl_elementtype)
+        self.cmb_element_type = QtWidgets.QComboBox(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.cmb_element_type.setFont(font)
+        self.cmb_element_type.setObjectName("cmb_element_type")
+        self.cmb_element_type.addItem("")
+        self.cmb_element_type.addItem("")
+        self.cmb_element_type.addItem("")
+        self.cmb_element_type.addItem("")
+        self.cmb_element_type.addItem("")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.cmb_element_type)
+        self.lbl_know_gainloss = QtWidgets.QLabel(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.lbl_know_gainloss.setFont(font)
+        self.lbl_know_gainloss.setObjectName("lbl_know_gainloss")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.lbl_know_gainloss)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.rdl_yes = QtWidgets.QRadioButton(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.rdl_yes.setFont(font)
+        self.rdl_yes.setCheckable(True)
+        self.rdl_yes.setChecked(False)
+        self.rdl_yes.setAutoExclusive(True)
+        self.rdl_yes.setObjectName("rdl_yes")
+        self.horizontalLayout.addWidget(self.rdl_yes)
+        self.rdl_no = QtWidgets.QRadioButton(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.rdl_no.setFont(font)
+        self.rdl_no.setObjectName("rdl_no")
+        self.horizontalLayout.addWidget(self.rdl_no)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout.addItem(spacerItem)
+        self.formLayout.setLayout(1, QtWidgets.QFormLayout.FieldRole, self.horizontalLayout)
+        self.verticalLayout.addLayout(self.formLayout)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        self.verticalLayout.addItem(spacerItem1)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.lbl_description = QtWidgets.QLabel(Dialog)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.lbl_description.setFont(font)
+        self.lbl_description.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        self.lbl_description.setObjectName("lbl_description")
+        self.horizontalLayout_2.addWidget(self.lbl_description)
+        self.txt_description = QtWidgets.QPlainTextEdit(Dialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.MinimumExpanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.txt_description.sizePolicy().hasHeightForWidth())
+        self.txt_description.setSizePolicy(sizePolicy)
+        self.txt_description.setMinimumSize(QtCore.QSize(0, 50))
+        self.txt_description.setMaximumSize(QtCore.QSize(16777215, 100))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.txt_description.setFont(font)
+        self.txt_description.setReadOnly(True)
+        self.txt_description.setObjectName("txt_description")
+        self.horizontalLayout_2.addWidget(self.txt_description)
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+        spacerItem2 = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.MinimumExpanding)
+        self.verticalLayout.addItem(spacerItem2)
+        self.group_parameters = QtWidgets.QGroupBox(Dialog)
+        self.group_parameters.setEnabled(True)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.group_parameters.setFont(font)
+        self.group_parameters.setObjectName("group_parameters")
+        self.formLayout_2 = QtWidgets.QFormLayout(self.group_parameters)
+        self.formLayout_2.setObjectName("formLayout_2")
+        self.lbl_set_of_param = QtWidgets.QLabel(self.group_parameters)
+        self.lbl_set_of_param.setObjectName("lbl_set_of_param")
+        self.formLayout_2.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.lbl_set_of_param)
+        self.cmb_set_param = QtWidgets.QComboBox(self.group_parameters)
+        self.cmb_set_param.setEnabled(True)
+        self.cmb_set_param.setObjectName("cmb_set_param")
+        self.cmb_set_param.addItem("")
+        self.cmb_set_param.addItem("")
+        self.formLayout_2.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.cmb_set_param)
+        self.lbl_parameters = QtWidgets.QLabel(self.group_parameters)
+        self.lbl_parameters.setEnabled(True)
+        self.lbl_parameters.setObjectName("lbl_parameters")
+        self.formLayout_2.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.lbl_parameters)
+        self.txt_summary = QtWidgets.QPlainTextEdit(self.group_parameters)
+        self.txt_summary.setObjectName("txt_summary")
+        self.formLayout_2.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.txt_summary)
+        self.verticalLayout.addWidget(self.group_parameters)
+        self.buttonBox = QtWidgets.QDialogButtonBox(Dialog)
+        self.buttonBox.setEnabled(True)
+        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Cancel|QtWidgets.QDialogButtonBox.Ok)
+        self.buttonBox.setObjectName("buttonBox")
+        self.verticalLayout.addWidget(self.buttonBox)
+
+        self.retranslateUi(Dialog)
+        self.rdl_no.clicked.connect(Dialog.no_gain_clicked) # type: ignore
+        self.rdl_yes.clicked.connect(Dialog.yes_gain_clicked) # type: ignore
+        self.buttonBox.rejected.connect(Dialog.reject) # type: ignore
+        self.buttonBox.accepted.connect(Dialog.accept) # type: ignore
+        self.cmb_set_param.currentTextChanged['QString'].connect(Dialog.param_set_selected) # type: ignore
+        self.cmb_element_type.currentTextChanged['QString'].connect(Dialog.element_type_selected) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "New Element"))
+        self.lbl_element_name.setText(_translate("Dialog", "Element Name:"))
+        self.lbl_elementtype.setText(_translate("Dialog", "Element Type:"))
+        self.cmb_element_type.setItemText(0, _translate("Dialog", " -- "))
+        self.cmb_element_type.setItemText(1, _translate("Dialog", "Blank Item"))
+        self.cmb_element_type.setItemText(2, _translate("Dialog", "TX - Transmitter"))
+        self.cmb_element_type.setItemText(3, _translate("Dialog", "RX - Receiver"))
+        self.cmb_element_type.setItemText(4, _translate("Dialog", "Path Loss"))
+        self.lbl_know_gainloss.setText(_translate("Dialog", "Do you know the total Gain/Loss?      "))
+        self.rdl_yes.setText(_translate("Dialog", "Yes"))
+        self.rdl_no.setText(_translate("Dialog", "No"))
+        self.lbl_description.setText(_translate("Dialog", "Description:"))
+        self.group_parameters.setTitle(_translate("Dialog", "Attributes"))
+        self.lbl_set_of_param.setText(_translate("Dialog", "Set of Attributes:"))
+        self.cmb_set_param.setItemText(0, _translate("Dialog", "Set 1"))
+        self.cmb_set_param.setItemText(1, _translate("Dialog", "Set 2"))
+        self.lbl_parameters.setText(_translate("Dialog", "Required Inputs:"))
+
+
+FORM_CLASS = Ui_Dialog
+UI_HASH = 'ac5451e292a6ba45e60aedff49174edcc87371c8'
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'project/app/ui/plot_dock.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_PlotDock(object):
+    def setupUi(self, PlotDock):
+        PlotDock.setObjectName("PlotDock")
+        PlotDock.resize(520, 600)
+        self.dockWidgetContents = QtWidgets.QWidget()
+        self.dockWidgetContents.setObjectName("dockWidgetContents")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.dockWidgetContents)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.horizontalLayout_type = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_type.setObjectName("horizontalLayout_type")
+        self.cmb_plot_type = QtWidgets.QComboBox(self.dockWidgetContents)
+        self.cmb_plot_type.setObjectName("cmb_plot_type")
+        self.cmb_plot_type.addItem("")
+        self.cmb_plot_type.addItem("")
+        self.cmb_plot_type.addItem("")
+        self.cmb_plot_type.addItem("")
+        self.horizontalLayout_type.addWidget(self.cmb_plot_type)
+        self.btn_plot = QtWidgets.QPushButton(self.dockWidgetContents)
+        self.btn_plot.setObjectName("btn_plot")
+        self.horizontalLayout_type.addWidget(self.btn_plot)
+        self.verticalLayout.addLayout(self.horizontalLayout_type)
+        self.stk_settings = QtWidgets.QStackedWidget(self.dockWidgetContents)
+        self.stk_settings.setObjectName("stk_settings")
+        self.page_sweep = QtWidgets.QWidget()
+        self.page_sweep.setObjectName("page_sweep")
+        self.gridLayout_sweep = QtWidgets.QGridLayout(self.page_sweep)
+        self.gridLayout_sweep.setObjectName("gridLayout_sweep")
+        self.lbl_sweep_param = QtWidgets.QLabel(self.page_sweep)
+        self.lbl_sweep_param.setObjectName("lbl_sweep_param")
+        self.gridLayout_sweep.addWidget(self.lbl_sweep_param, 0, 1, 1, 1)
+        self.lbl_sweep_start = QtWidgets.QLabel(self.page_sweep)
+        self.lbl_sweep_start.setObjectName("lbl_sweep_start")
+        self.gridLayout_sweep.addWidget(self.lbl_sweep_start, 0, 2, 1, 1)
+        self.lbl_sweep_stop = QtWidgets.QLabel(self.page_sweep)
+        self.lbl_sweep_stop.setObjectName("lbl_sweep_stop")
+        self.gridLayout_sweep.addWidget(self.lbl_sweep_stop, 0, 3, 1, 1)
+        self.lbl_sweep_points = QtWidgets.QLabel(self.page_sweep)
+        self.lbl_sweep_points.setObjectName("lbl_sweep_points")
+        self.gridLayout_sweep.addWidget(self.lbl_sweep_points, 0, 4, 1, 1)
+        self.lbl_x = QtWidgets.QLabel(self.page_sweep)
+        self.lbl_x.setObjectName("lbl_x")
+        self.gridLayout_sweep.addWidget(self.lbl_x, 1, 0, 1, 1)
+        self.cmb_x_param = QtWidgets.QComboBox(self.page_sweep)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cmb_x_param.sizePolicy().hasHeightForWidth())
+        self.cmb_x_param.setSizePolicy(sizePolicy)
+        self.cmb_x_param.setObjectName("cmb_x_param")
+        self.gridLayout_sweep.addWidget(self.cmb_x_param, 1, 1, 1, 1)
+        self.txt_x_start = QtWidgets.QLineEdit(self.page_sweep)
+        self.txt_x_start.setObjectName("txt_x_start")
+        self.gridLayout_sweep.addWidget(self.txt_x_start, 1, 2, 1, 1)
+        self.txt_x_stop = QtWidgets.QLineEdit(self.page_sweep)
+        self.txt_x_stop.setObjectName("txt_x_stop")
+        self.gridLayout_sweep.addWidget(self.txt_x_stop, 1, 3, 1, 1)
+        self.spn_x_points = QtWidgets.QSpinBox(self.page_sweep)
+        self.spn_x_points.setMinimum(2)
+        self.spn_x_points.setMaximum(10000000)
+        self.spn_x_points.setProperty("value", 1000)
+        self.spn_x_points.setObjectName("spn_x_points")
+        self.gridLayout_sweep.addWidget(self.spn_x_points, 1, 4, 1, 1)
+        self.lbl_y = QtWidgets.QLabel(self.page_sweep)
+        self.lbl_y.setObjectName("lbl_y")
+        self.gridLayout_sweep.addWidget(self.lbl_y, 2, 0, 1, 1)
+        self.cmb_y_param = QtWidgets.QComboBox(self.page_sweep)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cmb_y_param.sizePolicy().hasHeightForWidth())
+        self.cmb_y_param.setSizePolicy(sizePolicy)
+        self.cmb_y_param.setObjectName("cmb_y_param")
+        self.gridLayout_sweep.addWidget(self.cmb_y_param, 2, 1, 1, 1)
+        self.txt_y_start = QtWidgets.QLineEdit(self.page_sweep)
+        self.txt_y_start.setObjectName("txt_y_start")
+        self.gridLayout_sweep.addWidget(self.txt_y_start, 2, 2, 1, 1)
+        self.txt_y_stop = QtWidgets.QLineEdit(self.page_sweep)
+        self.txt_y_stop.setObjectName("txt_y_stop")
+        self.gridLayout_sweep.addWidget(self.txt_y_stop, 2, 3, 1, 1)
+        self.spn_y_points = QtWidgets.QSpinBox(self.page_sweep)
+        self.spn_y_points.setMinimum(2)
+        self.spn_y_points.setMaximum(10000)
+        self.spn_y_points.setProperty("value", 200)
+        self.spn_y_points.setObjectName("spn_y_points")
+        self.gridLayout_sweep.addWidget(self.spn_y_points, 2, 4, 1, 1)
+        self.stk_settings.addWidget(self.page_sweep)
+        self.page_monte_carlo = QtWidgets.QWidget()
+        self.page_monte_carlo.setObjectName("page_monte_carlo")
+        self.formLayout_monte_carlo = QtWidgets.QFormLayout(self.page_monte_carlo)
+        self.formLayout_monte_carlo.setObjectName("formLayout_monte_carlo")
+        self.lbl_mc_param = QtWidgets.QLabel(self.page_monte_carlo)
+        self.lbl_mc_param.setObjectName("lbl_mc_param")
+        self.formLayout_monte_carlo.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.lbl_mc_param)
+        self.cmb_mc_param = QtWidgets.QComboBox(self.page_monte_carlo)
+        self.cmb_mc_param.setObjectName("cmb_mc_param")
+        self.formLayout_monte_carlo.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.cmb_mc_param)
+        self.lbl_mc_sigma = QtWidgets.QLabel(self.page_monte_carlo)
+        self.lbl_mc_sigma.setObjectName("lbl_mc_sigma")
+        self.formLayout_monte_carlo.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.lbl_mc_sigma)
+        self.txt_mc_sigma = QtWidgets.QLineEdit(self.page_monte_carlo)
+        self.txt_mc_sigma.setObjectName("txt_mc_sigma")
+        self.formLayout_monte_carlo.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.txt_mc_sigma)
+        self.lbl_mc_samples = QtWidgets.QLabel(self.page_monte_carlo)
+        self.lbl_mc_samples.setObjectName("lbl_mc_samples")
+        self.formLayout_monte_carlo.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.lbl_mc_samples)
+        self.spn_mc_samples = QtWidgets.QSpinBox(self.page_monte_carlo)
+        self.spn_mc_samples.setMinimum(10)
+        self.spn_mc_samples.setMaximum(100000000)
+        self.spn_mc_samples.setProperty("value", 100000)
+        self.spn_mc_samples.setObjectName("spn_mc_samples")
+        self.formLayout_monte_carlo.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.spn_mc_samples)
+        self.lbl_mc_bins = QtWidgets.QLabel(self.page_monte_carlo)
+        self.lbl_mc_bins.setObjectName("lbl_mc_bins")
+        self.formLayout_monte_carlo.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.lbl_mc_bins)
+        self.spn_mc_bins = QtWidgets.QSpinBox(self.page_monte_carlo)
+        self.spn_mc_bins.setMinimum(5)
+        self.spn_mc_bins.setMaximum(1000)
+        self.spn_mc_bins.setProperty("value", 100)
+        self.spn_mc_bins.setObjectName("spn_mc_bins")
+        self.formLayout_monte_carlo.setWidget(3, QtWidgets.QFormLayout.FieldRole, self.spn_mc_bins)
+        self.stk_settings.addWidget(self.page_monte_carlo)
+        self.page_pass = QtWidgets.QWidget()
+        self.page_pass.setObjectName("page_pass")
+        self.formLayout_pass = QtWidgets.QFormLayout(self.page_pass)
+        self.formLayout_pass.setObjectName("formLayout_pass")
+        self.lbl_altitude = QtWidgets.QLabel(self.page_pass)
+        self.lbl_altitude.setObjectName("lbl_altitude")
+        self.formLayout_pass.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.lbl_altitude)
+        self.txt_altitude = QtWidgets.QLineEdit(self.page_pass)
+        self.txt_altitude.setObjectName("txt_altitude")
+        self.formLayout_pass.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.txt_altitude)
+        self.lbl_inclination = QtWidgets.QLabel(self.page_pass)
+        self.lbl_inclination.setObjectName("lbl_inclination")
+        self.formLayout_pass.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.lbl_inclination)
+        self.txt_inclination = QtWidgets.QLineEdit(self.page_pass)
+        self.txt_inclination.setObjectName("txt_inclination")
+        self.formLayout_pass.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.txt_inclination)
+        self.lbl_latitude = QtWidgets.QLabel(self.page_pass)
+        self.lbl_latitude.setObjectName("lbl_latitude")
+        self.formLayout_pass.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.lbl_latitude)
+        self.txt_latitude = QtWidgets.QLineEdit(self.page_pass)
+        self.txt_latitude.setObjectName("txt_latitude")
+        self.formLayout_pass.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.txt_latitude)
+        self.lbl_longitude = QtWidgets.QLabel(self.page_pass)
+        self.lbl_longitude.setObjectName("lbl_longitude")
+        self.formLayout_pass.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.lbl_longitude)
+        self.txt_longitude = QtWidgets.QLineEdit(self.page_pass)
+        self.txt_longitude.setObjectName("txt_longitude")
+        self.formLayout_pass.setWidget(3, QtWidgets.QFormLayout.FieldRole, self.txt_longitude)
+        self.lbl_min_elevation = QtWidgets.QLabel(self.page_pass)
+        self.lbl_min_elevation.setObjectName("lbl_min_elevation")
+        self.formLayout_pass.setWidget(4, QtWidgets.QFormLayout.LabelRole, self.lbl_min_elevation)
+        self.txt_min_elevation = QtWidgets.QLineEdit(self.page_pass)
+        self.txt_min_elevation.setObjectName("txt_min_elevation")
+        self.formLayout_pass.setWidget(4, QtWidgets.QFormLayout.FieldRole, self.txt_min_elevation)
+        self.stk_settings.addWidget(self.page_pass)
+        self.verticalLayout.addWidget(self.stk_settings)
+        self.plot = PlotWidget(self.dockWidgetContents)
+        self.plot.setObjectName("plot")
+        self.verticalLayout.addWidget(self.plot)
+        PlotDock.setWidget(self.dockWidgetContents)
+
+        self.retranslateUi(PlotDock)
+        self.stk_settings.setCurrentIndex(0)
+        self.cmb_plot_type.currentIndexChanged['int'].connect(PlotDock.plot_type_changed) # type: ignore
+        self.cmb_x_param.activated['int'].connect(PlotDock.x_param_changed) # type: ignore
+        self.cmb_y_param.activated['int'].connect(PlotDock.y_param_changed) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(PlotDock)
+
+    def retranslateUi(self, PlotDock):
+        _translate = QtCore.QCoreApplication.translate
+        PlotDock.setWindowTitle(_translate("PlotDock", "Plots"))
+        self.cmb_plot_type.setToolTip(_translate("PlotDock", "Kind of plot"))
+        self.cmb_plot_type.setItemText(0, _translate("PlotDock", "Sweep"))
+        self.cmb_plot_type.setItemText(1, _translate("PlotDock", "2-D Sweep"))
+        self.cmb_plot_type.setItemText(2, _translate("PlotDock", "Monte Carlo"))
+        self.cmb_plot_type.setItemText(3, _translate("PlotDock", "Pass"))
+        self.btn_plot.setToolTip(_translate("PlotDock", "Evaluate the budget in the background and plot the margin"))
+        self.btn_plot.setText(_translate("PlotDock", "Plot"))
+        self.lbl_sweep_param.setText(_translate("PlotDock", "Parameter"))
+        self.lbl_sweep_start.setText(_translate("PlotDock", "From"))
+        self.lbl_sweep_stop.setText(_translate("PlotDock", "To"))
+        self.lbl_sweep_points.setText(_translate("PlotDock", "Points"))
+        self.lbl_x.setText(_translate("PlotDock", "X"))
+        self.lbl_y.setText(_translate("PlotDock", "Y"))
+        self.lbl_mc_param.setText(_translate("PlotDock", "Parameter"))
+        self.lbl_mc_sigma.setText(_translate("PlotDock", "Standard deviation"))
+        self.txt_mc_sigma.setToolTip(_translate("PlotDock", "Normal distribution around the configured value, in the units of the parameter"))
+        self.txt_mc_sigma.setText(_translate("PlotDock", "1"))
+        self.lbl_mc_samples.setText(_translate("PlotDock", "Samples"))
+        self.lbl_mc_bins.setText(_translate("PlotDock", "Bins"))
+        self.lbl_altitude.setText(_translate("PlotDock", "Orbit altitude [km]"))
+        self.txt_altitude.setText(_translate("PlotDock", "500"))
+        self.lbl_inclination.setText(_translate("PlotDock", "Inclination [deg]"))
+        self.txt_inclination.setText(_translate("PlotDock", "97.4"))
+        self.lbl_latitude.setText(_translate("PlotDock", "Station latitude [deg]"))
+        self.txt_latitude.setText(_translate("PlotDock", "52.0"))
+        self.lbl_longitude.setText(_translate("PlotDock", "Station longitude [deg]"))
+        self.txt_longitude.setText(_translate("PlotDock", "4.4"))
+        self.lbl_min_elevation.setText(_translate("PlotDock", "Elevation mask [deg]"))
+        self.txt_min_elevation.setText(_translate("PlotDock", "10"))
+from project.app.plots import PlotWidget
+
+
+FORM_CLASS = Ui_PlotDock
+UI_HASH = 'cdb05573e657d212044268cc43d698f37dd56ac8'
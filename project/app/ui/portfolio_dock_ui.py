@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'project/app/ui/portfolio_dock.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_PortfolioDock(object):
+    def setupUi(self, PortfolioDock):
+        PortfolioDock.setObjectName("PortfolioDock")
+        PortfolioDock.resize(520, 400)
+        self.dockWidgetContents = QtWidgets.QWidget()
+        self.dockWidgetContents.setObjectName("dockWidgetContents")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.dockWidgetContents)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.horizontalLayout_folder = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_folder.setObjectName("horizontalLayout_folder")
+        self.btn_open_folder = QtWidgets.QPushButton(self.dockWidgetContents)
+        self.btn_open_folder.setObjectName("btn_open_folder")
+        self.horizontalLayout_folder.addWidget(self.btn_open_folder)
+        self.lbl_folder = QtWidgets.QLabel(self.dockWidgetContents)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lbl_folder.sizePolicy().hasHeightForWidth())
+        self.lbl_folder.setSizePolicy(sizePolicy)
+        self.lbl_folder.setText("")
+        self.lbl_folder.setObjectName("lbl_folder")
+        self.horizontalLayout_folder.addWidget(self.lbl_folder)
+        self.btn_refresh = QtWidgets.QPushButton(self.dockWidgetContents)
+        self.btn_refresh.setObjectName("btn_refresh")
+        self.horizontalLayout_folder.addWidget(self.btn_refresh)
+        self.verticalLayout.addLayout(self.horizontalLayout_folder)
+        self.tbl_portfolio = QtWidgets.QTableView(self.dockWidgetContents)
+        self.tbl_portfolio.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.tbl_portfolio.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.tbl_portfolio.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.tbl_portfolio.setSortingEnabled(True)
+        self.tbl_portfolio.setObjectName("tbl_portfolio")
+        self.verticalLayout.addWidget(self.tbl_portfolio)
+        self.prg_portfolio = QtWidgets.QProgressBar(self.dockWidgetContents)
+        self.prg_portfolio.setProperty("value", 0)
+        self.prg_portfolio.setObjectName("prg_portfolio")
+        self.verticalLayout.addWidget(self.prg_portfolio)
+        PortfolioDock.setWidget(self.dockWidgetContents)
+
+        self.retranslateUi(PortfolioDock)
+        self.btn_open_folder.clicked.connect(PortfolioDock.open_folder_clicked) # type: ignore
+        self.btn_refresh.clicked.connect(PortfolioDock.refresh_clicked) # type: ignore
+        self.tbl_portfolio.clicked['QModelIndex'].connect(PortfolioDock.row_clicked) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(PortfolioDock)
+
+    def retranslateUi(self, PortfolioDock):
+        _translate = QtCore.QCoreApplication.translate
+        PortfolioDock.setWindowTitle(_translate("PortfolioDock", "Portfolio"))
+        self.btn_open_folder.setToolTip(_translate("PortfolioDock", "Choose a folder of configuration files"))
+        self.btn_open_folder.setText(_translate("PortfolioDock", "Open Folder..."))
+        self.btn_refresh.setToolTip(_translate("PortfolioDock", "Evaluate the files again that were added or modified"))
+        self.btn_refresh.setText(_translate("PortfolioDock", "Refresh"))
+        self.tbl_portfolio.setToolTip(_translate("PortfolioDock", "Click a configuration to open it"))
+
+
+FORM_CLASS = Ui_PortfolioDock
+UI_HASH = '1f1cc5bf5a94ccbced371e57cf524a31640ce36b'
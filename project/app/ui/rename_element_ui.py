@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'project/app/ui/rename_element.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Rename_Element_Dlg(object):
+    def setupUi(self, Rename_Element_Dlg):
+        Rename_Element_Dlg.setObjectName("Rename_Element_Dlg")
+        Rename_Element_Dlg.resize(400, 70)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(Rename_Element_Dlg.sizePolicy().hasHeightForWidth())
+        Rename_Element_Dlg.setSizePolicy(sizePolicy)
+        Rename_Element_Dlg.setMaximumSize(QtCore.QSize(800, 76))
+        Rename_Element_Dlg.setSizeGripEnabled(False)
+        self.gridLayout_2 = QtWidgets.QGridLayout(Rename_Element_Dlg)
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.buttonBox = QtWidgets.QDialogButtonBox(Rename_Element_Dlg)
+        self.buttonBox.setOrientation(QtCore.Qt.Vertical)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Cancel|QtWidgets.QDialogButtonBox.Ok)
+        self.buttonBox.setObjectName("buttonBox")
+        self.gridLayout_2.addWidget(self.buttonBox, 0, 1, 1, 1)
+        self.gridLayout = QtWidgets.QGridLayout()
+        self.gridLayout.setSizeConstraint(QtWidgets.QLayout.SetFixedSize)
+        self.gridLayout.setObjectName("gridLayout")
+        self.label = QtWidgets.QLabel(Rename_Element_Dlg)
+        self.label.setObjectName("label")
+        self.gridLayout.addWidget(self.label, 0, 0, 1, 1)
+        self.txt_name = QtWidgets.QLineEdit(Rename_Element_Dlg)
+        self.txt_name.setCursorPosition(0)
+        self.txt_name.setObjectName("txt_name")
+        self.gridLayout.addWidget(self.txt_name, 0, 1, 1, 1)
+        self.gridLayout_2.addLayout(self.gridLayout, 0, 0, 1, 1)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.gridLayout_2.addItem(spacerItem, 1, 0, 1, 2)
+
+        self.retranslateUi(Rename_Element_Dlg)
+        self.buttonBox.accepted.connect(Rename_Element_Dlg.accept) # type: ignore
+        self.buttonBox.rejected.connect(Rename_Element_Dlg.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(Rename_Element_Dlg)
+
+    def retranslateUi(self, Rename_Element_Dlg):
+        _translate = QtCore.QCoreApplication.translate
+        Rename_Element_Dlg.setWindowTitle(_translate("Rename_Element_Dlg", "Rename Element"))
+        self.label.setText(_translate("Rename_Element_Dlg", "New name (must be unique):"))
+
+
+FORM_CLASS = Ui_Rename_Element_Dlg
+UI_HASH = 'e47290566e723fb932cfd0dc5771904b567e50f2'
@@ -0,0 +1,376 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+title: worker.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Background evaluation for the User Interface.
+
+Anything that takes longer than a frame must not run on the Qt main thread, or the window
+freezes. A job is a generator that does the work in steps: every step yields
+(done, total, partial), with partial any intermediate result or None, and the job
+returns its final result. The Worker runs a job in a QThread and reports through signals,
+which Qt delivers on the main thread. Cancellation is checked between steps, so a job
+should keep its steps short (a chunk of a sweep, one Monte Carlo batch, ...).
+
+Progress is emitted at most at the refresh rate of the screen, together with the partial
+results of all steps since the previous update, so a job with many small steps does not
+flood the main thread.
+
+The calculation modules (link elements, SciPy, pandas) take much longer to import than the
+User Interface itself. They are only imported by the jobs, and by preload() in the
+background once the window is shown.
+"""
+import contextlib
+import copy
+import importlib
+import threading
+import time
+import traceback
+
+import numpy as np
+from PyQt5.QtCore import QObject, QThread, Qt, pyqtSignal, pyqtSlot
+
+CALCULATION_MODULES = ('project.process', 'project.batch')
+
+UPDATE_INTERVAL = 1 / 60    # [s], minimum time between two progress updates
+
+
+class Worker(QObject):
+    """Runs a job generator in a background thread
+
+    Signals
+    -------
+    progress(int, int)
+        Steps done and total number of steps
+    partial(list)
+        Partial results of the steps since the previous update, none are dropped
+    finished(object)
+        Final result of the job
+    failed(str)
+        Traceback of an exception raised by the job
+    cancelled()
+        The job was stopped by cancel()
+    """
+    progress = pyqtSignal(int, int)
+    partial = pyqtSignal(list)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, job):
+        """
+        Parameters
+        ----------
+        job : generator
+            Yields (done, total, partial) per step and returns the result
+        """
+        QObject.__init__(self)
+        self.job = job
+        self._cancel = threading.Event()
+        self._thread = None
+
+    def cancel(self):
+        """Requests the job to stop after its current step. Thread-safe"""
+        self._cancel.set()
+
+    def is_cancelled(self):
+        """Returns whether cancel() was called"""
+        return self._cancel.is_set()
+
+    def start(self, parent=None):
+        """Moves the worker to a new QThread and starts the job
+
+        The thread quits and both objects are deleted once the job ends, in any way.
+
+        Parameters
+        ----------
+        parent : QObject, optional
+            Parent of the thread, e.g. the window that started the job
+
+        Returns
+        -------
+        Worker
+            self, to keep a reference for cancel()
+        """
+        self._thread = QThread(parent)
+        self._thread.worker = self  # Keeps the worker alive until the thread has finished
+        self.moveToThread(self._thread)
+        self._thread.started.connect(self.run)
+        # Quit from the worker thread itself, so wait() on the main thread cannot block it
+        for signal in (self.finished, self.failed, self.cancelled):
+            signal.connect(self._thread.quit, Qt.DirectConnection)
+        self._thread.finished.connect(self.deleteLater)
+        self._thread.finished.connect(self._thread.deleteLater)
+        self._thread.start()
+        return self
+
+    def wait(self, msecs=None):
+        """Blocks until the thread has finished, see QThread.wait"""
+        if self._thread is None:
+            return True
+        return self._thread.wait() if msecs is None else self._thread.wait(msecs)
+
+    @pyqtSlot()
+    def run(self):
+        """Runs the job until it returns, raises or is cancelled"""
+        last_update = 0.0
+        partials = []
+        done, total = 0, 0
+        try:
+            while True:
+                if self._cancel.is_set():
+                    self.job.close()
+                    self.cancelled.emit()
+                    return
+
+                done, total, partial = next(self.job)
+                if partial is not None:
+                    partials.append(partial)
+
+                # Throttle updates, but always report the last step
+                now = time.perf_counter()
+                if now - last_update >= UPDATE_INTERVAL or done >= total:
+                    last_update = now
+                    self.progress.emit(done, total)
+                    if partials:
+                        self.partial.emit(partials)
+                        partials = []
+
+        except StopIteration as stop:
+            if self._cancel.is_set():
+                self.cancelled.emit()   # Result of a cancelled job is discarded
+                return
+            # Report the work after the last step, and what was throttled before it
+            self.progress.emit(total, total)
+            if partials:
+                self.partial.emit(partials)
+            self.finished.emit(stop.value)
+        except Exception:
+            self.failed.emit(traceback.format_exc())
+
+
+def preload():
+    '''Imports the calculation modules in a daemon thread
+
+    The first analysis then does not have to wait for the imports, while the window stays
+    responsive. Importing them again in a job is safe, Python imports each module once.
+
+    Returns
+    -------
+    threading.Thread
+    '''
+    def import_modules():
+        for module in CALCULATION_MODULES:
+            importlib.import_module(module)
+
+    thread = threading.Thread(target=import_modules, name='preload', daemon=True)
+    thread.start()
+    return thread
+
+
+def budget_job(user_data):
+    '''Job that runs the main process on a copy of a configuration
+
+    Parameters
+    ----------
+    user_data : dict
+        Configuration dictionary, not modified
+
+    Returns
+    -------
+    generator
+        Returns the results of project.process.main_process
+    '''
+    user_data = copy.deepcopy(user_data)    # The window may be edited meanwhile
+    yield 0, 1, None
+    from project.process import main_process
+    return main_process(user_data)
+
+
+def batch_job(user_data, columns, chunk_size=2**16, max_memory=None):
+    '''Job that evaluates a scenario table in chunks, e.g. a sweep or a Monte Carlo run
+
+    The columns are broadcast to a common shape and evaluated in chunks along the first
+    axis with a single project.batch.CompiledBudget. Every step yields the chunk as partial
+    result: {'slice': slice of the first axis, 'results': results of the chunk}
+
+    With a memory limit, the first chunk is small and its peak memory sizes the other
+    chunks, so that they fit next to the results of the full table, see project.memory.
+
+    Parameters
+    ----------
+    user_data : dict
+        Configuration dictionary, not modified
+    columns : dict
+        Scenario columns, see project.batch.evaluate_budget
+    chunk_size : int, default=2**16
+        Maximum number of samples per step
+    max_memory : int, optional
+        Memory limit of the job [B], by default project.memory.max_memory()
+
+    Raises
+    ------
+    MemoryError:
+        If the results do not fit within the memory limit
+
+    Returns
+    -------
+    generator
+        Returns the results of the full table, as project.batch.evaluate_budget
+    '''
+    from project import memory
+    from project.batch import CompiledBudget
+    from project.tracing import span
+
+    budget = CompiledBudget(copy.deepcopy(user_data))
+    names = list(columns)
+    arrays = np.broadcast_arrays(*(np.atleast_1d(np.asarray(columns[name])) for name in names))
+    shape = arrays[0].shape
+    row_size = max(1, int(np.prod(shape[1:])))
+    max_rows = max(1, chunk_size // row_size)
+    limit = memory.max_memory() if max_memory is None else max_memory
+    n_rows = max_rows if limit is None else max(1, min(max_rows, memory.PILOT_SIZE // row_size))
+
+    out = None  # Results of the full table, filled chunk by chunk
+    start, total = 0, shape[0]
+    while start < total:
+        part = slice(start, min(start + n_rows, total))
+        pilot = limit is not None and out is None   # Only the first chunk is traced, it is slow
+        with span('evaluate chunk', start=part.start, stop=part.stop), \
+                (memory.MemoryUse() if pilot else contextlib.nullcontext()) as use:
+            results = budget.evaluate({name: arr[part] for name, arr in zip(names, arrays)})
+            chunk_shape = (part.stop - part.start,) + shape[1:]
+            results = {key: np.broadcast_to(val, chunk_shape) for key, val in results.items()}
+        if out is None:
+            out = {key: np.empty((total,) + shape[1:], val.dtype) for key, val in results.items()}
+            if pilot:
+                # A chunk takes its peak, next to the results of the previous chunk that
+                # the caller may still hold
+                reserved = sum(arr.nbytes for arr in out.values())
+                row_bytes = use.peak / (part.stop - part.start) + reserved / total
+                n_rows = memory.chunk_rows(max_rows, row_bytes, reserved, limit)
+        for key, val in results.items():
+            out[key][part] = val
+        start = part.stop
+        yield part.stop, total, {'slice': part, 'results': results}
+
+    return out
+
+
+def histogram_job(user_data, columns, bins=100, key='total_margin', chunk_size=2**16,
+                  max_memory=None):
+    '''Job that evaluates a Monte Carlo scenario table and a histogram of one result
+
+    Parameters
+    ----------
+    user_data : dict
+        Configuration dictionary, not modified
+    columns : dict
+        Scenario columns of random samples, see project.batch.evaluate_budget
+    bins : int, default=100
+        Number of bins of the histogram
+    key : str, default='total_margin'
+        Result to count
+    chunk_size : int, default=2**16
+        Maximum number of samples per step
+    max_memory : int, optional
+        Memory limit of the job [B], see batch_job
+
+    Returns
+    -------
+    generator
+        Returns {'counts': ..., 'edges': ...} as numpy.histogram, and 'results' of the
+        full table as batch_job
+    '''
+    results = yield from batch_job(user_data, columns, chunk_size, max_memory)
+    values = np.ravel(results[key])
+    counts, edges = np.histogram(values[np.isfinite(values)], bins)
+    return {'counts': counts, 'edges': edges, 'results': results}
+
+
+def pass_job(user_data, orbit, station, min_elevation=0.0, duration=86400.0, step=1.0):
+    '''Job that finds the first pass of an orbit over a station and evaluates it
+
+    Parameters
+    ----------
+    user_data : dict
+        Configuration dictionary, not modified
+    orbit : project.orbit.Orbit
+    station : project.orbit.GroundStation
+        A single ground station
+    min_elevation : float, default=0.0
+        Elevation mask in [deg]
+    duration : float, default=86400.0
+        Time span since epoch to search in [s]
+    step : float, default=1.0
+        Sample step inside the pass in [s]
+
+    Returns
+    -------
+    generator
+        Returns the samples of the pass, see project.passes.evaluate_passes, or None
+        if there is no pass within the duration
+    '''
+    from project.passes import evaluate_passes, find_passes
+
+    user_data = copy.deepcopy(user_data)
+    yield 0, 2, None
+    passes = find_passes(orbit, station, 0.0, duration, min_elevation)
+    if passes.empty:
+        return None
+    yield 1, 2, None
+    _, samples = evaluate_passes(user_data, orbit, station, passes.iloc[:1], step,
+                                 return_samples=True)
+    return samples
+
+
+def portfolio_job(paths, cache, max_workers=None):
+    '''Job that summarizes a list of configuration files, see project.portfolio
+
+    Every file is a step, with partial result {'path': ..., 'summary': ..., 'cached': ...}.
+    Cached summaries come first, the others as their worker process finishes.
+
+    Parameters
+    ----------
+    paths : list of Path
+        Configuration files
+    cache : project.portfolio.ResultCache
+        Summaries of files evaluated before, updated and saved by the job
+    max_workers : int, optional
+        Number of worker processes, by default the number of processors
+
+    Returns
+    -------
+    generator
+        Returns {path: summary}
+    '''
+    from project.portfolio import evaluate_configs
+
+    summaries = {}
+    total = len(paths)
+    yield 0, total, None
+    try:
+        for path, summary, cached in evaluate_configs(paths, cache, max_workers):
+            summaries[path] = summary
+            yield len(summaries), total, {'path': path, 'summary': summary, 'cached': cached}
+    finally:
+        cache.save()    # Keeps the files done so far, also when cancelled
+    return summaries
+
+
+if __name__ == '__main__':
+    # Runs a Monte Carlo job without event loop, as the Worker does
+    from pathlib import Path
+    from project.process import load_from_yaml
+    from project.settings import CONFIGS_DIR
+
+    data = load_from_yaml(Path(CONFIGS_DIR, 'Example_Delfi.yaml'))
+    job = batch_job(data, {'input_power': np.random.normal(30, 1, 10**6)})
+    try:
+        while True:
+            print(next(job)[:2])
+    except StopIteration as stop:
+        print(np.mean(stop.value['total_margin']))
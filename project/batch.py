@@ -0,0 +1,408 @@
+# -*- coding: utf-8 -*-
+"""
+title: batch.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Evaluation of a link budget for many scenarios at once.
+
+A scenario table (pandas DataFrame or NumPy structured array) holds one row per
+scenario and one column per varied value. Columns are named after the value they
+replace in the base configuration:
+    - "<element name>.<parameter>" for an element parameter, e.g. "Path Loss.distance"
+    - "<element name>.gain_loss" for the gain of a GENERIC (gain_loss) element
+    - "input_power" or "rx_sys_threshold" for the general values
+
+Values are given in the units of element_reference.yaml, exactly as in a configuration
+file. Every column is passed to the link element classes as a single array, so the
+scenarios are evaluated without building a configuration dictionary per row.
+"""
+
+import numpy as np
+import pandas as pd
+
+import project.link_element as le
+from project.process import load_from_yaml, noise_element_name
+from project.settings import ELEMENT_REFERENCE
+from project.tracing import span
+from project.unit_conversion import convert_parameters
+
+GENERAL_COLUMNS = ('input_power', 'rx_sys_threshold')
+RESULT_COLUMNS = ('total_gain', 'output_power', 'total_margin')
+
+
+def scenario_columns(scenarios):
+    '''Get the columns of a scenario table as 1-D arrays
+
+    No data is copied: DataFrame columns are returned as views on the underlying
+    blocks where pandas allows it, and the fields of a structured array are always views.
+
+    Parameters
+    ----------
+    scenarios : pandas.DataFrame or numpy.ndarray
+        Scenario table, a structured array must have named fields
+
+    Raises
+    ------
+    TypeError:
+        If scenarios is neither a DataFrame nor a structured array
+
+    Returns
+    -------
+    dict
+        {column name: numpy.ndarray}
+    '''
+    if isinstance(scenarios, pd.DataFrame):
+        return {str(col): scenarios[col].to_numpy(copy=False) for col in scenarios.columns}
+
+    if isinstance(scenarios, np.ndarray) and scenarios.dtype.names is not None:
+        return {name: scenarios[name] for name in scenarios.dtype.names}
+
+    raise TypeError('Scenarios must be a pandas DataFrame or a NumPy structured array')
+
+
+def split_columns(user_data, columns):
+    '''Sort scenario columns into general values and per-element overrides
+
+    Parameters
+    ----------
+    user_data : dict
+        Base configuration dictionary
+    columns : dict
+        {column name: array}, see module docstring for the naming of columns
+
+    Raises
+    ------
+    KeyError:
+        If a column does not refer to an existing element attribute or general value
+
+    Returns
+    -------
+    dict
+        {general value: array}
+    dict
+        {element name: {parameter or 'gain_loss': array}}
+    '''
+    general = {}
+    overrides = {}
+    for column, values in columns.items():
+        if column in GENERAL_COLUMNS:
+            general[column] = values
+            continue
+
+        element, _, attribute = column.rpartition('.')
+        if element not in user_data['elements']:
+            raise KeyError(f'Scenario column "{column}" does not match any element or general value')
+
+        parameters = user_data['elements'][element]['parameters'] or {}
+        if attribute != 'gain_loss' and attribute not in parameters:
+            raise KeyError(f'Scenario column "{column}": element "{element}" has no '
+                           f'parameter "{attribute}"')
+
+        overrides.setdefault(element, {})[attribute] = values
+
+    return general, overrides
+
+
+def is_additive(attributes):
+    '''Whether an element enters the budget only through its given gain_loss'''
+    return attributes['link_type'] == 'GENERIC' or attributes['input_type'] == 'gain_loss'
+
+
+def build_element(name, attributes, overrides=None, param_ref=None):
+    '''Create the link element object of an element given by parameters
+
+    Parameters
+    ----------
+    name : str
+        Element name
+    attributes : dict
+        Element dictionary as found in a configuration file (units of element_reference.yaml)
+    overrides : dict, optional
+        {parameter: value or array} replacing the configuration values
+    param_ref : dict, optional
+        Loaded element_reference.yaml. Loaded from file if not given
+
+    Returns
+    -------
+    LinkElement
+        Processed element of the class matching the link type
+    '''
+    link_type = attributes['link_type']
+    input_type = attributes['input_type']
+
+    if param_ref is None:
+        param_ref = load_from_yaml(ELEMENT_REFERENCE)
+
+    parameters = dict(attributes['parameters'] or {})
+    parameters.update(overrides or {})
+    parameters = convert_parameters(parameters, param_ref[link_type][input_type])
+
+    link_class = getattr(le, f'{link_type}_LinkElement')
+    return link_class(name, input_type, None, parameters)
+
+
+def element_gain(name, attributes, overrides=None, param_ref=None):
+    '''Calculate the gain of a single element, with array-valued parameters
+
+    Parameters
+    ----------
+    name : str
+        Element name
+    attributes : dict
+        Element dictionary as found in a configuration file (units of element_reference.yaml)
+    overrides : dict, optional
+        {parameter or 'gain_loss': value or array} replacing the configuration values
+    param_ref : dict, optional
+        Loaded element_reference.yaml. Loaded from file if not given
+
+    Returns
+    -------
+    float or numpy.ndarray
+        Gain [dB], with the broadcast shape of all overriding arrays
+    '''
+    overrides = overrides or {}
+
+    # Gain is directly given (GENERIC or any element with a gain_loss input type)
+    if is_additive(attributes):
+        return overrides.get('gain_loss', attributes['gain_loss'])
+
+    return build_element(name, attributes, overrides, param_ref).gain
+
+
+class CompiledBudget:
+    '''Link budget split into cached physics gains and additive terms
+
+    The input power, the threshold and the gain of GENERIC (gain_loss) elements enter
+    the budget additively in dB. The gains of elements given by parameters are only
+    computed for elements whose parameters are varied; the others are computed once,
+    on first use, and summed into a constant. A sweep or Monte Carlo run over additive
+    terms is then a broadcast add on that constant, without calling any element.
+
+    The elements of the configuration must not be added, removed or renamed after the
+    budget is compiled. After editing the values of an element, call invalidate(name),
+    so that only that element is computed again (e.g. live recalculation in the GUI).
+
+    ...
+
+    Attributes
+    ----------
+    user_data : dict
+        Base configuration dictionary
+    noise_name : str or None
+        Name of the NOISE element, see process.noise_element_name
+
+    Methods:
+    -------
+    evaluate(columns)
+        Returns the budget for arrays of values, as evaluate_budget
+    cached_gain(name)
+        Returns the gain of an element with its configuration values
+    invalidate(name)
+        Forgets the cached gain of an element whose values were edited
+    '''
+    def __init__(self, user_data, gains=None):
+        '''
+        Parameters
+        ----------
+        user_data : dict
+            Base configuration dictionary, supplying every value that is not varied
+        gains : dict, optional
+            {name: gain} already known for the configuration values, e.g. the results of
+            process.main_process. These elements are not computed again
+        '''
+        self.user_data = user_data
+        self.noise_name = noise_element_name(user_data['elements'])
+        self._param_ref = load_from_yaml(ELEMENT_REFERENCE)
+        self._elements = {}     # {name: processed element with the configuration values}
+        self._gains = dict(gains or {})     # {name: gain with the configuration values}
+
+    def _element(self, name):
+        if name not in self._elements:
+            with span('compile', element=name):
+                self._elements[name] = build_element(name, self.user_data['elements'][name],
+                                                     param_ref=self._param_ref)
+        return self._elements[name]
+
+    def cached_gain(self, name):
+        '''Returns the gain [dB] of an element with its configuration values'''
+        attributes = self.user_data['elements'][name]
+        if is_additive(attributes):
+            return attributes['gain_loss']
+        if name not in self._gains:
+            self._gains[name] = self._element(name).gain
+        return self._gains[name]
+
+    def invalidate(self, name):
+        '''Forgets the cached gain of an element, after its configuration values changed
+
+        Parameters
+        ----------
+        name : str
+            Element name
+        '''
+        self._gains.pop(name, None)
+        self._elements.pop(name, None)
+
+    def evaluate(self, columns):
+        '''Evaluate the link budget for arrays of values
+
+        Parameters
+        ----------
+        columns : dict
+            {column name: array}, see module docstring for the naming of columns
+
+        Returns
+        -------
+        dict
+            See evaluate_budget
+        '''
+        general, overrides = split_columns(self.user_data, columns)
+
+        results = {}
+        constant = 0.0      # configuration values, scalars
+        varied = []         # overridden values, arrays
+        noise = None
+        for name, attributes in self.user_data['elements'].items():
+            override = overrides.get(name)
+            if override is None:
+                gain = self.cached_gain(name)
+                constant += gain
+                if name == self.noise_name:
+                    noise = self._element(name)
+            elif is_additive(attributes):
+                gain = override.get('gain_loss', attributes['gain_loss'])
+                varied.append(gain)
+            else:
+                element = build_element(name, attributes, override, self._param_ref)
+                gain = element.gain
+                varied.append(gain)
+                if name == self.noise_name:
+                    noise = element
+            results[f'{name}.gain_loss'] = gain
+
+        gain_sum = constant
+        for gain in varied:
+            gain_sum = gain_sum + gain
+
+        input_power = general.get('input_power', self.user_data['general_values']['input_power'])
+        threshold = general.get('rx_sys_threshold',
+                                self.user_data['general_values']['rx_sys_threshold'])
+
+        # Same definitions as process.sum_results
+        output_power = input_power + gain_sum
+        results['total_gain'] = gain_sum
+        results['output_power'] = output_power
+        results['total_margin'] = threshold - output_power
+        if noise is not None:
+            results.update(noise.link_quality(output_power))
+
+        return results
+
+    __call__ = evaluate
+
+
+def evaluate_budget(user_data, columns):
+    '''Evaluate a link budget for arrays of values
+
+    All arrays must be broadcastable against each other. 1-D arrays give one result
+    per scenario, but higher dimensional arrays (for example satellite x station x time)
+    are handled in the same way. Elements whose parameters are not varied are
+    evaluated once; use a CompiledBudget to also reuse them across calls.
+
+    Parameters
+    ----------
+    user_data : dict
+        Base configuration dictionary, supplying every value that is not in columns
+    columns : dict
+        {column name: array}, see module docstring for the naming of columns
+
+    Returns
+    -------
+    dict
+        {"<element name>.gain_loss": gain, 'total_gain': ..., 'output_power': ...,
+        'total_margin': ...}, followed by 'c_n0', 'eb_n0' and 'ebn0_margin' if the
+        budget contains a NOISE element. Results have the broadcast shape of the columns
+    '''
+    return CompiledBudget(user_data).evaluate(columns)
+
+
+def evaluate_data_rates(user_data, data_rates, columns=None):
+    '''Evaluate the Eb/N0 margin of a link budget against an array of data rates
+
+    The budget is evaluated once: the data rates only enter through Eb/N0, along a
+    new last axis. This gives a rate selection table without a run per data rate.
+
+    Parameters
+    ----------
+    user_data : dict
+        Base configuration dictionary, with a NOISE element given by parameters
+    data_rates : numpy.ndarray
+        1-D array of data rates, in the units of element_reference.yaml [kbit/s]
+    columns : dict, optional
+        {column name: array} of other varied values, see module docstring
+
+    Raises
+    ------
+    ValueError:
+        If the configuration has no NOISE element
+
+    Returns
+    -------
+    dict
+        As evaluate_budget, with 'data_rate', 'eb_n0' and 'ebn0_margin' of shape
+        (*shape of the columns, number of data rates)
+    '''
+    noise_name = noise_element_name(user_data['elements'])
+    if noise_name is None:
+        raise ValueError('Evaluating data rates requires a NOISE element given by parameters')
+
+    data_rates = np.asarray(data_rates, dtype=float)
+    columns = {col: np.asarray(val)[..., None] for col, val in (columns or {}).items()}
+    columns[f'{noise_name}.data_rate'] = data_rates
+
+    results = evaluate_budget(user_data, columns)
+    results['data_rate'] = data_rates
+    return results
+
+
+def batch_process(user_data, scenarios):
+    '''Evaluate a link budget for every scenario in a table
+
+    Parameters
+    ----------
+    user_data : dict
+        Base configuration dictionary, supplying every value that is not varied
+    scenarios : pandas.DataFrame or numpy.ndarray
+        Scenario table, one row per scenario. See module docstring for the naming
+        of columns
+
+    Returns
+    -------
+    pandas.DataFrame or numpy.ndarray
+        Same type as scenarios, one row per scenario with the gain of each element
+        ("<element name>.gain_loss") followed by 'total_gain', 'output_power' and
+        'total_margin'. A DataFrame shares the index of scenarios
+    '''
+    n_rows = len(scenarios)
+    results = evaluate_budget(user_data, scenario_columns(scenarios))
+
+    if isinstance(scenarios, pd.DataFrame):
+        return pd.DataFrame({col: np.broadcast_to(val, n_rows) for col, val in results.items()},
+                            index=scenarios.index)
+
+    out = np.empty(n_rows, dtype=[(col, float) for col in results])
+    for col, val in results.items():
+        out[col] = val
+    return out
+
+
+if __name__ == '__main__':
+    from project.settings import CONFIGS_DIR
+    from pathlib import Path
+
+    data = load_from_yaml(Path(CONFIGS_DIR, 'demo.yaml'))
+    sweep = pd.DataFrame({'Free Space.elevation_angle': np.linspace(5, 90, 10),
+                          'input_power': np.full(10, 60.0)})
+    print(batch_process(data, sweep))
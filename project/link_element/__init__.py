@@ -2,4 +2,9 @@ from .generic_element import LinkElement
 from .rx_link_element import RX_LinkElement
 from .tx_link_element import TX_LinkElement
 from .free_space_link_element import FREE_SPACE_LinkElement
-from .atmospheric_link_element import ATMOSPHERIC_LinkElement
\ No newline at end of file
+from .atmospheric_link_element import ATMOSPHERIC_LinkElement
+from .rain_link_element import RAIN_LinkElement
+from .noise_link_element import NOISE_LinkElement
+from .beam_divergence_link_element import BEAM_DIVERGENCE_LinkElement
+from .pointing_link_element import POINTING_LinkElement
+from .turbulence_link_element import TURBULENCE_LinkElement
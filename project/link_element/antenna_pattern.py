@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+title: antenna_pattern.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Tabulated antenna radiation patterns, interpolated at arrays of pointing angles.
+
+Two layouts are read, from CSV (comma separated, optional header line) or NPY files:
+    - 1-D: two columns, off-boresight angle [deg] and gain [dBi]. If all angles are
+      non-negative the pattern is taken as rotationally symmetric and evaluated at the
+      absolute off-boresight angle.
+    - 2-D: a matrix of gains [dBi], with the azimuth offsets [deg] in the first
+      column and the elevation offsets [deg] in the first row (the top-left value is
+      ignored).
+Angles must be strictly increasing. Outside the tabulated angles the gain at the
+nearest edge of the table is used.
+
+Files are read and converted once, and read again when their modification time or size
+changes. Relative paths are taken relative to settings.PATTERNS_DIR.
+"""
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from project.settings import PATTERNS_DIR
+
+
+def _read_table(path):
+    '''Returns the numerical table in a CSV or NPY file'''
+    if path.suffix.lower() == '.npy':
+        return np.load(path)
+    # A non-numeric header line is skipped by reading it as NaN
+    table = np.genfromtxt(path, delimiter=',')
+    if np.all(np.isnan(table[0, 1:])):
+        table = table[1:]
+    return table
+
+
+def _check_axis(axis, path):
+    if np.any(np.diff(axis) <= 0):
+        raise ValueError(f'Antenna pattern {path}: angles must be strictly increasing')
+    return np.ascontiguousarray(axis, dtype=float)
+
+
+class AntennaPattern:
+    '''Antenna gain pattern in one or two angles
+
+    ...
+
+    Attributes
+    ----------
+    axes : tuple of numpy.ndarray
+        Tabulated angles [deg], (off-boresight,) or (azimuth, elevation)
+    gain : numpy.ndarray
+        Tabulated gain [dBi]
+    symmetric : bool
+        1-D pattern evaluated at the absolute off-boresight angle
+
+    Methods:
+    -------
+    __call__(*angles)
+        Returns the interpolated gain
+    '''
+    def __init__(self, axes, gain):
+        '''
+        Parameters
+        ----------
+        axes : tuple of numpy.ndarray
+            Strictly increasing angles [deg], one array per dimension of gain
+        gain : numpy.ndarray
+            Gain [dBi]
+        '''
+        self.axes = tuple(np.ascontiguousarray(a, dtype=float) for a in axes)
+        self.gain = np.ascontiguousarray(gain, dtype=float)
+        if self.gain.shape != tuple(a.size for a in self.axes):
+            raise ValueError('Antenna pattern gain does not match its angles')
+        self.symmetric = self.gain.ndim == 1 and self.axes[0][0] >= 0
+
+    @property
+    def ndim(self):
+        return self.gain.ndim
+
+    def __call__(self, *angles):
+        '''Returns the gain at the given angles [dBi]
+
+        Parameters
+        ----------
+        *angles : float or numpy.ndarray
+            Off-boresight angle for a 1-D pattern, or azimuth and elevation offset
+            for a 2-D pattern [deg]. Arrays broadcast against each other
+
+        Returns
+        -------
+        float or numpy.ndarray
+        '''
+        if len(angles) != self.ndim:
+            raise ValueError(f'A {self.ndim}-D antenna pattern needs {self.ndim} angle(s)')
+
+        if self.ndim == 1:
+            theta = np.abs(angles[0]) if self.symmetric else angles[0]
+            return np.interp(theta, self.axes[0], self.gain)
+
+        # Bilinear interpolation, clamped to the edges of the table
+        az, el = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in angles))
+        weights, index = [], []
+        for axis, x in zip(self.axes, (az, el)):
+            x = np.clip(x, axis[0], axis[-1])
+            i = np.clip(np.searchsorted(axis, x, side='right') - 1, 0, axis.size - 2)
+            weights.append((x - axis[i]) / (axis[i + 1] - axis[i]))
+            index.append(i)
+        (wa, we), (ia, ie) = weights, index
+        g = self.gain
+        out = (g[ia, ie] * (1 - wa) * (1 - we) + g[ia + 1, ie] * wa * (1 - we)
+               + g[ia, ie + 1] * (1 - wa) * we + g[ia + 1, ie + 1] * wa * we)
+        return out[()]
+
+
+@lru_cache(maxsize=32)
+def _load_pattern(path, mtime_ns, size):
+    # The modification time and size are only part of the cache key, so that an edited
+    # file is read again
+    table = _read_table(path)
+    if table.ndim != 2 or table.shape[1] < 2:
+        raise ValueError(f'Antenna pattern {path}: expected a table of at least two columns')
+
+    if table.shape[1] == 2:
+        return AntennaPattern((_check_axis(table[:, 0], path),), table[:, 1])
+    return AntennaPattern((_check_axis(table[1:, 0], path), _check_axis(table[0, 1:], path)),
+                          table[1:, 1:])
+
+
+def load_pattern(path):
+    '''Returns the antenna pattern in a file, read again only if the file changed
+
+    Parameters
+    ----------
+    path : str or Path
+        CSV or NPY file, absolute or relative to settings.PATTERNS_DIR
+
+    Raises
+    ------
+    FileNotFoundError:
+        If the file does not exist
+    ValueError:
+        If the table layout is not recognised
+
+    Returns
+    -------
+    AntennaPattern
+    '''
+    path = Path(path)
+    if not path.is_absolute():
+        path = Path(PATTERNS_DIR, path)
+    path = path.resolve()
+    if not path.is_file():
+        raise FileNotFoundError(f'Antenna pattern file not found: {path}')
+    stat = path.stat()
+    return _load_pattern(path, stat.st_mtime_ns, stat.st_size)
+
+
+if __name__ == '__main__':
+    # Put any code here you want to use to test the class
+    # (like a scratch pad to test stuff while you're working)
+    import time
+
+    pattern = load_pattern('example_dish.csv')
+    theta = np.random.default_rng(0).uniform(-10, 10, 10_000_000)
+    start = time.perf_counter()
+    pattern(theta)
+    print(f'{theta.size / (time.perf_counter() - start) / 1e6:.1f} M points/s')
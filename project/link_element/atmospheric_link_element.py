@@ -4,7 +4,10 @@ Created on Sun May 23 18:46:47 2021
 
 @author: Willem van Lynden
 """
+from functools import lru_cache
+
 from project.link_element import LinkElement
+from project.link_element import itu_p676
 import numpy as np
 
 c = 299792458   #[m/s]
@@ -38,14 +41,27 @@ class ATMOSPHERIC_LinkElement(LinkElement):
             'elevation_angle': int
                 The elevation from the horizon of ground station to the 
                 spacecraft in [deg]
+            'gs_altitude': int
+                Altitude of the ground station in [m] (parameter_set_3)
+            'n_layers': int
+                Number of atmospheric layers (parameter_set_3)
+    lookup_table : AttenuationTable or None
+        Class attribute. If set, parameter_set_2 interpolates the zenith
+        attenuation in this table instead of evaluating ITU-R P.676-12.
     Methods:
     -------
     process()
         Updates the attenuation loss
+    zenithAttenuation()
+        Returns the zenith attenuation, once per weather state
     attenuationDryAir()
         Returns the attenuation in dry air based on ITU-R P.676-9
     attenuationWetAir()
         Returns the attenuation in wet air based on ITU-R P.676-9
+    attenuationLineByLine()
+        Returns the attenuation in dry and wet air based on ITU-R P.676-12 Annex 1
+    attenuationLayered()
+        Returns the slant path attenuation through a layered atmosphere
     g()
         Wet air attenuation substitution calculation in Rec. ITU-R P.676-10
     phi()
@@ -54,6 +70,10 @@ class ATMOSPHERIC_LinkElement(LinkElement):
     Although not defined here, methods "dB(value)", "get_gain()" and 
     "get_loss()" are automatically inherited and will also work
     """
+    # Fast mode for large simulations, e.g.
+    # ATMOSPHERIC_LinkElement.lookup_table = AttenuationTable.cached()
+    lookup_table = None
+
     def __init__(self, name, input_type, gain, parameters):
         '''
         Parameters
@@ -78,6 +98,10 @@ class ATMOSPHERIC_LinkElement(LinkElement):
             'elevation_angle': int
                 The elevation from the horizon of ground station to the 
                 spacecraft in [deg]
+            'gs_altitude': int
+                Altitude of the ground station in [m] (parameter_set_3)
+            'n_layers': int
+                Number of atmospheric layers (parameter_set_3)
         '''
         
         # Run the initialization of parent LinkElement
@@ -90,7 +114,9 @@ class ATMOSPHERIC_LinkElement(LinkElement):
         self.ro = parameters.get('water_vapor_content', None)*1e3   # [g/m**3]
         self.wavelength = parameters.get('wavelength', None)        # [m]
         self.angle = parameters.get('elevation_angle', None)        # [deg]
-        self.f = c/self.wavelength*1e-6                             # [GHz]
+        self.f = c/self.wavelength*1e-9                             # [GHz]
+        self.gs_altitude = parameters.get('gs_altitude', 0)*1e-3    # [km]
+        self.n_layers = parameters.get('n_layers', 100)             # [-]
         # Check if gain/loss is given directly or calculations are required
         if self.input_type != 'gain_loss':
             self.process()
@@ -98,19 +124,53 @@ class ATMOSPHERIC_LinkElement(LinkElement):
     def process(self):
         '''Updates the attenuation loss
         
-        Follows the "RECOMMENDATION ITU-R P.676-9 - Attenuation by
+        Follows the "RECOMMENDATION ITU-R P.676 - Attenuation by
         atmospheric gases" document of the International Telecommunication
-        Union. The calculations of attenuation in wet and dry air are summated
-        and multiplied with the path length.
+        Union. The zenith attenuations in wet and dry air are summated
+        and multiplied with the cosecant of the elevation. The zenith
+        attenuation does not depend on the elevation and is only evaluated
+        once per weather state, see zenithAttenuation().
+        parameter_set_1 uses the Annex 2 approximation of P.676-9, valid up
+        to 54 GHz for dry air. parameter_set_2 uses the line-by-line
+        specific attenuations of P.676-12 Annex 1, valid up to 1000 GHz,
+        or interpolates them in lookup_table when it is set.
+        parameter_set_3 integrates the line-by-line specific attenuation
+        along a refracted path through a layered atmosphere instead.
 
         Returns
         -------
         None
 
         '''
+        if self.input_type == 'parameter_set_3':
+            # The path length through each layer replaces the cosecant
+            self.gain = -self.attenuationLayered()
+            return
         # Summates the attenuations due to the path through wet and dry air
-        self.gain = -(self.attenuationWetAir() + self.attenuationDryAir()
-                     ) / np.sin(self.angle / 180 * np.pi)
+        self.gain = -self.zenithAttenuation() / np.sin(self.angle / 180 * np.pi)
+
+    def zenithAttenuation(self):
+        '''Returns the zenith attenuation, once per weather state
+        
+        The zenith attenuation only depends on the frequency, temperature,
+        pressure and water vapour content. It is cached for a scalar weather
+        state, so that rebuilding the element for other elevations (passes,
+        batch sweeps) only recomputes the cosecant. Arrays of weather states
+        are evaluated once per distinct state.
+
+        Returns
+        -------
+        double
+
+        '''
+        if self.input_type == 'parameter_set_2':
+            return self.attenuationLineByLine()
+
+        weather = (self.f, self.p, self.ro, self.t)
+        if all(np.ndim(x) == 0 for x in weather):
+            return _cached_annex2_zenith(*(float(x) for x in weather))
+        return itu_p676.per_weather_state(_annex2_zenith, *weather)
+
     def attenuationDryAir(self):
         '''Returns the attenuation in dry air based on ITU-R P.676-9
         
@@ -129,9 +189,9 @@ class ATMOSPHERIC_LinkElement(LinkElement):
         rp= ptot/ 1013
         rt= 288 / (273 + self.t)
 
-        xi1 = float(self.phi(rp, rt, 0.0717, -1.8132, 0.0156, -1.6515))
-        xi2 = float(self.phi(rp, rt, 0.5146, -4.6368, -0.1921, -5.7416))
-        xi3 = float(self.phi(rp, rt, 0.3414, -6.5851, 0.2130, -8.5854))
+        xi1 = self.phi(rp, rt, 0.0717, -1.8132, 0.0156, -1.6515)
+        xi2 = self.phi(rp, rt, 0.5146, -4.6368, -0.1921, -5.7416)
+        xi3 = self.phi(rp, rt, 0.3414, -6.5851, 0.2130, -8.5854)
         gamma0 = (((7.2 * rt**(2.8)) / (self.f**2 + 0.34 * rp**2 * rt**(1.6)))
                   + ((0.62 * xi3) / ((54 -self.f)**(1.16 * xi1) + 0.83 * xi2))
                   ) * self.f**2 * rp**2 * 1e-3
@@ -199,6 +259,51 @@ class ATMOSPHERIC_LinkElement(LinkElement):
 
         return att
 
+    def attenuationLineByLine(self):
+        '''Returns the attenuation in dry and wet air based on ITU-R P.676-12
+        
+        Calculates the zenith attenuation from the specific attenuations of
+        the line-by-line summation over all oxygen and water vapour lines
+        (Annex 1), multiplied with the equivalent heights of dry air and
+        water vapour (Annex 2). The function is valid from 1 to 1000 GHz.
+        It is cached per weather state, see itu_p676.zenith_attenuation.
+        If lookup_table is set, the zenith attenuation is interpolated in
+        the table instead.
+
+        Returns
+        -------
+        double
+
+        '''
+        T = self.t + 273.15
+        if self.lookup_table is not None:
+            return self.lookup_table.zenith_attenuation(self.f, self.p, self.ro, T)
+
+        att = itu_p676.zenith_attenuation(self.f, self.p, self.ro, T)
+
+        return att
+
+    def attenuationLayered(self):
+        '''Returns the slant path attenuation through a layered atmosphere
+        
+        Follows Annex 1, Section 2.2 of ITU-R P.676-12. The atmosphere
+        between the ground station and 100 km is split into n_layers layers
+        with the ITU-R P.835 reference profiles, scaled to the given surface
+        weather. The line-by-line specific attenuation of each layer is
+        multiplied with the ray-traced path length through that layer,
+        including refraction, which remains valid at low elevations.
+
+        Returns
+        -------
+        double
+
+        '''
+        att = itu_p676.slant_attenuation(self.f, self.angle, self.t + 273.15,
+                                         self.p, self.ro, self.gs_altitude,
+                                         self.n_layers)
+
+        return att
+
     def g(self,f,fi):
         '''
         Wet air attenuation substitution calculation in Rec. ITU-R P.676-10
@@ -223,13 +328,25 @@ class ATMOSPHERIC_LinkElement(LinkElement):
         out = rp**a * rt**b * np.exp(c * (1 - rp) + d * (1 - rt))
         return out
 
+
+def _annex2_zenith(f, p, ro, t):
+    '''Zenith attenuation of parameter_set_1 for weather states, in the units of the element'''
+    state = ATMOSPHERIC_LinkElement.__new__(ATMOSPHERIC_LinkElement)
+    state.f, state.p, state.ro, state.t = f, p, ro, t
+    return state.attenuationWetAir() + state.attenuationDryAir()
+
+
+@lru_cache(maxsize=1024)
+def _cached_annex2_zenith(f, p, ro, t):
+    return float(_annex2_zenith(f, p, ro, t))
+
 if __name__ == '__main__':
     # Put any code here you want to use to test the class
     # (like a scratch pad to test stuff while you're working)
     testparameters = {'air_temperature': 15+273.15,
                       'air_pressure': 101300,
                       'water_vapor_content': 7.5*1e-3,
-                      'wavelength': c/2e6,
+                      'wavelength': c/2e9,
                       'elevation_angle': 5}
     testelement = ATMOSPHERIC_LinkElement('test', 'parameter_set_2', -131,
                                           testparameters)
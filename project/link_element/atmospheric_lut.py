@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+"""
+title: atmospheric_lut.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Lookup table of the line-by-line zenith attenuation of ITU-R P.676-12, as a fast
+alternative to the exact kernel for large Monte Carlo and pass simulations.
+
+The zenith attenuation is tabulated once on a regular grid over
+(log10(frequency), temperature, pressure, water vapour density) and interpolated
+multilinearly or with cubic B-splines. Two tables are kept: the dry air attenuation,
+and the water vapour attenuation per unit of water vapour density. Both vary smoothly
+with all four variables, so their logarithm is interpolated, which keeps the relative
+error even over the many decades between the window regions and the absorption lines,
+while the total attenuation remains linear in the water vapour density.
+
+Multilinear interpolation is the fast mode (about an order of magnitude faster than
+the exact kernel). Cubic interpolation is several times more accurate on the same grid
+but only slightly faster than the exact kernel, so it suits coarse grids.
+
+After building, the table is compared with the exact kernel inside every grid cell
+(at the cell centre and at the quarter points along frequency) and the largest
+absolute and relative errors at these points are stored with the table. They are
+estimates, not bounds: the error between the sampled points may be larger, slightly
+for the multilinear interpolation and somewhat more for the cubic one. Tables are
+saved to CACHE_DIR, under a name derived from the grid definition and method, so a
+table is only computed once per machine.
+
+Inputs outside the grid bounds are evaluated with the exact kernel instead.
+"""
+import hashlib
+import json
+from pathlib import Path
+
+import numpy as np
+from scipy import ndimage
+
+from project.link_element import itu_p676
+from project.settings import CACHE_DIR
+
+# Default grid: (lower bound, upper bound, number of points) per axis
+DEFAULT_GRID = {'frequency': (1.0, 100.0, 512),             # [GHz], log spaced
+                'temperature': (230.0, 310.0, 17),          # [K]
+                'pressure': (500.0, 1100.0, 13),            # [hPa]
+                'water_vapour': (0.0, 30.0, 13)}            # [g/m**3]
+AXES = tuple(DEFAULT_GRID)
+METHODS = {'linear': 1, 'cubic': 3}
+
+
+def zenith_components(f, p, rho, T):
+    '''Returns the dry air and the normalised water vapour zenith attenuation
+
+    The exact kernel of the table, itu_p676.zenith_attenuation split into the part
+    due to dry air [dB] and the part due to water vapour divided by the water vapour
+    density [dB/(g/m**3)]. The latter is evaluated at a vanishing density for dry air.
+
+    Parameters
+    ----------
+    f : float or numpy.ndarray
+        Frequency [GHz]
+    p : float or numpy.ndarray
+        Surface dry air pressure [hPa]
+    rho : float or numpy.ndarray
+        Surface water vapour density [g/m**3]
+    T : float or numpy.ndarray
+        Surface temperature [K]
+
+    Returns
+    -------
+    numpy.ndarray
+        Stacked along the first axis
+    '''
+    rho_w = np.maximum(rho, 1e-6)
+    h0, _ = itu_p676.equivalent_heights(f, p, rho, T)
+    _, hw = itu_p676.equivalent_heights(f, p, rho_w, T)
+    dry = itu_p676.oxygen_specific_attenuation(f, p, rho, T) * h0
+    wet = itu_p676.water_vapour_specific_attenuation(f, p, rho_w, T) * hw / rho_w
+    return np.stack(np.broadcast_arrays(dry, wet))
+
+
+class AttenuationTable:
+    '''Interpolated zenith attenuation of ITU-R P.676-12 Annex 1
+
+    ...
+
+    Attributes
+    ----------
+    grid : dict
+        (lower bound, upper bound, number of points) per axis, in the units of
+        itu_p676: frequency [GHz], temperature [K], pressure [hPa] and
+        water_vapour [g/m**3]
+    method : str
+        'linear' or 'cubic' interpolation
+    values : numpy.ndarray
+        log10 of the dry air zenith attenuation [dB] and of the water vapour zenith
+        attenuation per unit density [dB/(g/m**3)] at the grid points, stacked
+        along the first axis
+    sampled_error : float
+        Largest absolute error against the exact kernel at the validation points [dB],
+        an estimate of the maximum error, not a bound
+    sampled_rel_error : float
+        Largest relative error against the exact kernel at the validation points [-],
+        an estimate of the maximum error, not a bound
+
+    Methods:
+    -------
+    cached(grid=None, method='linear', cache_dir=CACHE_DIR)
+        Loads the table from disk, or builds and saves it
+    axes()
+        Returns the grid points along each axis
+    zenith_attenuation(f, p, rho, T)
+        Returns the interpolated zenith attenuation
+    error_report()
+        Returns the errors against the exact kernel at the validation points
+    '''
+    def __init__(self, grid=None, method='linear', values=None, errors=None):
+        '''
+        Parameters
+        ----------
+        grid : dict, optional
+            Replaces the bounds and number of points of the given axes of DEFAULT_GRID
+        method : str, default='linear'
+            'linear' or 'cubic' interpolation
+        values : numpy.ndarray, optional
+            Tabulated values as in the attribute, computed if not given
+        errors : tuple of float, optional
+            (sampled_error, sampled_rel_error), validated against the exact kernel if not
+            given
+        '''
+        if method not in METHODS:
+            raise ValueError(f'Unknown interpolation method "{method}", '
+                             f'choose from {list(METHODS)}')
+        self.grid = {**DEFAULT_GRID, **(grid or {})}
+        for axis, (lower, upper, n) in self.grid.items():
+            if axis not in DEFAULT_GRID or n < 2 or upper <= lower:
+                raise ValueError(f'Invalid grid axis {axis}: {(lower, upper, n)}')
+        if self.grid['frequency'][0] <= 0:
+            raise ValueError('The frequency axis must be strictly positive')
+        self.method = method
+
+        if values is None:
+            f, T, p, rho = np.meshgrid(*self.axes(), indexing='ij', sparse=True)
+            values = zenith_components(f, p, rho, T)
+            if np.any(values <= 0):
+                raise ValueError('The grid extends beyond the validity of the equivalent '
+                                 'heights of ITU-R P.676 (non-positive attenuation)')
+            values = np.log10(values)
+        self.values = values
+
+        # Cubic B-spline coefficients only have to be computed once. The table is
+        # first extended by odd reflection, which continues the slope at the bounds
+        # instead of the zero slope of a mirrored boundary.
+        if self.method == 'cubic':
+            self._pad = 4
+            self._coefficients = [ndimage.spline_filter(
+                np.pad(v, self._pad, mode='reflect', reflect_type='odd'),
+                order=3, mode='mirror') for v in self.values]
+        else:
+            self._pad = 0
+            self._coefficients = list(self.values)
+
+        if errors is None:
+            errors = self._validation_errors()
+        self.sampled_error, self.sampled_rel_error = map(float, errors)
+
+    @classmethod
+    def cached(cls, grid=None, method='linear', cache_dir=CACHE_DIR):
+        '''Returns the table of this grid, built only if not yet saved in cache_dir
+
+        Parameters
+        ----------
+        grid : dict, optional
+            Replaces the bounds and number of points of the given axes of DEFAULT_GRID
+        method : str, default='linear'
+            'linear' or 'cubic' interpolation
+        cache_dir : str or Path, default=settings.CACHE_DIR
+
+        Returns
+        -------
+        AttenuationTable
+        '''
+        grid = {**DEFAULT_GRID, **(grid or {})}
+        key = json.dumps({'method': method,
+                          **{axis: list(map(float, grid[axis])) for axis in AXES}})
+        path = Path(cache_dir, f'p676_zenith_{hashlib.sha1(key.encode()).hexdigest()[:16]}.npz')
+
+        if path.exists():
+            with np.load(path) as data:
+                return cls(grid, method, values=data['values'], errors=data['errors'])
+
+        table = cls(grid, method)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(path, values=table.values, errors=[table.sampled_error, table.sampled_rel_error])
+        return table
+
+    def axes(self):
+        '''Returns the grid points along each axis
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            frequency [GHz], temperature [K], pressure [hPa], water_vapour [g/m**3]
+        '''
+        axes = [np.linspace(lower, upper, int(n)) for lower, upper, n in
+                (self.grid[axis] for axis in AXES)]
+        axes[0] = np.logspace(*np.log10(self.grid['frequency'][:2]),
+                              int(self.grid['frequency'][2]))
+        return tuple(axes)
+
+    def _coordinates(self, f, T, p, rho):
+        '''Returns the fractional grid indices of the inputs, and whether they are in bounds'''
+        points = np.broadcast_arrays(np.log10(f), T, p, rho)
+        coords = np.empty((len(AXES),) + points[0].shape)
+        inside = np.ones(points[0].shape, dtype=bool)
+        for i, (axis, x) in enumerate(zip(AXES, points)):
+            lower, upper, n = self.grid[axis]
+            if axis == 'frequency':
+                lower, upper = np.log10(lower), np.log10(upper)
+            coords[i] = (x - lower) / (upper - lower) * (n - 1)
+            inside &= (x >= lower) & (x <= upper)
+        return coords, inside
+
+    def zenith_attenuation(self, f, p, rho, T):
+        '''Returns the interpolated zenith attenuation by atmospheric gases [dB]
+
+        Same signature as itu_p676.zenith_attenuation. Inputs outside the grid are
+        evaluated with the exact kernel.
+
+        Parameters
+        ----------
+        f : float or numpy.ndarray
+            Frequency [GHz]
+        p : float or numpy.ndarray
+            Surface dry air pressure [hPa]
+        rho : float or numpy.ndarray
+            Surface water vapour density [g/m**3]
+        T : float or numpy.ndarray
+            Surface temperature [K]
+
+        Returns
+        -------
+        float or numpy.ndarray
+        '''
+        coords, inside = self._coordinates(f, T, p, rho)
+        att = np.empty(inside.shape)
+
+        dry, wet = (10**ndimage.map_coordinates(c, coords[:, inside] + self._pad,
+                                                order=METHODS[self.method],
+                                                mode='mirror', prefilter=False)
+                    for c in self._coefficients)
+        att[inside] = dry + wet * np.broadcast_to(rho, inside.shape)[inside]
+        if not np.all(inside):
+            f, p, rho, T = (x[~inside] for x in np.broadcast_arrays(f, p, rho, T))
+            att[~inside] = itu_p676.zenith_attenuation(f, p, rho, T)
+
+        return att[()]
+
+    def _validation_errors(self):
+        '''Returns the largest absolute [dB] and relative errors at the validation points
+
+        Evaluated at the centre of every cell, and at the quarter points along
+        frequency, the axis with by far the largest curvature. The error between these
+        points is not checked, so the result estimates the maximum error.
+        '''
+        axes = self.axes()
+        centres = [(x[1:] + x[:-1]) / 2 for x in axes[1:]]
+        log_f = np.log10(axes[0])
+
+        sampled_error, sampled_rel_error = 0.0, 0.0
+        for fraction in (0.25, 0.5, 0.75):
+            f = 10**(log_f[:-1] + fraction * np.diff(log_f))
+            f, T, p, rho = np.meshgrid(f, *centres, indexing='ij', sparse=True)
+            exact = itu_p676.zenith_attenuation(f, p, rho, T)
+            error = np.abs(self.zenith_attenuation(f, p, rho, T) - exact)
+            sampled_error = max(sampled_error, error.max())
+            sampled_rel_error = max(sampled_rel_error, (error / exact).max())
+        return sampled_error, sampled_rel_error
+
+    def error_report(self):
+        '''Returns the errors against the exact kernel at the validation points
+
+        Evaluated at the centre of every grid cell, and at the quarter points
+        along frequency, when the table is built. These are the largest errors
+        found at the sampled points, an estimate of the maximum error, not a bound.
+
+        Returns
+        -------
+        dict
+            'sampled_error' [dB] and 'sampled_rel_error' [-]
+        '''
+        return {'sampled_error': self.sampled_error, 'sampled_rel_error': self.sampled_rel_error}
+
+    def __repr__(self):
+        return (f'AttenuationTable({self.method}, shape={self.values.shape}, '
+                f'sampled_error={self.sampled_error:.3g} dB, '
+                f'sampled_rel_error={self.sampled_rel_error:.3g})')
+
+
+if __name__ == '__main__':
+    # Put any code here you want to use to test the class
+    # (like a scratch pad to test stuff while you're working)
+    for method in METHODS:
+        print(AttenuationTable.cached(method=method))
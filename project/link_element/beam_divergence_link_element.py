@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+title: beam_divergence_link_element.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+"""
+from project.link_element import LinkElement
+import numpy as np
+
+class BEAM_DIVERGENCE_LinkElement(LinkElement):
+    '''Specific type of LinkElement for the divergence of a Gaussian
+    (optical) beam, that can depend a single gain/loss value or on
+    parameters instead. as dictated by the input_type value.
+
+    parameter_set_1 gives the fraction of the transmitted power collected by
+    the receiver aperture, so it takes the place of the TX gain, free space
+    loss and RX gain of an RF budget. parameter_set_2 gives the additional
+    loss of a beam that diverges more than a diffraction limited beam of
+    the same waist, as in the "Additional Divergence Loss" of an optical
+    budget with a TX waist gain.
+
+    ...
+
+    Attributes
+    ----------
+    name : str
+        Defines the type of link element.
+    input_type : str
+        Defines wether a gain/loss is given or a parameter set is used.
+    gain : int
+        The gain or loss in Decibel of this link element in the case it is
+        known or given. Losses are given as negative gains.
+    parameters : dict
+        Contains parameters used:
+            'waist_radius': int
+                1/e^2 intensity radius of the beam at its waist in [m],
+            'wavelength': int
+                Wavelength of the transmission in [m],
+            'distance': int
+                Distance between transmitter and receiver in [m]
+                (parameter_set_1),
+            'rx_aperture_diameter': int
+                Diameter of the receiver aperture in [m] (parameter_set_1),
+            'beam_divergence': int
+                1/e^2 half-angle divergence of the beam in [rad]
+                (parameter_set_2)
+    Methods:
+    -------
+    process()
+        Updates the beam divergence loss
+    calc_beam_radius()
+        Returns the beam radius at the receiver
+    calc_collected_fraction()
+        Returns the fraction of the power collected by the receiver aperture
+    calc_divergence_loss()
+        Returns the loss relative to a diffraction limited beam
+
+    Although not defined here, methods "dB(value)", "get_gain()" and
+    "get_loss()" are automatically inherited and will also work
+    '''
+    def __init__(self, name, input_type, gain, parameters):
+        '''
+        Parameters
+        ----------
+        name : str
+            Defines the type of link element.
+        input_type : str
+            Defines wether a gain/loss is given or a parameter set is used.
+        gain : int
+            The gain or loss in Decibel of this link element in the case it is
+            known or given. Losses are given as negative gains.
+        parameters : dict
+            Contains parameters used:
+                'waist_radius': int
+                    1/e^2 intensity radius of the beam at its waist in [m],
+                'wavelength': int
+                    Wavelength of the transmission in [m],
+                'distance': int
+                    Distance between transmitter and receiver in [m],
+                'rx_aperture_diameter': int
+                    Diameter of the receiver aperture in [m],
+                'beam_divergence': int
+                    1/e^2 half-angle divergence of the beam in [rad]
+        '''
+        # Run the initialization of parent LinkElement
+        super().__init__(name, linktype='BEAM_DIVERGENCE', gain = gain)
+        # Add attributes that are unique to BEAM_DIVERGENCE_LinkElement
+        self.input_type = input_type
+
+        self.w0 = parameters.get('waist_radius', None)              # [m]
+        self.wavelength = parameters.get('wavelength', None)        # [m]
+        self.distance = parameters.get('distance', None)            # [m]
+        self.D = parameters.get('rx_aperture_diameter', None)       # [m]
+        self.divergence = parameters.get('beam_divergence', None)   # [rad]
+        # Check if gain/loss is given directly or calculations are required
+        if self.input_type != 'gain_loss':
+            self.process()
+
+    def process(self):
+        '''Updates the beam divergence loss
+
+        Returns
+        -------
+        None
+
+        '''
+        if self.input_type == 'parameter_set_1':
+            self.gain = self.dB(self.calc_collected_fraction())
+        elif self.input_type == 'parameter_set_2':
+            self.gain = self.calc_divergence_loss()
+
+    def calc_beam_radius(self):
+        '''Returns the 1/e^2 beam radius at the receiver in [m]
+
+        w(z) = w0 sqrt(1 + (z/zR)^2), with the Rayleigh range zR = pi w0^2 / lambda
+
+        Returns
+        -------
+        double
+            Beam radius in [m]
+
+        '''
+        zR = np.pi*self.w0**2/self.wavelength
+        return self.w0*np.sqrt(1 + (self.distance/zR)**2)
+
+    def calc_collected_fraction(self):
+        '''Returns the fraction of the transmitted power within the aperture
+
+        The Gaussian intensity profile, centred on the aperture, integrates
+        to 1 - exp(-2 a^2 / w^2) over a circular aperture of radius a.
+
+        Returns
+        -------
+        double
+            Collected fraction of the power [-]
+
+        '''
+        w = self.calc_beam_radius()
+        return -np.expm1(-2*(self.D/2)**2/w**2)
+
+    def calc_divergence_loss(self):
+        '''Returns the loss relative to a diffraction limited beam in [dB]
+
+        The far field on-axis intensity scales with the inverse square of
+        the divergence, and a diffraction limited beam of waist w0 diverges
+        with lambda / (pi w0).
+
+        Returns
+        -------
+        double
+            Gain in [dB], negative for a beam diverging more than the
+            diffraction limit
+
+        '''
+        theta_d = self.wavelength/(np.pi*self.w0)
+        return 2*self.dB(theta_d/self.divergence)
+
+
+if __name__ == '__main__':
+    # Put any code here you want to use to test the class
+    # (like a scratch pad to test stuff while you're working)
+    testparameters = {'waist_radius': 0.05,
+                      'wavelength': 1550e-9,
+                      'distance': np.array([500e3, 1000e3, 2000e3]),
+                      'rx_aperture_diameter': 0.4,
+                      'beam_divergence': 15e-6}
+    print(BEAM_DIVERGENCE_LinkElement('test', 'parameter_set_1', None, testparameters).gain)
+    print(BEAM_DIVERGENCE_LinkElement('test', 'parameter_set_2', None, testparameters).gain)
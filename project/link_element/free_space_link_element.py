@@ -5,6 +5,7 @@ Created on Fri May 14 14:28:25 2021
 @author: Willem van Lynden
 """
 from project.link_element import LinkElement
+from project import orbit
 import numpy as np
 # parameter_set_2 assumes an orbit surrounding a barycentre of both points
 # Earth is taken as the system in which the transmission occurs.
@@ -40,6 +41,14 @@ class FREE_SPACE_LinkElement(LinkElement):
                 Wavelength of the transmission in [m],
             'elevation_angle': int
                 Elevation of sc from horizon of gs in [deg].
+            'semi_major_axis', 'eccentricity', 'inclination', 'raan',
+            'arg_perigee', 'mean_anomaly', 'j2_drift': int
+                Keplerian elements of the sc orbit at epoch in [m], [-] and
+                [deg], and whether to include the J2 drift (parameter_set_3),
+            'gs_latitude', 'gs_longitude': int
+                Geodetic coordinates of gs in [deg] (parameter_set_3),
+            'time': int
+                Time since epoch in [s] (parameter_set_3).
     Methods:
     -------
     process()
@@ -48,6 +57,9 @@ class FREE_SPACE_LinkElement(LinkElement):
         Calculates the Free Space loss when a parameter_set is used
     calc_elevdistance()
         Calculates the distance when parameter_set_2 is used
+    calc_orbit_geometry()
+        Calculates the distance, elevation and range rate when
+        parameter_set_3 is used
     
     Although not defined here, methods "dB(value)", "get_gain()" and 
     "get_loss()" are automatically inherited and will also work
@@ -75,6 +87,15 @@ class FREE_SPACE_LinkElement(LinkElement):
                     Wavelength of the transmission in [m],
                 'elevation_angle': int
                     Elevation of sc from horizon of gs in [deg].
+                'semi_major_axis', 'eccentricity', 'inclination', 'raan',
+                'arg_perigee', 'mean_anomaly', 'j2_drift': int
+                    Keplerian elements of the sc orbit at epoch in [m], [-]
+                    and [deg], and whether to include the J2 drift
+                    (parameter_set_3),
+                'gs_latitude', 'gs_longitude': int
+                    Geodetic coordinates of gs in [deg] (parameter_set_3),
+                'time': int
+                    Time since epoch in [s] (parameter_set_3).
 
         '''
         # Run the initialization of parent LinkElement
@@ -87,6 +108,8 @@ class FREE_SPACE_LinkElement(LinkElement):
         self.gs_altitude = parameters.get('gs_altitude', None)
         self.angle = parameters.get('elevation_angle', None)     #[deg]
         self.wavelength = parameters.get('wavelength', None)
+        self.parameters = parameters
+        self.range_rate = None
         # check if gain/loss is given directly or calculations are required
         if self.input_type != 'gain_loss':
             self.process()
@@ -109,6 +132,9 @@ class FREE_SPACE_LinkElement(LinkElement):
         elif self.input_type == 'parameter_set_2':
                 self.calc_distance()
                 self.gain = self.calc_FreeSpaceLoss()
+        elif self.input_type == 'parameter_set_3':
+                self.calc_orbit_geometry()
+                self.gain = self.calc_FreeSpaceLoss()
 
     def calc_FreeSpaceLoss(self):
         '''returns the Free Space loss in decibels.
@@ -149,25 +175,50 @@ class FREE_SPACE_LinkElement(LinkElement):
         # Set altitudes to orbital distance around barycentre of Earth-System.
         r_sc = self.sc_altitude + Re    #[m]
         r_gs = self.gs_altitude + Re    #[m]
-        # Check the given horizon elevation for straight alignment with origin
-        if self.angle == 90:
-            # Distance is subtraction of orbits
-            S = abs(r_sc-r_gs)  #[m]
-        elif self.angle == -90 or self.angle == 270:
-            # Distance is summation of orbits, signal passes through barycentre
-            S = abs(r_sc+r_gs)  #[m]
-        else:
-            # Create triangle between origin, sc and gs, find angle sc-origin
-            if self.angle < 90:
-                a = 90+self.angle               #[deg]
-            elif self.angle > 90:
-                a = 90+180-self.angle           #[deg]
+        angle = np.asarray(self.angle, dtype=float)    #[deg]
+        # Create triangle between origin, sc and gs, find angle sc-origin.
+        # Evaluated element-wise, so arrays of angles are handled in one go
+        a = np.where(angle < 90, 90+angle, 90+180-angle)   #[deg]
+        with np.errstate(divide='ignore', invalid='ignore'):
             #Use the sine rule to calculate the distance of sc-gs
             sineratio = r_sc/np.sin(np.deg2rad(a))
             b = np.rad2deg(np.arcsin(r_gs/sineratio))  #[deg]
             c = 180-a-b                     #[deg]
             S = sineratio*np.sin(np.deg2rad(c))         #[m]
+        # Check the given horizon elevation for straight alignment with origin
+        # Distance is subtraction of orbits
+        S = np.where(angle == 90, abs(r_sc-r_gs), S)    #[m]
+        # Distance is summation of orbits, signal passes through barycentre
+        S = np.where((angle == -90) | (angle == 270), abs(r_sc+r_gs), S)   #[m]
+        if S.ndim == 0:
+            S = S[()]
         self.distance = S
+
+    def calc_orbit_geometry(self):
+        '''Updates the distance, elevation and range rate based on
+        parameter_set_3
+
+        Propagates the Keplerian orbit of sc analytically to the given time
+        (an array of times gives a time series), with the secular J2 drift
+        if 'j2_drift' is non-zero, and computes the geometry as seen from
+        gs on the WGS-84 ellipsoid. See project.orbit.
+
+        Returns
+        -------
+        None
+
+        '''
+        p = self.parameters
+        sc_orbit = orbit.Orbit(p['semi_major_axis'], p['eccentricity'],
+                               p['inclination'], p['raan'], p['arg_perigee'],
+                               p['mean_anomaly'], j2=p.get('j2_drift', 1))
+        station = orbit.GroundStation(p['gs_latitude'], p['gs_longitude'],
+                                      p.get('gs_altitude', 0))
+        geometry = orbit.look_angles(sc_orbit, station, p.get('time', 0))
+
+        self.distance = geometry['range']               #[m]
+        self.angle = geometry['elevation']              #[deg]
+        self.range_rate = geometry['range_rate']        #[m/s]
 if __name__ == '__main__':
     # Put any code here you want to use to test the class
     # (like a scratch pad to test stuff while you're working)
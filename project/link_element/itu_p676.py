@@ -0,0 +1,596 @@
+# -*- coding: utf-8 -*-
+"""
+title: itu_p676.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Line-by-line gaseous attenuation of RECOMMENDATION ITU-R P.676-12 Annex 1.
+
+The spectroscopic data of the oxygen (Table 1) and water vapour (Table 2) lines are
+packaged as NumPy arrays in link_element/data and loaded once per process. Each row is
+a line: [f0, a1..a6] for oxygen and [f0, b1..b6] for water vapour, f0 in [GHz].
+
+All functions are element-wise in their inputs. The line summation is done along an
+extra trailing axis, so any broadcastable combination of frequencies, layers and weather
+states (lines x frequencies x layers) is evaluated in a single call.
+
+Units follow the recommendation: f [GHz], p dry air pressure [hPa], rho water vapour
+density [g/m**3], T temperature [K]. Valid from 1 to 1000 GHz.
+
+Slant paths through a layered atmosphere (Annex 1, Section 2.2) use the reference
+profiles of ITU-R P.835 anchored to the surface weather. The layer boundaries depend
+only on the station altitude and number of layers and are cached, so repeated passes
+over the same station only recompute the path lengths and the attenuation sum.
+
+None of the specific attenuations depend on the elevation. Scalar weather states are
+cached, and arrays of weather (e.g. one state per station of a network, repeated over
+every sample) are evaluated once per distinct state with per_weather_state. The station
+altitude may be an array as well, the layers are then built once per distinct altitude.
+"""
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from project.link_element import itu_p835
+from project.settings import ITU_DATA_DIR
+
+Re = 6371.0         # [km], mean Earth radius
+TOP_OF_ATMOSPHERE = 100.0   # [km]
+
+# Annex 2 Table 3, oxygen lines contributing to the dry air equivalent height (ci, fi)
+T2_COEFFS = np.array([(0.1597, 118.750334),
+                      (0.1066, 368.498246),
+                      (0.1325, 424.763020),
+                      (0.1242, 487.249273),
+                      (0.0938, 715.392902),
+                      (0.1448, 773.839490),
+                      (0.1374, 834.145546)])
+
+# Annex 2 Table 4, water vapour lines contributing to the wet equivalent height (fi, ai, bi)
+HW_COEFFS = np.array([(22.23508, 1.52, 2.56),
+                      (183.310087, 7.62, 10.2),
+                      (325.152888, 1.56, 2.7),
+                      (380.197353, 4.15, 5.7),
+                      (439.150807, 0.2, 0.91),
+                      (448.001085, 1.63, 2.46),
+                      (474.689092, 0.76, 2.22),
+                      (488.490108, 0.26, 2.49),
+                      (556.935985, 7.81, 10),
+                      (620.70087, 1.25, 2.35),
+                      (752.033113, 16.2, 20),
+                      (916.171582, 1.47, 2.58),
+                      (970.315022, 1.36, 2.44),
+                      (987.926764, 1.6, 1.86)])
+
+
+@lru_cache(maxsize=None)
+def load_line_tables():
+    '''Returns the oxygen and water vapour spectral line tables
+
+    The arrays are read from file on the first call only and are read-only.
+
+    Returns
+    -------
+    numpy.ndarray
+        Oxygen lines, shape (7, 44): f0, a1, a2, a3, a4, a5, a6
+    numpy.ndarray
+        Water vapour lines, shape (7, 35): f0, b1, b2, b3, b4, b5, b6
+    '''
+    tables = []
+    for fname in ('p676_oxygen_lines.npy', 'p676_water_vapour_lines.npy'):
+        # Store transposed, so that each coefficient is a contiguous row
+        table = np.ascontiguousarray(np.load(Path(ITU_DATA_DIR, fname)).T)
+        table.setflags(write=False)
+        tables.append(table)
+    return tuple(tables)
+
+
+def _line_axis(*args):
+    '''Add a trailing axis to each argument, along which the lines are summed'''
+    return tuple(np.asarray(arg, dtype=float)[..., np.newaxis] for arg in args)
+
+
+def per_weather_state(func, *args):
+    '''Evaluates func once per distinct combination of its arguments
+
+    The arguments are broadcast and every distinct combination of values is passed to
+    func once, as 1-D arrays. The results are mapped back onto the broadcast shape, with
+    any trailing axes that func adds (e.g. layers). Every column is factorised on its
+    own, which is much faster than finding the unique rows of the stacked arguments.
+
+    Parameters
+    ----------
+    func : callable
+        Element-wise function of the arguments
+    *args : float or numpy.ndarray
+        Broadcastable arguments
+
+    Returns
+    -------
+    numpy.ndarray
+        func(*args)
+    '''
+    args = np.broadcast_arrays(*(np.asarray(arg, dtype=float) for arg in args))
+    shape = args[0].shape
+    if args[0].size <= 1:
+        return np.asarray(func(*args))
+
+    flat = [arg.ravel() for arg in args]
+    state = np.zeros(flat[0].size, dtype=np.int64)
+    for arg in flat:
+        # Combined codes stay below the number of samples, so they cannot overflow
+        code = np.unique(arg, return_inverse=True)[1].ravel()
+        state = np.unique(state * (code.max() + 1) + code, return_inverse=True)[1].ravel()
+
+    first = np.unique(state, return_index=True)[1]
+    if first.size == state.size:
+        return np.asarray(func(*args))
+    out = np.asarray(func(*(arg[first] for arg in flat)))
+    return out[state].reshape(shape + out.shape[1:])
+
+
+def oxygen_specific_attenuation(f, p, rho, T):
+    '''Returns the specific attenuation due to dry air [dB/km]
+
+    Sum of the oxygen line contributions and the dry continuum (Eq. 1-8)
+
+    Parameters
+    ----------
+    f : float or numpy.ndarray
+        Frequency [GHz]
+    p : float or numpy.ndarray
+        Dry air pressure [hPa]
+    rho : float or numpy.ndarray
+        Water vapour density [g/m**3]
+    T : float or numpy.ndarray
+        Temperature [K]
+
+    Returns
+    -------
+    float or numpy.ndarray
+    '''
+    f_ox, a1, a2, a3, a4, a5, a6 = load_line_tables()[0]
+    f_l, p_l, rho_l, T_l = _line_axis(f, p, rho, T)
+
+    theta = 300 / T_l
+    e = rho_l * T_l / 216.7     # water vapour partial pressure [hPa]
+
+    # Line strength and width, including Zeeman splitting
+    S = a1 * 1e-7 * p_l * theta**3 * np.exp(a2 * (1 - theta))
+    df = a3 * 1e-4 * (p_l * theta**(0.8 - a4) + 1.1 * e * theta)
+    df = np.sqrt(df**2 + 2.25e-6)
+    delta = (a5 + a6 * theta) * 1e-4 * (p_l + e) * theta**0.8
+
+    # Line shape factor
+    F = f_l / f_ox * ((df - delta * (f_ox - f_l)) / ((f_ox - f_l)**2 + df**2)
+                      + (df - delta * (f_ox + f_l)) / ((f_ox + f_l)**2 + df**2))
+
+    N_lines = np.sum(S * F, axis=-1)
+
+    # Dry continuum due to pressure-induced nitrogen absorption and the Debye spectrum
+    f, p, rho, T = (np.asarray(arg, dtype=float) for arg in (f, p, rho, T))
+    theta = 300 / T
+    e = rho * T / 216.7
+    d = 5.6e-4 * (p + e) * theta**0.8
+    N_d = f * p * theta**2 * (6.14e-5 / (d * (1 + (f / d)**2))
+                              + 1.4e-12 * p * theta**1.5 / (1 + 1.9e-5 * f**1.5))
+
+    return 0.1820 * f * (N_lines + N_d)
+
+
+def water_vapour_specific_attenuation(f, p, rho, T):
+    '''Returns the specific attenuation due to water vapour [dB/km]
+
+    Sum of the water vapour line contributions (Eq. 1-7, 9-10)
+
+    Parameters
+    ----------
+    f : float or numpy.ndarray
+        Frequency [GHz]
+    p : float or numpy.ndarray
+        Dry air pressure [hPa]
+    rho : float or numpy.ndarray
+        Water vapour density [g/m**3]
+    T : float or numpy.ndarray
+        Temperature [K]
+
+    Returns
+    -------
+    float or numpy.ndarray
+    '''
+    f_wv, b1, b2, b3, b4, b5, b6 = load_line_tables()[1]
+    f_l, p_l, rho_l, T_l = _line_axis(f, p, rho, T)
+
+    theta = 300 / T_l
+    e = rho_l * T_l / 216.7     # water vapour partial pressure [hPa]
+
+    # Line strength and width, including Doppler broadening
+    S = b1 * 1e-1 * e * theta**3.5 * np.exp(b2 * (1 - theta))
+    df = b3 * 1e-4 * (p_l * theta**b4 + b5 * e * theta**b6)
+    df = 0.535 * df + np.sqrt(0.217 * df**2 + 2.1316e-12 * f_wv**2 / theta)
+
+    # Line shape factor
+    F = f_l / f_wv * (df / ((f_wv - f_l)**2 + df**2) + df / ((f_wv + f_l)**2 + df**2))
+
+    return 0.1820 * np.asarray(f, dtype=float) * np.sum(S * F, axis=-1)
+
+
+def equivalent_heights(f, p, rho, T):
+    '''Returns the equivalent heights of dry air and water vapour [km]
+
+    Annex 2 (Eq. 30-38). Multiplying the specific attenuations of Annex 1 by these
+    heights gives the zenith attenuation of a slant path starting at the surface.
+
+    Parameters
+    ----------
+    f : float or numpy.ndarray
+        Frequency [GHz]
+    p : float or numpy.ndarray
+        Dry air pressure [hPa]
+    rho : float or numpy.ndarray
+        Water vapour density [g/m**3]
+    T : float or numpy.ndarray
+        Temperature [K]
+
+    Returns
+    -------
+    float or numpy.ndarray
+        Dry air equivalent height h0
+    float or numpy.ndarray
+        Water vapour equivalent height hw
+    '''
+    f, p, rho, T = (np.asarray(arg, dtype=float) for arg in (f, p, rho, T))
+    t = T - 273.15
+    e = rho * T / 216.7
+    rp = (p + e) / 1013.25
+
+    # Dry air
+    c_i, f_i = T2_COEFFS[:, 0], T2_COEFFS[:, 1]
+    t1 = 5.1040 / (1 + 0.066 * rp**-2.3) * \
+        np.exp(-((f - 59.7) / (2.87 + 12.4 * np.exp(-7.9 * rp)))**2)
+    t2 = np.sum(c_i * np.exp(2.12 * rp[..., np.newaxis]) /
+                ((f[..., np.newaxis] - f_i)**2 + 0.025 * np.exp(2.2 * rp[..., np.newaxis])),
+                axis=-1)
+    t3 = 0.0114 * f / (1 + 0.14 * rp**-2.6) * (15.02 * f**2 - 1353 * f + 5.333e4) / \
+        (f**3 - 151.3 * f**2 + 9629 * f - 6803)
+    A = 0.7832 + 0.00709 * t
+    h0 = 6.1 * A / (1 + 0.17 * rp**-1.1) * (1 + t1 + t2 + t3)
+    h0 = np.where(f < 70, np.minimum(h0, 10.7 * rp**0.3), h0)
+
+    # Water vapour
+    f_i, a_i, b_i = HW_COEFFS[:, 0], HW_COEFFS[:, 1], HW_COEFFS[:, 2]
+    A = 1.9298 - 0.04166 * t + 0.0517 * rho
+    B = 1.1674 - 0.00622 * t + 0.0063 * rho
+    sigmaw = 1.013 / (1 + np.exp(-8.6 * (rp - 0.57)))
+    hw = A + B * np.sum(a_i * sigmaw[..., np.newaxis] /
+                        ((f[..., np.newaxis] - f_i)**2 + b_i * sigmaw[..., np.newaxis]),
+                        axis=-1)
+
+    return h0, hw
+
+
+@lru_cache(maxsize=1024)
+def _cached_zenith_attenuation(f, p, rho, T):
+    return float(_zenith_attenuation(f, p, rho, T))
+
+
+def _zenith_attenuation(f, p, rho, T):
+    h0, hw = equivalent_heights(f, p, rho, T)
+    return oxygen_specific_attenuation(f, p, rho, T) * h0 + \
+        water_vapour_specific_attenuation(f, p, rho, T) * hw
+
+
+def zenith_attenuation(f, p, rho, T):
+    '''Returns the zenith attenuation by atmospheric gases [dB]
+
+    The slant path attenuation is this times the cosecant of the elevation. Cached for
+    scalar inputs, and evaluated once per weather state for arrays.
+
+    Parameters
+    ----------
+    f : float or numpy.ndarray
+        Frequency [GHz]
+    p : float or numpy.ndarray
+        Surface dry air pressure [hPa]
+    rho : float or numpy.ndarray
+        Surface water vapour density [g/m**3]
+    T : float or numpy.ndarray
+        Surface temperature [K]
+
+    Returns
+    -------
+    float or numpy.ndarray
+    '''
+    if all(np.ndim(arg) == 0 for arg in (f, p, rho, T)):
+        return _cached_zenith_attenuation(float(f), float(p), float(rho), float(T))
+    return per_weather_state(_zenith_attenuation, f, p, rho, T)
+
+
+@lru_cache(maxsize=64)
+def layer_geometry(station_altitude, n_layers):
+    '''Returns the layer boundaries above a ground station
+
+    Layer thickness grows exponentially with height, as in Eq. 21 of Annex 1,
+    scaled such that n_layers layers span from the station to 100 km. The result
+    is cached per station altitude and number of layers.
+
+    Parameters
+    ----------
+    station_altitude : float
+        Geometric height of the station [km]
+    n_layers : int
+        Number of layers
+
+    Returns
+    -------
+    numpy.ndarray
+        Height of the bottom of each layer [km]
+    numpy.ndarray
+        Thickness of each layer [km]
+    '''
+    n_layers = int(n_layers)
+    # Ratio of the thickest to the thinnest layer equal to the 922 layers of Eq. 21
+    growth = 9.21 / max(n_layers - 1, 1)
+    steps = np.exp(growth * np.arange(n_layers + 1)) - 1
+    boundaries = station_altitude + (TOP_OF_ATMOSPHERE - station_altitude) * steps / steps[-1]
+
+    bottom = boundaries[:-1]
+    thickness = np.diff(boundaries)
+    for arr in (bottom, thickness):
+        arr.setflags(write=False)
+    return bottom, thickness
+
+
+def per_station_altitude(func, station_altitude, *args):
+    '''Evaluates func once per distinct station altitude
+
+    The layers of a slant path depend on the station altitude, which func takes as a
+    float. The other arguments are passed to func as 1-D arrays of the samples at each
+    altitude, and the results are mapped back onto the broadcast shape.
+
+    Parameters
+    ----------
+    func : callable
+        func(station_altitude, *args), element-wise in args
+    station_altitude : float or numpy.ndarray
+        Geometric height of the station [km]
+    *args : float or numpy.ndarray
+        Broadcastable arguments
+
+    Returns
+    -------
+    numpy.ndarray
+        func(station_altitude, *args)
+    '''
+    if np.ndim(station_altitude) == 0:
+        return np.asarray(func(float(station_altitude), *args))
+
+    station_altitude, *args = np.broadcast_arrays(np.asarray(station_altitude, dtype=float),
+                                                  *(np.asarray(arg, dtype=float) for arg in args))
+    shape = station_altitude.shape
+    altitudes, index = np.unique(station_altitude, return_inverse=True)
+    index = index.ravel()
+    flat = [arg.ravel() for arg in args]
+
+    out = None
+    for k, altitude in enumerate(altitudes):
+        samples = index == k
+        part = np.asarray(func(float(altitude), *(arg[samples] for arg in flat)))
+        if out is None:
+            out = np.empty((index.size,) + part.shape[1:], dtype=part.dtype)
+        out[samples] = part
+    return out.reshape(shape + out.shape[1:])
+
+
+def refractive_index(p, rho, T):
+    '''Returns the radio refractive index (ITU-R P.453, Eq. 1-6)
+
+    Parameters
+    ----------
+    p : float or numpy.ndarray
+        Dry air pressure [hPa]
+    rho : float or numpy.ndarray
+        Water vapour density [g/m**3]
+    T : float or numpy.ndarray
+        Temperature [K]
+
+    Returns
+    -------
+    float or numpy.ndarray
+    '''
+    e = rho * T / 216.7
+    N = 77.6 * p / T + 72 * e / T + 3.75e5 * e / T**2
+    return 1 + N * 1e-6
+
+
+def layer_profile(station_altitude, n_layers, T_s, p_s, rho_s):
+    '''Returns temperature, dry pressure and water vapour density of each layer
+
+    Evaluated at the middle of each layer. Surface values may be arrays, the layers
+    are placed along a trailing axis.
+
+    Parameters
+    ----------
+    station_altitude : float
+        Geometric height of the station [km]
+    n_layers : int
+        Number of layers
+    T_s, p_s, rho_s : float or numpy.ndarray
+        Surface temperature [K], dry air pressure [hPa] and water vapour density [g/m**3]
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        T, p, rho with shape (..., n_layers)
+    '''
+    bottom, thickness = layer_geometry(station_altitude, n_layers)
+    T_s, p_s, rho_s = _line_axis(T_s, p_s, rho_s)
+    return itu_p835.scaled_profile(bottom + thickness / 2, station_altitude, T_s, p_s, rho_s)
+
+
+@lru_cache(maxsize=256)
+def _cached_layer_attenuation(f, T_s, p_s, rho_s, station_altitude, n_layers):
+    gamma = _layer_attenuation(f, T_s, p_s, rho_s, station_altitude, n_layers)
+    gamma.setflags(write=False)
+    return gamma
+
+
+def _layer_attenuation(f, T_s, p_s, rho_s, station_altitude, n_layers):
+    T, p, rho = layer_profile(station_altitude, n_layers, T_s, p_s, rho_s)
+    f = np.asarray(f, dtype=float)[..., np.newaxis]
+    return oxygen_specific_attenuation(f, p, rho, T) + water_vapour_specific_attenuation(f, p, rho, T)
+
+
+def layer_specific_attenuation(f, T_s, p_s, rho_s, station_altitude, n_layers):
+    '''Returns the specific attenuation of each layer [dB/km]
+
+    For scalar inputs the result is cached, since it does not depend on the elevation.
+    Arrays are evaluated once per weather state and station altitude.
+
+    Parameters
+    ----------
+    f : float or numpy.ndarray
+        Frequency [GHz]
+    T_s, p_s, rho_s : float or numpy.ndarray
+        Surface temperature [K], dry air pressure [hPa] and water vapour density [g/m**3]
+    station_altitude : float or numpy.ndarray
+        Geometric height of the station [km]
+    n_layers : int
+        Number of layers
+
+    Returns
+    -------
+    numpy.ndarray
+        Shape (..., n_layers)
+    '''
+    if all(np.ndim(arg) == 0 for arg in (f, T_s, p_s, rho_s, station_altitude)):
+        return _cached_layer_attenuation(float(f), float(T_s), float(p_s), float(rho_s),
+                                         float(station_altitude), int(n_layers))
+
+    def attenuation(f, T_s, p_s, rho_s, station_altitude):
+        return per_station_altitude(
+            lambda altitude, *state: _layer_attenuation(*state, altitude, n_layers),
+            station_altitude, f, T_s, p_s, rho_s)
+    return per_weather_state(attenuation, f, T_s, p_s, rho_s, station_altitude)
+
+
+@lru_cache(maxsize=256)
+def _cached_layer_refractive_index(T_s, p_s, rho_s, station_altitude, n_layers):
+    T, p, rho = layer_profile(station_altitude, n_layers, T_s, p_s, rho_s)
+    n = refractive_index(p, rho, T)
+    n.setflags(write=False)
+    return n
+
+
+def layer_refractive_index(T_s, p_s, rho_s, station_altitude, n_layers):
+    '''Returns the refractive index of each layer
+
+    Cached for scalar inputs, and evaluated once per weather state and station altitude
+    for arrays.
+
+    Parameters
+    ----------
+    T_s, p_s, rho_s : float or numpy.ndarray
+        Surface temperature [K], dry air pressure [hPa] and water vapour density [g/m**3]
+    station_altitude : float or numpy.ndarray
+        Geometric height of the station [km]
+    n_layers : int
+        Number of layers
+
+    Returns
+    -------
+    numpy.ndarray
+        Shape (..., n_layers)
+    '''
+    if all(np.ndim(arg) == 0 for arg in (T_s, p_s, rho_s, station_altitude)):
+        return _cached_layer_refractive_index(float(T_s), float(p_s), float(rho_s),
+                                              float(station_altitude), int(n_layers))
+
+    def index(altitude, T_s, p_s, rho_s):
+        T, p, rho = layer_profile(altitude, n_layers, T_s, p_s, rho_s)
+        return refractive_index(p, rho, T)
+
+    def index_per_state(T_s, p_s, rho_s, station_altitude):
+        return per_station_altitude(index, station_altitude, T_s, p_s, rho_s)
+    return per_weather_state(index_per_state, T_s, p_s, rho_s, station_altitude)
+
+
+def slant_path_lengths(elevation, T_s, p_s, rho_s, station_altitude, n_layers):
+    '''Returns the ray-traced path length through each layer [km]
+
+    Refraction at the layer boundaries follows from Bouguer's law for a spherically
+    stratified atmosphere, n * r * sin(z) = constant (z the zenith angle), which gives
+    the local zenith angle at the bottom of every layer directly (Eq. 17-19).
+
+    Parameters
+    ----------
+    elevation : float or numpy.ndarray
+        Elevation angle at the station [deg], in (0, 90]
+    T_s, p_s, rho_s : float or numpy.ndarray
+        Surface temperature [K], dry air pressure [hPa] and water vapour density [g/m**3]
+    station_altitude : float or numpy.ndarray
+        Geometric height of the station [km]
+    n_layers : int
+        Number of layers
+
+    Returns
+    -------
+    numpy.ndarray
+        Shape (..., n_layers)
+    '''
+    if np.ndim(station_altitude) == 0:
+        bottom, thickness = layer_geometry(float(station_altitude), n_layers)
+    else:
+        # Layers of every sample, shape (..., 2, n_layers)
+        layers = per_station_altitude(
+            lambda altitude: np.stack(layer_geometry(altitude, n_layers))[np.newaxis],
+            station_altitude)
+        bottom, thickness = layers[..., 0, :], layers[..., 1, :]
+    n = layer_refractive_index(T_s, p_s, rho_s, station_altitude, n_layers)
+    r = Re + bottom
+
+    elevation = np.asarray(elevation, dtype=float)[..., np.newaxis]
+    invariant = n[..., :1] * r[..., :1] * np.cos(np.deg2rad(elevation))
+    # (r cos(z))**2 of each layer, with sin(z) = invariant / (n r)
+    r_cos_z_sq = np.maximum(r**2 - (invariant / n)**2, 0)
+
+    # Eq. 17, rearranged to avoid cancellation in thin layers
+    step = 2 * r * thickness + thickness**2
+    return step / (np.sqrt(r_cos_z_sq + step) + np.sqrt(r_cos_z_sq))
+
+
+def slant_attenuation(f, elevation, T_s, p_s, rho_s, station_altitude, n_layers):
+    '''Returns the gaseous attenuation along a slant path through a layered atmosphere [dB]
+
+    Parameters
+    ----------
+    f : float or numpy.ndarray
+        Frequency [GHz]
+    elevation : float or numpy.ndarray
+        Elevation angle at the station [deg], in (0, 90]
+    T_s, p_s, rho_s : float or numpy.ndarray
+        Surface temperature [K], dry air pressure [hPa] and water vapour density [g/m**3]
+    station_altitude : float or numpy.ndarray
+        Geometric height of the station [km]
+    n_layers : int
+        Number of layers
+
+    Returns
+    -------
+    float or numpy.ndarray
+    '''
+    gamma = layer_specific_attenuation(f, T_s, p_s, rho_s, station_altitude, n_layers)
+    lengths = slant_path_lengths(elevation, T_s, p_s, rho_s, station_altitude, n_layers)
+    if gamma.ndim == 1:
+        return lengths @ gamma  # Same layers for every path
+    return np.sum(gamma * lengths, axis=-1)
+
+
+if __name__ == '__main__':
+    # Full spectrum at the standard surface conditions
+    freqs = np.linspace(1, 1000, 100000)
+    gamma = oxygen_specific_attenuation(freqs, 1013.25, 7.5, 288.15) + \
+        water_vapour_specific_attenuation(freqs, 1013.25, 7.5, 288.15)
+    print(f'Peak specific attenuation {gamma.max():.1f} dB/km at {freqs[gamma.argmax()]:.1f} GHz')
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""
+title: itu_p835.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Reference standard atmosphere of RECOMMENDATION ITU-R P.835-6 (mean annual global
+reference atmosphere, Section 1).
+
+Heights h are geometric heights above mean sea level in [km]. All functions are
+element-wise, so profiles of any number of layers are evaluated in one call.
+"""
+import numpy as np
+
+
+def geopotential_height(h):
+    '''Returns the geopotential height [km'] of a geometric height [km] (Eq. 1a)'''
+    return 6356.766 * h / (6356.766 + h)
+
+
+def standard_temperature(h):
+    '''Returns the temperature of the reference atmosphere [K]
+
+    Parameters
+    ----------
+    h : float or numpy.ndarray
+        Geometric height [km], 0 to 100 km
+
+    Returns
+    -------
+    numpy.ndarray
+    '''
+    h = np.asarray(h, dtype=float)
+    h_p = geopotential_height(h)
+
+    conditions = [h_p <= 11, h_p <= 20, h_p <= 32, h_p <= 47, h_p <= 51, h_p <= 71,
+                  h_p <= 84.852, h <= 91]
+    choices = [288.15 - 6.5 * h_p,
+               216.65 + 0 * h_p,
+               216.65 + (h_p - 20),
+               228.65 + 2.8 * (h_p - 32),
+               270.65 + 0 * h_p,
+               270.65 - 2.8 * (h_p - 51),
+               214.65 - 2.0 * (h_p - 71),
+               186.8673 + 0 * h_p]
+    with np.errstate(invalid='ignore'):
+        upper = 263.1905 - 76.3232 * np.sqrt(1 - ((h - 91) / 19.9429)**2)
+    return np.select(conditions, choices, default=upper)
+
+
+def standard_pressure(h):
+    '''Returns the total pressure of the reference atmosphere [hPa]
+
+    Parameters
+    ----------
+    h : float or numpy.ndarray
+        Geometric height [km], 0 to 100 km
+
+    Returns
+    -------
+    numpy.ndarray
+    '''
+    h = np.asarray(h, dtype=float)
+    h_p = geopotential_height(h)
+
+    conditions = [h_p <= 11, h_p <= 20, h_p <= 32, h_p <= 47, h_p <= 51, h_p <= 71,
+                  h_p <= 84.852]
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        choices = [1013.25 * (288.15 / (288.15 - 6.5 * h_p))**(-34.1632 / 6.5),
+                   226.3226 * np.exp(-34.1632 * (h_p - 11) / 216.65),
+                   54.74980 * (216.65 / (216.65 + (h_p - 20)))**34.1632,
+                   8.680422 * (228.65 / (228.65 + 2.8 * (h_p - 32)))**(34.1632 / 2.8),
+                   1.109106 * np.exp(-34.1632 * (h_p - 47) / 270.65),
+                   0.6694167 * (270.65 / (270.65 - 2.8 * (h_p - 51)))**(-34.1632 / 2.8),
+                   0.03956649 * (214.65 / (214.65 - 2.0 * (h_p - 71)))**(-34.1632 / 2.0)]
+        upper = np.exp(95.571899 - 4.011801 * h + 6.424731e-2 * h**2 - 4.789660e-4 * h**3
+                       + 1.340543e-6 * h**4)
+    return np.select(conditions, choices, default=upper)
+
+
+def standard_water_vapour_density(h, rho_0=7.5, h_0=2.0):
+    '''Returns the water vapour density of the reference atmosphere [g/m**3]
+
+    Exponential decay (Eq. 6), limited below by a mixing ratio of 2e-6 (Eq. 8)
+
+    Parameters
+    ----------
+    h : float or numpy.ndarray
+        Geometric height [km]
+    rho_0 : float or numpy.ndarray, default=7.5
+        Water vapour density at sea level [g/m**3]
+    h_0 : float, default=2.0
+        Scale height [km]
+
+    Returns
+    -------
+    numpy.ndarray
+    '''
+    rho = rho_0 * np.exp(-np.asarray(h, dtype=float) / h_0)
+    T = standard_temperature(h)
+    rho_min = 2e-6 * standard_pressure(h) * 216.7 / T
+    return np.maximum(rho, rho_min)
+
+
+def scaled_profile(h, station_altitude, T_s, p_s, rho_s):
+    '''Returns the reference atmosphere anchored to weather at a ground station
+
+    The shape of the reference profiles is kept, offset (temperature) or scaled (pressure
+    and water vapour) to match the given surface values at the station altitude.
+
+    Parameters
+    ----------
+    h : float or numpy.ndarray
+        Geometric heights of the profile [km]
+    station_altitude : float
+        Geometric height of the station [km]
+    T_s : float or numpy.ndarray
+        Surface temperature [K]
+    p_s : float or numpy.ndarray
+        Surface dry air pressure [hPa]
+    rho_s : float or numpy.ndarray
+        Surface water vapour density [g/m**3]
+
+    Returns
+    -------
+    numpy.ndarray
+        Temperature [K]
+    numpy.ndarray
+        Dry air pressure [hPa]
+    numpy.ndarray
+        Water vapour density [g/m**3]
+    '''
+    h = np.asarray(h, dtype=float)
+    T = T_s + (standard_temperature(h) - standard_temperature(station_altitude))
+    p = p_s * standard_pressure(h) / standard_pressure(station_altitude)
+    rho = rho_s * standard_water_vapour_density(h, rho_0=1.0) / \
+        standard_water_vapour_density(station_altitude, rho_0=1.0)
+    return T, p, rho
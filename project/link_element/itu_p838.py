@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+title: itu_p838.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Specific attenuation model for rain of RECOMMENDATION ITU-R P.838-3.
+
+The regression of the coefficients k and alpha (Eq. 2-3, Tables 1-4) is evaluated
+once on a logarithmic frequency grid from 1 to 1000 GHz, and interpolated with cubic
+splines in log10(f). The splines are built on first use and kept for the rest of the
+process, so every following evaluation is a cheap spline lookup on arrays of any shape.
+"""
+from functools import lru_cache
+
+import numpy as np
+from scipy.interpolate import CubicSpline
+
+# Tables 1-4: (a_j, b_j, c_j) per term and the (m, c) linear term
+KH_COEFFS = ([(-5.33980, -0.10008, 1.13098),
+              (-0.35351, 1.26970, 0.45400),
+              (-0.23789, 0.86036, 0.15354),
+              (-0.94158, 0.64552, 0.16817)], (-0.18961, 0.71147))
+KV_COEFFS = ([(-3.80595, 0.56934, 0.81061),
+              (-3.44965, -0.22911, 0.51059),
+              (-0.39902, 0.73042, 0.11899),
+              (0.50167, 1.07319, 0.27195)], (-0.16398, 0.63297))
+ALPHAH_COEFFS = ([(-0.14318, 1.82442, -0.55187),
+                  (0.29591, 0.77564, 0.19822),
+                  (0.32177, 0.63773, 0.13164),
+                  (-5.37610, -0.96230, 1.47828),
+                  (16.1721, -3.29980, 3.43990)], (0.67849, -1.95537))
+ALPHAV_COEFFS = ([(-0.07771, 2.33840, -0.76284),
+                  (0.56727, 0.95545, 0.54039),
+                  (-0.20238, 1.14520, 0.26809),
+                  (-48.2991, 0.791669, 0.116226),
+                  (48.5833, 0.791459, 0.116479)], (-0.053739, 0.83433))
+
+N_SPLINE_POINTS = 601
+
+
+def _regression(log_f, coeffs):
+    '''Sum of Gaussian terms and a linear term in log10(f) (Eq. 2-3)'''
+    terms, (m, c) = coeffs
+    return sum(a * np.exp(-((log_f - b) / c_)**2) for a, b, c_ in terms) + m * log_f + c
+
+
+@lru_cache(maxsize=None)
+def coefficient_splines():
+    '''Returns the splines of log10(kH), log10(kV), alphaH and alphaV against log10(f)
+
+    Built once per process on the first call.
+
+    Returns
+    -------
+    tuple of scipy.interpolate.CubicSpline
+    '''
+    log_f = np.linspace(0, 3, N_SPLINE_POINTS)  # 1 to 1000 GHz
+    return tuple(CubicSpline(log_f, _regression(log_f, coeffs))
+                 for coeffs in (KH_COEFFS, KV_COEFFS, ALPHAH_COEFFS, ALPHAV_COEFFS))
+
+
+def rain_coefficients(f, elevation, tilt):
+    '''Returns the coefficients k and alpha for any path elevation and polarisation
+
+    Parameters
+    ----------
+    f : float or numpy.ndarray
+        Frequency [GHz], 1 to 1000 GHz
+    elevation : float or numpy.ndarray
+        Path elevation angle [deg]
+    tilt : float or numpy.ndarray
+        Polarisation tilt angle relative to the horizontal [deg]
+        (45 deg for circular polarisation)
+
+    Returns
+    -------
+    float or numpy.ndarray
+        k
+    float or numpy.ndarray
+        alpha
+    '''
+    log_kh, log_kv, spl_alpha_h, spl_alpha_v = coefficient_splines()
+    log_f = np.log10(f)
+
+    kh, kv = 10**log_kh(log_f), 10**log_kv(log_f)
+    alpha_h, alpha_v = spl_alpha_h(log_f), spl_alpha_v(log_f)
+
+    # Eq. 4-5
+    pol = np.cos(np.deg2rad(elevation))**2 * np.cos(np.deg2rad(2 * tilt))
+    k = (kh + kv + (kh - kv) * pol) / 2
+    alpha = (kh * alpha_h + kv * alpha_v + (kh * alpha_h - kv * alpha_v) * pol) / (2 * k)
+
+    return k, alpha
+
+
+def specific_attenuation(rain_rate, f, elevation, tilt):
+    '''Returns the specific attenuation due to rain, gamma = k * R**alpha [dB/km]
+
+    Parameters
+    ----------
+    rain_rate : float or numpy.ndarray
+        Rain rate [mm/h]
+    f : float or numpy.ndarray
+        Frequency [GHz]
+    elevation : float or numpy.ndarray
+        Path elevation angle [deg]
+    tilt : float or numpy.ndarray
+        Polarisation tilt angle relative to the horizontal [deg]
+
+    Returns
+    -------
+    float or numpy.ndarray
+    '''
+    k, alpha = rain_coefficients(f, elevation, tilt)
+    return k * np.power(rain_rate, alpha)
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+title: noise_link_element.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+"""
+from project.link_element import LinkElement
+import numpy as np
+
+k_B = 1.380649e-23  #[J/K], Boltzmann constant
+T0 = 290            #[K], reference temperature of the feed and of the noise figure
+
+class NOISE_LinkElement(LinkElement):
+    '''Specific type of LinkElement for the noise of the receiver chain,
+    from which the carrier to noise density (C/N0), the energy per bit to
+    noise density (Eb/N0) and the margin against a required Eb/N0 follow.
+
+    The system noise temperature is referred to the input of the LNA, so
+    the feed loss in front of it is also the gain of this element. The
+    other gains of the table are unaffected: C/N0 follows from the output
+    power of the whole budget.
+
+    ...
+
+    Attributes
+    ----------
+    name : str
+        Defines the type of link element.
+    input_type : str
+        Defines wether a gain/loss is given or a parameter set is used.
+    gain : int
+        The gain or loss in Decibel of this link element in the case it is
+        known or given. Losses are given as negative gains.
+    parameters : dict
+        Contains parameters used:
+            'antenna_temperature': int
+                Noise temperature of the antenna in [K] (parameter_set_1),
+            'feed_loss': int
+                Loss of the feed between antenna and LNA, at a physical
+                temperature of 290 K, in [dB] (parameter_set_1),
+            'noise_figure': int
+                Noise figure of the LNA in [dB] (parameter_set_1),
+            'system_temperature': int
+                System noise temperature in [K] (parameter_set_2),
+            'data_rate': int
+                Data rate in [bit/s],
+            'required_eb_n0': int
+                Eb/N0 required by the demodulator in [dB]
+    Methods:
+    -------
+    process()
+        Updates the feed loss and the system noise temperature
+    calc_system_temperature()
+        Returns the system noise temperature
+    link_quality(output_power)
+        Returns C/N0, Eb/N0 and the Eb/N0 margin for a received power
+
+    Although not defined here, methods "dB(value)", "get_gain()" and
+    "get_loss()" are automatically inherited and will also work
+    '''
+    def __init__(self, name, input_type, gain, parameters):
+        '''
+        Parameters
+        ----------
+        name : str
+            Defines the type of link element.
+        input_type : str
+            Defines wether a gain/loss is given or a parameter set is used.
+        gain : int
+            The gain or loss in Decibel of this link element in the case it is
+            known or given. Losses are given as negative gains.
+        parameters : dict
+            Contains parameters used:
+                'antenna_temperature': int
+                    Noise temperature of the antenna in [K],
+                'feed_loss': int
+                    Loss of the feed between antenna and LNA in [dB],
+                'noise_figure': int
+                    Noise figure of the LNA in [dB],
+                'system_temperature': int
+                    System noise temperature in [K],
+                'data_rate': int
+                    Data rate in [bit/s],
+                'required_eb_n0': int
+                    Eb/N0 required by the demodulator in [dB]
+        '''
+        # Run the initialization of parent LinkElement
+        super().__init__(name, linktype='NOISE', gain = gain)
+        # Add attributes that are unique to NOISE_LinkElement
+        self.input_type = input_type
+
+        self.Ta = parameters.get('antenna_temperature', None)       # [K]
+        self.feed_loss = parameters.get('feed_loss', 0)             # [dB]
+        self.nf = parameters.get('noise_figure', None)              # [dB]
+        self.Tsys = parameters.get('system_temperature', None)      # [K]
+        self.data_rate = parameters.get('data_rate', None)          # [bit/s]
+        self.required_eb_n0 = parameters.get('required_eb_n0', None) # [dB]
+        # Check if gain/loss is given directly or calculations are required
+        if self.input_type != 'gain_loss':
+            self.process()
+
+    def process(self):
+        '''Updates the feed loss and the system noise temperature
+
+        parameter_set_1 builds the system noise temperature up from the
+        antenna, feed and LNA, parameter_set_2 takes it as given, in which
+        case the element has no gain.
+
+        Returns
+        -------
+        None
+
+        '''
+        if self.input_type == 'parameter_set_1':
+            self.Tsys = self.calc_system_temperature()
+            self.gain = -np.asarray(self.feed_loss, dtype=float)[()]
+        else:
+            self.gain = 0.0
+
+    def calc_system_temperature(self):
+        '''Returns the system noise temperature at the LNA input in [K]
+
+        The antenna noise is attenuated by the feed, which adds its own
+        thermal noise at 290 K, and the LNA adds its equivalent noise
+        temperature. Stages after the LNA are neglected.
+
+        Returns
+        -------
+        double
+            System noise temperature in [K]
+
+        '''
+        L = 10**(np.asarray(self.feed_loss, dtype=float)/10)    #[-], feed loss
+        Te = T0*(10**(np.asarray(self.nf, dtype=float)/10) - 1) #[K], LNA
+        return self.Ta/L + T0*(1 - 1/L) + Te
+
+    def link_quality(self, output_power, data_rate=None):
+        '''Returns the C/N0, Eb/N0 and Eb/N0 margin for a received power
+
+        All inputs may be arrays that broadcast against each other, so a
+        whole table of data rates is evaluated in one call.
+
+        Parameters
+        ----------
+        output_power : float or numpy.ndarray
+            Received power at the end of the budget in [dBm]
+        data_rate : float or numpy.ndarray, optional
+            Data rate in [bit/s], the data_rate parameter by default
+
+        Returns
+        -------
+        dict
+            'c_n0' in [dBHz], 'eb_n0' and 'ebn0_margin' in [dB]. The margin
+            has the sign convention of total_margin: required minus
+            achieved, negative when the link closes.
+
+        '''
+        if data_rate is None:
+            data_rate = self.data_rate
+        c_n0 = np.asarray(output_power) - 30 - self.dB(k_B*self.Tsys)
+        eb_n0 = c_n0 - self.dB(data_rate)
+        return {'c_n0': c_n0[()],
+                'eb_n0': eb_n0[()],
+                'ebn0_margin': (self.required_eb_n0 - eb_n0)[()]}
+
+
+if __name__ == '__main__':
+    # Put any code here you want to use to test the class
+    # (like a scratch pad to test stuff while you're working)
+    testparameters = {'antenna_temperature': 150,
+                      'feed_loss': 0.5,
+                      'noise_figure': 1.0,
+                      'data_rate': np.array([1.2e3, 9.6e3, 38.4e3]),
+                      'required_eb_n0': 9.6}
+    testelement = NOISE_LinkElement('test', 'parameter_set_1', None, testparameters)
+    print(testelement.Tsys, testelement.gain)
+    print(testelement.link_quality(-120))
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+title: pointing_link_element.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+"""
+from project.link_element import LinkElement
+import numpy as np
+from scipy import stats
+
+class POINTING_LinkElement(LinkElement):
+    '''Specific type of LinkElement for the pointing loss of a Gaussian
+    (optical) beam, that can depend a single gain/loss value or on
+    parameters instead. as dictated by the input_type value.
+
+    The far field intensity of a Gaussian beam falls off with the pointing
+    error theta as exp(-2 theta^2 / theta_d^2), with theta_d the 1/e^2
+    half-angle divergence. The pointing error has a constant bias and a
+    random jitter with the same standard deviation about both axes, so its
+    magnitude follows a Rice distribution (Rayleigh without bias).
+
+    ...
+
+    Attributes
+    ----------
+    name : str
+        Defines the type of link element.
+    input_type : str
+        Defines wether a gain/loss is given or a parameter set is used.
+    gain : int
+        The gain or loss in Decibel of this link element in the case it is
+        known or given. Losses are given as negative gains.
+    parameters : dict
+        Contains parameters used:
+            'pointing_error': int
+                Pointing error in [rad] (parameter_set_1),
+            'pointing_bias': int
+                Constant part of the pointing error in [rad]
+                (parameter_set_2/3),
+            'pointing_jitter': int
+                Standard deviation of the jitter about each axis in [rad]
+                (parameter_set_2/3),
+            'beam_divergence': int
+                1/e^2 half-angle divergence of the beam in [rad],
+            'exceedance': int
+                Percentage of the time the loss is exceeded in [%]
+                (parameter_set_2)
+    Methods:
+    -------
+    process()
+        Updates the pointing loss
+    calc_instantaneous_loss()
+        Returns the loss for the given pointing error
+    calc_loss_exceeded()
+        Returns the loss exceeded for the given percentage of time
+    calc_mean_loss()
+        Returns the loss of the mean received power
+
+    Although not defined here, methods "dB(value)", "get_gain()" and
+    "get_loss()" are automatically inherited and will also work
+    '''
+    def __init__(self, name, input_type, gain, parameters):
+        '''
+        Parameters
+        ----------
+        name : str
+            Defines the type of link element.
+        input_type : str
+            Defines wether a gain/loss is given or a parameter set is used.
+        gain : int
+            The gain or loss in Decibel of this link element in the case it is
+            known or given. Losses are given as negative gains.
+        parameters : dict
+            Contains parameters used:
+                'pointing_error': int
+                    Pointing error in [rad],
+                'pointing_bias': int
+                    Constant part of the pointing error in [rad],
+                'pointing_jitter': int
+                    Standard deviation of the jitter about each axis in [rad],
+                'beam_divergence': int
+                    1/e^2 half-angle divergence of the beam in [rad],
+                'exceedance': int
+                    Percentage of the time the loss is exceeded in [%]
+        '''
+        # Run the initialization of parent LinkElement
+        super().__init__(name, linktype='POINTING', gain = gain)
+        # Add attributes that are unique to POINTING_LinkElement
+        self.input_type = input_type
+
+        self.error = parameters.get('pointing_error', None)         # [rad]
+        self.bias = parameters.get('pointing_bias', 0)              # [rad]
+        self.jitter = parameters.get('pointing_jitter', None)       # [rad]
+        self.divergence = parameters.get('beam_divergence', None)   # [rad]
+        self.p = parameters.get('exceedance', None)                 # [%]
+        # Check if gain/loss is given directly or calculations are required
+        if self.input_type != 'gain_loss':
+            self.process()
+
+    def process(self):
+        '''Updates the pointing loss
+
+        parameter_set_1 gives the loss for a pointing error, which may be an
+        array of Monte Carlo samples (see sample_pointing_error).
+        parameter_set_2 gives the loss exceeded for a percentage of the
+        time, and parameter_set_3 the loss of the mean received power.
+
+        Returns
+        -------
+        None
+
+        '''
+        if self.input_type == 'parameter_set_1':
+            self.gain = self.calc_instantaneous_loss()
+        elif self.input_type == 'parameter_set_2':
+            self.gain = self.calc_loss_exceeded()
+        elif self.input_type == 'parameter_set_3':
+            self.gain = self.calc_mean_loss()
+
+    def calc_instantaneous_loss(self):
+        '''Returns the loss for the given pointing error in [dB]
+
+        Returns
+        -------
+        double
+            Gain in [dB], negative
+
+        '''
+        return -20/np.log(10)*(self.error/self.divergence)**2
+
+    def calc_loss_exceeded(self):
+        '''Returns the loss exceeded for the given percentage of time in [dB]
+
+        The squared pointing error, normalised by the jitter variance, has a
+        non-central chi-squared distribution with two degrees of freedom.
+
+        Returns
+        -------
+        double
+            Gain in [dB], negative
+
+        '''
+        bias = np.asarray(self.bias, dtype=float)
+        jitter = np.asarray(self.jitter, dtype=float)
+        # Without jitter the error is the bias all of the time
+        sigma = np.where(jitter > 0, jitter, 1.0)
+        theta2 = sigma**2*stats.ncx2.isf(np.asarray(self.p)/100, 2, (bias/sigma)**2)
+        theta2 = np.where(jitter > 0, theta2, bias**2)
+        return -20/np.log(10)*theta2/self.divergence**2
+
+    def calc_mean_loss(self):
+        '''Returns the loss of the mean received power in [dB]
+
+        Expectation of the Gaussian beam profile over the Rice distributed
+        pointing error.
+
+        Returns
+        -------
+        double
+            Gain in [dB], negative
+
+        '''
+        ratio = 1 + 4*(self.jitter/self.divergence)**2
+        return self.dB(np.exp(-2*self.bias**2/(self.divergence**2*ratio))/ratio)
+
+
+def sample_pointing_error(bias, jitter, size, rng=None):
+    '''Returns random samples of the pointing error in [rad]
+
+    Magnitude of a two-axis error with the bias along one axis and Gaussian
+    jitter about both axes, for a Monte Carlo run with parameter_set_1.
+
+    Parameters
+    ----------
+    bias : float
+        Constant part of the pointing error in [rad]
+    jitter : float
+        Standard deviation of the jitter about each axis in [rad]
+    size : int or tuple
+        Number or shape of the samples
+    rng : numpy.random.Generator or int, optional
+        Random generator or seed
+
+    Returns
+    -------
+    numpy.ndarray
+        Pointing error in [rad]
+    '''
+    rng = np.random.default_rng(rng)
+    x = rng.standard_normal(size)*jitter + bias
+    y = rng.standard_normal(size)*jitter
+    return np.hypot(x, y)
+
+
+if __name__ == '__main__':
+    # Put any code here you want to use to test the class
+    # (like a scratch pad to test stuff while you're working)
+    import time
+
+    testparameters = {'pointing_bias': 2e-6,
+                      'pointing_jitter': 3e-6,
+                      'beam_divergence': 15e-6,
+                      'exceedance': 1}
+    print(POINTING_LinkElement('test', 'parameter_set_2', None, testparameters).gain)
+    print(POINTING_LinkElement('test', 'parameter_set_3', None, testparameters).gain)
+
+    start = time.perf_counter()
+    testparameters['pointing_error'] = sample_pointing_error(2e-6, 3e-6, 10_000_000, rng=0)
+    loss = POINTING_LinkElement('test', 'parameter_set_1', None, testparameters).gain
+    print(f'{loss.size} samples in {time.perf_counter() - start:.2f} s, '
+          f'1% quantile {np.percentile(loss, 1):.3f} dB')
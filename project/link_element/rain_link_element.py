@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""
+title: rain_link_element.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+"""
+from project.link_element import LinkElement
+from project.link_element import itu_p838
+import numpy as np
+
+c = 299792458   #[m/s]
+Re = 8500       #[km], effective Earth radius of ITU-R P.618
+
+class RAIN_LinkElement(LinkElement):
+    '''Specific type of LinkElement for the attenuation due to rain on an
+    Earth-space path, that can depend a single gain/loss value or on
+    parameters instead. as dictated by the input_type value.
+
+    ...
+
+    Attributes
+    ----------
+    name : str
+        Defines the type of link element.
+    input_type : str
+        Defines wether a gain/loss is given or a parameter set is used.
+    gain : int
+        The gain or loss in Decibel of this link element in the case it is
+        known or given. Losses are given as negative gains.
+    parameters : dict
+        Contains parameters used:
+            'wavelength': int
+                Wavelength of the transmission in [m],
+            'polarization_tilt': int
+                Polarisation tilt angle relative to the horizontal in [deg],
+                45 for circular polarisation,
+            'elevation_angle': int
+                Elevation of sc from horizon of gs in [deg],
+            'gs_latitude': int
+                Latitude of the ground station in [deg],
+            'gs_altitude': int
+                Altitude of the ground station above mean sea level in [m],
+            'rain_rate': int
+                Rain rate in [m/s]. For parameter_set_2 this is the rain rate
+                exceeded for 0.01% of an average year,
+            'exceedance': int
+                Percentage of an average year the attenuation is exceeded
+                in [%], from 0.001 to 5 (parameter_set_2).
+    Methods:
+    -------
+    process()
+        Updates the rain attenuation loss
+    calc_rain_height()
+        Returns the rain height above mean sea level
+    calc_attenuation001()
+        Returns the attenuation for the given rain rate
+    calc_attenuation_exceeded()
+        Returns the attenuation exceeded for the given percentage of time
+
+    Although not defined here, methods "dB(value)", "get_gain()" and
+    "get_loss()" are automatically inherited and will also work
+    '''
+    def __init__(self, name, input_type, gain, parameters):
+        '''
+        Parameters
+        ----------
+        name : str
+            Defines the type of link element.
+        input_type : str
+            Defines wether a gain/loss is given or a parameter set is used.
+        gain : int
+            The gain or loss in Decibel of this link element in the case it is
+            known or given. Losses are given as negative gains.
+        parameters : dict
+            Contains parameters used:
+                'wavelength': int
+                    Wavelength of the transmission in [m],
+                'polarization_tilt': int
+                    Polarisation tilt angle relative to the horizontal in [deg],
+                'elevation_angle': int
+                    Elevation of sc from horizon of gs in [deg],
+                'gs_latitude': int
+                    Latitude of the ground station in [deg],
+                'gs_altitude': int
+                    Altitude of the ground station above mean sea level in [m],
+                'rain_rate': int
+                    Rain rate in [m/s],
+                'exceedance': int
+                    Percentage of an average year the attenuation is exceeded
+                    in [%] (parameter_set_2).
+        '''
+        # Run the initialization of parent LinkElement
+        super().__init__(name, linktype='RAIN', gain = gain)
+        # Add attributes that are unique to RAIN_LinkElement
+        self.input_type = input_type
+
+        self.wavelength = parameters.get('wavelength', None)        # [m]
+        self.tilt = parameters.get('polarization_tilt', None)       # [deg]
+        self.angle = parameters.get('elevation_angle', None)        # [deg]
+        self.latitude = parameters.get('gs_latitude', None)         # [deg]
+        self.hs = parameters.get('gs_altitude', None)               # [m]
+        self.rain_rate = parameters.get('rain_rate', None)          # [m/s]
+        self.p = parameters.get('exceedance', None)                 # [%]
+        # Check if gain/loss is given directly or calculations are required
+        if self.input_type != 'gain_loss':
+            self.process()
+
+    def process(self):
+        '''Updates the rain attenuation loss
+
+        Follows the "RECOMMENDATION ITU-R P.618-13 - Propagation data and
+        prediction methods required for the design of Earth-space
+        telecommunication systems", Section 2.2.1.1, with the specific
+        attenuation of ITU-R P.838-3. parameter_set_1 gives the attenuation
+        for the given rain rate, parameter_set_2 the attenuation exceeded
+        for the given percentage of an average year. All parameters may be
+        arrays, for example a range of exceedance percentages to obtain an
+        availability curve in one go.
+
+        Returns
+        -------
+        None
+
+        '''
+        if self.input_type == 'parameter_set_2':
+            self.gain = -self.calc_attenuation_exceeded()
+        else:
+            self.gain = -self.calc_attenuation001()
+
+    def calc_rain_height(self):
+        '''Returns the mean rain height above mean sea level in [km]
+
+        Latitude-dependent approximation of the rain height of ITU-R P.839,
+        used instead of the digital maps of the current recommendation.
+
+        Returns
+        -------
+        double
+
+        '''
+        lat = np.asarray(self.latitude, dtype=float)
+        hr = np.where(lat > 23, 5 - 0.075 * (lat - 23),
+             np.where(lat >= -21, 5.0,
+             np.where(lat >= -71, 5 + 0.1 * (lat + 21), 0.0)))
+        return hr
+
+    def calc_attenuation001(self):
+        '''Returns the attenuation for the given rain rate in [dB]
+
+        Steps 1-9 of ITU-R P.618-13, Section 2.2.1.1, where the given rain
+        rate takes the place of the rain rate exceeded for 0.01% of the time.
+
+        Returns
+        -------
+        double
+
+        '''
+        f = c / self.wavelength * 1e-9              # [GHz]
+        R = np.asarray(self.rain_rate) * 3.6e6      # [mm/h]
+        el = np.deg2rad(self.angle)                 # [rad]
+        lat = np.abs(self.latitude)                 # [deg]
+        hs = np.asarray(self.hs) * 1e-3             # [km]
+
+        # Step 1-3: rain height, slant path below it and its horizontal projection
+        dh = np.maximum(self.calc_rain_height() - hs, 0)
+        Ls = np.where(self.angle >= 5, dh / np.sin(el),
+                      2 * dh / (np.sqrt(np.sin(el)**2 + 2 * dh / Re) + np.sin(el)))
+        Lg = np.abs(Ls * np.cos(el))
+
+        # Step 5: specific attenuation
+        gamma = itu_p838.specific_attenuation(R, f, self.angle, self.tilt)
+
+        # Step 6: horizontal reduction factor
+        r001 = 1 / (1 + 0.78 * np.sqrt(Lg * gamma / f) - 0.38 * (1 - np.exp(-2 * Lg)))
+
+        # Step 7: vertical adjustment factor
+        zeta = np.arctan2(dh, Lg * r001)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            Lr = np.where(zeta > el, Lg * r001 / np.cos(el), dh / np.sin(el))
+        chi = np.where(lat < 36, 36 - lat, 0)
+        v001 = 1 / (1 + np.sqrt(np.sin(el)) * (31 * (1 - np.exp(-(self.angle / (1 + chi))))
+                                                * np.sqrt(Lr * gamma) / f**2 - 0.45))
+
+        # Step 8-9: effective path length and attenuation
+        att = gamma * Lr * v001
+
+        return att
+
+    def calc_attenuation_exceeded(self):
+        '''Returns the attenuation exceeded for a percentage of the year in [dB]
+
+        Step 10 of ITU-R P.618-13, Section 2.2.1.1. Valid for exceedance
+        percentages between 0.001% and 5%.
+
+        Returns
+        -------
+        double
+
+        '''
+        A001 = self.calc_attenuation001()
+        p = np.asarray(self.p, dtype=float)
+        lat = np.abs(self.latitude)
+        sin_el = np.sin(np.deg2rad(self.angle))
+
+        beta = np.where((p >= 1) | (lat >= 36), 0,
+               np.where(self.angle >= 25, -0.005 * (lat - 36),
+                        -0.005 * (lat - 36) + 1.8 - 4.25 * sin_el))
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            exponent = -(0.655 + 0.033 * np.log(p) - 0.045 * np.log(A001)
+                         - beta * (1 - p) * sin_el)
+            att = np.where(A001 > 0, A001 * (p / 0.01)**exponent, 0.0)
+
+        return att
+
+if __name__ == '__main__':
+    # Put any code here you want to use to test the class
+    # (like a scratch pad to test stuff while you're working)
+    testparameters = {'wavelength': c/20e9,
+                      'polarization_tilt': 45,
+                      'elevation_angle': 30,
+                      'gs_latitude': 52,
+                      'gs_altitude': 0,
+                      'rain_rate': 30/3.6e6,
+                      'exceedance': np.logspace(-3, np.log10(5), 7)}
+    testelement = RAIN_LinkElement('test', 'parameter_set_2', None, testparameters)
+    print(testelement.gain)
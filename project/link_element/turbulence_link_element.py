@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+title: turbulence_link_element.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+"""
+from functools import lru_cache
+
+from project.link_element import LinkElement
+import numpy as np
+from scipy import integrate, stats
+
+H_TOP = 30e3        #[m], top of the turbulence profile
+H_TURB = 20e3       #[m], effective height of the turbulent layer for aperture averaging
+
+@lru_cache(maxsize=64)
+def _hv_integrals(h0):
+    '''Returns the integrals of the Hufnagel-Valley terms, weighted by (h - h0)^(5/6)
+
+    The Cn^2 profile is a linear combination of the three terms, with the
+    wind speed and the ground level Cn^2 as coefficients, so the path
+    integral only has to be computed once per station altitude.
+    '''
+    s = np.geomspace(1e-3, H_TOP - h0, 4000)   #[m], height above the station
+    h = h0 + s
+    weight = s**(5/6)
+    terms = (0.00594/27**2*(1e-5*h)**10*np.exp(-h/1000),   # times wind_speed^2
+             2.7e-16*np.exp(-h/1500),
+             np.exp(-h/100))                              # times ground_cn2
+    return tuple(float(integrate.trapezoid(term*weight, s)) for term in terms)
+
+
+class TURBULENCE_LinkElement(LinkElement):
+    '''Specific type of LinkElement for the scintillation fade of an optical
+    downlink through atmospheric turbulence, that can depend a single
+    gain/loss value or on parameters instead. as dictated by the input_type
+    value.
+
+    The refractive index structure constant follows the Hufnagel-Valley
+    profile
+        Cn^2(h) = 0.00594 (v/27)^2 (1e-5 h)^10 exp(-h/1000)
+                  + 2.7e-16 exp(-h/1500) + A exp(-h/100)
+    with the rms wind speed v and the ground level Cn^2 A (HV 5/7 for
+    v = 21 m/s, A = 1.7e-14 m^-2/3). The Rytov variance of a plane wave
+    along the slant path gives the scintillation index (Andrews and
+    Phillips, weak to strong fluctuations), which is reduced by aperture
+    averaging. The received intensity is log-normal, and the fade is the
+    intensity exceeded for all but the given percentage of time.
+
+    ...
+
+    Attributes
+    ----------
+    name : str
+        Defines the type of link element.
+    input_type : str
+        Defines wether a gain/loss is given or a parameter set is used.
+    gain : int
+        The gain or loss in Decibel of this link element in the case it is
+        known or given. Losses are given as negative gains.
+    parameters : dict
+        Contains parameters used:
+            'wavelength': int
+                Wavelength of the transmission in [m],
+            'elevation_angle': int
+                Elevation of sc from horizon of gs in [deg],
+            'gs_altitude': int
+                Altitude of the ground station above mean sea level in [m],
+            'wind_speed': int
+                Rms wind speed of the Hufnagel-Valley profile in [m/s],
+            'ground_cn2': int
+                Cn^2 at ground level in [m^-2/3],
+            'rx_aperture_diameter': int
+                Diameter of the receiver aperture in [m],
+            'exceedance': int
+                Percentage of the time the fade is exceeded in [%]
+    Methods:
+    -------
+    process()
+        Updates the scintillation fade
+    calc_rytov_variance()
+        Returns the Rytov variance of the slant path
+    calc_scintillation_index()
+        Returns the aperture averaged scintillation index
+    calc_fade()
+        Returns the fade exceeded for the given percentage of time
+
+    Although not defined here, methods "dB(value)", "get_gain()" and
+    "get_loss()" are automatically inherited and will also work
+    '''
+    def __init__(self, name, input_type, gain, parameters):
+        '''
+        Parameters
+        ----------
+        name : str
+            Defines the type of link element.
+        input_type : str
+            Defines wether a gain/loss is given or a parameter set is used.
+        gain : int
+            The gain or loss in Decibel of this link element in the case it is
+            known or given. Losses are given as negative gains.
+        parameters : dict
+            Contains parameters used:
+                'wavelength': int
+                    Wavelength of the transmission in [m],
+                'elevation_angle': int
+                    Elevation of sc from horizon of gs in [deg],
+                'gs_altitude': int
+                    Altitude of the ground station above mean sea level in [m],
+                'wind_speed': int
+                    Rms wind speed of the Hufnagel-Valley profile in [m/s],
+                'ground_cn2': int
+                    Cn^2 at ground level in [m^-2/3],
+                'rx_aperture_diameter': int
+                    Diameter of the receiver aperture in [m],
+                'exceedance': int
+                    Percentage of the time the fade is exceeded in [%]
+        '''
+        # Run the initialization of parent LinkElement
+        super().__init__(name, linktype='TURBULENCE', gain = gain)
+        # Add attributes that are unique to TURBULENCE_LinkElement
+        self.input_type = input_type
+
+        self.wavelength = parameters.get('wavelength', None)        # [m]
+        self.angle = parameters.get('elevation_angle', None)        # [deg]
+        self.hs = parameters.get('gs_altitude', 0)                  # [m]
+        self.wind = parameters.get('wind_speed', 21)                # [m/s]
+        self.A = parameters.get('ground_cn2', 1.7e-14)              # [m^-2/3]
+        self.D = parameters.get('rx_aperture_diameter', None)       # [m]
+        self.p = parameters.get('exceedance', None)                 # [%]
+        # Check if gain/loss is given directly or calculations are required
+        if self.input_type != 'gain_loss':
+            self.process()
+
+    def process(self):
+        '''Updates the scintillation fade
+
+        All parameters may be arrays, for example the elevation over a pass.
+
+        Returns
+        -------
+        None
+
+        '''
+        if self.input_type == 'parameter_set_1':
+            self.gain = self.calc_fade()
+
+    def calc_rytov_variance(self):
+        '''Returns the Rytov variance of a plane wave along the slant path
+
+        sigma_R^2 = 2.25 k^(7/6) sec(zeta)^(11/6) int Cn^2(h) (h - h0)^(5/6) dh
+
+        Returns
+        -------
+        double
+            Rytov variance [-]
+
+        '''
+        hs, inverse = np.unique(np.asarray(self.hs, dtype=float), return_inverse=True)
+        integrals = np.array([_hv_integrals(h0) for h0 in hs])[inverse]
+        integrals = integrals.reshape(np.shape(self.hs) + (3,))
+        path = (self.wind**2*integrals[..., 0] + integrals[..., 1]
+                + self.A*integrals[..., 2])
+
+        k = 2*np.pi/self.wavelength
+        sec = 1/np.sin(np.deg2rad(self.angle))
+        return 2.25*k**(7/6)*sec**(11/6)*path
+
+    def calc_scintillation_index(self):
+        '''Returns the aperture averaged scintillation index
+
+        Plane wave scintillation index for weak to strong fluctuations (zero
+        inner scale), times the aperture averaging factor
+        [1 + 1.062 k D^2 / (4 L)]^(-7/6) over the slant path L through a
+        turbulent layer of H_TURB.
+
+        Returns
+        -------
+        double
+            Scintillation index [-]
+
+        '''
+        sr2 = self.calc_rytov_variance()
+        s125 = sr2**(6/5)
+        point = np.expm1(0.49*sr2/(1 + 1.11*s125)**(7/6)
+                         + 0.51*sr2/(1 + 0.69*s125)**(5/6))
+
+        k = 2*np.pi/self.wavelength
+        L = (H_TURB - np.minimum(self.hs, H_TURB - 1))/np.sin(np.deg2rad(self.angle))
+        averaging = (1 + 1.062*k*self.D**2/(4*L))**(-7/6)
+        return averaging*point
+
+    def calc_fade(self):
+        '''Returns the fade exceeded for the given percentage of time in [dB]
+
+        Returns
+        -------
+        double
+            Gain in [dB], negative for a fade
+
+        '''
+        s2 = np.log1p(self.calc_scintillation_index())
+        log_intensity = -s2/2 + np.sqrt(s2)*stats.norm.ppf(np.asarray(self.p)/100)
+        return 10/np.log(10)*log_intensity
+
+
+if __name__ == '__main__':
+    # Put any code here you want to use to test the class
+    # (like a scratch pad to test stuff while you're working)
+    testparameters = {'wavelength': 1550e-9,
+                      'elevation_angle': np.array([10, 20, 45, 90]),
+                      'gs_altitude': 0,
+                      'wind_speed': 21,
+                      'ground_cn2': 1.7e-14,
+                      'rx_aperture_diameter': 0.4,
+                      'exceedance': 1}
+    element = TURBULENCE_LinkElement('test', 'parameter_set_1', None, testparameters)
+    print(element.calc_rytov_variance(), element.calc_scintillation_index(), element.gain)
@@ -5,6 +5,7 @@ Created on Tue May 11 12:32:54 2021
 @author: Willem van Lynden
 """
 from project.link_element import LinkElement
+from project.link_element.antenna_pattern import load_pattern
 import numpy as np
 
 
@@ -34,6 +35,14 @@ class TX_LinkElement(LinkElement):
                 Transmission wavelength in [m],
             'w0': int
                     The waist radius of the antenna in [m]
+            'pattern_file': str
+                Antenna pattern file, CSV or NPY (parameter_set_3/4),
+            'off_boresight_angle': int
+                Angle between boresight and the link in [deg]
+                (parameter_set_3),
+            'azimuth_offset', 'elevation_offset': int
+                Pointing offsets of the link from boresight in [deg]
+                (parameter_set_4)
     Methods:
     -------
     process()
@@ -42,6 +51,9 @@ class TX_LinkElement(LinkElement):
         Returns the calculated peak antenna gain using parameter_set_1
     calc_waistgain()
         Returns the calculated antenna gain using parameter_set_2
+    calc_patterngain()
+        Returns the antenna gain from a tabulated pattern using
+        parameter_set_3 or parameter_set_4
     
     Although not defined here, methods "dB(value)", "get_gain()" and 
     "get_loss()" are automatically inherited and will also work
@@ -67,6 +79,14 @@ class TX_LinkElement(LinkElement):
                     Transmission wavelength in [m],
                 'w0': int
                     The waist radius of the antenna in [m]
+                'pattern_file': str
+                    Antenna pattern file, CSV or NPY (parameter_set_3/4),
+                'off_boresight_angle': int
+                    Angle between boresight and the link in [deg]
+                    (parameter_set_3),
+                'azimuth_offset', 'elevation_offset': int
+                    Pointing offsets of the link from boresight in [deg]
+                    (parameter_set_4)
         '''
         # Run the initialization of parent LinkElement
         super().__init__(name, linktype='TX', gain = gain)
@@ -77,6 +97,10 @@ class TX_LinkElement(LinkElement):
         self.diameter = parameters.get('antenna_diameter', None)
         self.wavelength = parameters.get('wavelength', None)
         self.w0 = parameters.get('waist_radius', None)
+        self.pattern_file = parameters.get('pattern_file', None)
+        self.off_boresight = parameters.get('off_boresight_angle', 0)     #[deg]
+        self.az_offset = parameters.get('azimuth_offset', 0)              #[deg]
+        self.el_offset = parameters.get('elevation_offset', 0)            #[deg]
         if self.input_type != 'gain_loss':
             self.process()
 
@@ -101,6 +125,8 @@ class TX_LinkElement(LinkElement):
         elif self.input_type == "parameter_set_2":
             Gt = self.calc_waistgain()
             self.gain = self.dB(Gt)
+        elif self.input_type in ("parameter_set_3", "parameter_set_4"):
+            self.gain = self.calc_patterngain()
 
     def calc_efficiencygain(self):
         '''Returns the Transmitting Channel antenna gain using the efficiency
@@ -134,6 +160,25 @@ class TX_LinkElement(LinkElement):
         Gt = 2*(2*np.pi*self.w0/self.wavelength)**2
         return Gt
 
+    def calc_patterngain(self):
+        '''Returns the Transmitting Channel antenna gain from a tabulated pattern
+
+        Uses parameter_set_3, the off-boresight angle in a 1-D pattern, or
+        parameter_set_4, the azimuth and elevation offsets in a 2-D pattern.
+        The pattern file is read once and the angles may be arrays, such
+        as the pointing angles over a pass.
+
+        Returns
+        -------
+        float
+            Transmitting Channel antenna gain in [dB]
+
+        '''
+        pattern = load_pattern(self.pattern_file)
+        if self.input_type == "parameter_set_3":
+            return pattern(self.off_boresight)
+        return pattern(self.az_offset, self.el_offset)
+
 if __name__ == '__main__':
     # Put any code here you want to use to test the class
     # (like a scratch pad to test stuff while you're working)
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+title: memory.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Memory used by the analyses: measurement with tracemalloc, and a memory limit for the
+chunked jobs (sweeps, Monte Carlo runs, networks).
+
+MemoryUse measures the memory allocated during a block, by Python objects and numpy
+arrays alike, see profiling.profile(memory=True) for a report per stage:
+
+    with MemoryUse() as use:
+        results = evaluate_budget(data, columns)
+    print(format_size(use.peak))
+
+A chunked job sizes its chunks to stay within a memory limit: it measures the peak memory
+of a small first chunk (PILOT_SIZE samples) and fits as many samples per chunk as the limit
+allows, after what the results of the whole job take. The limit applies to the data of a
+job, the interpreter and the loaded libraries come on top. It is set for all jobs with
+memory_limit(), or per job.
+"""
+import contextlib
+import re
+import threading
+import tracemalloc
+
+PILOT_SIZE = 4096   # Samples of the first chunk of a job with a memory limit
+
+UNITS = {'': 1, 'K': 2**10, 'M': 2**20, 'G': 2**30, 'T': 2**40}
+
+_max_memory = None          # Limit of every job [B], None for none
+_lock = threading.Lock()
+_open = set()               # Running measurements
+_started = False            # Whether tracemalloc was started by a measurement
+# Python 3.9 and later. Before, the peak is the highest since tracing started, which
+# overestimates the peak of a block, on the safe side for a memory limit
+_reset_peak = getattr(tracemalloc, 'reset_peak', None)
+
+
+class MemoryUse:
+    '''Memory allocated during a with block, traced by tracemalloc
+
+    Tracing is started for the block if it is not running. Measurements may be nested
+    and run in several threads, every one sees the allocations of the whole process.
+    Before Python 3.9, the peak may include allocations made before the block, since
+    tracing started.
+
+    Attributes
+    ----------
+    peak : int
+        Highest memory allocated above the start of the block [B]
+    net : int
+        Memory still allocated at the end of the block [B], negative if more was freed
+    '''
+    def __init__(self):
+        self.peak = self.net = 0
+        self._start = self._high = 0
+
+    @staticmethod
+    def _update():
+        # The peak of tracemalloc is shared, so it is handed to all open measurements
+        # before it is reset
+        current, peak = tracemalloc.get_traced_memory()
+        for use in _open:
+            use._high = max(use._high, peak)
+        if _reset_peak is not None:
+            _reset_peak()
+        return current
+
+    def __enter__(self):
+        global _started
+        with _lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _started = True
+            self._start = self._high = self._update()
+            _open.add(self)
+        return self
+
+    def __exit__(self, *exc):
+        global _started
+        with _lock:
+            current = self._update()
+            _open.discard(self)
+            if _started and not _open:
+                tracemalloc.stop()
+                _started = False
+        self.peak = max(self._high, current) - self._start
+        self.net = current - self._start
+        return False
+
+
+def parse_size(text):
+    '''Number of bytes of a size such as '512M', '2 GiB' or '1e9'
+
+    The units K, M, G and T are powers of 1024, with or without 'iB' or 'B'.
+
+    Raises
+    ------
+    ValueError:
+        If the text is not a size
+
+    Returns
+    -------
+    int
+    '''
+    match = re.fullmatch(r'\s*([0-9.eE+]+)\s*([kKmMgGtT]?)(i?B)?\s*', str(text))
+    try:
+        value = float(match.group(1))
+    except (AttributeError, ValueError):
+        raise ValueError(f'Not a memory size: "{text}", e.g. 512M or 2GiB') from None
+    return int(value * UNITS[match.group(2).upper()])
+
+
+def format_size(nbytes):
+    '''Size in B, KiB, MiB, GiB or TiB, e.g. '12.3 MiB' '''
+    for unit in ('T', 'G', 'M', 'K'):
+        if abs(nbytes) >= UNITS[unit]:
+            return f'{nbytes / UNITS[unit]:.1f} {unit}iB'
+    return f'{nbytes:.0f} B'
+
+
+def max_memory():
+    '''Returns the memory limit of the jobs [B], None if there is none'''
+    return _max_memory
+
+
+@contextlib.contextmanager
+def memory_limit(nbytes):
+    '''Sets the memory limit of all jobs started during its block
+
+    Parameters
+    ----------
+    nbytes : int or None
+        Limit [B], None for none
+    '''
+    global _max_memory
+    previous, _max_memory = _max_memory, nbytes
+    try:
+        yield
+    finally:
+        _max_memory = previous
+
+
+def chunk_rows(max_rows, row_bytes, reserved=0, limit=None):
+    '''Number of rows per chunk that keeps a chunked job within a memory limit
+
+    Parameters
+    ----------
+    max_rows : int
+        Rows per chunk without a limit
+    row_bytes : float
+        Peak memory per row of a chunk [B], e.g. measured by MemoryUse on a first chunk
+    reserved : int, default=0
+        Memory held by the job for all chunks, e.g. its results [B]
+    limit : int, optional
+        Memory limit [B], max_memory() by default
+
+    Raises
+    ------
+    MemoryError:
+        If not even a single row fits within the limit
+
+    Returns
+    -------
+    int
+    '''
+    limit = max_memory() if limit is None else limit
+    if limit is None:
+        return max_rows
+    available = limit - reserved
+    if available < row_bytes:
+        raise MemoryError(f'The job does not fit within the memory limit of '
+                          f'{format_size(limit)}: its results take {format_size(reserved)} '
+                          f'and a chunk of a single row {format_size(row_bytes)}')
+    if row_bytes <= 0:
+        return max_rows
+    return int(min(max_rows, available // row_bytes))
+
+
+if __name__ == '__main__':
+    import numpy as np
+
+    with MemoryUse() as use:
+        a = np.ones(10**6)
+        with MemoryUse() as inner:
+            b = a * 2
+            del b
+    print(f'peak {format_size(use.peak)}, net {format_size(use.net)}, '
+          f'inner peak {format_size(inner.peak)}, inner net {format_size(inner.net)}')
+    print(chunk_rows(2**16, 1e3, reserved=parse_size('10M'), limit=parse_size('64M')))
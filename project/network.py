@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+title: network.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Link budgets of a constellation against a network of ground stations.
+
+One configuration serves as the template of every satellite-station link. The
+differences between satellites (orbit, transmit power, spacecraft antenna, ...) and
+between stations (location, ground antenna, local weather, ...) are given as scenario
+columns with one value per satellite or per station, named as in project.batch.
+The geometry drives the element parameters named in GEOMETRY_PARAMETERS and
+STATION_PARAMETERS.
+
+The geometry is computed for the full satellite x station x time tensor with
+broadcasting, in chunks of time so that memory stays bounded. The budget is then
+evaluated in a single call per chunk (elements that do not depend on the geometry or
+the value columns only once), only on the samples where the satellite is above
+the elevation mask of the station. The result is the best satellite of every station at
+every time, and optionally the full margin tensor.
+
+With a memory limit (see project.memory), the chunks are sized by the peak memory of a
+first small chunk, as if every satellite were visible from every station.
+"""
+import contextlib
+import copy
+
+import numpy as np
+import pandas as pd
+
+from project import memory
+from project.batch import CompiledBudget, scenario_columns
+from project.orbit import GroundStation, look_angles
+from project.passes import GEOMETRY_PARAMETERS, geometry_columns, _stations
+from project.tracing import span
+
+# Element parameters that follow from the station location, and the geometry key they take
+STATION_PARAMETERS = {'gs_latitude': 'latitude',
+                      'gs_altitude': 'altitude'}
+
+def _satellites(orbit):
+    '''Returns the orbit with its elements reshaped to (n_sat, 1, 1), and n_sat'''
+    elements = np.broadcast_arrays(*(np.atleast_1d(x) for x in
+                                     (orbit.a, orbit.e, orbit.i, orbit.raan, orbit.argp, orbit.M0)))
+    if elements[0].ndim != 1:
+        raise ValueError('Orbit elements of a constellation must be scalars or 1-D arrays')
+
+    satellites = copy.copy(orbit)
+    (satellites.a, satellites.e, satellites.i,
+     satellites.raan, satellites.argp, satellites.M0) = (x[:, None, None] for x in elements)
+    return satellites, elements[0].size
+
+
+def _value_columns(values, size, kind):
+    '''Returns per-satellite or per-station scenario columns as 1-D arrays'''
+    if values is None:
+        return {}
+    if not isinstance(values, dict):
+        values = scenario_columns(values)
+
+    columns = {}
+    for column, val in values.items():
+        val = np.asarray(val)
+        if val.shape != (size,):
+            raise ValueError(f'Column "{column}" must have one value per {kind} ({size}), '
+                             f'got shape {val.shape}')
+        columns[column] = val
+    return columns
+
+
+def evaluate_network(user_data, satellites, stations, t, satellite_values=None,
+                     station_values=None, min_elevation=0.0, metric='total_margin',
+                     chunk_size=2**20, gmst0=0.0, return_margin=False, max_memory=None):
+    '''Evaluate the link budget of every satellite against every station over time
+
+    Parameters
+    ----------
+    user_data : dict
+        Configuration dictionary, the template of every link
+    satellites : project.orbit.Orbit
+        Orbit with 1-D arrays of elements, one per satellite
+    stations : project.orbit.GroundStation
+        Stations with 1-D coordinates
+    t : numpy.ndarray
+        Times since epoch in [s]
+    satellite_values : dict, pandas.DataFrame or numpy.ndarray, optional
+        Scenario columns with one value per satellite, e.g. {'input_power': ...}
+    station_values : dict, pandas.DataFrame or numpy.ndarray, optional
+        Scenario columns with one value per station, e.g. {'Rain.rain_rate': ...}
+    min_elevation : float or numpy.ndarray, default=0.0
+        Elevation mask in [deg], per station if an array
+    metric : str, default='total_margin'
+        Result that ranks the satellites, lowest is best (e.g. 'ebn0_margin')
+    chunk_size : int, default=2**20
+        Maximum number of satellite x station x time samples per chunk
+    gmst0 : float, default=0.0
+        Greenwich sidereal angle at epoch in [deg]
+    return_margin : bool, default=False
+        Also return the full tensor of metric (n_sat x n_station x n_time)
+    max_memory : int, optional
+        Memory limit [B], by default project.memory.max_memory()
+
+    Raises
+    ------
+    ValueError:
+        If a value column does not have one value per satellite or station
+    MemoryError:
+        If the results do not fit within the memory limit
+
+    Returns
+    -------
+    dict
+        'time': t,
+        'best_satellite': index of the best visible satellite, -1 if none
+            (n_station x n_time),
+        'best_margin': metric of the best satellite, NaN if none (n_station x n_time),
+        'margin': metric, NaN where not visible (n_sat x n_station x n_time), only
+            if return_margin
+    '''
+    t = np.atleast_1d(np.asarray(t, dtype=float))
+    orbits, n_sat = _satellites(satellites)
+    stations = _stations(stations)
+    n_station = stations.latitude.size
+
+    sat_columns = _value_columns(satellite_values, n_sat, 'satellite')
+    station_columns = _value_columns(station_values, n_station, 'station')
+    mask = np.broadcast_to(min_elevation, (n_station,)).astype(float)[:, None]
+    station_grid = GroundStation(np.rad2deg(stations.latitude)[:, None],
+                                 np.rad2deg(stations.longitude)[:, None],
+                                 stations.altitude[:, None])
+    station_geometry = {'latitude': np.rad2deg(stations.latitude),
+                        'altitude': stations.altitude}
+    parameters = {**GEOMETRY_PARAMETERS, **STATION_PARAMETERS}
+    # Elements that do not depend on the geometry or the value columns are computed once
+    budget = CompiledBudget(user_data)
+
+    best_satellite = np.full((n_station, t.size), -1, dtype=int)
+    best_margin = np.full((n_station, t.size), np.nan)
+    margin = np.full((n_sat, n_station, t.size), np.nan) if return_margin else None
+
+    def evaluate_chunk(k0, k1):
+        '''Fills the results of times k0:k1, returns the number of visible samples'''
+        geometry = look_angles(orbits, station_grid, t[k0:k1], gmst0)
+        visible = geometry['elevation'] >= mask
+        sat_idx, station_idx, _ = np.nonzero(visible)
+        if sat_idx.size == 0:
+            return 0
+
+        # Budget of the visible samples only, as one flat scenario table
+        samples = {key: val[visible] for key, val in geometry.items()}
+        samples.update({key: val[station_idx] for key, val in station_geometry.items()})
+        columns = geometry_columns(user_data, samples, parameters=parameters)
+        columns.update({col: val[sat_idx] for col, val in sat_columns.items()})
+        columns.update({col: val[station_idx] for col, val in station_columns.items()})
+        with span('evaluate chunk', start=k0, stop=k1, samples=int(sat_idx.size)):
+            results = budget.evaluate(columns)
+
+        chunk = np.full(visible.shape, np.inf)
+        chunk[visible] = np.broadcast_to(results[metric], sat_idx.shape)
+        best = np.argmin(chunk, axis=0)
+        best_value = np.take_along_axis(chunk, best[None], axis=0)[0]
+        in_view = np.isfinite(best_value)
+        best_satellite[:, k0:k1] = np.where(in_view, best, -1)
+        best_margin[:, k0:k1] = np.where(in_view, best_value, np.nan)
+        if return_margin:
+            margin[:, :, k0:k1] = np.where(visible, chunk, np.nan)
+        return sat_idx.size
+
+    n_links = n_sat * n_station
+    max_chunk = max(1, chunk_size // n_links)
+    limit = memory.max_memory() if max_memory is None else max_memory
+    pilot = limit is not None
+    n_chunk = max(1, min(max_chunk, memory.PILOT_SIZE // n_links)) if pilot else max_chunk
+    reserved = sum(arr.nbytes for arr in (best_satellite, best_margin, margin) if arr is not None)
+    k0 = 0
+    while k0 < t.size:
+        k1 = min(k0 + n_chunk, t.size)
+        with (memory.MemoryUse() if pilot else contextlib.nullcontext()) as use:
+            n_visible = evaluate_chunk(k0, k1)
+        if pilot and n_visible:
+            # Measured until a chunk has visible samples, scaled up to all visible
+            n_chunk = memory.chunk_rows(max_chunk, use.peak / n_visible * n_links, reserved,
+                                        limit)
+            pilot = False
+        k0 = k1
+
+    out = {'time': t, 'best_satellite': best_satellite, 'best_margin': best_margin}
+    if return_margin:
+        out['margin'] = margin
+    return out
+
+
+def assignment_table(result, satellite_names=None, station_names=None):
+    '''Intervals during which each station is served by the same best satellite
+
+    Parameters
+    ----------
+    result : dict
+        Output of evaluate_network
+    satellite_names, station_names : list, optional
+        Names to use instead of the indices
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per interval, sorted by station and start: 'station', 'satellite',
+        'start' and 'end' in [s] (first and last sample) and 'worst_margin', the worst
+        value of the metric over the interval. The highest value, as evaluate_network
+        ranks the lowest value best
+    '''
+    best = result['best_satellite']
+    t = result['time']
+    n_station, n_time = best.shape
+
+    # Runs of equal assignment; every station row starts a new run
+    change = np.ones(best.shape, dtype=bool)
+    change[:, 1:] = best[:, 1:] != best[:, :-1]
+    starts = np.flatnonzero(change)
+    ends = np.append(starts[1:], best.size) - 1
+
+    satellite = best.ravel()[starts]
+    served = satellite >= 0
+    worst_margin = np.maximum.reduceat(result['best_margin'].ravel(), starts) if starts.size \
+        else np.empty(0)
+
+    table = pd.DataFrame({'station': starts // n_time,
+                          'satellite': satellite,
+                          'start': t[starts % n_time],
+                          'end': t[ends % n_time],
+                          'worst_margin': worst_margin})[served].reset_index(drop=True)
+    if station_names is not None:
+        table['station'] = np.asarray(station_names)[table['station']]
+    if satellite_names is not None:
+        table['satellite'] = np.asarray(satellite_names)[table['satellite']]
+    return table
+
+
+if __name__ == '__main__':
+    import time
+    from pathlib import Path
+    from project.orbit import Orbit, R_EARTH
+    from project.process import load_from_yaml
+    from project.settings import CONFIGS_DIR
+
+    # 36 satellites in 6 planes, 12 stations, one day at 10 s
+    plane, slot = np.meshgrid(np.arange(6), np.arange(6), indexing='ij')
+    constellation = Orbit(R_EARTH + 550e3, 0, 53, 60 * plane.ravel(), 0,
+                          60 * slot.ravel() + 30 * plane.ravel())
+    rng = np.random.default_rng(1)
+    network = GroundStation(rng.uniform(-60, 60, 12), rng.uniform(-180, 180, 12), 0)
+    t = np.arange(0, 86400, 10.0)
+
+    data = load_from_yaml(Path(CONFIGS_DIR, 'Example_Delfi.yaml'))
+    start = time.perf_counter()
+    result = evaluate_network(data, constellation, network, t, min_elevation=10)
+    print(f'{36 * 12 * t.size} links in {time.perf_counter() - start:.2f} s')
+    print(assignment_table(result).head())
@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+"""
+title: orbit.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Analytical orbit propagation and ground station geometry.
+
+A Keplerian orbit is propagated over an array of times, optionally with the secular
+drift of the right ascension of the ascending node, argument of perigee and mean
+anomaly due to the J2 oblateness of the Earth. The Earth rotates at a constant rate,
+with the Greenwich meridian aligned with the vernal equinox at the epoch (t = 0),
+unless another sidereal angle is given. No ephemeris data or services are needed.
+
+Ground stations are given by their geodetic (WGS-84) coordinates. The geometry
+between an orbit and a station gives the slant range, elevation, azimuth and range
+rate that drive the free space, atmospheric and pointing losses.
+
+Vectors are passed around as (x, y, z) tuples of arrays rather than stacked arrays, so
+orbit elements, station coordinates and times broadcast like any NumPy operands. For
+example orbit elements of shape (n_sat, 1, 1), station coordinates of shape
+(n_station, 1) and times of shape (n_time,) give geometry of shape
+(n_sat, n_station, n_time).
+"""
+import numpy as np
+
+MU = 3.986004418e14         # [m**3/s**2], Earth gravitational parameter
+R_EARTH = 6378137.0         # [m], WGS-84 equatorial radius
+FLATTENING = 1 / 298.257223563  # [-], WGS-84
+J2 = 1.08262668e-3          # [-], Earth oblateness
+OMEGA_EARTH = 7.2921150e-5  # [rad/s], Earth rotation rate
+
+
+class Orbit:
+    '''Keplerian orbit with optional J2 secular drift
+
+    ...
+
+    Attributes
+    ----------
+    a : float or numpy.ndarray
+        Semi-major axis in [m]
+    e : float or numpy.ndarray
+        Eccentricity [-]
+    i : float or numpy.ndarray
+        Inclination in [rad]
+    raan : float or numpy.ndarray
+        Right ascension of the ascending node at epoch in [rad]
+    argp : float or numpy.ndarray
+        Argument of perigee at epoch in [rad]
+    M0 : float or numpy.ndarray
+        Mean anomaly at epoch in [rad]
+    j2 : bool
+        Include the secular J2 drift
+
+    Methods:
+    -------
+    mean_motion()
+        Returns the Keplerian mean motion
+    secular_rates()
+        Returns the drift rates of the node, perigee and mean anomaly
+    state_eci(t)
+        Returns the inertial position and velocity at times t
+    '''
+    def __init__(self, semi_major_axis, eccentricity, inclination, raan,
+                 arg_perigee, mean_anomaly, j2=True):
+        '''
+        Parameters
+        ----------
+        semi_major_axis : float or numpy.ndarray
+            Semi-major axis in [m]
+        eccentricity : float or numpy.ndarray
+            Eccentricity [-], 0 <= e < 1
+        inclination : float or numpy.ndarray
+            Inclination in [deg]
+        raan : float or numpy.ndarray
+            Right ascension of the ascending node at epoch in [deg]
+        arg_perigee : float or numpy.ndarray
+            Argument of perigee at epoch in [deg]
+        mean_anomaly : float or numpy.ndarray
+            Mean anomaly at epoch in [deg]
+        j2 : bool, default=True
+            Include the secular J2 drift
+        '''
+        self.a = np.asarray(semi_major_axis, dtype=float)
+        self.e = np.asarray(eccentricity, dtype=float)
+        if np.any(self.e < 0) or np.any(self.e >= 1):
+            raise ValueError('Eccentricity must be in [0, 1) for a closed orbit')
+        self.i = np.deg2rad(inclination)
+        self.raan = np.deg2rad(raan)
+        self.argp = np.deg2rad(arg_perigee)
+        self.M0 = np.deg2rad(mean_anomaly)
+        self.j2 = bool(j2)
+
+    def mean_motion(self):
+        '''Returns the Keplerian mean motion in [rad/s]'''
+        return np.sqrt(MU / self.a**3)
+
+    def secular_rates(self):
+        '''Returns the secular drift rates due to J2 in [rad/s]
+
+        Returns
+        -------
+        float or numpy.ndarray
+            Rate of the right ascension of the ascending node
+        float or numpy.ndarray
+            Rate of the argument of perigee
+        float or numpy.ndarray
+            Rate of the mean anomaly, including the mean motion
+        '''
+        n = self.mean_motion()
+        if not self.j2:
+            return 0.0, 0.0, n
+
+        factor = 1.5 * n * J2 * (R_EARTH / (self.a * (1 - self.e**2)))**2
+        cos_i = np.cos(self.i)
+        raan_dot = -factor * cos_i
+        argp_dot = factor / 2 * (5 * cos_i**2 - 1)
+        M_dot = n + factor / 2 * np.sqrt(1 - self.e**2) * (3 * cos_i**2 - 1)
+        return raan_dot, argp_dot, M_dot
+
+    def eccentric_anomaly(self, M, tol=1e-12, max_iter=20):
+        '''Solves Kepler's equation M = E - e sin(E) for the eccentric anomaly [rad]
+
+        Newton iterations on the whole array at once.
+        '''
+        E = M + self.e * np.sin(M)
+        for _ in range(max_iter):
+            dE = (E - self.e * np.sin(E) - M) / (1 - self.e * np.cos(E))
+            E = E - dE
+            if np.all(np.abs(dE) < tol):
+                break
+        return E
+
+    def state_eci(self, t):
+        '''Returns the inertial position and velocity at times t
+
+        Parameters
+        ----------
+        t : float or numpy.ndarray
+            Time since epoch in [s]
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            Position (x, y, z) in [m]
+        tuple of numpy.ndarray
+            Velocity (vx, vy, vz) in [m/s]
+        '''
+        t = np.asarray(t, dtype=float)
+        raan_dot, argp_dot, M_dot = self.secular_rates()
+        raan = self.raan + raan_dot * t
+        argp = self.argp + argp_dot * t
+        M = np.mod(self.M0 + M_dot * t, 2 * np.pi)
+
+        # Position and velocity in the perifocal frame
+        E = self.eccentric_anomaly(M)
+        cos_E, sin_E = np.cos(E), np.sin(E)
+        sqrt_1e2 = np.sqrt(1 - self.e**2)
+        x_pf = self.a * (cos_E - self.e)
+        y_pf = self.a * sqrt_1e2 * sin_E
+        E_dot = M_dot / (1 - self.e * cos_E)
+        vx_pf = -self.a * sin_E * E_dot
+        vy_pf = self.a * sqrt_1e2 * cos_E * E_dot
+
+        # Perifocal unit vectors P and Q in the inertial frame
+        cos_O, sin_O = np.cos(raan), np.sin(raan)
+        cos_w, sin_w = np.cos(argp), np.sin(argp)
+        cos_i, sin_i = np.cos(self.i), np.sin(self.i)
+        P = (cos_O * cos_w - sin_O * sin_w * cos_i,
+             sin_O * cos_w + cos_O * sin_w * cos_i,
+             sin_w * sin_i)
+        Q = (-cos_O * sin_w - sin_O * cos_w * cos_i,
+             -sin_O * sin_w + cos_O * cos_w * cos_i,
+             cos_w * sin_i)
+
+        r = tuple(x_pf * p + y_pf * q for p, q in zip(P, Q))
+        # In-plane velocity, the rotation of the perigee within the plane and the
+        # rotation of the plane about the polar axis
+        v = tuple((vx_pf - argp_dot * y_pf) * p + (vy_pf + argp_dot * x_pf) * q
+                  for p, q in zip(P, Q))
+        v = (v[0] - raan_dot * r[1], v[1] + raan_dot * r[0], v[2])
+        return r, v
+
+    def state_ecef(self, t, gmst0=0.0):
+        '''Returns the Earth-fixed position and velocity at times t
+
+        Parameters
+        ----------
+        t : float or numpy.ndarray
+            Time since epoch in [s]
+        gmst0 : float, default=0.0
+            Greenwich sidereal angle at epoch in [deg]
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            Position (x, y, z) in [m]
+        tuple of numpy.ndarray
+            Velocity (vx, vy, vz) relative to the rotating Earth in [m/s]
+        '''
+        (x, y, z), (vx, vy, vz) = self.state_eci(t)
+        theta = np.deg2rad(gmst0) + OMEGA_EARTH * np.asarray(t, dtype=float)
+        cos_t, sin_t = np.cos(theta), np.sin(theta)
+
+        x_e = cos_t * x + sin_t * y
+        y_e = -sin_t * x + cos_t * y
+        vx_e = cos_t * vx + sin_t * vy + OMEGA_EARTH * y_e
+        vy_e = -sin_t * vx + cos_t * vy - OMEGA_EARTH * x_e
+        return (x_e, y_e, z), (vx_e, vy_e, vz)
+
+
+class GroundStation:
+    '''Ground station at geodetic (WGS-84) coordinates
+
+    ...
+
+    Attributes
+    ----------
+    latitude : float or numpy.ndarray
+        Geodetic latitude in [rad]
+    longitude : float or numpy.ndarray
+        Longitude in [rad]
+    altitude : float or numpy.ndarray
+        Height above the ellipsoid in [m]
+
+    Methods:
+    -------
+    position_ecef()
+        Returns the Earth-fixed position
+    enu_axes()
+        Returns the local east, north and up unit vectors
+    '''
+    def __init__(self, latitude, longitude, altitude=0.0):
+        '''
+        Parameters
+        ----------
+        latitude : float or numpy.ndarray
+            Geodetic latitude in [deg]
+        longitude : float or numpy.ndarray
+            Longitude in [deg]
+        altitude : float or numpy.ndarray, default=0.0
+            Height above the ellipsoid in [m]
+        '''
+        self.latitude = np.deg2rad(latitude)
+        self.longitude = np.deg2rad(longitude)
+        self.altitude = np.asarray(altitude, dtype=float)
+
+    def position_ecef(self):
+        '''Returns the Earth-fixed position (x, y, z) in [m]'''
+        e2 = FLATTENING * (2 - FLATTENING)
+        sin_lat = np.sin(self.latitude)
+        N = R_EARTH / np.sqrt(1 - e2 * sin_lat**2)
+        return ((N + self.altitude) * np.cos(self.latitude) * np.cos(self.longitude),
+                (N + self.altitude) * np.cos(self.latitude) * np.sin(self.longitude),
+                (N * (1 - e2) + self.altitude) * sin_lat)
+
+    def enu_axes(self):
+        '''Returns the local east, north and up unit vectors in the Earth-fixed frame'''
+        sin_lat, cos_lat = np.sin(self.latitude), np.cos(self.latitude)
+        sin_lon, cos_lon = np.sin(self.longitude), np.cos(self.longitude)
+        east = (-sin_lon, cos_lon, 0.0 * sin_lon)
+        north = (-sin_lat * cos_lon, -sin_lat * sin_lon, cos_lat)
+        up = (cos_lat * cos_lon, cos_lat * sin_lon, sin_lat)
+        return east, north, up
+
+
+def _dot(u, v):
+    return u[0] * v[0] + u[1] * v[1] + u[2] * v[2]
+
+
+def look_angles(orbit, station, t, gmst0=0.0):
+    '''Returns the geometry of an orbit as seen from a ground station
+
+    Parameters
+    ----------
+    orbit : Orbit
+    station : GroundStation
+    t : float or numpy.ndarray
+        Time since epoch in [s]
+    gmst0 : float, default=0.0
+        Greenwich sidereal angle at epoch in [deg]
+
+    Returns
+    -------
+    dict
+        'range': slant range in [m],
+        'elevation': elevation above the local horizon in [deg],
+        'azimuth': azimuth from north towards east in [deg],
+        'range_rate': rate of change of the slant range in [m/s]
+    '''
+    r_sat, v_sat = orbit.state_ecef(t, gmst0)
+    r_gs = station.position_ecef()
+    east, north, up = station.enu_axes()
+
+    rho = tuple(s - g for s, g in zip(r_sat, r_gs))
+    slant_range = np.sqrt(_dot(rho, rho))
+
+    return {'range': slant_range,
+            'elevation': np.rad2deg(np.arcsin(_dot(rho, up) / slant_range)),
+            'azimuth': np.mod(np.rad2deg(np.arctan2(_dot(rho, east), _dot(rho, north))), 360),
+            'range_rate': _dot(rho, v_sat) / slant_range}
+
+
+if __name__ == '__main__':
+    # Put any code here you want to use to test the class
+    # (like a scratch pad to test stuff while you're working)
+    import time
+
+    iss = Orbit(R_EARTH + 420e3, 0.0005, 51.6, 0, 0, 0)
+    delft = GroundStation(52.0, 4.36, 0)
+    t = np.arange(0, 86400, 1.0)
+
+    start = time.perf_counter()
+    geometry = look_angles(iss, delft, t)
+    print(f'{t.size} samples in {time.perf_counter() - start:.3f} s, '
+          f'{np.sum(geometry["elevation"] > 10)} s above 10 deg')
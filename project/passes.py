@@ -0,0 +1,425 @@
+# -*- coding: utf-8 -*-
+"""
+title: passes.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Visibility windows of an orbit over ground stations, and link budgets over passes.
+
+Passes are found with a coarse scan of the elevation of all stations at once, followed
+by a bisection of every acquisition (AOS) and loss of signal (LOS) crossing of the
+elevation mask, again for all crossings at once. The scan step must be shorter than
+the shortest pass of interest: passes that rise above the mask and set again between
+two scan samples are missed.
+
+The link budget is then evaluated only on samples inside the passes, in a single call
+of batch.evaluate_budget for all passes of all stations, and reduced to a summary per
+pass. The Doppler shift and Doppler rate at the link frequency follow from the range
+rate of the same geometry.
+"""
+import numpy as np
+import pandas as pd
+import scipy.constants as sc
+
+from project.batch import evaluate_budget
+from project.orbit import GroundStation, look_angles
+from project.process import load_from_yaml
+from project.settings import ELEMENT_REFERENCE
+from project.unit_conversion import to_base_SI, to_prefixed_SI
+
+# Element parameters that follow from the geometry, and the look_angles output they take
+GEOMETRY_PARAMETERS = {'distance': 'range',
+                       'elevation_angle': 'elevation'}
+
+def _stations(stations, idx=None):
+    '''Returns the stations as a 1-D GroundStation, or the stations at idx'''
+    coords = [np.atleast_1d(np.rad2deg(stations.latitude)),
+              np.atleast_1d(np.rad2deg(stations.longitude)),
+              np.atleast_1d(stations.altitude)]
+    coords = np.broadcast_arrays(*coords)
+    if idx is not None:
+        coords = [x[idx] for x in coords]
+    return GroundStation(*coords)
+
+
+def _bisect(func, lo, hi, tol):
+    '''Vectorised bisection of func on the brackets [lo, hi]
+
+    func(lo) and func(hi) must have opposite signs for every bracket.
+    '''
+    f_lo = func(lo)
+    n_iter = int(np.ceil(np.log2(max(np.max(hi - lo, initial=0), tol) / tol)))
+    for _ in range(n_iter):
+        mid = (lo + hi) / 2
+        f_mid = func(mid)
+        same = np.sign(f_mid) == np.sign(f_lo)
+        lo, f_lo = np.where(same, mid, lo), np.where(same, f_mid, f_lo)
+        hi = np.where(same, hi, mid)
+    return (lo + hi) / 2
+
+
+def _golden_max(func, lo, hi, tol):
+    '''Vectorised golden section search of the maximum of func on [lo, hi]'''
+    ratio = (np.sqrt(5) - 1) / 2
+    width = max(np.max(hi - lo, initial=0), tol)
+    for _ in range(int(np.ceil(np.log(tol / width) / np.log(ratio)))):
+        x1, x2 = hi - ratio * (hi - lo), lo + ratio * (hi - lo)
+        left = func(x1) > func(x2)
+        lo, hi = np.where(left, lo, x1), np.where(left, x2, hi)
+    return (lo + hi) / 2
+
+
+def find_passes(orbit, stations, t_start, t_end, min_elevation=0.0, step=30.0,
+                tol=1e-3, gmst0=0.0):
+    '''Find the passes of an orbit over one or more ground stations
+
+    Parameters
+    ----------
+    orbit : project.orbit.Orbit
+        Orbit with scalar elements
+    stations : project.orbit.GroundStation
+        One station, or several with 1-D coordinates
+    t_start, t_end : float
+        Time span since epoch in [s]
+    min_elevation : float or numpy.ndarray, default=0.0
+        Elevation mask in [deg], per station if an array
+    step : float, default=30.0
+        Coarse scan step in [s]
+    tol : float, default=1e-3
+        Accuracy of the AOS, LOS and peak times in [s]
+    gmst0 : float, default=0.0
+        Greenwich sidereal angle at epoch in [deg]
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per pass, sorted by station and AOS: 'station' (index of the station),
+        'aos', 'los', 'duration', 't_peak' in [s] and 'peak_elevation' in [deg].
+        Passes in progress at t_start or t_end are cut off there.
+    '''
+    stations = _stations(stations)
+    n_station = stations.latitude.size
+    mask = np.broadcast_to(min_elevation, (n_station,)).astype(float)
+
+    # Coarse scan of all stations (n_station x n_time)
+    t = np.append(np.arange(t_start, t_end, step), t_end)
+    coarse = GroundStation(np.rad2deg(stations.latitude)[:, None],
+                           np.rad2deg(stations.longitude)[:, None],
+                           stations.altitude[:, None])
+    elevation = look_angles(orbit, coarse, t, gmst0)['elevation']
+    visible = elevation >= mask[:, None]
+
+    # Rising and setting crossings between samples k and k+1
+    change = np.diff(visible.astype(np.int8), axis=1)
+    rise_station, rise_k = np.nonzero(change == 1)
+    set_station, set_k = np.nonzero(change == -1)
+
+    def elevation_above_mask(idx):
+        sub = _stations(stations, idx)
+        return lambda tt: look_angles(orbit, sub, tt, gmst0)['elevation'] - mask[idx]
+
+    aos = _bisect(elevation_above_mask(rise_station), t[rise_k], t[rise_k + 1], tol)
+    los = _bisect(elevation_above_mask(set_station), t[set_k], t[set_k + 1], tol)
+
+    # Passes already in view at the start, or still in view at the end
+    start_station = np.nonzero(visible[:, 0])[0]
+    end_station = np.nonzero(visible[:, -1])[0]
+    aos = np.concatenate([np.full(start_station.size, float(t_start)), aos])
+    aos_station = np.concatenate([start_station, rise_station])
+    los = np.concatenate([los, np.full(end_station.size, float(t_end))])
+    los_station = np.concatenate([set_station, end_station])
+
+    # Every station alternates AOS and LOS, so sorting pairs them up
+    aos_order = np.lexsort((aos, aos_station))
+    los_order = np.lexsort((los, los_station))
+    station = aos_station[aos_order]
+    aos, los = aos[aos_order], los[los_order]
+
+    # Peak elevation, searched around the highest coarse sample of each pass
+    k_aos = np.searchsorted(t, aos)
+    k_los = np.searchsorted(t, los, side='right')
+    k_peak = np.array([k0 + np.argmax(elevation[s, k0:k1]) if k1 > k0 else k0
+                       for s, k0, k1 in zip(station, k_aos, k_los)], dtype=int)
+    k_peak = np.minimum(k_peak, t.size - 1)
+    lo = np.maximum(t[np.maximum(k_peak - 1, 0)], aos)
+    hi = np.minimum(t[np.minimum(k_peak + 1, t.size - 1)], los)
+    sub = _stations(stations, station)
+    t_peak = _golden_max(lambda tt: look_angles(orbit, sub, tt, gmst0)['elevation'],
+                         lo, hi, tol)
+    peak_elevation = look_angles(orbit, sub, t_peak, gmst0)['elevation']
+
+    return pd.DataFrame({'station': station, 'aos': aos, 'los': los,
+                         'duration': los - aos, 't_peak': t_peak,
+                         'peak_elevation': peak_elevation})
+
+
+def pass_samples(passes, step=1.0):
+    '''Sample times inside every pass, from AOS to LOS inclusive
+
+    Parameters
+    ----------
+    passes : pandas.DataFrame
+        Output of find_passes
+    step : float, default=1.0
+        Sample step in [s]
+
+    Returns
+    -------
+    numpy.ndarray
+        Pass number (row of passes) of every sample
+    numpy.ndarray
+        Time of every sample in [s]
+    '''
+    aos = passes['aos'].to_numpy(dtype=float)
+    duration = passes['duration'].to_numpy(dtype=float)
+    n_samples = np.ceil(duration / step).astype(int) + 1
+
+    pass_idx = np.repeat(np.arange(len(passes)), n_samples)
+    starts = np.cumsum(n_samples) - n_samples
+    j = np.arange(n_samples.sum()) - np.repeat(starts, n_samples)
+    t = aos[pass_idx] + np.minimum(j * step, duration[pass_idx])
+    return pass_idx, t
+
+
+def sample_durations(pass_idx, t, n_pass):
+    '''Time each sample holds, until the next sample of the same pass
+
+    Parameters
+    ----------
+    pass_idx : numpy.ndarray
+        Pass number of every sample, sorted, see pass_samples
+    t : numpy.ndarray
+        Time of every sample in [s]
+    n_pass : int
+        Number of passes
+
+    Returns
+    -------
+    numpy.ndarray
+        Duration of every sample in [s], zero for the last sample of a pass
+    numpy.ndarray
+        Index of the first sample of every pass
+    '''
+    starts = np.searchsorted(pass_idx, np.arange(n_pass))
+    dt = np.append(np.diff(t), 0.0)
+    dt[np.append(starts[1:], t.size) - 1] = 0.0
+    return dt, starts
+
+
+def geometry_columns(user_data, geometry, columns=None, parameters=None):
+    '''Scenario columns of the element parameters that follow from the geometry
+
+    Parameters
+    ----------
+    user_data : dict
+        Base configuration dictionary
+    geometry : dict
+        Output of project.orbit.look_angles, in SI units
+    columns : dict, optional
+        {scenario column: geometry key}. By default every element parameter named
+        in parameters is driven by the geometry
+    parameters : dict, optional
+        {element parameter: geometry key} used when columns is not given,
+        GEOMETRY_PARAMETERS by default
+
+    Returns
+    -------
+    dict
+        {scenario column: array}, in the units of element_reference.yaml
+    '''
+    param_ref = load_from_yaml(ELEMENT_REFERENCE)
+
+    if columns is None:
+        parameters = parameters or GEOMETRY_PARAMETERS
+        columns = {}
+        for name, attributes in user_data['elements'].items():
+            for param in (attributes.get('parameters') or {}):
+                if param in parameters:
+                    columns[f'{name}.{param}'] = parameters[param]
+
+    out = {}
+    for column, key in columns.items():
+        name, _, param = column.rpartition('.')
+        element = user_data['elements'][name]
+        unit = param_ref[element['link_type']][element['input_type']][param]['units']
+        out[column] = geometry[key] if unit in ('deg', '-', '') else \
+            to_prefixed_SI(geometry[key], unit)
+    return out
+
+
+def configured_frequency(user_data):
+    '''Returns the link frequency of a configuration in [Hz]
+
+    Taken from the 'frequency' (or optical 'wavelength') parameters of the FREE_SPACE
+    elements, as the path loss is evaluated at the link frequency, or of the other
+    elements if no FREE_SPACE element has one.
+
+    Parameters
+    ----------
+    user_data : dict
+        Configuration dictionary
+
+    Raises
+    ------
+    ValueError:
+        If the elements give different frequencies
+
+    Returns
+    -------
+    float or None
+        None if no element has a frequency
+    '''
+    param_ref = load_from_yaml(ELEMENT_REFERENCE)
+
+    free_space, other = set(), set()
+    for attributes in user_data['elements'].values():
+        parameters = attributes.get('parameters') or {}
+        ref = param_ref[attributes['link_type']].get(attributes['input_type'], {})
+        found = free_space if attributes['link_type'] == 'FREE_SPACE' else other
+        if 'frequency' in parameters:
+            found.add(round(to_base_SI(parameters['frequency'], ref['frequency']['units']), 3))
+        elif 'wavelength' in parameters:
+            found.add(round(sc.c / to_base_SI(parameters['wavelength'],
+                                              ref['wavelength']['units']), 3))
+
+    frequencies = free_space or other
+    if len(frequencies) > 1:
+        raise ValueError(f'Elements give different frequencies {sorted(frequencies)} Hz, '
+                         f'pass the frequency explicitly')
+    return frequencies.pop() if frequencies else None
+
+
+def doppler(range_rate, t, frequency, starts=None):
+    '''Doppler shift and Doppler rate of a range rate time series
+
+    Parameters
+    ----------
+    range_rate : numpy.ndarray
+        Range rate in [m/s]
+    t : numpy.ndarray
+        Time of every sample in [s], increasing within every segment
+    frequency : float
+        Transmitted frequency in [Hz]
+    starts : numpy.ndarray, optional
+        Index of the first sample of every independent segment (pass), by default
+        the series is one segment
+
+    Returns
+    -------
+    numpy.ndarray
+        Doppler shift in [Hz], positive while the range decreases
+    numpy.ndarray
+        Doppler rate in [Hz/s], from finite differences of the range rate within
+        every segment (zero for segments of a single sample)
+    '''
+    range_rate = np.asarray(range_rate, dtype=float)
+    shift = -frequency * range_rate / sc.c
+    if shift.size < 2:
+        return shift, np.zeros_like(shift)
+
+    # Slopes between neighbouring samples, except across segment boundaries
+    slope = np.diff(shift) / np.diff(t)
+    if starts is not None:
+        slope[np.asarray(starts)[1:] - 1] = np.nan
+    left = np.append(np.nan, slope)
+    right = np.append(slope, np.nan)
+    both = np.stack([left, right])
+    valid = ~np.isnan(both)
+    rate = np.where(valid, both, 0.0).sum(axis=0) / np.maximum(valid.sum(axis=0), 1)
+    return shift, rate
+
+
+def evaluate_passes(user_data, orbit, stations, passes, step=1.0, columns=None,
+                    gmst0=0.0, return_samples=False, frequency=None):
+    '''Evaluate a link budget over all passes, and summarise it per pass
+
+    Parameters
+    ----------
+    user_data : dict
+        Base configuration dictionary, supplying every value not driven by the geometry
+    orbit : project.orbit.Orbit
+    stations : project.orbit.GroundStation
+        Same stations as given to find_passes
+    passes : pandas.DataFrame
+        Output of find_passes
+    step : float, default=1.0
+        Sample step inside the passes in [s]
+    columns : dict, optional
+        {scenario column: look_angles key}, see geometry_columns
+    gmst0 : float, default=0.0
+        Greenwich sidereal angle at epoch in [deg]
+    return_samples : bool, default=False
+        Also return the geometry and budget of every sample
+    frequency : float, optional
+        Link frequency for the Doppler shift in [Hz]. By default the frequency of the
+        elements (see configured_frequency), without Doppler if there is none
+
+    Returns
+    -------
+    pandas.DataFrame
+        passes, with 'min_margin' and 'max_margin' in [dB] and
+        'time_above_threshold' in [s], the time during which the received power is
+        at least rx_sys_threshold. With a frequency also 'max_doppler' in [Hz] and
+        'max_doppler_rate' in [Hz/s], the largest absolute values over the pass
+    pandas.DataFrame, optional
+        One row per sample, with 'pass', 'time', the geometry, 'doppler' and
+        'doppler_rate' (with a frequency) and the budget results
+    '''
+    pass_idx, t = pass_samples(passes, step)
+    station = passes['station'].to_numpy()[pass_idx]
+    geometry = look_angles(orbit, _stations(stations, station), t, gmst0)
+
+    results = evaluate_budget(user_data, geometry_columns(user_data, geometry, columns))
+    margin = np.broadcast_to(results['total_margin'], t.shape)
+    output_power = np.broadcast_to(results['output_power'], t.shape)
+    threshold = user_data['general_values']['rx_sys_threshold']
+
+    dt, starts = sample_durations(pass_idx, t, len(passes))
+
+    if frequency is None:
+        frequency = configured_frequency(user_data)
+    shift = {}
+    if frequency is not None:
+        shift['doppler'], shift['doppler_rate'] = doppler(geometry['range_rate'], t, frequency,
+                                                          starts)
+
+    summary = passes.copy()
+    if t.size:
+        summary['min_margin'] = np.minimum.reduceat(margin, starts)
+        summary['max_margin'] = np.maximum.reduceat(margin, starts)
+        summary['time_above_threshold'] = np.add.reduceat(dt * (output_power >= threshold),
+                                                          starts)
+        for key, val in shift.items():
+            summary[f'max_{key}'] = np.maximum.reduceat(np.abs(val), starts)
+    else:
+        summary = summary.assign(min_margin=[], max_margin=[], time_above_threshold=[],
+                                 **{f'max_{key}': [] for key in shift})
+
+    if not return_samples:
+        return summary
+
+    samples = pd.DataFrame({'pass': pass_idx, 'station': station, 'time': t, **geometry, **shift,
+                            **{key: np.broadcast_to(val, t.shape) for key, val in results.items()}})
+    return summary, samples
+
+
+if __name__ == '__main__':
+    import time
+    from pathlib import Path
+    from project.orbit import Orbit, R_EARTH
+    from project.settings import CONFIGS_DIR
+
+    sc_orbit = Orbit(R_EARTH + 500e3, 0.001, 97.4, 0, 0, 0)
+    rng = np.random.default_rng(1)
+    stations = GroundStation(rng.uniform(-70, 70, 24), rng.uniform(-180, 180, 24), 0)
+
+    start = time.perf_counter()
+    passes = find_passes(sc_orbit, stations, 0, 14 * 86400, min_elevation=10)
+    print(f'{len(passes)} passes in {time.perf_counter() - start:.2f} s')
+
+    data = load_from_yaml(Path(CONFIGS_DIR, 'Example_Delfi.yaml'))
+    start = time.perf_counter()
+    summary = evaluate_passes(data, sc_orbit, stations, passes)
+    print(f'Budget over all passes in {time.perf_counter() - start:.2f} s')
+    print(summary.head())
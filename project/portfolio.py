@@ -0,0 +1,277 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+title: portfolio.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Evaluation of a folder of configuration files at once, e.g. to compare the designs of a
+mission or to check a set of reviewed budgets.
+
+Every file is run through process.main_process and summarized by its total gain, output
+power and margin. Files are independent, so they are evaluated in parallel in worker
+processes. The summaries are cached under the SHA-1 of the file contents, in memory and
+in CACHE_DIR: a file that has not changed since it was last evaluated is not run again,
+also after restarting the application. The key also covers the calculation itself (see
+calculation_hash): the code of the process and of the link elements, the element
+reference and the antenna patterns in PATTERNS_DIR. Editing any of them evaluates the
+files again. Not covered are pattern files outside PATTERNS_DIR and upgrades of the
+installed libraries (NumPy, SciPy), increment CACHE_VERSION or delete the cache file
+for those. Files that fail are not cached, they are tried again on every refresh.
+"""
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from project import tracing
+from project.settings import BASE_DIR, CACHE_DIR, ELEMENT_REFERENCE, PATTERNS_DIR
+
+CACHE_VERSION = 1   # Increment when the calculations change, to discard cached results
+SUMMARY_KEYS = ('total_gain', 'output_power', 'total_margin')
+
+# Files and folders whose contents the results depend on, besides the configuration
+CALCULATION_FILES = (Path(BASE_DIR, 'project/process.py'),
+                     Path(BASE_DIR, 'project/unit_conversion.py'),
+                     ELEMENT_REFERENCE,
+                     Path(BASE_DIR, 'project/link_element'),
+                     PATTERNS_DIR)
+
+
+def list_configs(folder):
+    '''Returns the configuration files of a folder, sorted by name, without reading them
+
+    Parameters
+    ----------
+    folder : str or Path
+
+    Returns
+    -------
+    list of Path
+    '''
+    return sorted((path for path in Path(folder).glob('*.yaml') if path.is_file()),
+                  key=lambda path: path.name.lower())
+
+
+def calculation_hash(files=CALCULATION_FILES):
+    '''Returns the SHA-1 of the calculation code and data, see CALCULATION_FILES
+
+    Folders are hashed with all files in them, except compiled Python files. A few
+    hundred kB, read in about a millisecond.
+    '''
+    digest = hashlib.sha1(f'v{CACHE_VERSION}:'.encode())
+    for entry in files:
+        entry = Path(entry)
+        paths = sorted(entry.rglob('*')) if entry.is_dir() else [entry]
+        for path in paths:
+            if path.is_file() and path.suffix != '.pyc':
+                digest.update(path.relative_to(entry.parent).as_posix().encode())
+                digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def config_hash(path, calculation=None):
+    '''Returns the cache key of a configuration file
+
+    Parameters
+    ----------
+    path : str or Path
+        Configuration YAML file
+    calculation : str, optional
+        calculation_hash(), computed if not given
+
+    Returns
+    -------
+    str
+        SHA-1 of the calculation hash and the file contents
+    '''
+    if calculation is None:
+        calculation = calculation_hash()
+    digest = hashlib.sha1(f'{calculation}:'.encode())
+    digest.update(Path(path).read_bytes())
+    return digest.hexdigest()
+
+
+def summarize_config(path):
+    '''Runs the main process on a configuration file and summarizes its results
+
+    Defined at module level, so that it can be run in a worker process.
+
+    Parameters
+    ----------
+    path : str or Path
+        Configuration YAML file
+
+    Returns
+    -------
+    dict
+        total_gain [dB], output_power [dBm] and total_margin [dB], and 'error': None.
+        If the file cannot be loaded or evaluated, the values are None and 'error'
+        describes the exception.
+    '''
+    from project.process import load_from_yaml, main_process
+
+    try:
+        data = load_from_yaml(path)
+        with tracing.span('evaluate', file=str(path)):
+            results = main_process(data)
+        general = results['general_values']
+        summary = {key: float(general[key]) for key in SUMMARY_KEYS}
+        summary['error'] = None
+    except Exception as E:
+        summary = dict.fromkeys(SUMMARY_KEYS)
+        summary['error'] = f'{type(E).__name__}: {E}'
+    return summary
+
+
+class ResultCache:
+    """Summaries of configuration files, keyed by config_hash
+
+    Usage:
+        cache = ResultCache.load()
+        summary = cache.get(key)    # None if not evaluated yet
+        cache[key] = summarize_config(path)
+        cache.save()
+    """
+    def __init__(self, path=None, results=None):
+        """
+        Parameters
+        ----------
+        path : str or Path, optional
+            JSON file to save to, not saved if None
+        results : dict, optional
+            {key: summary}
+        """
+        self.path = None if path is None else Path(path)
+        self.results = dict(results or {})
+        self.changed = False
+
+    @classmethod
+    def load(cls, path=Path(CACHE_DIR, 'portfolio_results.json')):
+        '''Reads the cache file, an unreadable or missing file gives an empty cache'''
+        try:
+            with open(path, 'r') as f:
+                results = json.load(f)
+        except (OSError, ValueError):
+            results = {}
+        return cls(path, results)
+
+    def get(self, key):
+        return self.results.get(key)
+
+    def __contains__(self, key):
+        return key in self.results
+
+    def __setitem__(self, key, summary):
+        self.results[key] = summary
+        self.changed = True
+
+    def __len__(self):
+        return len(self.results)
+
+    def update(self, other):
+        '''Adds the summaries of another cache, e.g. of a job that evaluated into a copy'''
+        self.results.update(other.results)
+        self.changed = True
+
+    def save(self):
+        '''Writes the cache file, if anything was added since it was loaded'''
+        if self.path is None or not self.changed:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix('.tmp')
+        with tracing.span('write', file=str(self.path)), open(tmp, 'w') as f:
+            json.dump(self.results, f)
+        os.replace(tmp, self.path)  # Never leaves a half written cache
+        self.changed = False
+
+
+def evaluate_configs(paths, cache=None, max_workers=None):
+    '''Summarizes configuration files, cached results first and the others as they finish
+
+    Files whose contents are in the cache are not evaluated again. The others run in
+    parallel in worker processes, or one after the other in this process if only a
+    single worker would be used (starting a process costs more than a budget).
+
+    Parameters
+    ----------
+    paths : list of str or Path
+        Configuration files
+    cache : ResultCache, optional
+        Updated with the new summaries that have no error, but not saved
+    max_workers : int, optional
+        Number of worker processes, by default the number of processors
+
+    Yields
+    ------
+    tuple
+        (path, summary, cached), see summarize_config. Every path is yielded once.
+    '''
+    cache = ResultCache() if cache is None else cache
+
+    calculation = calculation_hash()
+    pending = {}
+    for path in paths:
+        try:
+            key = config_hash(path, calculation)
+        except OSError as E:     # Removed or unreadable meanwhile
+            summary = dict.fromkeys(SUMMARY_KEYS)
+            summary['error'] = f'{type(E).__name__}: {E}'
+            yield path, summary, False
+            continue
+        if key in cache:
+            yield path, cache.get(key), True
+        else:
+            pending[path] = key
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(pending))
+
+    if max_workers <= 1:
+        for path, key in pending.items():
+            summary = summarize_config(path)
+            if summary['error'] is None:    # A failed file is tried again next time
+                cache[key] = summary
+            yield path, summary, False
+        return
+
+    # A trace of this process does not reach the workers, they trace their own and return it
+    tracer = tracing.active_tracer()
+    executor = ProcessPoolExecutor(max_workers)
+    futures = {}
+    try:
+        if tracer is None:
+            futures = {executor.submit(summarize_config, path): path for path in pending}
+        else:
+            futures = {executor.submit(tracing.call_traced, tracer.capacity, summarize_config,
+                                       path): path for path in pending}
+        for future in as_completed(futures):
+            path = futures[future]
+            if tracer is None:
+                summary = future.result()
+            else:
+                summary, buffers = future.result()
+                tracer.merge(buffers)
+            if summary['error'] is None:
+                cache[pending[path]] = summary
+            yield path, summary, False
+    finally:
+        # Also when the caller stops early: drop the files that have not started
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+if __name__ == '__main__':
+    import time
+    from project.settings import CONFIGS_DIR
+
+    cache = ResultCache()
+    for run in range(2):
+        start = time.perf_counter()
+        for path, summary, cached in evaluate_configs(list_configs(CONFIGS_DIR), cache):
+            print(f'{path.name:30s} {summary["total_margin"]!s:>24s} {"cached" if cached else ""}')
+        print(f'{time.perf_counter() - start:.3f} s\n')
@@ -12,12 +12,18 @@ import project.link_element as le
 from pathlib import Path
 import yaml
 import pandas as pd
+from time import perf_counter
+from project.profiling import active_profile, stage
+from project.tracing import span
 from project.unit_conversion import convert_config_units
 from project.settings import CONFIGS_DIR, DEFAULT_LINK_CONFIG
 
 def load_from_yaml(file):
-    with open(file, 'r') as f:
-        data = yaml.full_load(f)
+    with span('load', file=str(file)):
+        with open(file, 'r') as f:
+            text = f.read()
+    with span('parse', file=str(file)):
+        data = yaml.full_load(text)
     return data
 
 def save_to_yaml(d:dict, filename:str):
@@ -41,7 +47,7 @@ def save_to_yaml(d:dict, filename:str):
         filepath = Path(CONFIGS_DIR, filepath.name)
 
     # Save ref_data to YAML
-    with open(filepath, 'w') as f:
+    with span('write', file=str(filepath)), open(filepath, 'w') as f:
         yaml.dump(d, f)
 
 def read_user_data(user_data):
@@ -81,7 +87,13 @@ def fill_results_data(df_user_data, user_data):
     # Create the results_data dict from the user_data dict
     results_data = user_data
 
+    # Time every element by link type, only when profiling (see profiling.py)
+    profile = active_profile()
+
     for i in range(len(df_user_data)): # Go through the rows of the dataframe (user data link elements)
+        if profile is not None:
+            start = perf_counter()
+
         # Calculate the gain/loss for the link element
         link_type = df_user_data.get("link_type")[i]
         link_class = f'{link_type}_LinkElement'
@@ -111,13 +123,43 @@ def fill_results_data(df_user_data, user_data):
         # Update the gain/loss in the results data dictionary
         results_data['elements'][df_user_data.get("name")[i]]["gain_loss"] = result_gain_loss
 
+        if profile is not None:
+            profile.record(f'elements.{link_type}', start, perf_counter())
+
     return results_data
 
 
+def noise_element_name(elements):
+    '''Returns the name of the receiver noise element of a configuration
+
+    Parameters
+    ----------
+    elements : dict
+        Elements of a configuration dictionary
+
+    Raises
+    ------
+    ValueError:
+        If more than one NOISE element is given by parameters
+
+    Returns
+    -------
+    str or None
+        None if there is no NOISE element, or only one with a given gain_loss
+    '''
+    names = [name for name, attributes in elements.items()
+             if attributes['link_type'] == 'NOISE' and attributes['input_type'] != 'gain_loss']
+    if len(names) > 1:
+        raise ValueError(f'Only one NOISE element can be given, found: {", ".join(names)}')
+    return names[0] if names else None
+
+
 def sum_results(data):
     '''Calculates total gain of processed elements
 
-    Additionally calculates the total margin and output power
+    Additionally calculates the total margin and output power. If the budget
+    contains a NOISE element, C/N0 [dBHz], Eb/N0 [dB] and the Eb/N0 margin [dB]
+    are added as 'c_n0', 'eb_n0' and 'ebn0_margin'
 
     Parameters
     ----------
@@ -146,6 +188,13 @@ def sum_results(data):
     data['general_values']['total_gain'] = gain_sum
     data['general_values']['output_power'] = output_power
 
+    noise_name = noise_element_name(elements)
+    if noise_name is not None:
+        attributes = elements[noise_name]
+        noise = le.NOISE_LinkElement(noise_name, attributes['input_type'],
+                                     attributes['gain_loss'], attributes['parameters'])
+        data['general_values'].update(noise.link_quality(output_power))
+
 
 
 def main_process(user_data):
@@ -162,13 +211,19 @@ def main_process(user_data):
         User_data dictionary which has been updated with the calculated gains/losses
     '''
     # Convert parameter units to standard SI base units
-    user_data = convert_config_units(user_data)
+    with stage('convert_units_in'):
+        user_data = convert_config_units(user_data)
 
-    results_data = fill_results_data(read_user_data(user_data), user_data)
-    sum_results(results_data)
+    with stage('dataframe'):
+        df_user_data = read_user_data(user_data)
+    with stage('elements'):
+        results_data = fill_results_data(df_user_data, user_data)
+    with stage('sum_results'):
+        sum_results(results_data)
 
     # Convert parameter units back to logical units
-    results_data = convert_config_units(results_data, conv_to_base_SI=False)
+    with stage('convert_units_out'):
+        results_data = convert_config_units(results_data, conv_to_base_SI=False)
 
     return results_data
 
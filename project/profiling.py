@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+"""
+title: profiling.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Opt-in timing of the stages of process.main_process.
+
+The analysis marks its stages with stage(name). Nothing is measured unless a profile is
+active in the same thread, in which case stage() costs a dictionary lookup and a
+function call per stage, and the elements are timed one by one, grouped by link type:
+
+    with profile() as prof:
+        main_process(data)
+    print(prof.table())
+
+Stages are named after what they do, a dot separates a stage from the parts it is made
+of, e.g. 'elements.FREE_SPACE' is a part of 'elements'. A callback receives every
+measurement as it is made, e.g. to log it or to record a timeline:
+
+    with profile(callback=lambda name, start, end: print(name, end - start)):
+        main_process(data)
+
+Profiles are per thread, so the analysis of another thread (e.g. the background worker
+of the User Interface) is not counted in.
+
+With memory=True, the profile also measures the memory allocated per stage with
+tracemalloc: the peak above the start of the stage, the memory still held at its end, and
+the lines that allocated most of the latter (for the top level stages only, a snapshot
+of all allocations is too slow for every element). Tracing slows the analysis down
+several times, so the durations are only indicative then:
+
+    with profile(memory=True) as prof:
+        main_process(data)
+    print(prof.memory_table())
+"""
+import contextlib
+import os
+import threading
+import time
+import tracemalloc
+
+import project.memory
+from project.memory import MemoryUse, format_size
+from project.settings import BASE_DIR
+
+_local = threading.local()
+_null = contextlib.nullcontext()
+
+
+class Profile:
+    '''Number of calls and cumulative duration of every stage
+
+    Attributes
+    ----------
+    stages : dict
+        {stage name: [count, total duration in s]}, in order of the first start, so a
+        stage comes before its parts
+    callback : function or None
+        Called as callback(name, start, end) for every measurement, with the times of
+        time.perf_counter()
+    '''
+    def __init__(self, callback=None):
+        self.stages = {}
+        self.callback = callback
+
+    def record(self, name, start, end):
+        '''Adds a measurement of a stage, times from time.perf_counter()'''
+        entry = self.stages.get(name)
+        if entry is None:
+            entry = self.stages[name] = [0, 0.0]
+        entry[0] += 1
+        entry[1] += end - start
+        if self.callback is not None:
+            self.callback(name, start, end)
+
+    @contextlib.contextmanager
+    def time(self, name):
+        '''Context manager that records the duration of its block as a stage'''
+        self.stages.setdefault(name, [0, 0.0])
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter())
+
+    def total(self):
+        '''Total duration of the top level stages [s]'''
+        return sum(total for name, (_, total) in self.stages.items() if '.' not in name)
+
+    def as_dict(self):
+        '''Returns {stage name: {'count': ..., 'total': ..., 'mean': ...}}, durations in s'''
+        return {name: {'count': count, 'total': total, 'mean': total / count}
+                for name, (count, total) in self.stages.items() if count}
+
+    def table(self):
+        '''Breakdown of the stages as text, parts indented below their stage
+
+        Returns
+        -------
+        str
+            Count, total and mean duration [ms] and share of the total of every stage
+        '''
+        overall = self.total()
+        lines = [f'{"Stage":32s} {"Count":>8s} {"Total [ms]":>12s} {"Mean [ms]":>12s} '
+                 f'{"Share":>7s}']
+        for name, (count, total) in self.stages.items():
+            if count == 0:
+                continue    # Still running
+            depth = name.count('.')
+            label = '  ' * depth + name.split('.')[-1]
+            share = f'{total / overall:7.1%}' if overall > 0 else ''
+            lines.append(f'{label:32s} {count:8d} {total * 1e3:12.3f} '
+                         f'{total / count * 1e3:12.4f} {share}')
+        lines.append(f'{"Total":32s} {"":8s} {overall * 1e3:12.3f}')
+        return '\n'.join(lines)
+
+
+class MemoryProfile(Profile):
+    '''Profile that also measures the memory allocated by every stage
+
+    Attributes
+    ----------
+    memory : dict
+        {stage name: [highest peak above the start of the stage, total memory still held
+        at its end]} [B], of the stages timed with time(), not the parts given to record()
+    sites : dict
+        {stage name: list of tracemalloc.StatisticDiff}, the lines that allocated the most
+        memory still held at the end of a top level stage, most first
+    n_sites : int
+        Number of lines kept per stage
+    '''
+    def __init__(self, callback=None, n_sites=5):
+        Profile.__init__(self, callback)
+        self.memory = {}
+        self.sites = {}
+        self.n_sites = n_sites
+
+    @contextlib.contextmanager
+    def time(self, name):
+        '''Context manager that records the duration and memory of its block as a stage'''
+        entry = self.memory.setdefault(name, [0, 0])
+        top = '.' not in name
+        before = _snapshot() if top else None
+        with MemoryUse() as use:
+            with Profile.time(self, name):
+                yield
+        entry[0] = max(entry[0], use.peak)
+        entry[1] += use.net
+        if top:
+            diff = _snapshot().compare_to(before, 'lineno')
+            self.sites[name] = [stat for stat in diff if stat.size_diff > 0][:self.n_sites]
+
+    def peak(self):
+        '''Highest peak of the top level stages, above their start [B]'''
+        return max((peak for name, (peak, _) in self.memory.items() if '.' not in name),
+                   default=0)
+
+    def as_dict(self):
+        '''Returns {stage name: {'count', 'total', 'mean', 'peak', 'net'}}, see Profile.as_dict'''
+        stages = Profile.as_dict(self)
+        for name, values in stages.items():
+            if name in self.memory:     # Not the parts recorded by duration only
+                values['peak'], values['net'] = self.memory[name]
+        return stages
+
+    def memory_table(self):
+        '''Memory of the stages as text, followed by the top allocation sites per stage
+
+        Returns
+        -------
+        str
+            Count, peak and held memory [MiB] of every stage, parts indented below their
+            stage, and the lines that allocated the memory held after the top level stages
+        '''
+        mib = 2**20
+        lines = [f'{"Stage":32s} {"Count":>8s} {"Peak [MiB]":>12s} {"Held [MiB]":>12s}']
+        for name, (count, _) in self.stages.items():
+            if count == 0 or name not in self.memory:
+                continue    # Still running, or recorded by duration only
+            peak, net = self.memory[name]
+            label = '  ' * name.count('.') + name.split('.')[-1]
+            lines.append(f'{label:32s} {count:8d} {peak / mib:12.3f} {net / mib:12.3f}')
+        lines.append(f'{"Peak":32s} {"":8s} {self.peak() / mib:12.3f}')
+
+        lines.append('')
+        lines.append('Top allocation sites, memory held after the stage:')
+        for name, stats in self.sites.items():
+            lines.append(f'{name}:')
+            for stat in stats:
+                frame = stat.traceback[0]
+                lines.append(f'  {format_size(stat.size_diff):>10s} {stat.count_diff:9d} '
+                             f'blocks  {_relative(frame.filename)}:{frame.lineno}')
+        return '\n'.join(lines)
+
+
+def _snapshot():
+    '''Snapshot of the traced allocations, without those of the measurement itself'''
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, project.memory.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, '<unknown>')))
+
+
+def _relative(filename):
+    '''File name relative to the repository, if it is in it'''
+    try:
+        relative = os.path.relpath(filename, BASE_DIR)
+    except ValueError:      # Another drive on Windows
+        return filename
+    return filename if relative.startswith('..') else relative
+
+
+def active_profile():
+    '''Returns the profile of this thread, None if not profiling'''
+    return getattr(_local, 'profile', None)
+
+
+@contextlib.contextmanager
+def profile(callback=None, memory=False):
+    '''Profiles the stages of the analyses run in its block, in this thread
+
+    Parameters
+    ----------
+    callback : function, optional
+        Called as callback(name, start, end) for every measurement
+    memory : bool, default=False
+        Also measures the memory allocated per stage, see MemoryProfile
+
+    Yields
+    ------
+    Profile or MemoryProfile
+    '''
+    previous = active_profile()
+    _local.profile = MemoryProfile(callback) if memory else Profile(callback)
+    started = memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()     # Also between the stages, for the snapshots
+    try:
+        yield _local.profile
+    finally:
+        _local.profile = previous
+        if started:
+            tracemalloc.stop()
+
+
+def stage(name):
+    '''Context manager that times its block as a stage of the active profile, if any
+
+    Parameters
+    ----------
+    name : str
+        Stage name
+
+    Returns
+    -------
+    context manager
+    '''
+    prof = getattr(_local, 'profile', None)
+    if prof is None:
+        return _null
+    return prof.time(name)
+
+
+if __name__ == '__main__':
+    from pathlib import Path
+    from project import profiling   # Not this __main__ module, which process.py does not use
+    from project.process import load_from_yaml, main_process
+    from project.settings import CONFIGS_DIR
+
+    data = load_from_yaml(Path(CONFIGS_DIR, 'Example_Delfi.yaml'))
+    with profiling.profile() as prof:
+        main_process(data)
+    print(prof.table())
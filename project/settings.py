@@ -26,6 +26,22 @@ ELEMENT_REFERENCE = Path(BASE_DIR, 'project/element_reference.yaml')
 CONFIGS_DIR = Path(BASE_DIR, 'project/configs')
 DEFAULT_LINK_CONFIG = Path(BASE_DIR, CONFIGS_DIR, 'Example_Uplink_GAIA.yaml')
 
+# Tabulated antenna radiation patterns, relative pattern file paths are taken from here
+PATTERNS_DIR = Path(CONFIGS_DIR, 'patterns')
+
+
+
+
+# Packaged numerical data of the link element models (e.g. ITU-R spectral line tables)
+ITU_DATA_DIR = Path(BASE_DIR, 'project/link_element/data')
+
+
+
+
+# Generated data that is expensive to compute but can be rebuilt at any time
+# (e.g. atmospheric attenuation lookup tables). Safe to delete.
+CACHE_DIR = Path(BASE_DIR, '.cache')
+
 
 
 
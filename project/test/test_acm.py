@@ -0,0 +1,88 @@
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from project.acm import DVB_S2, modcod_table, select_modcod, pass_data_volume
+from project.orbit import Orbit, GroundStation, R_EARTH
+from project.passes import find_passes, evaluate_passes
+from project.process import load_from_yaml
+
+
+class ModcodTest(unittest.TestCase):
+    def test_table(self):
+        table = modcod_table()
+
+        self.assertTrue(np.all(np.diff(table['es_n0']) > 0))
+        self.assertTrue(np.all(np.diff(table['efficiency']) > 0))
+        # 8PSK 3/5 needs less Es/N0 than QPSK 8/9 and carries more bits
+        self.assertNotIn('QPSK 8/9', table['name'].tolist())
+        self.assertIn('8PSK 3/5', table['name'].tolist())
+
+    def test_select(self):
+        es_n0 = np.random.default_rng(0).uniform(-5, 20, 10000)
+        idx, efficiency = select_modcod(es_n0, implementation_margin=0.5)
+
+        # Brute force over the full table
+        closes = DVB_S2['es_n0'].to_numpy() + 0.5 <= es_n0[:, None]
+        ref_val = np.max(np.where(closes, DVB_S2['efficiency'].to_numpy(), 0), axis=1)
+        np.testing.assert_array_equal(efficiency, ref_val)
+        np.testing.assert_array_equal(idx == -1, ref_val == 0)
+
+
+class DataVolumeTest(unittest.TestCase):
+    def setUp(self):
+        # Two passes, the second starting with a sample that holds for 2 s
+        self.samples = pd.DataFrame({'pass': [0, 0, 0, 3, 3, 3],
+                                     'time': [0.0, 1.0, 2.0, 10.0, 12.0, 13.0],
+                                     'c_n0': [60.0, 70.0, 50.0, 65.0, 80.0, 80.0]})
+        self.symbol_rate = 1e5
+
+    def test_volume(self):
+        out_val = pass_data_volume(self.samples, self.symbol_rate, fixed=['QPSK 1/2', '8PSK 9/10'])
+
+        es_n0 = self.samples['c_n0'].to_numpy() - 50
+        dt = np.array([1, 1, 0, 2, 1, 0])
+        _, efficiency = select_modcod(es_n0)
+        bits = self.symbol_rate * efficiency * dt
+        np.testing.assert_allclose(out_val['acm_volume'], [bits[:3].sum() / 8, bits[3:].sum() / 8])
+        np.testing.assert_array_equal(out_val.index, [0, 3])
+
+        # Es/N0 of 0, 10, 15, 20 and 30 dB: QPSK 1/2 (1 dB) closes from 10 dB on,
+        # 8PSK 9/10 (10.98 dB) from 15 dB on
+        qpsk = self.symbol_rate * 0.988858 / 8
+        psk8 = self.symbol_rate * 2.679207 / 8
+        np.testing.assert_allclose(out_val['QPSK 1/2 volume'], [2 * qpsk, 3 * qpsk])
+        np.testing.assert_allclose(out_val['8PSK 9/10 volume'], [psk8, 3 * psk8])
+        np.testing.assert_allclose(out_val['acm_time'], [2, 3])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            pass_data_volume(self.samples.drop(columns='c_n0'), self.symbol_rate)
+        with self.assertRaises(ValueError):
+            pass_data_volume(self.samples, self.symbol_rate, fixed=['QPSK 7/8'])
+
+    def test_passes(self):
+        cwd = Path(__file__).parent
+        data = load_from_yaml(f'{cwd}/ref_data/user_data.yaml')
+        data['elements']['Noise'] = {'gain_loss': None, 'idx': 4, 'link_type': 'NOISE',
+                                     'input_type': 'parameter_set_2',
+                                     'parameters': {'system_temperature': 500.0,
+                                                    'data_rate': 9.6,
+                                                    'required_eb_n0': 9.6}}
+        orbit = Orbit(R_EARTH + 500e3, 0.001, 97.4, 0, 0, 0)
+        station = GroundStation(52.0, 4.36, 0)
+        passes = find_passes(orbit, station, 0, 7 * 86400, min_elevation=5)
+        _, samples = evaluate_passes(data, orbit, station, passes, return_samples=True)
+
+        out_val = pass_data_volume(samples, 1e6, fixed=['QPSK 1/4', 'QPSK 3/4'])
+
+        self.assertEqual(len(out_val), len(passes))
+        self.assertTrue(np.all(out_val['acm_volume'] >= out_val['QPSK 1/4 volume']))
+        self.assertTrue(np.all(out_val['acm_volume'] >= out_val['QPSK 3/4 volume']))
+        self.assertTrue(np.all(out_val['acm_time'] <= passes['duration'].to_numpy() + 1e-9))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from project.link_element import ATMOSPHERIC_LinkElement, itu_p676
+from project.link_element.atmospheric_lut import AttenuationTable
+
+c = 299792458   #[m/s]
+
+GRID = {'frequency': (10.0, 40.0, 64),
+        'temperature': (260.0, 300.0, 5),
+        'pressure': (900.0, 1050.0, 4),
+        'water_vapour': (0.0, 20.0, 5)}
+
+
+class AttenuationTableTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = tempfile.TemporaryDirectory()
+        self.tables = {method: AttenuationTable.cached(GRID, method, self.cache.name)
+                       for method in ('linear', 'cubic')}
+
+        rng = np.random.default_rng(0)
+        self.f = 10**rng.uniform(1, np.log10(40), 2000)
+        self.T = rng.uniform(260, 300, 2000)
+        self.p = rng.uniform(900, 1050, 2000)
+        self.rho = rng.uniform(0, 20, 2000)
+
+    def tearDown(self):
+        self.cache.cleanup()
+
+    def test_grid_points(self):
+        f, T, p, rho = np.meshgrid(*self.tables['linear'].axes(), indexing='ij', sparse=True)
+        ref_val = itu_p676.zenith_attenuation(f, p, rho, T)
+
+        for table in self.tables.values():
+            np.testing.assert_allclose(table.zenith_attenuation(f, p, rho, T), ref_val, rtol=1e-9)
+
+    def test_sampled_error(self):
+        ref_val = itu_p676.zenith_attenuation(self.f, self.p, self.rho, self.T)
+
+        for table in self.tables.values():
+            out_val = table.zenith_attenuation(self.f, self.p, self.rho, self.T)
+            self.assertLessEqual(np.max(np.abs(out_val - ref_val) / ref_val),
+                                 table.sampled_rel_error)
+            self.assertLess(table.sampled_rel_error, 0.05)
+
+        # Cubic interpolation is the more accurate
+        self.assertLess(self.tables['cubic'].sampled_error, self.tables['linear'].sampled_error)
+
+    def test_disk_cache(self):
+        # One file per grid and method
+        self.assertEqual(len(list(Path(self.cache.name).iterdir())), 2)
+
+        table = AttenuationTable.cached(GRID, 'linear', self.cache.name)
+        np.testing.assert_array_equal(table.values, self.tables['linear'].values)
+        self.assertEqual(table.error_report(), self.tables['linear'].error_report())
+
+    def test_out_of_bounds(self):
+        out_val = self.tables['linear'].zenith_attenuation(np.array([5.0, 20.0]), 1013, 7.5, 288)
+        ref_val = itu_p676.zenith_attenuation(5.0, 1013, 7.5, 288)
+
+        self.assertAlmostEqual(out_val[0], ref_val, 12)
+
+    def test_link_element(self):
+        testparameters = {'air_temperature': 15+273.15,
+                      'air_pressure': 101325,
+                      'water_vapor_content': 7.5*1e-3,
+                      'wavelength': c/30e9,
+                      'elevation_angle': 30}
+        ref_val = ATMOSPHERIC_LinkElement('test', 'parameter_set_2', None, testparameters).gain
+
+        ATMOSPHERIC_LinkElement.lookup_table = self.tables['cubic']
+        try:
+            out_val = ATMOSPHERIC_LinkElement('test', 'parameter_set_2', None, testparameters).gain
+        finally:
+            ATMOSPHERIC_LinkElement.lookup_table = None
+
+        self.assertAlmostEqual(out_val, ref_val, 2)
+
+    def test_invalid_grid(self):
+        with self.assertRaises(ValueError):
+            AttenuationTable({'temperature': (300.0, 260.0, 5)})
+
+
+if __name__ == '__main__':
+    unittest.main()
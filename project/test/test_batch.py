@@ -0,0 +1,204 @@
+import unittest
+import copy
+from unittest import mock
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import project.batch
+from project.batch import batch_process, scenario_columns, evaluate_data_rates, \
+    evaluate_budget, CompiledBudget
+from project.process import load_from_yaml, main_process
+
+
+class BatchProcessTestCase(unittest.TestCase):
+    def setUp(self):
+        self.cwd = Path(__file__).parent
+        self.data_test_user_data = load_from_yaml(f'{self.cwd}/ref_data/user_data.yaml')
+
+        self.elevations = np.array([10.0, 30.0, 60.0, 90.0])
+        self.diameters = np.array([1.0, 2.0, 3.0, 4.0])
+        self.powers = np.array([65.0, 60.0, 55.0, 50.0])
+
+    def reference_results(self):
+        # Run main_process once per scenario
+        results = []
+        for el, diam, power in zip(self.elevations, self.diameters, self.powers):
+            data = copy.deepcopy(self.data_test_user_data)
+            data['elements']['Free Space']['parameters']['elevation_angle'] = el
+            data['elements']['GS RX Ant']['parameters']['antenna_diameter'] = diam
+            data['general_values']['input_power'] = power
+            results.append(main_process(data)['general_values'])
+        return results
+
+    def test_dataframe(self):
+        index = pd.Index(['a', 'b', 'c', 'd'], name='case')
+        scenarios = pd.DataFrame({'Free Space.elevation_angle': self.elevations,
+                                  'GS RX Ant.antenna_diameter': self.diameters,
+                                  'input_power': self.powers}, index=index)
+
+        result = batch_process(self.data_test_user_data, scenarios)
+
+        self.assertTrue(result.index.equals(index))
+        for row, ref in zip(result.itertuples(), self.reference_results()):
+            self.assertAlmostEqual(row.total_gain, ref['total_gain'], 9)
+            self.assertAlmostEqual(row.total_margin, ref['total_margin'], 9)
+            self.assertAlmostEqual(row.output_power, ref['output_power'], 9)
+
+    def test_structured_array(self):
+        scenarios = np.zeros(4, dtype=[('Free Space.elevation_angle', float),
+                                       ('GS RX Ant.antenna_diameter', float),
+                                       ('input_power', float)])
+        scenarios['Free Space.elevation_angle'] = self.elevations
+        scenarios['GS RX Ant.antenna_diameter'] = self.diameters
+        scenarios['input_power'] = self.powers
+
+        result = batch_process(self.data_test_user_data, scenarios)
+
+        np.testing.assert_allclose(result['total_margin'],
+                                   [ref['total_margin'] for ref in self.reference_results()])
+        # Unvaried GENERIC element is repeated for every scenario
+        np.testing.assert_array_equal(result['SC TX Ant.gain_loss'], 10.0)
+
+    def test_columns_are_views(self):
+        scenarios = np.zeros(4, dtype=[('input_power', float), ('rx_sys_threshold', float)])
+        columns = scenario_columns(scenarios)
+
+        self.assertTrue(np.shares_memory(columns['input_power'], scenarios))
+
+    def test_unknown_column(self):
+        scenarios = pd.DataFrame({'Free Space.not_a_parameter': self.elevations})
+
+        with self.assertRaises(KeyError):
+            batch_process(self.data_test_user_data, scenarios)
+
+
+class CompiledBudgetTestCase(unittest.TestCase):
+    def setUp(self):
+        cwd = Path(__file__).parent
+        self.data = load_from_yaml(f'{cwd}/ref_data/user_data.yaml')
+        rng = np.random.default_rng(0)
+        self.additive = {'input_power': rng.normal(60, 1, 1000),
+                         'rx_sys_threshold': rng.normal(6, 0.5, 1000),
+                         'SC TX Ant.gain_loss': rng.normal(10, 0.2, 1000)}
+
+    def test_additive_sweep(self):
+        budget = CompiledBudget(self.data)
+        ref_val = evaluate_budget(self.data, self.additive)
+        budget.evaluate({'input_power': 60.0})
+
+        # Physics elements are cached after the first call
+        with mock.patch.object(project.batch, 'build_element',
+                               wraps=project.batch.build_element) as kernel:
+            out_val = budget.evaluate(self.additive)
+            kernel.assert_not_called()
+
+        for key in ('total_gain', 'output_power', 'total_margin'):
+            np.testing.assert_allclose(out_val[key], ref_val[key])
+
+    def test_physics_sweep(self):
+        budget = CompiledBudget(self.data)
+        columns = {**self.additive, 'Free Space.elevation_angle': np.linspace(5, 90, 1000)}
+
+        with mock.patch.object(project.batch, 'build_element',
+                               wraps=project.batch.build_element) as kernel:
+            out_val = budget.evaluate(columns)
+            budget.evaluate(columns)
+            # Free Space for both calls, GS RX Ant only once
+            self.assertEqual([call.args[0] for call in kernel.call_args_list],
+                             ['Free Space', 'GS RX Ant', 'Free Space'])
+
+        for row in (0, 500, 999):
+            data = copy.deepcopy(self.data)
+            data['elements']['Free Space']['parameters']['elevation_angle'] = \
+                columns['Free Space.elevation_angle'][row]
+            data['elements']['SC TX Ant']['gain_loss'] = columns['SC TX Ant.gain_loss'][row]
+            data['general_values']['input_power'] = columns['input_power'][row]
+            data['general_values']['rx_sys_threshold'] = columns['rx_sys_threshold'][row]
+            ref_val = main_process(data)['general_values']
+            self.assertAlmostEqual(out_val['total_margin'][row], ref_val['total_margin'], 9)
+
+    def test_altitude_column(self):
+        # Layered atmosphere above stations at different altitudes
+        self.data['elements']['Atmos'] = {
+            'gain_loss': None, 'idx': 4, 'input_type': 'parameter_set_3',
+            'link_type': 'ATMOSPHERIC',
+            'parameters': {'air_temperature': 288.15, 'air_pressure': 1013.25,
+                           'water_vapor_content': 7.5, 'elevation_angle': 30.0,
+                           'frequency': 22.0, 'gs_altitude': 0.0, 'n_layers': 20}}
+        budget = CompiledBudget(self.data)
+        altitudes = np.tile([0.0, 500.0, 1500.0], 4)
+        for temperatures in (288.15, np.tile([280.0, 300.0], 6)):
+            columns = {'Atmos.gs_altitude': altitudes,
+                       'Atmos.elevation_angle': np.linspace(5, 90, altitudes.size),
+                       'Atmos.air_temperature': temperatures}
+            out_val = budget.evaluate(columns)
+
+            for row in (0, 1, 2, 11):
+                data = copy.deepcopy(self.data)
+                data['elements']['Atmos']['parameters'].update(
+                    {key.split('.')[1]: np.broadcast_to(val, altitudes.shape)[row]
+                     for key, val in columns.items()})
+                ref_val = main_process(data)['general_values']
+                self.assertAlmostEqual(out_val['total_margin'][row], ref_val['total_margin'], 9)
+
+    def test_invalidate(self):
+        results = main_process(copy.deepcopy(self.data))
+        gains = {name: element['gain_loss'] for name, element in results['elements'].items()}
+        budget = CompiledBudget(self.data, gains=gains)
+
+        # Only the edited element is computed again
+        self.data['elements']['Free Space']['parameters']['elevation_angle'] = 30.0
+        budget.invalidate('Free Space')
+        with mock.patch.object(project.batch, 'build_element',
+                               wraps=project.batch.build_element) as kernel:
+            out_val = budget.evaluate({})
+            self.assertEqual([call.args[0] for call in kernel.call_args_list], ['Free Space'])
+
+        ref_val = main_process(copy.deepcopy(self.data))['general_values']
+        self.assertAlmostEqual(out_val['total_margin'], ref_val['total_margin'], 9)
+
+
+class DataRateTestCase(unittest.TestCase):
+    def setUp(self):
+        cwd = Path(__file__).parent
+        self.data = load_from_yaml(f'{cwd}/ref_data/user_data.yaml')
+        self.data['elements']['LNA'] = {'gain_loss': None, 'idx': 4, 'input_type': 'parameter_set_1',
+                                        'link_type': 'NOISE',
+                                        'parameters': {'antenna_temperature': 150.0,
+                                                       'feed_loss': 0.5,
+                                                       'noise_figure': 1.0,
+                                                       'data_rate': 9.6,
+                                                       'required_eb_n0': 9.6}}
+        self.rates = np.array([1.2, 9.6, 38.4, 153.6])
+
+    def test_main_process(self):
+        results = main_process(copy.deepcopy(self.data))['general_values']
+
+        self.assertAlmostEqual(results['eb_n0'], results['c_n0'] - 10*np.log10(9600), 9)
+        self.assertAlmostEqual(results['ebn0_margin'], 9.6 - results['eb_n0'], 9)
+
+    def test_rates(self):
+        elevations = np.array([10.0, 45.0])
+        results = evaluate_data_rates(self.data, self.rates,
+                                      {'Free Space.elevation_angle': elevations})
+
+        self.assertEqual(results['ebn0_margin'].shape, (2, 4))
+        for i, el in enumerate(elevations):
+            for j, rate in enumerate(self.rates):
+                data = copy.deepcopy(self.data)
+                data['elements']['Free Space']['parameters']['elevation_angle'] = el
+                data['elements']['LNA']['parameters']['data_rate'] = rate
+                ref_val = main_process(data)['general_values']['ebn0_margin']
+                self.assertAlmostEqual(results['ebn0_margin'][i, j], ref_val, 9)
+
+    def test_no_noise_element(self):
+        del self.data['elements']['LNA']
+
+        with self.assertRaises(ValueError):
+            evaluate_data_rates(self.data, self.rates)
+
+
+if __name__ == '__main__':
+    unittest.main()
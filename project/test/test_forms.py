@@ -0,0 +1,27 @@
+import importlib
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from project.app import forms
+from project.settings import APP_UI_DIR
+
+
+class FormsTestCase(unittest.TestCase):
+    def test_compiled_up_to_date(self):
+        # Run 'python -m project.app.forms' after modifying a .ui file
+        for ui_file in Path(APP_UI_DIR).glob('*.ui'):
+            module = importlib.import_module(f'{forms.UI_PACKAGE}.{ui_file.stem}_ui')
+            self.assertEqual(module.UI_HASH, forms.ui_hash(ui_file), ui_file.name)
+
+    def test_outdated_fallback(self):
+        compiled = forms.load_form('rename_element')
+        with mock.patch.object(forms, 'ui_hash', return_value='modified'):
+            loaded = forms.load_form('rename_element')
+        self.assertIsNot(loaded, compiled)
+        self.assertEqual(loaded.__name__, compiled.__name__)
+        self.assertTrue(hasattr(loaded, 'setupUi'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,9 +5,17 @@ Created on Wed Jun  2 13:49:50 2021
 @author: Willem van Lynden
 """
 
+import os
 import unittest
+from unittest import mock
+import tempfile
+from pathlib import Path
+import numpy as np
 from project.link_element import FREE_SPACE_LinkElement, RX_LinkElement, \
-    TX_LinkElement, ATMOSPHERIC_LinkElement
+    TX_LinkElement, ATMOSPHERIC_LinkElement, RAIN_LinkElement, NOISE_LinkElement, \
+    BEAM_DIVERGENCE_LinkElement, POINTING_LinkElement, TURBULENCE_LinkElement
+from project.link_element import itu_p676
+from project.link_element.pointing_link_element import sample_pointing_error
 
 Re = 6371e3     #[m]
 c = 299792458   #[m/s]
@@ -53,6 +61,15 @@ class TX_LinkElementTest(unittest.TestCase):
 
 
         self.assertAlmostEqual(ref_val, out_val,0)
+
+    def test_pattern(self):
+        testparameters = {'pattern_file': 'example_dish.csv',
+                          'off_boresight_angle': np.array([0, -0.05, 0.025, 90])}
+
+        out_val = TX_LinkElement('test', 'parameter_set_3', None, testparameters).gain
+
+        # Symmetric pattern, linear between tabulated angles, sidelobe floor
+        np.testing.assert_allclose(out_val, [44.278, 44.241, (44.278+44.241)/2, -10])
     
 class RX_LinkElementTest(unittest.TestCase):
     def test_outcome(self):
@@ -68,12 +85,46 @@ class RX_LinkElementTest(unittest.TestCase):
 
         self.assertAlmostEqual(ref_val, out_val,0)
 
+    def test_pattern_2d(self):
+        # Table of gain = az + 10 * el, with axes in the first column and row
+        table = np.zeros((4, 5))
+        table[1:, 0] = [-10, 0, 10]
+        table[0, 1:] = [-5, 0, 5, 10]
+        table[1:, 1:] = table[1:, :1] + 10 * table[:1, 1:]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp, 'pattern.npy')
+            np.save(path, table)
+            testparameters = {'pattern_file': str(path),
+                              'azimuth_offset': np.array([0, 5, -20]),
+                              'elevation_offset': np.array([0, 2.5, 0])}
+
+            out_val = RX_LinkElement('test', 'parameter_set_4', None, testparameters).gain
+
+        # Bilinear is exact for a bilinear table, clamped outside it
+        np.testing.assert_allclose(out_val, [0, 30, -10])
+
+    def test_pattern_edited(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp, 'pattern.csv')
+            testparameters = {'pattern_file': str(path), 'off_boresight_angle': 0.5}
+            out_val = []
+            for k, gain in enumerate((30, 20)):
+                path.write_text(f'angle,gain\n0,{gain}\n1,{gain - 10}\n')
+                # Same size, so the file is only known as edited by its time
+                os.utime(path, ns=(k * 10**9, k * 10**9))
+                out_val.append(RX_LinkElement('test', 'parameter_set_3', None,
+                                              testparameters).gain)
+
+        # The edited file is read again
+        np.testing.assert_allclose(out_val, [25, 15])
+
 class Atmospheric_LinkElementTest(unittest.TestCase):
     def test_outcome(self):
         testparameters = {'air_temperature': 15+273.15,
                       'air_pressure': 101300,
                       'water_vapor_content': 7.5*1e-3,
-                      'wavelength': c/2e6,
+                      'wavelength': c/2e9,
                       'elevation_angle': 10}
 
         out_val = ATMOSPHERIC_LinkElement('test', 'parameter_set_1', 30, testparameters).gain
@@ -82,8 +133,253 @@ class Atmospheric_LinkElementTest(unittest.TestCase):
 
         self.assertAlmostEqual(ref_val, out_val,0)
 
+    def test_line_by_line(self):
+        testparameters = {'air_temperature': 15+273.15,
+                      'air_pressure': 101325,
+                      'water_vapor_content': 7.5*1e-3,
+                      'wavelength': c/30e9,
+                      'elevation_angle': 30}
+
+        out_val = ATMOSPHERIC_LinkElement('test', 'parameter_set_2', None, testparameters).gain
+        # print(out_val)
+        ref_val = -0.46 # Should be -0.46 (Ka-band, P.676-12 Annex 1)
+
+        self.assertAlmostEqual(ref_val, out_val,2)
+
+    def test_layered(self):
+        testparameters = {'air_temperature': 15+273.15,
+                      'air_pressure': 101325,
+                      'water_vapor_content': 7.5*1e-3,
+                      'wavelength': c/30e9,
+                      'elevation_angle': np.array([1, 5, 30, 90]),
+                      'gs_altitude': 0,
+                      'n_layers': 300}
+
+        out_val = ATMOSPHERIC_LinkElement('test', 'parameter_set_3', None, testparameters).gain
+        testparameters['elevation_angle'] = 30
+        ref_val = ATMOSPHERIC_LinkElement('test', 'parameter_set_2', None, testparameters).gain
+
+        # Agrees with the equivalent height model at moderate elevation, finite at the horizon
+        self.assertAlmostEqual(ref_val, out_val[2], 1)
+        self.assertTrue(np.all(np.diff(out_val) > 0))
+        self.assertGreater(out_val[0], -10)
+
+    def test_line_by_line_spectrum(self):
+        testparameters = {'air_temperature': 15+273.15,
+                      'air_pressure': 101325,
+                      'water_vapor_content': 7.5*1e-3,
+                      'wavelength': c/np.array([22.235e9, 30e9, 60e9]),
+                      'elevation_angle': 90}
+
+        out_val = ATMOSPHERIC_LinkElement('test', 'parameter_set_2', None, testparameters).gain
+
+        # Water vapour line at 22 GHz and oxygen complex at 60 GHz
+        self.assertEqual(out_val.shape, (3,))
+        self.assertLess(out_val[0], out_val[1])
+        self.assertLess(out_val[2], -100)
+
+    def test_zenith_cached(self):
+        testparameters = {'air_temperature': 15+273.15,
+                      'air_pressure': 101325,
+                      'water_vapor_content': 7.5*1e-3,
+                      'wavelength': c/26e9,
+                      'elevation_angle': np.array([5, 30, 90])}
+        ref_val = ATMOSPHERIC_LinkElement('test', 'parameter_set_2', None, testparameters).gain
+
+        # Rebuilding the element for other elevations reuses the zenith attenuation
+        itu_p676._cached_zenith_attenuation.cache_clear()
+        with mock.patch.object(itu_p676, '_zenith_attenuation',
+                               wraps=itu_p676._zenith_attenuation) as kernel:
+            out_val = [ATMOSPHERIC_LinkElement('test', 'parameter_set_2', None,
+                                               {**testparameters, 'elevation_angle': el}).gain
+                       for el in testparameters['elevation_angle']]
+        self.assertEqual(kernel.call_count, 1)
+        np.testing.assert_allclose(out_val, ref_val)
+        np.testing.assert_allclose(ref_val[0]*np.sin(np.deg2rad(5)), ref_val[2])
+
+    def test_zenith_per_weather_state(self):
+        # Two stations, each repeated over many samples
+        station = np.tile([0, 1], 50)
+        testparameters = {'air_temperature': np.array([288.15, 300.0])[station],
+                      'air_pressure': 101325,
+                      'water_vapor_content': np.array([7.5e-3, 15e-3])[station],
+                      'wavelength': c/26e9,
+                      'elevation_angle': np.linspace(5, 90, station.size),
+                      'gs_altitude': 0,
+                      'n_layers': 50}
+
+        for input_type in ('parameter_set_1', 'parameter_set_2', 'parameter_set_3'):
+            out_val = ATMOSPHERIC_LinkElement('test', input_type, None, testparameters).gain
+            ref_val = [ATMOSPHERIC_LinkElement('test', input_type, None,
+                                               {**testparameters,
+                                                'air_temperature': testparameters['air_temperature'][k],
+                                                'water_vapor_content': testparameters['water_vapor_content'][k],
+                                                'elevation_angle': testparameters['elevation_angle'][k]}).gain
+                       for k in (0, 1, 2, 99)]
+            np.testing.assert_allclose(out_val[[0, 1, 2, 99]], ref_val, rtol=1e-12)
+
+    def test_per_weather_state(self):
+        rng = np.random.default_rng(0)
+        T = rng.choice([270.0, 290.0, 300.0], size=(20, 30))
+        rho = rng.choice([2.0, 10.0], size=(20, 1))
+        func = mock.Mock(side_effect=lambda T, rho: np.stack([T, T*rho], axis=-1))
+
+        out_val = itu_p676.per_weather_state(func, T, rho)
+
+        self.assertEqual(out_val.shape, (20, 30, 2))
+        np.testing.assert_array_equal(out_val, np.stack([T, T*rho], axis=-1))
+        self.assertEqual(func.call_count, 1)
+        self.assertLessEqual(func.call_args[0][0].size, 6)
+
+
+class Rain_LinkElementTest(unittest.TestCase):
+    def setUp(self):
+        self.testparameters = {'wavelength': c/20e9,
+                      'polarization_tilt': 45,
+                      'elevation_angle': 30,
+                      'gs_latitude': 52,
+                      'gs_altitude': 0,
+                      'rain_rate': 30/3.6e6}
+
+    def test_outcome(self):
+        out_val = RAIN_LinkElement('test', 'parameter_set_1', None, self.testparameters).gain
+        ref_val = -14.99
+        self.assertAlmostEqual(ref_val, out_val, 2)
+
+    def test_availability_curve(self):
+        exceedance = np.logspace(-3, np.log10(5), 50)
+        self.testparameters['exceedance'] = exceedance
+        out_val = RAIN_LinkElement('test', 'parameter_set_2', None, self.testparameters).gain
+        self.testparameters['exceedance'] = 0.01
+        ref_val = RAIN_LinkElement('test', 'parameter_set_1', None, self.testparameters).gain
+
+        # Attenuation falls with exceedance, and R0.01 gives A0.01 at 0.01%
+        self.assertEqual(out_val.shape, exceedance.shape)
+        self.assertTrue(np.all(np.diff(out_val) > 0))
+        self.assertAlmostEqual(np.interp(-2, np.log10(exceedance), out_val), ref_val, 2)
+
+    def test_above_rain_height(self):
+        self.testparameters['gs_altitude'] = 6000
+        out_val = RAIN_LinkElement('test', 'parameter_set_1', None, self.testparameters).gain
+        self.assertEqual(out_val, 0)
+
+class NOISE_LinkElementTest(unittest.TestCase):
+    def setUp(self):
+        self.testparameters = {'antenna_temperature': 150,
+                      'feed_loss': 0.5,
+                      'noise_figure': 1.0,
+                      'data_rate': 9600,
+                      'required_eb_n0': 9.6}
+
+    def test_outcome(self):
+        element = NOISE_LinkElement('test', 'parameter_set_1', None, self.testparameters)
+        self.assertAlmostEqual(element.gain, -0.5)
+        self.assertAlmostEqual(element.Tsys, 240.31, 2)
+
+        out_val = element.link_quality(-120)
+        self.assertAlmostEqual(out_val['c_n0'], 54.79, 2)
+        self.assertAlmostEqual(out_val['eb_n0'], 14.97, 2)
+        self.assertAlmostEqual(out_val['ebn0_margin'], -5.37, 2)
+
+    def test_system_temperature(self):
+        self.testparameters['system_temperature'] = 240.31323808158413
+        element = NOISE_LinkElement('test', 'parameter_set_2', None, self.testparameters)
+        ref_val = NOISE_LinkElement('test', 'parameter_set_1', None,
+                                    self.testparameters).link_quality(-120.5)
+        self.assertEqual(element.gain, 0)
+        self.assertAlmostEqual(element.link_quality(-120.5)['eb_n0'], ref_val['eb_n0'], 9)
+
+    def test_data_rates(self):
+        element = NOISE_LinkElement('test', 'parameter_set_1', None, self.testparameters)
+        rates = np.array([1200, 9600, 76800])
+        out_val = element.link_quality(np.array([[-120], [-130]]), rates)['ebn0_margin']
+
+        # Every doubling of the rate costs 3 dB
+        self.assertEqual(out_val.shape, (2, 3))
+        np.testing.assert_allclose(np.diff(out_val, axis=1), 10*np.log10(8))
+        np.testing.assert_allclose(out_val[1] - out_val[0], 10)
+
+class BEAM_DIVERGENCE_LinkElementTest(unittest.TestCase):
+    def setUp(self):
+        self.testparameters = {'waist_radius': 0.05,
+                      'wavelength': 1550e-9,
+                      'distance': 2000e3,
+                      'rx_aperture_diameter': 0.01,
+                      'beam_divergence': 2*1550e-9/(np.pi*0.05)}
+
+    def test_far_field(self):
+        # A small aperture in the far field collects the same power as the
+        # waist gain, free space loss and aperture gain of an ideal antenna
+        out_val = BEAM_DIVERGENCE_LinkElement('test', 'parameter_set_1', None, self.testparameters).gain
+        tx = TX_LinkElement('test', 'parameter_set_2', None, self.testparameters).gain
+        fs = FREE_SPACE_LinkElement('test', 'parameter_set_1', None, self.testparameters).gain
+        rx = RX_LinkElement('test', 'parameter_set_1', None,
+                            {'antenna_efficiency': 1, 'antenna_diameter': 0.01,
+                             'wavelength': 1550e-9}).gain
+        self.assertAlmostEqual(out_val, tx + fs + rx, 3)
+
+    def test_large_aperture(self):
+        self.testparameters['distance'] = np.array([1, 10])
+        self.testparameters['rx_aperture_diameter'] = 0.5
+        out_val = BEAM_DIVERGENCE_LinkElement('test', 'parameter_set_1', None, self.testparameters).gain
+        np.testing.assert_allclose(out_val, 0, atol=1e-3)
+
+    def test_divergence(self):
+        out_val = BEAM_DIVERGENCE_LinkElement('test', 'parameter_set_2', None, self.testparameters).gain
+        self.assertAlmostEqual(out_val, -6.02, 2)
+
+class POINTING_LinkElementTest(unittest.TestCase):
+    def setUp(self):
+        self.testparameters = {'pointing_bias': 2e-6,
+                      'pointing_jitter': 3e-6,
+                      'beam_divergence': 15e-6,
+                      'exceedance': 1}
+        self.testparameters['pointing_error'] = sample_pointing_error(2e-6, 3e-6, 1_000_000, rng=0)
+        self.samples = POINTING_LinkElement('test', 'parameter_set_1', None, self.testparameters).gain
+
+    def test_loss_exceeded(self):
+        out_val = POINTING_LinkElement('test', 'parameter_set_2', None, self.testparameters).gain
+        self.assertAlmostEqual(out_val, np.percentile(self.samples, 1), 2)
+
+    def test_mean_loss(self):
+        out_val = POINTING_LinkElement('test', 'parameter_set_3', None, self.testparameters).gain
+        ref_val = 10*np.log10(np.mean(10**(self.samples/10)))
+        self.assertAlmostEqual(out_val, ref_val, 2)
+
+    def test_no_jitter(self):
+        self.testparameters['pointing_jitter'] = 0
+        self.testparameters['pointing_error'] = 2e-6
+        out_val = POINTING_LinkElement('test', 'parameter_set_2', None, self.testparameters).gain
+        ref_val = POINTING_LinkElement('test', 'parameter_set_1', None, self.testparameters).gain
+        self.assertAlmostEqual(out_val, ref_val, 9)
+
+class TURBULENCE_LinkElementTest(unittest.TestCase):
+    def setUp(self):
+        self.testparameters = {'wavelength': 1550e-9,
+                      'elevation_angle': np.array([10, 20, 45, 90]),
+                      'gs_altitude': 0,
+                      'wind_speed': 21,
+                      'ground_cn2': 1.7e-14,
+                      'rx_aperture_diameter': 0.4,
+                      'exceedance': 1}
+
+    def test_rytov_variance(self):
+        element = TURBULENCE_LinkElement('test', 'parameter_set_1', None, self.testparameters)
+        out_val = element.calc_rytov_variance()
+        # HV 5/7 at 1550 nm, zenith, and the sec^(11/6) scaling with zenith angle
+        self.assertAlmostEqual(out_val[-1], 0.06, delta=0.01)
+        np.testing.assert_allclose(out_val/out_val[-1],
+                                   np.sin(np.deg2rad([10, 20, 45, 90]))**(-11/6))
 
+    def test_fade(self):
+        out_val = TURBULENCE_LinkElement('test', 'parameter_set_1', None, self.testparameters).gain
+        self.assertTrue(np.all(np.diff(out_val) > 0))
+        self.assertTrue(np.all(out_val < 0))
 
+        # Larger aperture averages out more of the scintillation
+        self.testparameters['rx_aperture_diameter'] = 1.0
+        self.assertTrue(np.all(TURBULENCE_LinkElement('test', 'parameter_set_1', None,
+                                                      self.testparameters).gain > out_val))
 
 
 if __name__ == '__main__':
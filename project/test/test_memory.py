@@ -0,0 +1,83 @@
+import threading
+import tracemalloc
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from project import memory
+from project.memory import MemoryUse, chunk_rows, format_size, memory_limit, parse_size
+
+
+class MemoryTestCase(unittest.TestCase):
+    def test_sizes(self):
+        self.assertEqual(parse_size('512'), 512)
+        self.assertEqual(parse_size('512k'), 512 * 2**10)
+        self.assertEqual(parse_size('1.5G'), int(1.5 * 2**30))
+        self.assertEqual(parse_size(' 2 GiB'), 2 * 2**30)
+        self.assertEqual(parse_size('64MB'), 64 * 2**20)
+        self.assertEqual(parse_size('1e6'), 10**6)
+        for text in ('', 'lots', '2 GHz', '1.2.3M'):
+            with self.assertRaises(ValueError):
+                parse_size(text)
+
+        self.assertEqual(format_size(100), '100 B')
+        self.assertEqual(format_size(1536), '1.5 KiB')
+        self.assertEqual(format_size(3 * 2**30), '3.0 GiB')
+
+    def test_use(self):
+        self.assertFalse(tracemalloc.is_tracing())
+        with MemoryUse() as outer:
+            a = np.ones(10**6)      # 8 MB
+            with MemoryUse() as inner:
+                b = a * 2
+                del b
+            c = np.ones(10**5)
+        del a, c
+
+        self.assertAlmostEqual(inner.peak / 8e6, 1, delta=0.05)
+        self.assertAlmostEqual(inner.net / 8e6, 0, delta=0.05)
+        # The peak of the inner measurement counts for the outer one as well
+        self.assertAlmostEqual(outer.peak / 16e6, 1, delta=0.05)
+        self.assertAlmostEqual(outer.net / 8.8e6, 1, delta=0.05)
+        self.assertFalse(tracemalloc.is_tracing())     # Stopped, it was not running before
+
+    def test_without_reset_peak(self):
+        # Before Python 3.9: the peak since tracing started, never below the true peak
+        with mock.patch.object(memory, '_reset_peak', None):
+            with MemoryUse() as outer:
+                a = np.ones(2 * 10**6)
+                del a
+                with MemoryUse() as inner:
+                    b = np.ones(10**6)
+                    del b
+        self.assertGreaterEqual(inner.peak / 8e6, 0.95)
+        self.assertAlmostEqual(outer.peak / 16e6, 1, delta=0.05)
+
+    def test_threads(self):
+        # A measurement in another thread does not reset the peak of this one
+        with MemoryUse() as use:
+            a = np.ones(10**6)
+            del a
+            thread = threading.Thread(target=lambda: MemoryUse().__enter__().__exit__())
+            thread.start()
+            thread.join()
+        self.assertAlmostEqual(use.peak / 8e6, 1, delta=0.05)
+
+    def test_chunk_rows(self):
+        self.assertEqual(chunk_rows(1000, 100.0), 1000)                 # No limit
+        self.assertEqual(chunk_rows(1000, 100.0, 0, limit=50_000), 500)
+        self.assertEqual(chunk_rows(1000, 100.0, 30_000, limit=50_000), 200)
+        self.assertEqual(chunk_rows(1000, 100.0, 0, limit=10**9), 1000)
+        with self.assertRaises(MemoryError):
+            chunk_rows(1000, 100.0, 50_000, limit=50_000)
+
+        self.assertIsNone(memory.max_memory())
+        with memory_limit(50_000):
+            self.assertEqual(memory.max_memory(), 50_000)
+            self.assertEqual(chunk_rows(1000, 100.0), 500)
+        self.assertIsNone(memory.max_memory())
+
+
+if __name__ == '__main__':
+    unittest.main()
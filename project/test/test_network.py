@@ -0,0 +1,133 @@
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from project.batch import evaluate_budget
+from project.network import evaluate_network, assignment_table
+from project.orbit import Orbit, GroundStation, look_angles, R_EARTH
+from project.process import load_from_yaml
+
+
+class NetworkTest(unittest.TestCase):
+    def setUp(self):
+        cwd = Path(__file__).parent
+        self.data = load_from_yaml(f'{cwd}/ref_data/user_data.yaml')
+        self.orbits = Orbit(R_EARTH + 550e3, 0, 53, np.array([0.0, 0.0, 120.0]), 0,
+                            np.array([0.0, 20.0, 0.0]))
+        self.lat, self.lon = np.array([52.0, 40.0]), np.array([4.36, 10.0])
+        self.stations = GroundStation(self.lat, self.lon, np.array([0.0, 800.0]))
+        self.t = np.arange(0, 6 * 3600, 20.0)
+        self.powers = np.array([65.0, 60.0, 55.0])
+        self.diameters = np.array([2.0, 3.0])
+
+    def evaluate(self, **kwargs):
+        return evaluate_network(self.data, self.orbits, self.stations, self.t,
+                                satellite_values={'input_power': self.powers},
+                                station_values={'GS RX Ant.antenna_diameter': self.diameters},
+                                min_elevation=10, return_margin=True, **kwargs)
+
+    def test_margin(self):
+        out_val = self.evaluate()
+
+        for sat in range(3):
+            orbit = Orbit(R_EARTH + 550e3, 0, 53, [0.0, 0.0, 120.0][sat], 0, [0.0, 20.0, 0.0][sat])
+            for station in range(2):
+                geometry = look_angles(orbit, GroundStation(self.lat[station], self.lon[station],
+                                                            [0.0, 800.0][station]), self.t)
+                visible = geometry['elevation'] >= 10
+                ref_val = evaluate_budget(self.data,
+                                          {'Free Space.elevation_angle': geometry['elevation'][visible],
+                                           'Free Space.distance': geometry['range'][visible] / 1e3,
+                                           'Free Space.gs_altitude': [0.0, 800.0][station],
+                                           'input_power': self.powers[sat],
+                                           'GS RX Ant.antenna_diameter': self.diameters[station]})
+
+                margin = out_val['margin'][sat, station]
+                self.assertTrue(np.all(np.isnan(margin[~visible])))
+                np.testing.assert_allclose(margin[visible], ref_val['total_margin'])
+
+        # Best satellite has the lowest margin of the visible ones
+        none = np.all(np.isnan(out_val['margin']), axis=0)
+        ref_val = np.min(np.nan_to_num(out_val['margin'], nan=np.inf), axis=0)
+        np.testing.assert_allclose(out_val['best_margin'][~none], ref_val[~none])
+        self.assertTrue(np.all(out_val['best_satellite'][none] == -1))
+        self.assertTrue(np.all(np.isnan(out_val['best_margin'][none])))
+
+    def test_layered_atmosphere(self):
+        # The layers of every station start at its own altitude
+        self.data['elements']['Atmos'] = {
+            'gain_loss': None, 'idx': 4, 'input_type': 'parameter_set_3',
+            'link_type': 'ATMOSPHERIC',
+            'parameters': {'air_temperature': 288.15, 'air_pressure': 1013.25,
+                           'water_vapor_content': 7.5, 'elevation_angle': 30.0,
+                           'frequency': 22.0, 'gs_altitude': 0.0, 'n_layers': 20}}
+        out_val = self.evaluate()
+
+        for sat in (0, 2):
+            orbit = Orbit(R_EARTH + 550e3, 0, 53, [0.0, 0.0, 120.0][sat], 0, [0.0, 20.0, 0.0][sat])
+            for station in range(2):
+                altitude = [0.0, 800.0][station]
+                geometry = look_angles(orbit, GroundStation(self.lat[station], self.lon[station],
+                                                            altitude), self.t)
+                visible = geometry['elevation'] >= 10
+                elevation = geometry['elevation'][visible]
+                ref_val = evaluate_budget(self.data,
+                                          {'Free Space.elevation_angle': elevation,
+                                           'Free Space.distance': geometry['range'][visible] / 1e3,
+                                           'Free Space.gs_altitude': altitude,
+                                           'Atmos.elevation_angle': elevation,
+                                           'Atmos.gs_altitude': altitude,
+                                           'input_power': self.powers[sat],
+                                           'GS RX Ant.antenna_diameter': self.diameters[station]})
+                np.testing.assert_allclose(out_val['margin'][sat, station][visible],
+                                           ref_val['total_margin'])
+
+    def test_memory_limit(self):
+        ref_val = self.evaluate()
+        out_val = self.evaluate(max_memory=2 * 2**20)
+        for key in ('best_satellite', 'best_margin', 'margin'):
+            np.testing.assert_array_equal(out_val[key], ref_val[key])
+        with self.assertRaises(MemoryError):
+            self.evaluate(max_memory=2**10)
+
+    def test_chunks(self):
+        ref_val = self.evaluate()
+        out_val = self.evaluate(chunk_size=37)
+
+        np.testing.assert_array_equal(out_val['best_satellite'], ref_val['best_satellite'])
+        np.testing.assert_array_equal(out_val['margin'], ref_val['margin'])
+
+    def test_assignment_table(self):
+        result = self.evaluate()
+        out_val = assignment_table(result, satellite_names=['A', 'B', 'C'])
+
+        served = np.zeros(result['best_satellite'].shape, dtype=bool)
+        for row in out_val.itertuples():
+            in_run = (self.t >= row.start) & (self.t <= row.end)
+            best = result['best_satellite'][row.station, in_run]
+            self.assertTrue(np.all(best == 'ABC'.index(row.satellite)))
+            self.assertAlmostEqual(row.worst_margin,
+                                   result['best_margin'][row.station, in_run].max())
+            served[row.station, in_run] = True
+        np.testing.assert_array_equal(served, result['best_satellite'] >= 0)
+
+    def test_worst_margin(self):
+        # Lower is better, so the worst value of an interval is its highest
+        result = {'time': np.arange(6.0),
+                  'best_satellite': np.array([[0, 0, 0, 1, 1, -1], [1, 1, 1, 1, 1, 1]]),
+                  'best_margin': np.array([[1.0, 3.0, 2.0, 5.0, 4.0, np.nan],
+                                           [-2.0, -1.0, -4.0, -3.0, -1.5, -2.5]])}
+        out_val = assignment_table(result)
+        self.assertEqual(out_val[['station', 'satellite', 'start', 'end']].values.tolist(),
+                         [[0, 0, 0, 2], [0, 1, 3, 4], [1, 1, 0, 5]])
+        np.testing.assert_array_equal(out_val['worst_margin'], [3.0, 5.0, -1.0])
+
+    def test_value_shape(self):
+        with self.assertRaises(ValueError):
+            evaluate_network(self.data, self.orbits, self.stations, self.t,
+                             satellite_values={'input_power': self.powers[:2]})
+
+
+if __name__ == '__main__':
+    unittest.main()
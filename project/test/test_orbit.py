@@ -0,0 +1,92 @@
+import unittest
+
+import numpy as np
+
+from project.link_element import FREE_SPACE_LinkElement
+from project.orbit import Orbit, GroundStation, look_angles, R_EARTH, MU
+
+c = 299792458   #[m/s]
+
+
+class OrbitTest(unittest.TestCase):
+    def test_overhead(self):
+        # Equatorial orbit passing over the station at epoch
+        sc_orbit = Orbit(R_EARTH + 500e3, 0, 0, 0, 0, 0, j2=False)
+        station = GroundStation(0, 0, 0)
+
+        out_val = look_angles(sc_orbit, station, 0)
+
+        self.assertAlmostEqual(out_val['range'], 500e3, 3)
+        self.assertAlmostEqual(out_val['elevation'], 90, 6)
+        self.assertAlmostEqual(out_val['range_rate'], 0, 6)
+
+    def test_period(self):
+        a = R_EARTH + 800e3
+        sc_orbit = Orbit(a, 0.1, 60, 30, 45, 10, j2=False)
+        period = 2 * np.pi * np.sqrt(a**3 / MU)
+
+        (r0, v0), (r1, v1) = sc_orbit.state_eci(0), sc_orbit.state_eci(period)
+
+        np.testing.assert_allclose(r0, r1, atol=1e-3)
+        # Vis-viva
+        v = np.sqrt(np.sum(np.square(v0)))
+        r = np.sqrt(np.sum(np.square(r0)))
+        self.assertAlmostEqual(v, np.sqrt(MU * (2 / r - 1 / a)), 6)
+
+    def test_sun_synchronous(self):
+        # Sun-synchronous orbit at 700 km drifts 360 deg per year
+        sc_orbit = Orbit(R_EARTH + 700e3, 0, 98.19, 0, 0, 0)
+
+        raan_dot = sc_orbit.secular_rates()[0]
+
+        self.assertAlmostEqual(np.rad2deg(raan_dot) * 86400, 360 / 365.2422, 2)
+
+    def test_range_rate(self):
+        sc_orbit = Orbit(R_EARTH + 550e3, 0.001, 53, 10, 0, 0)
+        station = GroundStation(40, 10, 100)
+        t = np.arange(0, 6000, 0.5)
+
+        out_val = look_angles(sc_orbit, station, t)
+        ref_val = np.gradient(out_val['range'], t)
+
+        np.testing.assert_allclose(out_val['range_rate'][1:-1], ref_val[1:-1], atol=0.05)
+
+    def test_broadcasting(self):
+        sc_orbit = Orbit(R_EARTH + np.array([500e3, 800e3, 1200e3])[:, None, None],
+                         0, 53, 0, 0, 0)
+        stations = GroundStation(np.array([0, 45])[:, None], np.array([0, 90])[:, None])
+        t = np.arange(0, 600, 10.0)
+
+        out_val = look_angles(sc_orbit, stations, t)
+
+        self.assertEqual(out_val['elevation'].shape, (3, 2, 60))
+        single = look_angles(Orbit(R_EARTH + 800e3, 0, 53, 0, 0, 0),
+                             GroundStation(45, 90), t)
+        np.testing.assert_allclose(out_val['elevation'][1, 1], single['elevation'])
+
+
+class FreeSpaceOrbitTest(unittest.TestCase):
+    def test_outcome(self):
+        testparameters = {'semi_major_axis': R_EARTH + 500e3,
+                          'eccentricity': 0,
+                          'inclination': 0,
+                          'raan': 0,
+                          'arg_perigee': 0,
+                          'mean_anomaly': 0,
+                          'j2_drift': 0,
+                          'gs_latitude': 0,
+                          'gs_longitude': 0,
+                          'gs_altitude': 0,
+                          'time': np.array([0, 60, 120]),
+                          'wavelength': c/2e9}
+
+        element = FREE_SPACE_LinkElement('test', 'parameter_set_3', None, testparameters)
+
+        # Same loss as parameter_set_1 at the slant range directly overhead
+        self.assertAlmostEqual(element.gain[0], -152.45, 2)
+        self.assertEqual(element.angle.shape, (3,))
+        self.assertTrue(np.all(np.diff(element.gain) < 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from project.batch import evaluate_budget
+from project.orbit import Orbit, GroundStation, look_angles, R_EARTH
+from project.passes import find_passes, evaluate_passes, configured_frequency
+from project.process import load_from_yaml
+
+
+class FindPassesTest(unittest.TestCase):
+    def setUp(self):
+        self.orbit = Orbit(R_EARTH + 500e3, 0.001, 97.4, 0, 0, 0)
+        self.stations = GroundStation(np.array([52.0, -30.0]), np.array([4.36, 150.0]),
+                                      np.array([0.0, 500.0]))
+        self.t = np.arange(0, 86400, 1.0)
+
+    def test_windows(self):
+        passes = find_passes(self.orbit, self.stations, 0, 86400, min_elevation=10)
+
+        for station in range(2):
+            sub = GroundStation(np.rad2deg(self.stations.latitude[station]),
+                                np.rad2deg(self.stations.longitude[station]),
+                                self.stations.altitude[station])
+            elevation = look_angles(self.orbit, sub, self.t)['elevation']
+            # Rising crossings of a 1 s brute force scan
+            rises = self.t[1:][np.diff((elevation >= 10).astype(int)) == 1]
+            found = passes[passes['station'] == station]
+
+            self.assertEqual(len(found), len(rises))
+            np.testing.assert_allclose(found['aos'], rises, atol=1)
+            for aos, los, peak in found[['aos', 'los', 'peak_elevation']].to_numpy():
+                in_view = (self.t >= aos) & (self.t <= los)
+                self.assertGreaterEqual(peak, elevation[in_view].max() - 1e-6)
+                self.assertLess(peak, elevation[in_view].max() + 0.01)
+
+            geometry = look_angles(self.orbit, sub, found[['aos', 'los']].to_numpy())
+            np.testing.assert_allclose(geometry['elevation'], 10, atol=1e-3)
+
+    def test_cut_off(self):
+        passes = find_passes(self.orbit, self.stations, 0, 86400, min_elevation=10)
+        first = passes.iloc[0]
+        t_start = (first['aos'] + first['los']) / 2
+
+        out_val = find_passes(self.orbit, self.stations, t_start, 86400, min_elevation=10)
+
+        self.assertEqual(out_val.iloc[0]['aos'], t_start)
+        self.assertAlmostEqual(out_val.iloc[0]['los'], first['los'], 3)
+
+
+class EvaluatePassesTest(unittest.TestCase):
+    def setUp(self):
+        cwd = Path(__file__).parent
+        self.data = load_from_yaml(f'{cwd}/ref_data/user_data.yaml')
+        self.orbit = Orbit(R_EARTH + 300e3, 0, 51.6, 0, 0, 0)
+        self.station = GroundStation(40.0, 10.0, 0)
+        self.passes = find_passes(self.orbit, self.station, 0, 86400, min_elevation=10)
+
+    def test_summary(self):
+        summary, samples = evaluate_passes(self.data, self.orbit, self.station, self.passes,
+                                           step=1.0, return_samples=True)
+
+        # Same budget as a scenario evaluation of the in-view samples
+        first = samples[samples['pass'] == 0]
+        ref_val = evaluate_budget(self.data,
+                                  {'Free Space.elevation_angle': first['elevation'].to_numpy(),
+                                   'Free Space.distance': first['range'].to_numpy() / 1e3})
+        self.assertAlmostEqual(summary['min_margin'][0], ref_val['total_margin'].min(), 9)
+        self.assertAlmostEqual(summary['max_margin'][0], ref_val['total_margin'].max(), 9)
+
+        self.assertTrue(np.all(samples['elevation'] >= 10 - 1e-3))
+        self.assertTrue(np.all(summary['time_above_threshold'] <= summary['duration']))
+
+    def test_threshold(self):
+        self.data['general_values']['rx_sys_threshold'] = -1000
+        summary = evaluate_passes(self.data, self.orbit, self.station, self.passes)
+
+        np.testing.assert_allclose(summary['time_above_threshold'], summary['duration'])
+
+    def test_doppler(self):
+        summary, samples = evaluate_passes(self.data, self.orbit, self.station, self.passes,
+                                           step=1.0, return_samples=True)
+        f = 10e6   # Free Space frequency
+
+        np.testing.assert_allclose(samples['doppler'], -f * samples['range_rate'] / 299792458)
+        # Doppler rate against a central difference of the exact range rate
+        t = samples['time'].to_numpy()
+        h = 1e-2
+        accel = (look_angles(self.orbit, self.station, t + h)['range_rate']
+                 - look_angles(self.orbit, self.station, t - h)['range_rate']) / (2 * h)
+        np.testing.assert_allclose(samples['doppler_rate'], -f * accel / 299792458,
+                                   rtol=1e-2, atol=1e-3 * np.abs(samples['doppler_rate']).max())
+
+        ref_val = samples.groupby('pass')['doppler'].apply(lambda x: x.abs().max())
+        np.testing.assert_allclose(summary['max_doppler'], ref_val)
+
+    def test_frequency(self):
+        self.assertEqual(configured_frequency(self.data), 10e6)
+        # Without path loss the other elements give the frequency
+        del self.data['elements']['Free Space']
+        self.assertEqual(configured_frequency(self.data), 100e6)
+        self.data['elements']['TX Ant'] = {'gain_loss': None, 'idx': 3, 'input_type': 'parameter_set_1',
+                                           'link_type': 'TX',
+                                           'parameters': {'antenna_diameter': 1.0,
+                                                          'antenna_efficiency': 0.6,
+                                                          'frequency': 200.0}}
+        with self.assertRaises(ValueError):
+            configured_frequency(self.data)
+
+        summary = evaluate_passes(self.data, self.orbit, self.station, self.passes, frequency=2e9)
+        self.assertTrue(np.all(summary['max_doppler'] > 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PyQt5.QtWidgets import QApplication
+
+from project.app.plot_dock import sweep_columns, default_range, clip_to_bounds
+from project.app.plots import PlotWidget, minmax_downsample, nice_ticks, heatmap_image
+from project.app.table_models import ElementReference, parse_range
+from project.process import load_from_yaml
+from project.settings import DEFAULT_LINK_CONFIG, ELEMENT_REFERENCE
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+class DownsampleTestCase(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.x = np.linspace(0, 100, 1_000_003)
+        self.y = np.cumsum(rng.normal(0, 1, self.x.size))
+
+    def test_extremes(self):
+        x, y = minmax_downsample(self.x, self.y, 500)
+        self.assertLessEqual(x.size, 1000)
+        self.assertTrue(np.all(np.diff(x) >= 0))
+        self.assertEqual(y.max(), self.y.max())
+        self.assertEqual(y.min(), self.y.min())
+
+        # Every bin keeps its own extremes
+        size = self.y.size // 500
+        self.assertIn(self.y[:size].min(), y[:2])
+        self.assertIn(self.y[:size].max(), y[:2])
+
+    def test_visible_range(self):
+        x, y = minmax_downsample(self.x, self.y, 500, (40.0, 40.01))
+        inside = (self.x >= 40.0) & (self.x <= 40.01)
+        # Few enough points to keep all, plus one on either side
+        self.assertEqual(x.size, inside.sum() + 2)
+        np.testing.assert_array_equal(y[1:-1], self.y[inside])
+
+    def test_nan(self):
+        y = self.y[:1000].copy()
+        y[::3] = np.nan
+        x, y = minmax_downsample(self.x[:1000], y, 100)
+        self.assertFalse(np.isnan(y).any())
+
+
+class PlotTestCase(unittest.TestCase):
+    def test_ticks(self):
+        np.testing.assert_allclose(nice_ticks(-3.2, 17.9), [0, 5, 10, 15])
+        np.testing.assert_allclose(nice_ticks(0.1, 0.3, 4), [0.1, 0.15, 0.2, 0.25, 0.3])
+        self.assertEqual(str(nice_ticks(-0.5, 0.5)[2]), '0.0')
+
+    def test_heatmap(self):
+        z = np.array([[0.0, 1.0], [2.0, np.nan]])
+        image = heatmap_image(z)
+        self.assertEqual((image.width(), image.height()), (2, 2))
+        # x to the right, y upwards: z[0, 0] at the bottom left
+        self.assertEqual(image.pixel(0, 1), 0xFF440154)
+        self.assertEqual(image.pixel(1, 1), 0xFFFDE725)
+        self.assertEqual(image.pixel(1, 0) >> 24, 0)    # NaN is transparent
+
+    def test_widget(self):
+        plot = PlotWidget()
+        plot.resize(800, 400)
+        x = np.linspace(0, 1, 100_000)
+        plot.set_line(x, np.sin(20 * x), ('x', 'y'), 'Line', reference=0.0)
+        plot.set_view(0.2, 0.3)
+        self.assertLessEqual(plot.view[2], np.sin(20 * x[(x >= 0.2) & (x <= 0.3)]).min())
+        self.assertFalse(plot.grab().isNull())
+
+        plot.set_histogram(*np.histogram(np.sin(20 * x), 50))
+        self.assertFalse(plot.grab().isNull())
+        plot.set_heatmap(np.outer(x[:100], x[:50]), (0, 1), (0, 2), z_label='z')
+        self.assertEqual(plot.full_view[:2], (-1 / 198, 1 + 1 / 198))
+        self.assertFalse(plot.grab().isNull())
+
+    def test_descending(self):
+        # A sweep with 'From' above 'To' is shown on an ascending axis
+        plot = PlotWidget()
+        x = np.linspace(9.5, 1.5, 17)
+        plot.set_line(x, x**2)
+        self.assertEqual(plot.full_view[:2], (1.5, 9.5))
+        np.testing.assert_array_equal(plot.data['x'], x[::-1])
+        np.testing.assert_array_equal(plot.data['y'], x[::-1]**2)
+        x_shown, _ = minmax_downsample(plot.data['x'], plot.data['y'], 10, plot.view[:2])
+        self.assertGreater(x_shown.size, 0)
+
+        z = np.arange(6.0).reshape(3, 2)
+        plot.set_heatmap(z, (2, 0), (1, 0))
+        self.assertEqual(plot.full_view, (-0.5, 2.5, -0.5, 1.5))
+        ref = PlotWidget()
+        ref.set_heatmap(z[::-1, ::-1], (0, 2), (0, 1))
+        self.assertEqual(plot.data['image'], ref.data['image'])
+
+
+class PlotDockTestCase(unittest.TestCase):
+    def test_columns(self):
+        data = load_from_yaml(DEFAULT_LINK_CONFIG)
+        columns = sweep_columns(data['elements'], ElementReference(load_from_yaml(ELEMENT_REFERENCE)))
+        self.assertEqual(list(columns)[-2:], ['input_power', 'rx_sys_threshold'])
+        for column in columns:
+            name = column.split('.')[0]
+            self.assertTrue(name in data['elements'] or name in data['general_values'])
+
+    def test_range(self):
+        bounds = parse_range('(0, 90]')
+        self.assertEqual(default_range(80.0, bounds), (40.0, 90.0))
+        start, _ = default_range(0.5, bounds)
+        self.assertGreater(start, 0.0)
+        self.assertEqual(clip_to_bounds(np.array([-1.0, 100.0]), bounds)[1], 90.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
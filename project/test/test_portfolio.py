@@ -0,0 +1,102 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from project import portfolio
+from project.portfolio import ResultCache, calculation_hash, config_hash, evaluate_configs, \
+    list_configs
+from project.process import load_from_yaml, main_process
+
+
+class PortfolioTestCase(unittest.TestCase):
+    def setUp(self):
+        ref_dir = Path(__file__).parent / 'ref_data'
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+        for name in ('user_data.yaml', 'generic_only.yaml'):
+            shutil.copy(ref_dir / name, self.tmp / name)
+        (self.tmp / 'broken.yaml').write_text('elements: {A: {link_type: NONE}}\n')
+        (self.tmp / 'notes.txt').write_text('not a configuration')
+
+    def test_list(self):
+        self.assertEqual([path.name for path in list_configs(self.tmp)],
+                         ['broken.yaml', 'generic_only.yaml', 'user_data.yaml'])
+
+    def test_evaluate(self):
+        paths = list_configs(self.tmp)
+        summaries = {path.name: summary for path, summary, cached in
+                     evaluate_configs(paths, max_workers=1)}
+
+        ref_val = main_process(load_from_yaml(self.tmp / 'user_data.yaml'))['general_values']
+        summary = summaries['user_data.yaml']
+        self.assertIsNone(summary['error'])
+        for key in ('total_gain', 'output_power', 'total_margin'):
+            self.assertAlmostEqual(summary[key], ref_val[key])
+
+        # A file that cannot be evaluated is reported, not raised
+        self.assertIsNone(summaries['broken.yaml']['total_margin'])
+        self.assertIsNotNone(summaries['broken.yaml']['error'])
+
+    def test_parallel(self):
+        paths = list_configs(self.tmp)
+        serial = {path: summary for path, summary, _ in evaluate_configs(paths, max_workers=1)}
+        parallel = {path: summary for path, summary, _ in evaluate_configs(paths, max_workers=2)}
+        self.assertEqual(parallel, serial)
+
+    def test_cache(self):
+        cache_file = self.tmp / 'cache' / 'results.json'
+        path = self.tmp / 'user_data.yaml'
+        cache = ResultCache.load(cache_file)
+        first = list(evaluate_configs([path], cache, max_workers=1))
+        self.assertFalse(first[0][2])
+        cache.save()
+
+        # Unchanged file: taken from the saved cache, without evaluating it
+        cache = ResultCache.load(cache_file)
+        with mock.patch.object(portfolio, 'summarize_config') as summarize:
+            second = list(evaluate_configs([path], cache, max_workers=1))
+        summarize.assert_not_called()
+        self.assertEqual(second, [(path, first[0][1], True)])
+
+        # Modified file: evaluated again
+        key = config_hash(path)
+        data = path.read_text().replace('input_power: 65', 'input_power: 70')
+        path.write_text(data)
+        self.assertNotEqual(config_hash(path), key)
+        third = list(evaluate_configs([path], cache, max_workers=1))
+        self.assertFalse(third[0][2])
+        self.assertEqual(len(cache), 2)
+
+        # Results of a job that evaluated into a copy of the cache
+        copy = ResultCache(results=cache.results)
+        list(evaluate_configs([self.tmp / 'generic_only.yaml'], copy, max_workers=1))
+        self.assertEqual((len(cache), len(copy)), (2, 3))
+        cache.update(copy)
+        self.assertEqual(len(cache), 3)
+        self.assertTrue(cache.changed)
+
+        # Failed files are not cached, they are tried again
+        broken = self.tmp / 'broken.yaml'
+        list(evaluate_configs([broken], cache, max_workers=1))
+        self.assertEqual(len(cache), 3)
+        self.assertFalse(list(evaluate_configs([broken], cache, max_workers=1))[0][2])
+
+    def test_calculation_hash(self):
+        # The key changes with the files of the calculation, e.g. an antenna pattern
+        pattern = self.tmp / 'pattern.csv'
+        pattern.write_text('angle,gain\n0,10\n5,7\n')
+        calculation = calculation_hash((pattern, self.tmp / 'cache'))
+        self.assertEqual(calculation_hash((pattern, self.tmp / 'cache')), calculation)
+
+        path = self.tmp / 'user_data.yaml'
+        key = config_hash(path, calculation)
+        pattern.write_text('angle,gain\n0,10\n5,6\n')
+        calculation = calculation_hash((pattern, self.tmp / 'cache'))
+        self.assertNotEqual(config_hash(path, calculation), key)
+        self.assertEqual(config_hash(path), config_hash(path, calculation_hash()))
+
+
+if __name__ == '__main__':
+    unittest.main()
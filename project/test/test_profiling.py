@@ -0,0 +1,66 @@
+import threading
+import unittest
+from pathlib import Path
+
+from project import profiling
+from project.process import load_from_yaml, main_process
+
+
+class ProfilingTestCase(unittest.TestCase):
+    def setUp(self):
+        cwd = Path(__file__).parent
+        self.data = load_from_yaml(f'{cwd}/ref_data/user_data.yaml')
+
+    def test_stages(self):
+        calls = []
+        with profiling.profile(callback=lambda *args: calls.append(args)) as prof:
+            main_process(self.data)
+
+        stages = prof.as_dict()
+        self.assertEqual([name for name in stages if '.' not in name],
+                         ['convert_units_in', 'dataframe', 'elements', 'sum_results',
+                          'convert_units_out'])
+
+        # Every element is counted once, under its link type
+        link_types = [element['link_type'] for element in self.data['elements'].values()]
+        for link_type in set(link_types):
+            self.assertEqual(stages[f'elements.{link_type}']['count'], link_types.count(link_type))
+        parts = sum(val['total'] for name, val in stages.items() if name.startswith('elements.'))
+        self.assertLessEqual(parts, stages['elements']['total'])
+
+        self.assertEqual(len(calls), sum(val['count'] for val in stages.values()))
+        self.assertTrue(all(end >= start for _, start, end in calls))
+        self.assertIn('  FREE_SPACE', prof.table())
+
+    def test_memory(self):
+        with profiling.profile(memory=True) as prof:
+            main_process(self.data)
+
+        stages = prof.as_dict()
+        for name in ('convert_units_in', 'dataframe', 'elements', 'sum_results',
+                     'convert_units_out'):
+            self.assertGreaterEqual(stages[name]['peak'], max(0, stages[name]['net']))
+            self.assertIn(name, prof.sites)
+        self.assertNotIn('peak', stages['elements.FREE_SPACE'])     # Timed only
+        self.assertEqual(prof.peak(), max(val['peak'] for val in stages.values() if 'peak' in val))
+
+        # The memory held after converting the units is allocated by the conversion
+        sites = [str(stat.traceback) for stat in prof.sites['convert_units_in']]
+        self.assertTrue(sites)
+        self.assertIn('Top allocation sites', prof.memory_table())
+
+    def test_disabled(self):
+        self.assertIsNone(profiling.active_profile())
+        self.assertIs(profiling.stage('anything'), profiling.stage('else'))   # Shared no-op
+
+        # Only the thread that profiles is measured
+        with profiling.profile() as prof:
+            thread = threading.Thread(target=main_process, args=(self.data,))
+            thread.start()
+            thread.join()
+        self.assertEqual(prof.stages, {})
+        self.assertIsNone(profiling.active_profile())
+
+
+if __name__ == '__main__':
+    unittest.main()
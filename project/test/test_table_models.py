@@ -0,0 +1,114 @@
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication
+
+from project.app import table_models
+from project.app.table_models import ElementReference, ElementTableModel, \
+    PortfolioTableModel, ResultsTableModel, parse_range, in_range
+from project.process import load_from_yaml
+from project.settings import ELEMENT_REFERENCE
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+
+class TableModelTestCase(unittest.TestCase):
+    def setUp(self):
+        self.reference = ElementReference(load_from_yaml(ELEMENT_REFERENCE))
+        self.elements = {'Gain': {'link_type': 'GENERIC', 'input_type': 'gain_loss',
+                                  'gain_loss': 3.0, 'parameters': None, 'idx': 2},
+                         'Path': {'link_type': 'FREE_SPACE', 'input_type': 'parameter_set_1',
+                                  'gain_loss': None, 'idx': 1,
+                                  'parameters': {'distance': 500.0, 'frequency': 2.2}}}
+
+    def test_range(self):
+        bounds = parse_range('(0, 90]')
+        self.assertEqual(bounds[-1], '0 < Value <= 90')
+        self.assertFalse(in_range(0, bounds))
+        self.assertTrue(in_range(90, bounds))
+        self.assertTrue(in_range(1e9, parse_range('[0, inf)')))
+
+    def test_elements(self):
+        model = ElementTableModel(self.reference)
+        model.set_elements(self.elements)
+
+        # Ordered by idx, one row per parameter, the name only on the first row
+        self.assertEqual(model.rows, [('Path', 'distance'), ('Path', 'frequency'), ('Gain', None)])
+        self.assertEqual(model.spans, {'Path': (0, 2), 'Gain': (2, 1)})
+        self.assertEqual(model.data(model.index(0, 0)), 'Path')
+        self.assertIsNone(model.data(model.index(1, 0)))
+        self.assertEqual(model.data(model.index(2, 1)), 'Gain')
+        self.assertEqual(model.data(model.index(0, 2)), '500.00')
+        self.assertEqual(model.data(model.index(0, 3)), 'km')
+
+    def test_edit(self):
+        model = ElementTableModel(self.reference)
+        model.set_elements(self.elements)
+        changed, edited = [], []
+        model.dataChanged.connect(lambda first, last: changed.append((first.row(), last.row())))
+        model.value_edited.connect(lambda name, param: edited.append((name, param)))
+
+        self.assertTrue(model.setData(model.index(0, 2), '750.5'))
+        self.assertEqual(self.elements['Path']['parameters']['distance'], 750.5)
+        self.assertEqual(changed, [(0, 0)])
+        self.assertEqual(edited, [('Path', 'distance')])
+
+        # Invalid values are refused and reported
+        with mock.patch.object(table_models, 'showdialog') as dialog:
+            self.assertFalse(model.setData(model.index(0, 2), 'far'))
+            self.assertFalse(model.setData(model.index(0, 2), '-1'))
+        self.assertEqual(dialog.call_count, 2)
+        self.assertEqual(self.elements['Path']['parameters']['distance'], 750.5)
+
+        self.elements['Path']['parameters']['frequency'] = ''
+        self.assertTrue(model.invalid_values())
+        self.assertFalse(model.invalid_values(allow_blank=True))
+
+    def test_results(self):
+        model = ResultsTableModel(self.reference)
+        results = {name: dict(element, gain_loss=-1.0) for name, element in self.elements.items()}
+        self.assertTrue(model.set_results(results))
+        self.assertEqual(model.rowCount(), 3)
+        self.assertEqual(model.data(model.index(0, 1)), '-1.00')
+
+        # Same layout: only the changed gain is repainted
+        changed = []
+        model.dataChanged.connect(lambda first, last: changed.append(first.row()))
+        results['Gain']['gain_loss'] = 2.5
+        self.assertFalse(model.set_results(results))
+        self.assertEqual(changed, [2])
+        self.assertEqual(model.data(model.index(2, 1)), '2.50')
+
+    def test_portfolio(self):
+        model = PortfolioTableModel()
+        a, b, c = Path('a.yaml'), Path('b.yaml'), Path('c.yaml')
+        model.set_files([c, a, b])
+        self.assertEqual(model.data(model.index(0, 3)), '...')
+
+        # Sorted by margin, files without a result stay at the bottom
+        model.sort(3, Qt.DescendingOrder)
+        model.set_summaries({a: {'total_gain': -100.0, 'output_power': -70.0,
+                                 'total_margin': 5.0, 'error': None},
+                             b: {'total_gain': -90.0, 'output_power': -60.0,
+                                 'total_margin': -5.0, 'error': None}})
+        self.assertEqual(model.paths, [a, b, c])
+        model.set_summaries({c: {'total_gain': None, 'output_power': None,
+                                 'total_margin': None, 'error': 'KeyError: x'}})
+        self.assertEqual(model.paths, [a, b, c])
+        self.assertEqual(model.data(model.index(2, 1)), 'Error')
+        self.assertEqual(model.data(model.index(2, 1), Qt.ToolTipRole), 'KeyError: x')
+
+        model.sort(1, Qt.AscendingOrder)
+        self.assertEqual(model.paths, [a, b, c])
+        self.assertEqual(model.data(model.index(1, 2)), '-60.00')
+        model.sort(0, Qt.DescendingOrder)
+        self.assertEqual(model.paths, [c, b, a])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from project import tracing
+from project.app.worker import batch_job
+from project.portfolio import evaluate_configs, list_configs
+from project.process import load_from_yaml
+
+
+class TracingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.ref_dir = Path(__file__).parent / 'ref_data'
+        self.tmp = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def test_disabled(self):
+        self.assertIsNone(tracing.active_tracer())
+        self.assertIs(tracing.span('anything'), tracing.span('else', chunk=1))   # Shared no-op
+        with tracing.trace() as tracer:
+            self.assertIs(tracing.active_tracer(), tracer)
+        self.assertIsNone(tracing.active_tracer())
+
+    def test_ring_buffer(self):
+        with tracing.trace(capacity=10) as tracer:
+            for k in range(25):
+                with tracing.span('evaluate chunk', start=k):
+                    pass
+        (_, _, _, spans, count), = tracer.buffers()
+        self.assertEqual(count, 25)
+        self.assertEqual([args['start'] for _, _, _, args in spans], list(range(15, 25)))
+        self.assertEqual(tracer.dropped, 15)
+
+    def test_chrome_trace(self):
+        file = self.tmp / 'trace.json'
+        with tracing.trace(file):
+            data = load_from_yaml(self.ref_dir / 'user_data.yaml')
+            job = batch_job(data, {'input_power': np.linspace(20, 40, 100)}, chunk_size=30)
+            for _ in job:
+                pass
+
+            # Every thread has its own buffer
+            thread = threading.Thread(target=load_from_yaml, name='loader',
+                                      args=(self.ref_dir / 'generic_only.yaml',))
+            thread.start()
+            thread.join()
+
+        trace = json.loads(file.read_text())
+        events = trace['traceEvents']
+        spans = [event for event in events if event['ph'] == 'X']
+        names = [event['name'] for event in spans]
+        for name in ('load', 'parse', 'compile', 'evaluate chunk'):
+            self.assertIn(name, names)
+        self.assertEqual([event['args'] for event in spans if event['name'] == 'evaluate chunk'],
+                         [{'start': 0, 'stop': 30}, {'start': 30, 'stop': 60},
+                          {'start': 60, 'stop': 90}, {'start': 90, 'stop': 100}])
+
+        self.assertEqual([event['ts'] for event in spans], sorted(event['ts'] for event in spans))
+        self.assertTrue(all(event['dur'] >= 0 and event['pid'] == os.getpid() for event in spans))
+        threads = {event['args']['name']: event['tid'] for event in events
+                   if event['name'] == 'thread_name'}
+        self.assertIn('loader', threads)
+        self.assertEqual({event['tid'] for event in spans}, set(threads.values()))
+        self.assertEqual(trace['otherData']['dropped'], 0)
+
+    def test_worker_processes(self):
+        for name in ('user_data.yaml', 'generic_only.yaml'):
+            shutil.copy(self.ref_dir / name, self.tmp / name)
+
+        with tracing.trace() as tracer:
+            summaries = [summary for _, summary, _ in
+                         evaluate_configs(list_configs(self.tmp), max_workers=2)]
+        self.assertTrue(all(summary['error'] is None for summary in summaries))
+
+        # The spans of the workers are merged, named after their process
+        spans = [event for event in tracer.chrome_trace()['traceEvents'] if event['ph'] == 'X']
+        evaluated = {event['args']['file'] for event in spans if event['name'] == 'evaluate'}
+        self.assertEqual({Path(file).name for file in evaluated},
+                         {'user_data.yaml', 'generic_only.yaml'})
+        self.assertNotIn(os.getpid(), {event['pid'] for event in spans})
+
+
+if __name__ == '__main__':
+    unittest.main()
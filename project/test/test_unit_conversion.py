@@ -23,6 +23,16 @@ class UnitConversionTests(unittest.TestCase):
         self.assertEqual(ref_val, out_val)
 
 
+    def test_base_SI_composite(self):
+        in_val  = 7.5
+        in_unit = 'g / m3'
+
+        out_val = to_base_SI(in_val, in_unit)
+        ref_val = 7.5e-3
+
+        self.assertAlmostEqual(ref_val, out_val, 12)
+
+
     def test_prefix_SI(self):
         in_val = 750e-9
         desired_unit = 'nm'
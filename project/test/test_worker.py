@@ -0,0 +1,162 @@
+import os
+import sys
+import time
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PyQt5.QtCore import QCoreApplication
+
+from project.app.worker import Worker, budget_job, batch_job, histogram_job, pass_job, \
+    portfolio_job
+from project.batch import evaluate_budget
+from project.orbit import GroundStation, Orbit, R_EARTH
+from project.portfolio import ResultCache
+from project.process import load_from_yaml, main_process
+
+
+def run_job(job, cancel=False):
+    '''Runs a job on a Worker thread and collects its signals until it ends'''
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    events = {'progress': [], 'partial': [], 'finished': [], 'failed': [], 'cancelled': []}
+    worker = Worker(job)
+    if cancel:
+        worker.progress.connect(worker.cancel)
+    worker.progress.connect(lambda done, total: events['progress'].append((done, total)))
+    worker.partial.connect(events['partial'].extend)
+    worker.finished.connect(events['finished'].append)
+    worker.failed.connect(events['failed'].append)
+    worker.cancelled.connect(lambda: events['cancelled'].append(True))
+    worker.start()
+
+    start = time.perf_counter()
+    while not (events['finished'] or events['failed'] or events['cancelled']):
+        app.processEvents()
+        if time.perf_counter() - start > 30:
+            raise TimeoutError('Worker did not end')
+    worker.wait()
+    app.processEvents()
+    return events
+
+
+class WorkerTestCase(unittest.TestCase):
+    def setUp(self):
+        cwd = Path(__file__).parent
+        self.data = load_from_yaml(f'{cwd}/ref_data/user_data.yaml')
+
+    def test_budget(self):
+        events = run_job(budget_job(self.data))
+        ref_val = main_process(self.data)
+
+        self.assertEqual(events['finished'][0]['general_values'], ref_val['general_values'])
+        self.assertEqual(events['progress'][-1], (1, 1))
+
+    def test_batch(self):
+        columns = {'input_power': np.random.default_rng(0).normal(60, 1, (100_000, 1)),
+                   'Free Space.elevation_angle': np.array([[10.0, 30.0, 90.0]])}
+        events = run_job(batch_job(self.data, columns, chunk_size=3000))
+        ref_val = evaluate_budget(self.data, columns)
+
+        out_val = events['finished'][0]
+        self.assertEqual(out_val['total_margin'].shape, (100_000, 3))
+        np.testing.assert_allclose(out_val['total_margin'], ref_val['total_margin'])
+        # Every chunk arrives as partial result, even when updates are throttled
+        self.assertEqual(sum(p['slice'].stop - p['slice'].start for p in events['partial']), 100_000)
+        self.assertEqual(events['progress'][-1], (100_000, 100_000))
+
+    def test_batch_memory(self):
+        columns = {'input_power': np.random.default_rng(0).normal(60, 1, 200_000)}
+        ref_val = evaluate_budget(self.data, columns)
+
+        job = batch_job(self.data, columns, chunk_size=2**20, max_memory=30 * 2**20)
+        sizes = []
+        while True:
+            try:
+                _, _, partial = next(job)
+            except StopIteration as stop:
+                out_val = stop.value
+                break
+            sizes.append(partial['slice'].stop - partial['slice'].start)
+        # A small first chunk, the others as large as the results leave room for
+        self.assertEqual(sizes[0], 4096)
+        self.assertTrue(4096 < sizes[1] < 200_000)
+        np.testing.assert_allclose(out_val['total_margin'], ref_val['total_margin'])
+
+        # The results alone do not fit
+        with self.assertRaises(MemoryError):
+            list(batch_job(self.data, columns, max_memory=2**20))
+
+    def test_histogram(self):
+        columns = {'input_power': np.random.default_rng(0).normal(60, 1, 50_000)}
+        events = run_job(histogram_job(self.data, columns, bins=20, chunk_size=10_000))
+        result = events['finished'][0]
+        self.assertEqual(result['counts'].sum(), 50_000)
+        self.assertEqual(result['edges'].size, 21)
+        self.assertEqual(len(events['partial'][0]['results']['total_margin']), 10_000)
+
+    def test_pass(self):
+        orbit = Orbit(R_EARTH + 500e3, 0.001, 97.4, 0, 0, 0)
+        station = GroundStation(52.0, 4.4)
+        samples = run_job(pass_job(self.data, orbit, station, 10.0))['finished'][0]
+        self.assertGreaterEqual(samples['elevation'].min(), 10.0 - 1e-3)
+        self.assertEqual(samples['pass'].nunique(), 1)
+
+        # No pass above 89 deg within a minute
+        events = run_job(pass_job(self.data, orbit, station, 89.0, duration=60.0))
+        self.assertIsNone(events['finished'][0])
+
+    def test_portfolio(self):
+        paths = [Path(__file__).parent / 'ref_data' / name
+                 for name in ('user_data.yaml', 'generic_only.yaml')]
+        cache = ResultCache()
+        events = run_job(portfolio_job(paths, cache, max_workers=1))
+        self.assertEqual(set(events['finished'][0]), set(paths))
+        self.assertEqual([p['cached'] for p in events['partial']], [False, False])
+
+        # Second run from the cache
+        events = run_job(portfolio_job(paths, cache, max_workers=1))
+        self.assertEqual([p['cached'] for p in events['partial']], [True, True])
+        self.assertEqual(events['progress'][-1], (2, 2))
+
+    def test_cancel(self):
+        steps = []
+
+        def job():
+            for k in range(1000):
+                steps.append(k)
+                time.sleep(0.001)
+                yield k + 1, 1000, None
+            return 'done'
+
+        # Cancelled on the first progress update, the job stops soon after
+        events = run_job(job(), cancel=True)
+        self.assertEqual(events['cancelled'], [True])
+        self.assertEqual(events['finished'], [])
+        self.assertLess(len(steps), 1000)
+
+    def test_cancel_wait(self):
+        def job():
+            while True:
+                time.sleep(0.001)
+                yield 0, 1, None
+
+        # Waiting on the main thread, without processing its events, does not block the worker
+        QCoreApplication.instance() or QCoreApplication(sys.argv)
+        worker = Worker(job()).start()
+        time.sleep(0.05)
+        worker.cancel()
+        self.assertTrue(worker.wait(5000))
+
+    def test_failed(self):
+        def job():
+            yield 0, 1, None
+            raise ValueError('bad config')
+
+        events = run_job(job())
+        self.assertIn('bad config', events['failed'][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
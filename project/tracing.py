@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""
+title: tracing.py
+project: Link-Budget-Toolbox
+date: 19/10/2026
+author: Luigi Maiorano
+
+Timeline of batch, sweep and parallel runs, written in the Chrome Trace Event format.
+
+Where profiling.py sums the time per stage, a trace keeps every span (file load, parse,
+compile, evaluate chunk, write, ...) with its start, duration and the process and thread
+that ran it. Gaps between the chunks of a worker, chunks that take longer than the
+others and waiting on files then show on a timeline. Open the file in a trace viewer,
+e.g. https://ui.perfetto.dev or chrome://tracing (both run locally in the browser).
+
+    with trace('run_trace.json'):
+        results = evaluate_network(...)
+
+Tracing is off unless a trace is active, span() then returns a shared no-op context.
+While active, every thread records its spans in its own ring buffer of fixed capacity,
+without locking: a job of a million chunks keeps the most recent spans per thread and
+counts the dropped ones, instead of exhausting the memory. The buffers are merged when
+the trace is written.
+
+Worker processes record a trace of their own with call_traced(), which returns its
+spans with the result, to be merged by the parent. Times are taken from
+time.perf_counter_ns(), a monotonic clock shared by the processes of a machine.
+"""
+import contextlib
+import json
+import os
+import threading
+import time
+from collections import deque
+
+DEFAULT_CAPACITY = 100_000  # Spans kept per thread
+
+_active = None              # Tracer of the run, shared by all threads
+_null = contextlib.nullcontext()
+
+
+class _Span:
+    '''Context manager recording its block as a span of a tracer'''
+    __slots__ = ('tracer', 'name', 'args', 'start')
+
+    def __init__(self, tracer, name, args):
+        self.tracer, self.name, self.args = tracer, name, args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.record(self.name, self.start, time.perf_counter_ns(), self.args)
+        return False
+
+
+class Tracer:
+    '''Spans of a run, in a ring buffer per thread
+
+    Attributes
+    ----------
+    capacity : int
+        Maximum number of spans kept per thread, the oldest are dropped first
+    '''
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.start = time.perf_counter_ns()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._buffers = []      # [pid, tid, thread name, deque of spans, spans recorded]
+        self._merged = []       # Buffers of other processes, see merge()
+
+    def _buffer(self):
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            thread = threading.current_thread()
+            buffer = [os.getpid(), threading.get_ident(), thread.name,
+                      deque(maxlen=self.capacity), 0]
+            self._local.buffer = buffer
+            with self._lock:
+                self._buffers.append(buffer)
+        return buffer
+
+    def record(self, name, start, end, args=None):
+        '''Adds a span of the current thread
+
+        Parameters
+        ----------
+        name : str
+        start, end : int
+            Times of time.perf_counter_ns()
+        args : dict, optional
+            Details shown with the span, e.g. the chunk or file
+        '''
+        buffer = self._buffer()
+        buffer[3].append((name, start, end - start, args))
+        buffer[4] += 1
+
+    def span(self, name, **args):
+        '''Context manager that records its block as a span'''
+        return _Span(self, name, args or None)
+
+    def buffers(self):
+        '''Returns the buffers of all threads, also of merged processes
+
+        Returns
+        -------
+        list of tuple
+            (pid, tid, thread name, list of spans, number of spans recorded), with a span
+            (name, start [ns], duration [ns], args)
+        '''
+        with self._lock:
+            own = [(pid, tid, name, list(spans), count)
+                   for pid, tid, name, spans, count in self._buffers]
+        return own + self._merged
+
+    def merge(self, buffers):
+        '''Adds the buffers of a trace of another process, see call_traced'''
+        self._merged.extend(buffers)
+
+    @property
+    def dropped(self):
+        '''Number of spans dropped because a buffer was full'''
+        return sum(count - len(spans) for _, _, _, spans, count in self.buffers())
+
+    def chrome_trace(self):
+        '''Returns the trace as a dictionary of the Chrome Trace Event format
+
+        Spans are complete events ('X') with times in microseconds since the start of
+        the tracer, the threads and processes are named by metadata events ('M').
+        '''
+        buffers = self.buffers()
+        main_pid = os.getpid()
+        events = []
+        for pid in sorted({buffer[0] for buffer in buffers}):
+            name = 'main' if pid == main_pid else f'worker {pid}'
+            events.append({'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+                           'args': {'name': name}})
+        spans = []
+        for pid, tid, thread_name, thread_spans, _ in buffers:
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                           'args': {'name': thread_name}})
+            for name, start, duration, args in thread_spans:
+                event = {'name': name, 'ph': 'X', 'pid': pid, 'tid': tid,
+                         'ts': (start - self.start) / 1e3, 'dur': duration / 1e3}
+                if args:
+                    event['args'] = args
+                spans.append(event)
+        spans.sort(key=lambda event: event['ts'])
+        return {'traceEvents': events + spans, 'displayTimeUnit': 'ms',
+                'otherData': {'capacity': self.capacity, 'dropped': self.dropped}}
+
+    def write(self, path):
+        '''Writes the trace to a JSON file, see chrome_trace'''
+        with open(path, 'w') as f:
+            json.dump(self.chrome_trace(), f, default=str)
+
+
+def active_tracer():
+    '''Returns the tracer of the running trace, None if not tracing'''
+    return _active
+
+
+def span(name, **args):
+    '''Context manager that records its block as a span of the active trace, if any
+
+    Parameters
+    ----------
+    name : str
+        Name of the span, e.g. 'parse' or 'evaluate chunk'
+    **args
+        Details shown with the span, e.g. the range of a chunk
+
+    Returns
+    -------
+    context manager
+    '''
+    tracer = _active
+    if tracer is None:
+        return _null
+    return _Span(tracer, name, args or None)
+
+
+@contextlib.contextmanager
+def trace(path=None, capacity=DEFAULT_CAPACITY):
+    '''Traces the spans of all threads during its block
+
+    Parameters
+    ----------
+    path : str or Path, optional
+        Chrome Trace Event JSON file written at the end of the block
+    capacity : int, default=DEFAULT_CAPACITY
+        Spans kept per thread
+
+    Yields
+    ------
+    Tracer
+    '''
+    global _active
+    previous, _active = _active, Tracer(capacity)
+    tracer = _active
+    try:
+        yield tracer
+    finally:
+        _active = previous
+        if path is not None:
+            tracer.write(path)
+
+
+def call_traced(capacity, func, *args, **kwargs):
+    '''Calls a function with a trace of its own, e.g. in a worker process
+
+    Parameters
+    ----------
+    capacity : int
+        Spans kept per thread
+    func : function
+        Module level function, so that it can be sent to a worker process
+    *args, **kwargs
+        Arguments of func
+
+    Returns
+    -------
+    tuple
+        (result of func, buffers of the trace), merge the buffers with Tracer.merge
+    '''
+    with trace(capacity=capacity) as tracer:
+        result = func(*args, **kwargs)
+    return result, tracer.buffers()
+
+
+if __name__ == '__main__':
+    import tempfile
+    from pathlib import Path
+    from project import tracing     # Not this __main__ module, which the others do not use
+    from project.portfolio import ResultCache, evaluate_configs, list_configs
+    from project.settings import CONFIGS_DIR
+
+    path = Path(tempfile.gettempdir(), 'portfolio_trace.json')
+    with tracing.trace(path) as tracer:
+        for _ in evaluate_configs(list_configs(CONFIGS_DIR), ResultCache(), max_workers=2):
+            pass
+    print(f'{path}: {sum(len(buffer[3]) for buffer in tracer.buffers())} spans')
@@ -12,6 +12,7 @@ import yaml
 from project.settings import ELEMENT_REFERENCE
 from astropy import units as u
 import scipy.constants as sc
+import numpy as np
 import copy
 
 def load_from_yaml(file):
@@ -24,33 +25,26 @@ def to_base_SI(val, prefix_unit_str):
 
     Parameters
     ----------
-    val : float
-        Quantity to convert
+    val : float or numpy.ndarray
+        Quantity to convert. Arrays are converted element-wise
     prefix_unit_str : str
         Unit to convert from. For available units, see:
          https://docs.astropy.org/en/stable/units/index.html
 
-    Raises
-    ------
-    NotImplementedError:
-        For composite units
-
     Returns
     -------
-    float or None
+    float, numpy.ndarray or None
         Quantity converted to base unit
     str or None
         Base unit string representation
     '''
     try:
         x_u = u.Unit(prefix_unit_str)          # Given units
-        if isinstance(x_u, u.CompositeUnit):
-            raise NotImplementedError(f'\n\tConversion of composite units not supported: "{prefix_unit_str}"')
 
-        scale = x_u.represents.scale
+        scale = unit_scale(x_u)
         base_val = val * scale
 
-        return float(base_val)  # convert numpy float64 (precision not necessary)
+        return _as_float(base_val)
 
     except AttributeError:
         logger.debug(f'Error decomposing units. "{prefix_unit_str}" is not a recognized unit')
@@ -61,45 +55,58 @@ def to_prefixed_SI(base_si_val, prefix_unit_str):
     '''Converts a Base SI value to a specified prefixed unit
 
     The base SI unit is derived directly from the desired prefixed unit.
-    Note: This only works for single units. Composite units (ie m / s^2) are not supported
+    Composite units (ie g / m3) are converted to the composition of their base units
 
     This is used after the main_process calculation to convert back to logical units
 
     Parameters
     ----------
-    base_si_val : float
-        Quantity to convert
+    base_si_val : float or numpy.ndarray
+        Quantity to convert. Arrays are converted element-wise
     prefix_unit_str : str
         Unit to convert TO. For available units, see:
          https://docs.astropy.org/en/stable/units/index.html
     
-    Raises
-    ------
-    NotImplementedError:
-        For composite units
-
     Returns
     -------
-    float or None
+    float, numpy.ndarray or None
         Quantity converted to base unit
     str or None
         Base unit string representation
     '''
     try:
         x_u = u.Unit(prefix_unit_str)         # Units to convert to
-        if isinstance(x_u, u.CompositeUnit):
-            raise NotImplementedError(f'\n\tConversion of composite units not supported: "{prefix_unit_str}"')
 
-        scale = x_u.represents.scale
+        scale = unit_scale(x_u)
         val = base_si_val / scale
 
-        return float(val)  # convert numpy float64 (precision not necessary)
+        return _as_float(val)
 
     except AttributeError:
         logger.debug(f'Error decomposing units. "{prefix_unit_str}" is not a recognized unit')
         return None
 
 
+def unit_scale(x_u):
+    '''Scale factor between a unit and its base SI unit
+
+    Single units are scaled by the unit they directly represent (km -> m). Composite
+    units (ie g / m3 or mm / h) are fully decomposed into base SI units (kg / m3, m / s).
+
+    Parameters
+    ----------
+    x_u : astropy.units.UnitBase
+        Unit to scale
+
+    Returns
+    -------
+    float
+    '''
+    if isinstance(x_u, u.CompositeUnit):
+        return x_u.decompose().scale
+    return x_u.represents.scale
+
+
 def convert_config_units(data, conv_to_base_SI=True):
     '''Convert units to the base SI units
 
@@ -116,8 +123,6 @@ def convert_config_units(data, conv_to_base_SI=True):
     elem_cfg_path = Path(ELEMENT_REFERENCE)
     param_ref = load_from_yaml(elem_cfg_path)
 
-    ignore_units = ['dB', 'deg', '-', '']
-
     # Create copy to write changes to, without modifying iterator
     converted_data = copy.deepcopy(data)
 
@@ -128,50 +133,86 @@ def convert_config_units(data, conv_to_base_SI=True):
         link_type = attributes['link_type']
         input_type = attributes['input_type']
 
-        converted_params = {}
-        for param, value in attributes['parameters'].items():
+        converted_params = convert_parameters(attributes['parameters'],
+                                              param_ref[link_type][input_type],
+                                              conv_to_base_SI=conv_to_base_SI)
+
+        # Replace value in dictionary
+        converted_data['elements'][element]['parameters'] = converted_params
+
+    return converted_data
 
-            if not conv_to_base_SI and 'frequency' in param_ref[link_type][input_type].keys():
-                # Convert frequency parameter (currently wavelength in [m]) to [Hz]
-                if param.lower() == 'wavelength':
-                    value = wavelength_to_freq(value)
-                    # replace w/ 'frequency'
-                    param = 'frequency'
 
-            unit = param_ref[link_type][input_type][param]['units'] # Determine unit
+def convert_parameters(parameters, param_set_ref, conv_to_base_SI=True):
+    '''Convert the parameters of a single element to or from base SI units
 
-            if unit not in ignore_units:
-                # -------------- BEFORE Calculations -------------
-                if conv_to_base_SI:
-                    # Convert value to base SI
-                    value = to_base_SI(value, unit)
+    Values may be floats or numpy arrays, in which case the conversion is applied
+    element-wise. This is shared by convert_config_units and the batch evaluation.
 
-                    # Convert frequency [Hz] to wavelength
-                    if param.lower() == 'frequency':
-                        value = freq_to_wavelength(value)
+    Parameters
+    ----------
+    parameters : dict
+        {parameter: value} of one link element
+    param_set_ref : dict
+        Parameter set of this element as defined in element_reference.yaml
+    conv_to_base_SI : bool, default=True
+        Convert to base SI units. Set to False to convert back to the units of the reference
 
-                        # Replace with 'wavelength'
-                        param = 'wavelength'
+    Returns
+    -------
+    dict
+        Converted {parameter: value}. 'frequency' is replaced by 'wavelength' when converting
+        to base SI, and vice versa
+    '''
+    ignore_units = ['dB', 'deg', '-', '', '%', 'path']
 
-                # -------------- AFTER Calculations -------------------
-                else:
-                    # Convert value to user-friendly unit
-                    value = to_prefixed_SI(value, unit)
+    converted_params = {}
+    for param, value in parameters.items():
 
-            converted_params[param] = value
+        if not conv_to_base_SI and 'frequency' in param_set_ref.keys():
+            # Convert frequency parameter (currently wavelength in [m]) to [Hz]
+            if param.lower() == 'wavelength':
+                value = wavelength_to_freq(value)
+                # replace w/ 'frequency'
+                param = 'frequency'
 
-        # Replace value in dictionary
-        converted_data['elements'][element]['parameters'] = converted_params
+        unit = param_set_ref[param]['units'] # Determine unit
 
-    return converted_data
+        if unit not in ignore_units:
+            # -------------- BEFORE Calculations -------------
+            if conv_to_base_SI:
+                # Convert value to base SI
+                value = to_base_SI(value, unit)
+
+                # Convert frequency [Hz] to wavelength
+                if param.lower() == 'frequency':
+                    value = freq_to_wavelength(value)
+
+                    # Replace with 'wavelength'
+                    param = 'wavelength'
+
+            # -------------- AFTER Calculations -------------------
+            else:
+                # Convert value to user-friendly unit
+                value = to_prefixed_SI(value, unit)
+
+        converted_params[param] = value
+
+    return converted_params
 
 
 
 def freq_to_wavelength(f):
-    return float(sc.c / f)
+    return _as_float(sc.c / f)
 
 def wavelength_to_freq(lmbda):
-    return float(sc.c / lmbda)
+    return _as_float(sc.c / lmbda)
+
+def _as_float(val):
+    '''Convert numpy scalars to float (precision not necessary), arrays are left as-is'''
+    if np.ndim(val) == 0:
+        return float(val)
+    return val
 
 
 if __name__ == '__main__':